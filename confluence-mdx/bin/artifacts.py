@@ -0,0 +1,87 @@
+"""
+Writer and reader of the YAML artifacts that the tools leave under var/.
+
+Verification and fetch write large YAML files: the reverse-sync mappings (every
+BlockMapping of a page), result.yaml, the sidecar mapping.yaml and the raw API
+payloads with body.storage. PyYAML's pure-Python dumper spends most of the run
+time on them. dump_yaml() uses libyaml's CDumper when PyYAML was built with it.
+The C emitter folds long lines and escapes some characters differently, so
+the bytes may differ from the pure-Python dumper, but the data loads back the
+same.
+
+Files that only programs read can also be written as compact JSON. Set
+CONFLUENCE_MDX_ARTIFACT_FORMAT=json (default: yaml) and dump_artifact() writes
+JSON under the same file names. JSON is valid YAML, so every YAML reader still
+works, and load_artifact() reads JSON with the json module.
+
+Files under version control (var/pages.<code>.yaml, the conversion manifests)
+keep their pure-Python YAML format so that their diffs only show real changes.
+"""
+
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Union
+
+import yaml
+
+try:
+    from yaml import CDumper as Dumper, CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import Dumper, SafeLoader
+
+ARTIFACT_FORMAT_ENV = 'CONFLUENCE_MDX_ARTIFACT_FORMAT'
+ARTIFACT_FORMATS = ('yaml', 'json')
+
+PathLike = Union[str, 'os.PathLike[str]']
+
+
+def artifact_format() -> str:
+    """The format of machine-only artifacts selected by CONFLUENCE_MDX_ARTIFACT_FORMAT."""
+    value = os.environ.get(ARTIFACT_FORMAT_ENV, '').strip().lower() or 'yaml'
+    if value not in ARTIFACT_FORMATS:
+        logging.warning(f"Ignoring {ARTIFACT_FORMAT_ENV}={value!r}; expected one of {', '.join(ARTIFACT_FORMATS)}")
+        return 'yaml'
+    return value
+
+
+def dump_yaml(data: Any, **kwargs: Any) -> str:
+    """yaml.dump() with the C dumper when available; kwargs are passed through."""
+    return yaml.dump(data, Dumper=Dumper, **kwargs)
+
+
+def dump_json(data: Any, sort_keys: bool = True) -> str:
+    """Compact JSON, one line and a trailing newline."""
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':'), sort_keys=sort_keys) + '\n'
+
+
+def dump_artifact(data: Any, **kwargs: Any) -> str:
+    """A machine-only artifact: compact JSON in json mode, else dump_yaml(data, **kwargs).
+
+    Keys are sorted in both formats unless sort_keys=False is given.
+    """
+    if artifact_format() == 'json':
+        return dump_json(data, sort_keys=kwargs.get('sort_keys', True))
+    kwargs.setdefault('allow_unicode', True)
+    kwargs.setdefault('default_flow_style', False)
+    return dump_yaml(data, **kwargs)
+
+
+def write_artifact(path: PathLike, data: Any, **kwargs: Any) -> None:
+    Path(path).write_text(dump_artifact(data, **kwargs), encoding='utf-8')
+
+
+def load_artifact(text: str) -> Any:
+    """Data of an artifact written as YAML or JSON."""
+    stripped = text.lstrip()
+    if stripped[:1] in ('{', '['):
+        try:
+            return json.loads(stripped)
+        except ValueError:
+            pass  # YAML flow collection
+    return yaml.load(text, Loader=SafeLoader)
+
+
+def read_artifact(path: PathLike) -> Any:
+    return load_artifact(Path(path).read_text(encoding='utf-8'))
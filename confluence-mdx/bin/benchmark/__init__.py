@@ -0,0 +1,7 @@
+"""Performance benchmark suite for the conversion pipelines.
+
+workloads loads the pages to measure (tests/testcases and synthetically scaled
+pages), stages times each pipeline stage over them, and baseline stores the
+results as JSON and compares a run with a committed baseline.
+The suite only reads local files, so it runs offline.
+"""
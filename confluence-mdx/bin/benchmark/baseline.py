@@ -0,0 +1,95 @@
+"""JSON benchmark baselines and the comparison of a run against one."""
+
+from __future__ import annotations
+
+import json
+import platform
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from benchmark.stages import Measurement
+
+BASELINE_VERSION = 1
+DEFAULT_THRESHOLD = 0.5  # a stage more than 50% slower than its baseline is a regression
+# 짧은 stage는 측정 잡음만으로도 수십 % 흔들리므로, 절대 증가량이 이보다 작으면 회귀로 보지 않는다
+MIN_REGRESSION_SECONDS = 0.1
+
+
+@dataclass(frozen=True)
+class Baseline:
+    threshold: float
+    repeat: int
+    results: Dict[str, Dict[str, dict]]  # stage → workload → {"pages": n, "seconds": s}
+
+    def seconds(self, stage: str, workload: str) -> Optional[float]:
+        entry = self.results.get(stage, {}).get(workload)
+        return entry['seconds'] if entry else None
+
+
+def to_baseline(measurements: List[Measurement], threshold: float = DEFAULT_THRESHOLD,
+                repeat: int = 5) -> Baseline:
+    results: Dict[str, Dict[str, dict]] = {}
+    for m in measurements:
+        results.setdefault(m.stage, {})[m.workload] = {'pages': m.pages, 'seconds': round(m.seconds, 4)}
+    return Baseline(threshold, repeat, results)
+
+
+def load_baseline(path: Path) -> Baseline:
+    data = json.loads(path.read_text(encoding='utf-8'))
+    if data.get('version') != BASELINE_VERSION:
+        raise ValueError(f'Unsupported benchmark baseline version in {path}: {data.get("version")}')
+    return Baseline(data.get('threshold', DEFAULT_THRESHOLD), data.get('repeat', 5), data['results'])
+
+
+def save_baseline(path: Path, baseline: Baseline) -> None:
+    data = {
+        'version': BASELINE_VERSION,
+        'python': platform.python_version(),
+        'threshold': baseline.threshold,
+        'repeat': baseline.repeat,
+        'results': baseline.results,
+    }
+    path.write_text(json.dumps(data, indent=2, ensure_ascii=False) + '\n', encoding='utf-8')
+
+
+@dataclass(frozen=True)
+class Comparison:
+    stage: str
+    workload: str
+    baseline_seconds: Optional[float]
+    current_seconds: float
+
+    @property
+    def change(self) -> Optional[float]:
+        """Relative change, e.g. 0.1 for 10% slower; None without a baseline."""
+        if not self.baseline_seconds:
+            return None
+        return self.current_seconds / self.baseline_seconds - 1
+
+    def is_regression(self, threshold: float) -> bool:
+        return (self.change is not None and self.change > threshold
+                and self.current_seconds - self.baseline_seconds >= MIN_REGRESSION_SECONDS)
+
+
+def compare(measurements: List[Measurement], baseline: Baseline) -> List[Comparison]:
+    return [Comparison(m.stage, m.workload, baseline.seconds(m.stage, m.workload), m.seconds)
+            for m in measurements]
+
+
+def format_table(comparisons: List[Comparison], threshold: float) -> str:
+    """Comparison table with one row per stage and workload."""
+    rows = [('stage', 'workload', 'baseline', 'current', 'change', '')]
+    for c in comparisons:
+        baseline = f'{c.baseline_seconds:.3f}s' if c.baseline_seconds is not None else '-'
+        change = f'{c.change:+.1%}' if c.change is not None else 'new'
+        rows.append((c.stage, c.workload, baseline, f'{c.current_seconds:.3f}s', change,
+                     'REGRESSION' if c.is_regression(threshold) else ''))
+    widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+    lines = []
+    for row in rows:
+        cells = [row[0].ljust(widths[0]), row[1].ljust(widths[1])]
+        cells += [cell.rjust(width) for cell, width in zip(row[2:5], widths[2:5])]
+        cells.append(row[5])
+        lines.append('  '.join(cells).rstrip())
+    return '\n'.join(lines)
@@ -0,0 +1,195 @@
+"""Benchmark stages: one pipeline step each, timed over the pages of a workload.
+
+A stage binds a page to a zero-argument call with all of its inputs prepared
+(MDX diffs, sidecars, patch plans, patched XHTML), so that only the stage
+itself is timed. Stages run outside reverse_sync.document_cache.parse_scope():
+each call parses its own input, as it does on its own.
+"""
+
+from __future__ import annotations
+
+import gc
+import time
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Any, Callable, Dict, List, Optional
+
+from benchmark.workloads import Page, Workload
+from converter.cli import convert_xhtml
+from converter.context import PageCatalog
+from mdx_to_storage import emit_document, parse_mdx
+from reverse_sync.planner import plan_patches
+from reverse_sync.roundtrip_verifier import verify_roundtrip
+from reverse_sync.sidecar import build_sidecar, generate_sidecar_mapping, load_page_lost_info
+from reverse_sync.verification_service import parse_and_diff, strip_frontmatter
+from reverse_sync.xhtml_patch_engine import patch_xhtml_engine
+from skeleton.cli import mdx_to_skeleton
+
+
+class PreparedPage:
+    """A page with its derived stage inputs, each computed once and only when needed."""
+
+    def __init__(self, page: Page, catalog: PageCatalog):
+        self.page = page
+        self.catalog = catalog
+
+    def forward_convert(self, xhtml: str) -> str:
+        page = self.page
+        return convert_xhtml(
+            xhtml, self.catalog,
+            page_v1=page.page_v1,
+            input_file=str(page.case_dir / 'page.xhtml'),
+            output_file=str(page.case_dir / 'output.mdx'),
+            public_dir=str(page.case_dir.parent),
+            skip_image_copy=True,
+        ).markdown
+
+    @property
+    def has_edit(self) -> bool:
+        """Whether the page has an original/improved MDX pair that differs."""
+        return (self.page.original_mdx is not None and self.page.improved_mdx is not None
+                and bool(self.diff[0]))
+
+    @cached_property
+    def diff(self):
+        """(changes, alignment, original_blocks, improved_blocks) of original → improved."""
+        return parse_and_diff(self.page.original_mdx or '', self.page.improved_mdx or '')
+
+    @cached_property
+    def plan_inputs(self) -> Dict[str, Any]:
+        changes, alignment, original_blocks, improved_blocks = self.diff
+        return dict(
+            changes=changes,
+            original_blocks=original_blocks,
+            improved_blocks=improved_blocks,
+            page_xhtml=self.page.xhtml,
+            alignment=alignment,
+            page_lost_info=load_page_lost_info(str(self.page.case_dir / 'mapping.yaml')),
+            roundtrip_sidecar=build_sidecar(self.page.xhtml, self.page.original_mdx,
+                                            page_id=self.page.page_id),
+        )
+
+    @cached_property
+    def patches(self) -> List[dict]:
+        patch_plan, _ = plan_patches(**self.plan_inputs)
+        return patch_plan.to_patch_dicts()
+
+    @cached_property
+    def verify_mdx(self) -> str:
+        """Forward conversion of the patched XHTML, as reverse-sync verify produces it."""
+        return self.forward_convert(patch_xhtml_engine(self.page.xhtml, self.patches, strict=False))
+
+
+def _forward(prepared: PreparedPage) -> Optional[Callable[[], Any]]:
+    return lambda: prepared.forward_convert(prepared.page.xhtml)
+
+
+def _mdx_to_storage(prepared: PreparedPage) -> Optional[Callable[[], Any]]:
+    mdx = prepared.page.mdx
+    if mdx is None:
+        return None
+    return lambda: emit_document(parse_mdx(mdx))
+
+
+def _sidecar(prepared: PreparedPage) -> Optional[Callable[[], Any]]:
+    page = prepared.page
+    if page.mdx is None:
+        return None
+    return lambda: generate_sidecar_mapping(page.xhtml, page.mdx, page.page_id)
+
+
+def _plan_patches(prepared: PreparedPage) -> Optional[Callable[[], Any]]:
+    if not prepared.has_edit:
+        return None
+    inputs = prepared.plan_inputs
+    return lambda: plan_patches(**inputs)
+
+
+def _patch_xhtml_engine(prepared: PreparedPage) -> Optional[Callable[[], Any]]:
+    if not prepared.has_edit:
+        return None
+    xhtml, patches = prepared.page.xhtml, prepared.patches
+    return lambda: patch_xhtml_engine(xhtml, patches, strict=False)
+
+
+def _verify_roundtrip(prepared: PreparedPage) -> Optional[Callable[[], Any]]:
+    if not prepared.has_edit:
+        return None
+    expected = strip_frontmatter(prepared.page.improved_mdx)
+    actual = strip_frontmatter(prepared.verify_mdx)
+    return lambda: verify_roundtrip(expected_mdx=expected, actual_mdx=actual)
+
+
+def _skeleton(prepared: PreparedPage) -> Optional[Callable[[], Any]]:
+    mdx = prepared.page.mdx
+    if mdx is None:
+        return None
+    return lambda: mdx_to_skeleton(mdx)
+
+
+@dataclass(frozen=True)
+class Stage:
+    name: str
+    description: str
+    bind: Callable[[PreparedPage], Optional[Callable[[], Any]]]
+
+
+STAGES: List[Stage] = [
+    Stage('forward', 'XHTML → MDX (ConfluenceToMarkdown)', _forward),
+    Stage('mdx_to_storage', 'MDX → storage XHTML (parse_mdx + emit_document)', _mdx_to_storage),
+    Stage('sidecar', 'mapping.yaml sidecar (generate_sidecar_mapping)', _sidecar),
+    Stage('plan_patches', 'reverse-sync patch planning (plan_patches)', _plan_patches),
+    Stage('patch_xhtml_engine', 'XHTML patching (patch_xhtml_engine)', _patch_xhtml_engine),
+    Stage('verify_roundtrip', 'improved MDX ↔ verify MDX comparison (verify_roundtrip)', _verify_roundtrip),
+    Stage('skeleton', 'MDX → skeleton MDX (mdx_to_skeleton)', _skeleton),
+]
+STAGE_NAMES = [stage.name for stage in STAGES]
+
+
+@dataclass(frozen=True)
+class Measurement:
+    """Best time of the repeats for running a stage once over every page of a workload."""
+    stage: str
+    workload: str
+    pages: int
+    seconds: float
+
+
+def measure(stage: Stage, workload: Workload, repeat: int = 5,
+            prepared: Optional[List[PreparedPage]] = None) -> Optional[Measurement]:
+    """Time stage over workload; None if no page of the workload has the stage's inputs."""
+    if prepared is None:
+        prepared = [PreparedPage(page, workload.catalog) for page in workload.pages]
+    calls = [call for call in (stage.bind(page) for page in prepared) if call is not None]
+    if not calls:
+        return None
+    best = None
+    for _ in range(repeat):
+        # timeit처럼 측정 중에는 GC를 끄고, 이전 반복의 garbage는 먼저 수거한다
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            for call in calls:
+                call()
+            elapsed = time.perf_counter() - start
+        finally:
+            gc.enable()
+        best = elapsed if best is None else min(best, elapsed)
+    return Measurement(stage.name, workload.name, len(calls), best)
+
+
+def run_suite(workloads: List[Workload], stages: List[Stage] = STAGES, repeat: int = 5,
+              progress: Optional[Callable[[Measurement], None]] = None) -> List[Measurement]:
+    """Measure every stage over every workload, sharing prepared inputs between stages."""
+    measurements = []
+    for workload in workloads:
+        prepared = [PreparedPage(page, workload.catalog) for page in workload.pages]
+        for stage in stages:
+            measurement = measure(stage, workload, repeat, prepared)
+            if measurement is None:
+                continue
+            measurements.append(measurement)
+            if progress is not None:
+                progress(measurement)
+    return measurements
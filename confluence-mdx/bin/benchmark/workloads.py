@@ -0,0 +1,120 @@
+"""Benchmark workloads: testcase pages and synthetically scaled large pages."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import List, Optional
+
+from converter.cli import load_catalog, resolve_pages_yaml_path
+from converter.context import PageCatalog, PageV1, load_page_v1_yaml
+
+
+@dataclass(frozen=True)
+class Page:
+    """Inputs of one page. Missing inputs are None; stages skip pages that lack theirs."""
+    page_id: str
+    case_dir: Path
+    xhtml: str
+    mdx: Optional[str] = None  # expected.mdx: forward conversion of xhtml
+    original_mdx: Optional[str] = None
+    improved_mdx: Optional[str] = None
+    page_v1: Optional[PageV1] = None
+
+
+@dataclass(frozen=True)
+class Workload:
+    name: str
+    pages: List[Page]
+    catalog: PageCatalog
+
+
+def _read_optional(path: Path) -> Optional[str]:
+    return path.read_text(encoding='utf-8') if path.is_file() else None
+
+
+def load_page(case_dir: Path) -> Page:
+    return Page(
+        page_id=case_dir.name,
+        case_dir=case_dir,
+        xhtml=(case_dir / 'page.xhtml').read_text(encoding='utf-8'),
+        mdx=_read_optional(case_dir / 'expected.mdx'),
+        original_mdx=_read_optional(case_dir / 'original.mdx'),
+        improved_mdx=_read_optional(case_dir / 'improved.mdx'),
+        page_v1=load_page_v1_yaml(str(case_dir / 'page.v1.yaml')),
+    )
+
+
+def load_testcase_pages(testcases_dir: Path) -> List[Page]:
+    """Every testcase directory with a page.xhtml, in name order."""
+    return [load_page(path.parent) for path in sorted(testcases_dir.glob('*/page.xhtml'))]
+
+
+def load_catalog_for(testcases_dir: Path) -> PageCatalog:
+    return load_catalog(resolve_pages_yaml_path(str(testcases_dir)))
+
+
+def _split_frontmatter(mdx: str) -> tuple:
+    if mdx.startswith('---\n'):
+        end = mdx.find('\n---\n', 4)
+        if end != -1:
+            return mdx[:end + 5], mdx[end + 5:]
+    return '', mdx
+
+
+def _body(mdx: str) -> str:
+    body = _split_frontmatter(mdx)[1]
+    return body if body.endswith('\n') else body + '\n'
+
+
+def _scale_mdx(mdx: Optional[str], factor: int, first_body: Optional[str] = None) -> Optional[str]:
+    """Keep the frontmatter once and repeat the body factor times.
+
+    With first_body, the first copy of the body is first_body instead.
+    """
+    if mdx is None:
+        return None
+    frontmatter = _split_frontmatter(mdx)[0]
+    body = _body(mdx)
+    return frontmatter + '\n'.join([first_body or body] + [body] * (factor - 1))
+
+
+def scale_page(page: Page, factor: int) -> Page:
+    """A synthetic page whose XHTML and MDX bodies are page's repeated factor times.
+
+    Storage XHTML is a fragment, so concatenated pages are still a valid page;
+    the MDX bodies stay the forward conversion of the repeated XHTML closely
+    enough for every stage to run on them. The improved MDX carries page's
+    edit in the first copy only: a small edit on a large page, as reverse-sync
+    usually sees it (identical edits in every copy would make the copies
+    indistinguishable to the planner).
+    """
+    improved_mdx = None
+    if page.original_mdx is not None and page.improved_mdx is not None:
+        improved_mdx = _scale_mdx(page.original_mdx, factor, first_body=_body(page.improved_mdx))
+    return replace(
+        page,
+        page_id=f'{page.page_id}x{factor}',
+        xhtml=page.xhtml * factor,
+        mdx=_scale_mdx(page.mdx, factor),
+        original_mdx=_scale_mdx(page.original_mdx, factor),
+        improved_mdx=improved_mdx,
+    )
+
+
+def largest_page(pages: List[Page]) -> Optional[Page]:
+    """The largest page that has inputs for every stage (original and improved MDX)."""
+    complete = [page for page in pages
+                if page.mdx is not None and page.original_mdx is not None and page.improved_mdx is not None]
+    return max(complete, key=lambda page: len(page.xhtml), default=None)
+
+
+def build_workloads(testcases_dir: Path, scale: int = 10) -> List[Workload]:
+    """The testcases workload and, if scale > 1, the largest testcase scaled scale times."""
+    catalog = load_catalog_for(testcases_dir)
+    pages = load_testcase_pages(testcases_dir)
+    workloads = [Workload('testcases', pages, catalog)]
+    large = largest_page(pages)
+    if scale > 1 and large is not None:
+        workloads.append(Workload(f'large-x{scale}', [scale_page(large, scale)], catalog))
+    return workloads
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""Performance benchmark CLI for the conversion pipelines.
+
+Times forward conversion, MDX → storage XHTML, sidecar generation, reverse-sync
+patch planning and patching, roundtrip verification and skeleton generation
+over tests/testcases and a synthetically scaled large page, then prints a
+comparison table against the committed JSON baseline. Fails when a stage is
+slower than its baseline by more than the threshold (and by at least
+MIN_REGRESSION_SECONDS, so that timing noise on short stages does not fail it).
+Runs offline.
+
+Usage:
+    bin/benchmark_cli.py                        # compare with etc/benchmark-baseline.json
+    bin/benchmark_cli.py --stage forward --stage skeleton --repeat 5
+    bin/benchmark_cli.py --update-baseline      # record this run as the baseline
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+from benchmark.baseline import (
+    DEFAULT_THRESHOLD, MIN_REGRESSION_SECONDS, Baseline, compare, format_table, load_baseline, save_baseline, to_baseline,
+)
+from benchmark.stages import STAGE_NAMES, STAGES, run_suite
+from benchmark.workloads import build_workloads
+from converter.cli import LOG_FORMAT
+
+_PROJECT_DIR = Path(__file__).resolve().parent.parent  # confluence-mdx/
+_DEFAULT_BASELINE = _PROJECT_DIR / "etc" / "benchmark-baseline.json"
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Benchmark the conversion pipelines and compare with a JSON baseline"
+    )
+    parser.add_argument(
+        "--testcases-dir",
+        type=Path,
+        default=_PROJECT_DIR / "tests" / "testcases",
+        help="Root directory containing testcase subdirectories",
+    )
+    parser.add_argument(
+        "--baseline",
+        type=Path,
+        default=_DEFAULT_BASELINE,
+        help="Baseline JSON file (default: etc/benchmark-baseline.json)",
+    )
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="Write the results of this run to --baseline instead of failing on regressions",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        help="Also write the results of this run as JSON to this file",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        help=f"Allowed slowdown before a stage counts as a regression, e.g. 0.5 for 50%% "
+             f"(default: the baseline's, else {DEFAULT_THRESHOLD}); slowdowns under "
+             f"{MIN_REGRESSION_SECONDS}s never count",
+    )
+    parser.add_argument(
+        "--stage",
+        action="append",
+        choices=STAGE_NAMES,
+        help="Only run this stage (repeatable; default: all stages)",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=5,
+        help="Run every stage N times and keep the best time (default: 5)",
+    )
+    parser.add_argument(
+        "--scale",
+        type=int,
+        default=10,
+        help="Scale factor of the synthetic large page; 1 disables it (default: 10)",
+    )
+    parser.add_argument(
+        "--log-level",
+        choices=["debug", "info", "warning", "error", "critical"],
+        default="error",
+        help="Converter log level (default: error)",
+    )
+    return parser
+
+
+def main() -> int:
+    parser = _build_parser()
+    args = parser.parse_args()
+    if args.repeat < 1:
+        parser.error("--repeat must be at least 1")
+    if args.scale < 1:
+        parser.error("--scale must be at least 1")
+    logging.basicConfig(level=getattr(logging, args.log_level.upper()), format=LOG_FORMAT)
+
+    if not args.testcases_dir.is_dir():
+        print(f"Error: testcases dir not found: {args.testcases_dir}", file=sys.stderr)
+        return 2
+
+    baseline = None
+    if args.baseline.exists():
+        try:
+            baseline = load_baseline(args.baseline)
+        except (ValueError, KeyError) as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 2
+    threshold = args.threshold
+    if threshold is None:
+        threshold = baseline.threshold if baseline else DEFAULT_THRESHOLD
+
+    stages = [stage for stage in STAGES if not args.stage or stage.name in args.stage]
+    workloads = build_workloads(args.testcases_dir, scale=args.scale)
+    measurements = run_suite(
+        workloads, stages, repeat=args.repeat,
+        progress=lambda m: print(f"  {m.stage} / {m.workload}: {m.seconds:.3f}s ({m.pages} pages)",
+                                 file=sys.stderr),
+    )
+    current = to_baseline(measurements, threshold, args.repeat)
+    if args.output:
+        save_baseline(args.output, current)
+
+    if args.update_baseline:
+        if baseline is not None and args.stage:
+            # 일부 stage만 실행한 경우 나머지 stage의 기준값은 유지한다
+            results = {stage: dict(values) for stage, values in baseline.results.items()}
+            for stage, values in current.results.items():
+                results.setdefault(stage, {}).update(values)
+            current = Baseline(threshold, args.repeat, results)
+        save_baseline(args.baseline, current)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    comparisons = compare(measurements, baseline or to_baseline([]))
+    print(format_table(comparisons, threshold))
+    if baseline is None:
+        print(f"\nNo baseline at {args.baseline}; record one with --update-baseline")
+        return 0
+    regressions = [c for c in comparisons if c.is_regression(threshold)]
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) above {threshold:.0%}:")
+        for c in regressions:
+            print(f"  - {c.stage} / {c.workload}: {c.change:+.1%}")
+        return 1
+    print(f"\nNo regression above {threshold:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    try:
+        sys.exit(main())
+    except KeyboardInterrupt:
+        sys.exit(130)
@@ -9,17 +9,30 @@ Usage:
   bin/convert_all.py                       # 전체 변환 (기본: --sync-code qm)
   bin/convert_all.py --sync-code qcp       # QCP Space 변환
   bin/convert_all.py --verify-translations  # 번역 검증만 수행
+  bin/convert_all.py --jobs 8               # worker 8개로 in-process 병렬 변환
+  bin/convert_all.py --jobs 8 --parser lxml # 더 빠른 lxml XHTML parser 사용
+  bin/convert_all.py --cache-dir cache/convert                # 변환 cache 사용 (기본: 사용하지 않음)
+  bin/convert_all.py --cache-dir cache/convert --clear-cache  # 변환 cache를 비우고 전체 변환
+  bin/convert_all.py --cache-dir cache/convert --incremental  # 바뀐 page와 그 page를 link하는 page만 변환
+  bin/convert_all.py --jobs 8 --profile var/profile.convert.json  # stage별 소요 시간과 counter 기록
 """
 
 import argparse
+import hashlib
+import html
+import io
+import json
+import logging
 import os
 import re
 import subprocess
 import sys
 import tempfile
+import uuid
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import date
 from pathlib import Path
-from typing import Any, Dict, List, Mapping, Sequence
+from typing import Any, Dict, List, Mapping, NamedTuple, Optional, Sequence, Tuple
 from urllib.parse import quote, urlsplit
 
 import yaml
@@ -36,6 +49,12 @@ _MANIFEST_SUFFIX = ".yaml"
 if str(_SCRIPT_DIR) not in sys.path:
     sys.path.insert(0, str(_SCRIPT_DIR))
 
+import artifacts
+import pages_catalog
+import profiling
+from converter.cache import ConversionCache, clear_cache, converter_stamp
+from converter.output import note_changed, parse_changed_outputs, take_changed, write_if_changed
+from converter.xhtml_parser import DEFAULT_PARSER, PARSER_BACKENDS, available_parsers
 from fetch.sync_profiles import SYNC_PROFILES
 from content_redirects import update_content_redirects
 
@@ -48,10 +67,10 @@ def _resolve(rel: str) -> str:
     return str(_PROJECT_DIR / rel)
 
 
+@profiling.timed('convert_all.load_pages')
 def load_pages_yaml(pages_yaml_path: str) -> List[Dict]:
     """Load pages.yaml and return typed content entries."""
-    with open(pages_yaml_path, 'r', encoding='utf-8') as f:
-        pages = yaml.safe_load(f)
+    pages = pages_catalog.load_pages(pages_yaml_path)
     if not isinstance(pages, list):
         raise ValueError(f"pages.yaml should contain a list, got {type(pages)}")
     return pages
@@ -125,27 +144,111 @@ def _child_position(child: Mapping[str, Any]) -> int:
         return 0
 
 
+# Fields of a children.v2.yaml result that planning and navigation read
+_CHILD_FIELDS = ("id", "type", "status", "title", "childPosition")
+
+
+class ChildrenIndex:
+    """Direct children of each parent, read from var/<id>/children.v2.yaml once per run.
+
+    Output planning (for every sync profile), folder pages and navigation all
+    ask for the children of the same parents. The index parses each snapshot
+    only on its first request, and keeps the children sorted by childPosition.
+    With cache_dir, the parsed snapshots are also stored in
+    <cache_dir>/children-index.json under the SHA-256 of each file, so a
+    later run only hashes the files that did not change.
+    """
+
+    FORMAT = 1
+
+    def __init__(self, var_dir: Path, cache_dir: str = ''):
+        self.var_dir = var_dir
+        self.cache_path = Path(cache_dir) / "children-index.json" if cache_dir else None
+        self._children: Dict[str, List[Dict[str, Any]]] = {}
+        self._stored: Dict[str, Dict[str, Any]] = self._load_stored()
+        self._dirty = False
+        self.parses = 0  # snapshots parsed in this run
+
+    def _load_stored(self) -> Dict[str, Dict[str, Any]]:
+        if self.cache_path is None:
+            return {}
+        try:
+            data = json.loads(self.cache_path.read_text(encoding="utf-8"))
+            if data.get("format") == self.FORMAT and isinstance(data.get("entries"), dict):
+                return data["entries"]
+        except (OSError, ValueError, AttributeError):
+            pass
+        return {}
+
+    def children(self, parent_id: str) -> List[Dict[str, Any]]:
+        """The child results of parent_id in childPosition order."""
+        if parent_id not in self._children:
+            self._children[parent_id] = self._read(parent_id)
+        return self._children[parent_id]
+
+    def _read(self, parent_id: str) -> List[Dict[str, Any]]:
+        path = self.var_dir / parent_id / "children.v2.yaml"
+        description = f"direct children snapshot for {parent_id}"
+        try:
+            content = path.read_bytes()
+        except FileNotFoundError:
+            raise ConversionError(f"Missing {description}: {path}") from None
+        digest = hashlib.sha256(content).hexdigest()
+        key = str(path.resolve())
+        stored = self._stored.get(key)
+        if stored is not None and stored.get("sha256") == digest:
+            return stored["children"]
+
+        self.parses += 1
+        profiling.count('children_snapshot_parses')
+        try:
+            data = artifacts.load_artifact(content.decode("utf-8"))
+        except yaml.YAMLError as exc:
+            raise ConversionError(f"Invalid YAML in {description} {path}: {exc}") from exc
+        if not isinstance(data, dict):
+            raise ConversionError(f"{description} must be a mapping: {path}")
+        results = data.get("results", [])
+        if not isinstance(results, list):
+            raise ConversionError(
+                f"children.v2.yaml results must be a list for parent {parent_id}"
+            )
+        children = [
+            {field: item[field] for field in _CHILD_FIELDS if field in item}
+            for item in sorted(
+                (item for item in results if isinstance(item, dict)),
+                key=_child_position,
+            )
+        ]
+        self._stored[key] = {"sha256": digest, "children": children}
+        self._dirty = True
+        return children
+
+    def save(self) -> None:
+        """Store the parsed snapshots for the next run; failures to write are only logged."""
+        if self.cache_path is None or not self._dirty:
+            return
+        temp_path = self.cache_path.with_name(f"{self.cache_path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path.write_text(
+                json.dumps({"format": self.FORMAT, "entries": self._stored}, ensure_ascii=False),
+                encoding="utf-8",
+            )
+            os.replace(temp_path, self.cache_path)
+            self._dirty = False
+        except OSError as exc:
+            logging.warning(f"Failed to write children index {self.cache_path}: {exc}")
+            temp_path.unlink(missing_ok=True)
+
+
 def _supported_children(
     parent: Mapping[str, Any],
-    var_dir: Path,
+    children_index: ChildrenIndex,
     nodes_by_id: Mapping[str, Mapping[str, Any]],
 ) -> List[Mapping[str, Any]]:
     parent_id = str(parent["page_id"])
-    data = _load_yaml_mapping(
-        var_dir / parent_id / "children.v2.yaml",
-        f"direct children snapshot for {parent_id}",
-    )
-    results = data.get("results", [])
-    if not isinstance(results, list):
-        raise ConversionError(
-            f"children.v2.yaml results must be a list for parent {parent_id}"
-        )
-
     supported: List[Mapping[str, Any]] = []
-    for child in sorted(
-        (item for item in results if isinstance(item, dict)),
-        key=_child_position,
-    ):
+    for child in children_index.children(parent_id):
         child_id_value = child.get("id")
         if child_id_value is None:
             print(
@@ -187,6 +290,221 @@ def _supported_children(
     return supported
 
 
+# Inputs of a page or folder conversion in var/<id>/, besides the pages catalog
+_PAGE_INPUTS = ("page.xhtml", "page.v1.yaml", "attachments.v1.yaml")
+_FOLDER_INPUTS = ("folder.v2.yaml",)
+# Fields of a catalog entry that other pages' links, folder pages and navigation read
+_ENTRY_FIELDS = ("type", "title", "title_orig", "path")
+
+# <ri:page ri:content-title="..."/> of ac:link, resolved through the catalog by title
+_LINKED_TITLE_RE = re.compile(r"""<ri:page\b[^>]*?\bri:content-title=(?:"([^"]*)"|'([^']*)')""")
+# Confluence page URLs, resolved through the catalog by page ID
+_LINKED_PAGE_ID_RE = re.compile(r"atlassian\.net/wiki/spaces/[^\s\"'<>]*?/pages/(\d+)")
+
+
+def _inputs_digest(directory: Path, names: Sequence[str]) -> str:
+    digest = hashlib.sha256()
+    for name in names:
+        try:
+            content = (directory / name).read_bytes()
+        except FileNotFoundError:
+            digest.update(f"{name}\0missing\0".encode("utf-8"))
+            continue
+        digest.update(f"{name}\0".encode("utf-8"))
+        digest.update(hashlib.sha256(content).digest())
+    return digest.hexdigest()
+
+
+def _page_references(xhtml_path: Path) -> Tuple[List[str], List[str]]:
+    """Titles and page IDs of the pages that a page.xhtml links to."""
+    try:
+        xhtml = xhtml_path.read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError):
+        return [], []
+    titles = {
+        html.unescape(double if double is not None else single)
+        for double, single in _LINKED_TITLE_RE.findall(xhtml)
+    }
+    return sorted(titles), sorted(set(_LINKED_PAGE_ID_RE.findall(xhtml)))
+
+
+def _first_by_title(records: Mapping[str, Mapping[str, Any]]) -> Dict[str, Tuple[str, Any]]:
+    """title_orig → (page_id, entry) of the first entry with that title, as PageCatalog resolves it."""
+    by_title: Dict[str, Tuple[str, Any]] = {}
+    for page_id, record in records.items():
+        title_orig = (record.get("entry") or {}).get("title_orig")
+        if title_orig:
+            by_title.setdefault(title_orig, (page_id, record["entry"]))
+    return by_title
+
+
+class IncrementalPlan(NamedTuple):
+    """Catalog nodes that an incremental run regenerates; everything else is left as is."""
+
+    pages: set[str]  # pages to convert
+    parents: set[str]  # folder landing pages and _meta.ts files to regenerate
+    changed: int  # pages whose own inputs or catalog entry changed, or whose MDX is missing
+    linked: int  # further pages that link to a changed, added, retitled or removed page
+
+    def needs(self, page_id: str, content_type: str) -> bool:
+        return page_id in (self.parents if content_type == "folder" else self.pages)
+
+
+class ConversionState:
+    """Inputs of the last successful incremental run, stored as <cache_dir>/convert-state.json.
+
+    For every catalog node it records the digest of its files under var/<id>/,
+    its catalog entry, its direct children and, for pages, the titles and page
+    IDs that page.xhtml links to. plan() compares the current tree with that
+    record: the fetch delta is the set of nodes whose files or entries
+    changed, and the links, read in reverse, give the pages whose relative
+    links point at a changed entry. The state only applies to runs with the
+    same options and the same converter and convert_all code; otherwise every
+    node is planned.
+    """
+
+    FORMAT = 1
+
+    def __init__(self, cache_dir: str, options: Mapping[str, str]):
+        self.path = Path(cache_dir) / "convert-state.json"
+        self.options = dict(options)
+        self.records: Dict[str, Dict[str, Any]] = {}  # current records, set by plan()
+        self.stored = self._load()  # None when there is no usable state
+
+    def _load(self) -> Optional[Dict[str, Dict[str, Any]]]:
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if (
+            not isinstance(data, dict)
+            or data.get("format") != self.FORMAT
+            or data.get("options") != self.options
+            or not isinstance(data.get("nodes"), dict)
+        ):
+            return None
+        return data["nodes"]
+
+    def plan(
+        self,
+        pages: Sequence[Mapping[str, Any]],
+        var_dir: Path,
+        output_base_dir: Path,
+        children_index: ChildrenIndex,
+    ) -> IncrementalPlan:
+        """Record the current inputs and return the nodes whose outputs may have changed."""
+        stored = self.stored or {}
+        self.records = {}
+        for node in pages:
+            page_id = str(node["page_id"])
+            content_type = str(node.get("type") or "page")
+            directory = var_dir / page_id
+            record: Dict[str, Any] = {"entry": {field: node.get(field) for field in _ENTRY_FIELDS}}
+            if content_type == "page":
+                record["inputs"] = _inputs_digest(directory, _PAGE_INPUTS)
+                previous = stored.get(page_id, {})
+                if previous.get("inputs") == record["inputs"] and "titles" in previous:
+                    record["titles"], record["ids"] = previous["titles"], previous.get("ids", [])
+                else:
+                    record["titles"], record["ids"] = _page_references(directory / "page.xhtml")
+            elif content_type == "folder":
+                record["inputs"] = _inputs_digest(directory, _FOLDER_INPUTS)
+            try:
+                record["children"] = children_index.children(page_id)
+            except ConversionError:
+                record["children"] = None  # reported when the node is generated
+            self.records[page_id] = record
+
+        # The root page is only recorded for the links that resolve it
+        root_id = str(pages[0]["page_id"]) if pages else None
+        page_ids = {
+            page_id for page_id, record in self.records.items()
+            if page_id != root_id and record["entry"]["type"] in (None, "page")
+        }
+        supported_ids = {
+            page_id for page_id, record in self.records.items()
+            if page_id != root_id and str(record["entry"]["type"] or "page") in _SUPPORTED_CONTENT_TYPES
+        }
+        if self.stored is None:
+            return IncrementalPlan(page_ids, supported_ids, len(page_ids), 0)
+
+        def output_missing(node: Mapping[str, Any]) -> bool:
+            try:
+                return not (output_base_dir / _output_relative_path(node)).is_file()
+            except ConversionError:
+                return True
+
+        nodes_by_id = {str(node["page_id"]): node for node in pages}
+        changed_entries = {
+            page_id for page_id in self.records.keys() | stored.keys()
+            if (self.records.get(page_id) or {}).get("entry") != (stored.get(page_id) or {}).get("entry")
+        }
+        old_by_title, new_by_title = _first_by_title(stored), _first_by_title(self.records)
+        changed_titles = {
+            title for title in old_by_title.keys() | new_by_title.keys()
+            if old_by_title.get(title) != new_by_title.get(title)
+        }
+
+        # Reverse link graph: title / page ID → pages whose MDX resolves it.
+        # A page also resolves its own entry for its relative links.
+        linking_titles: Dict[str, set[str]] = {}
+        linking_ids: Dict[str, set[str]] = {}
+        for page_id in page_ids:
+            record = self.records[page_id]
+            for title in [*record["titles"], record["entry"]["title_orig"]]:
+                if title:
+                    linking_titles.setdefault(title, set()).add(page_id)
+            for linked_id in [*record["ids"], page_id]:
+                linking_ids.setdefault(linked_id, set()).add(page_id)
+
+        changed = {
+            page_id for page_id in page_ids
+            if self.records[page_id]["inputs"] != (stored.get(page_id) or {}).get("inputs")
+            or page_id in changed_entries
+            or output_missing(nodes_by_id[page_id])
+        }
+        linked: set[str] = set()
+        for title in changed_titles:
+            linked |= linking_titles.get(title, set())
+        for page_id in changed_entries:
+            linked |= linking_ids.get(page_id, set())
+        linked -= changed
+
+        parents = set()
+        for page_id in supported_ids:
+            record, previous = self.records[page_id], stored.get(page_id) or {}
+            children = record["children"]
+            if (
+                children is None
+                or children != previous.get("children")
+                or page_id in changed_entries
+                or any(str(child.get("id")) in changed_entries for child in children)
+                or (
+                    record["entry"]["type"] == "folder"
+                    and (record["inputs"] != previous.get("inputs") or output_missing(nodes_by_id[page_id]))
+                )
+            ):
+                parents.add(page_id)
+        return IncrementalPlan(changed | linked, parents, len(changed), len(linked))
+
+    def save(self) -> None:
+        """Store the records of plan() for the next run; failures to write are only logged."""
+        temp_path = self.path.with_name(f"{self.path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path.write_text(
+                json.dumps(
+                    {"format": self.FORMAT, "options": self.options, "nodes": self.records},
+                    ensure_ascii=False,
+                ),
+                encoding="utf-8",
+            )
+            os.replace(temp_path, self.path)
+        except OSError as exc:
+            logging.warning(f"Failed to write conversion state {self.path}: {exc}")
+            temp_path.unlink(missing_ok=True)
+
+
 def _single_quoted_yaml(value: str) -> str:
     return "'" + value.replace("'", "''") + "'"
 
@@ -236,6 +554,7 @@ def _markdown_link_title(value: str) -> str:
     return value.replace("\\", "\\\\").replace("[", "\\[").replace("]", "\\]")
 
 
+@profiling.timed('convert_all.folder')
 def generate_folder_mdx(
     folder: Mapping[str, Any],
     nodes_by_id: Mapping[str, Mapping[str, Any]],
@@ -243,6 +562,7 @@ def generate_folder_mdx(
     output_base_dir: Path,
     base_url: str,
     space_key: str = "QM",
+    children_index: Optional[ChildrenIndex] = None,
 ) -> Path:
     """Generate a deterministic folder landing page and return its relative path."""
     folder_id = str(folder["page_id"])
@@ -258,7 +578,7 @@ def generate_folder_mdx(
         space_key,
         folder_id,
     )
-    children = _supported_children(folder, var_dir, nodes_by_id)
+    children = _supported_children(folder, children_index or ChildrenIndex(var_dir), nodes_by_id)
 
     title = str(folder.get("title") or folder_data.get("title") or "").strip()
     if not title:
@@ -292,7 +612,7 @@ def generate_folder_mdx(
     lines.append("")
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text("\n".join(lines), encoding="utf-8")
+    note_changed(write_if_changed(str(output_path), "\n".join(lines)))
     return relative_path
 
 
@@ -300,14 +620,22 @@ def _typescript_string(value: str) -> str:
     return value.replace("\\", "\\\\").replace("'", "\\'")
 
 
+@profiling.timed('convert_all.navigation')
 def generate_navigation(
     pages: Sequence[Mapping[str, Any]],
     var_dir: Path,
     output_base_dir: Path,
+    children_index: Optional[ChildrenIndex] = None,
+    parents: Optional[set[str]] = None,
 ) -> List[Dict[str, str]]:
-    """Generate non-root navigation files after all MDX outputs exist."""
+    """Generate non-root navigation files after all MDX outputs exist.
+
+    With parents, only the _meta.ts files of those parents (and missing ones)
+    are written; the entries of all parents are still returned.
+    """
     if not pages:
         return []
+    children_index = children_index or ChildrenIndex(var_dir)
 
     nodes_by_id = {str(page["page_id"]): page for page in pages}
     root_id = str(pages[0]["page_id"])
@@ -318,7 +646,7 @@ def generate_navigation(
         if parent_id == root_id:
             continue
 
-        children = _supported_children(parent, var_dir, nodes_by_id)
+        children = _supported_children(parent, children_index, nodes_by_id)
         if not children:
             continue
 
@@ -340,8 +668,9 @@ def generate_navigation(
             meta_lines.append(f"  '{slug}': '{title}',")
 
         meta_lines.extend(["};", ""])
-        meta_path.parent.mkdir(parents=True, exist_ok=True)
-        meta_path.write_text("\n".join(meta_lines), encoding="utf-8")
+        if parents is None or parent_id in parents or not meta_path.is_file():
+            meta_path.parent.mkdir(parents=True, exist_ok=True)
+            note_changed(write_if_changed(str(meta_path), "\n".join(meta_lines)))
         entries.append({
             "page_id": parent_id,
             "type": str(parent.get("type") or "page"),
@@ -417,10 +746,12 @@ def _validated_manifest_path(output_root: Path, relative_value: Any) -> Path:
 def _planned_output_paths(
     pages: Sequence[Mapping[str, Any]],
     var_dir: Path,
+    children_index: Optional[ChildrenIndex] = None,
 ) -> set[str]:
     """Calculate all MDX/navigation paths without creating output files."""
     if not pages:
         return set()
+    children_index = children_index or ChildrenIndex(var_dir)
 
     root_id = str(pages[0]["page_id"])
     nodes_by_id = {str(page["page_id"]): page for page in pages}
@@ -437,7 +768,7 @@ def _planned_output_paths(
         parent_id = str(parent["page_id"])
         if parent_id == root_id:
             continue
-        if _supported_children(parent, var_dir, nodes_by_id):
+        if _supported_children(parent, children_index, nodes_by_id):
             parent_path = _output_relative_path(parent)
             planned_paths.add(
                 (parent_path.with_suffix("") / "_meta.ts").as_posix()
@@ -451,6 +782,7 @@ def _other_profile_planned_paths(
     sync_code: str,
     var_dir: Path,
     output_root: Path,
+    children_index: Optional[ChildrenIndex] = None,
 ) -> Dict[str, set[str]]:
     """Load current sibling catalogs, falling back to manifests if absent."""
     manifest_dir = manifest_path.parent
@@ -471,7 +803,7 @@ def _other_profile_planned_paths(
         catalog_path = var_dir / f"pages.{sibling_code}.yaml"
         if catalog_path.exists():
             sibling_pages = load_pages_yaml(str(catalog_path))
-            sibling_paths = _planned_output_paths(sibling_pages, var_dir)
+            sibling_paths = _planned_output_paths(sibling_pages, var_dir, children_index)
         else:
             sibling_manifest = (
                 manifest_dir
@@ -499,9 +831,11 @@ def _ensure_exclusive_output_plan(
     pages: Sequence[Mapping[str, Any]],
     var_dir: Path,
     output_root: Path,
+    children_index: Optional[ChildrenIndex] = None,
 ) -> None:
     """Reject cross-profile current output collisions before writing files."""
-    current_paths = _planned_output_paths(pages, var_dir)
+    children_index = children_index or ChildrenIndex(var_dir)
+    current_paths = _planned_output_paths(pages, var_dir, children_index)
     for relative_path in current_paths:
         _validated_manifest_path(output_root, relative_path)
     for sibling_code, sibling_paths in _other_profile_planned_paths(
@@ -509,6 +843,7 @@ def _ensure_exclusive_output_plan(
         sync_code,
         var_dir,
         output_root,
+        children_index,
     ).items():
         conflicts = sorted(current_paths & sibling_paths)
         if conflicts:
@@ -552,6 +887,7 @@ def _remove_empty_parents(path: Path, output_root: Path) -> None:
         parent = parent.parent
 
 
+@profiling.timed('convert_all.manifest')
 def finalize_manifest(
     manifest_path: Path,
     sync_code: str,
@@ -604,6 +940,7 @@ def finalize_manifest(
                     f"Refusing to delete non-file manifest path: {stale_relative_path}"
                 )
             stale_path.unlink()
+            note_changed()
             _remove_empty_parents(stale_path, output_root)
 
     manifest_path.parent.mkdir(parents=True, exist_ok=True)
@@ -631,13 +968,137 @@ def finalize_manifest(
     os.replace(temp_path, manifest_path)
 
 
+class _PageTask(NamedTuple):
+    index: int
+    page_id: str
+    input_file: str
+    output_file: str
+    attachment_dir: str
+
+
+# Pages catalog and conversion cache of a conversion worker process, set up once by its initializer.
+_worker_catalog = None
+_worker_cache: Optional[ConversionCache] = None
+
+
+def _init_conversion_worker(var_dir: str, pages_yaml: str, log_level: str,
+                            cache_dir: str = '', profile: bool = False) -> None:
+    """Load the converter and the pages catalog once per worker process.
+
+    With profile, the worker records stage timings and counters and hands
+    them back with every page for the parent's --profile report.
+    """
+    global _worker_catalog, _worker_cache
+    from converter.cli import load_catalog, resolve_pages_yaml_path
+
+    if profile:
+        profiling.PROFILER.enable()
+    root_logger = logging.getLogger()
+    for handler in list(root_logger.handlers):
+        root_logger.removeHandler(handler)
+    root_logger.setLevel(getattr(logging, log_level.upper()))
+    pages_yaml_path = resolve_pages_yaml_path(var_dir, pages_yaml or None)
+    _worker_catalog = load_catalog(pages_yaml_path)
+    _worker_cache = ConversionCache(cache_dir, pages_yaml_path) if cache_dir else None
+
+
+def _convert_page_in_worker(task: _PageTask, public_dir: str,
+                            parser: str = DEFAULT_PARSER,
+                            ) -> Tuple[Optional[str], bool, int, Optional[Dict[str, Any]]]:
+    """Convert one page in a worker process.
+
+    Returns (error, cached, changed, profile). error is None on success, or the
+    captured converter log on failure, matching the stderr the converter/cli.py
+    subprocess would have reported. cached tells whether the outputs were
+    restored from the conversion cache, and changed is the number of output
+    files written for the page. profile holds the worker's stage
+    timings and counters for this page when profiling is enabled, else None.
+    """
+    from converter.cli import LOG_FORMAT, convert_file, format_conversion_error
+
+    buffer = io.StringIO()
+    handler = logging.StreamHandler(buffer)
+    handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    root_logger = logging.getLogger()
+    root_logger.addHandler(handler)
+    hits = _worker_cache.hits if _worker_cache else 0
+    take_changed()
+    try:
+        convert_file(
+            task.input_file,
+            task.output_file,
+            public_dir,
+            _worker_catalog,
+            attachment_dir=task.attachment_dir,
+            parser=parser,
+            cache=_worker_cache,
+        )
+        error, cached = None, bool(_worker_cache and _worker_cache.hits > hits)
+    except Exception as exc:
+        logging.error(format_conversion_error(exc))
+        error, cached = buffer.getvalue().strip(), False
+    finally:
+        root_logger.removeHandler(handler)
+    return error, cached, take_changed(), profiling.take() if profiling.enabled() else None
+
+
+def _convert_pages_in_process(
+    tasks: Sequence[_PageTask],
+    jobs: int,
+    var_dir: str,
+    public_dir: str,
+    pages_yaml: str,
+    log_level: str,
+    parser: str = DEFAULT_PARSER,
+    cache_dir: str = '',
+):
+    """Convert pages across a process pool, yielding (task, error, cached) as they finish."""
+    with ProcessPoolExecutor(
+        max_workers=jobs,
+        initializer=_init_conversion_worker,
+        initargs=(var_dir, pages_yaml, log_level, cache_dir, profiling.enabled()),
+    ) as executor:
+        futures = {
+            executor.submit(_convert_page_in_worker, task, public_dir, parser): task
+            for task in tasks
+        }
+        for future in as_completed(futures):
+            task = futures[future]
+            try:
+                error, cached, changed, profile = future.result()
+                note_changed(changed)
+                profiling.merge(profile)
+            except Exception as exc:
+                # A crashed worker fails only the pages it was handed.
+                error, cached = f"conversion worker failed: {exc!r}", False
+            yield task, error, cached
+
+
 def convert_all(pages: List[Dict], var_dir: str, output_base_dir: str, public_dir: str,
                 log_level: str, pages_yaml: str = '',
                 manifest_path: str = '', sync_code: str = 'qm',
                 base_url: str = _DEFAULT_CONFLUENCE_BASE_URL,
                 space_key: str = '', redirects_path: str = '',
-                redirect_date: date | None = None) -> int:
-    """Convert typed catalog nodes and return the number of failures."""
+                redirect_date: date | None = None,
+                jobs: int = 0,
+                parser: str = DEFAULT_PARSER,
+                cache_dir: str = '',
+                incremental: bool = False) -> int:
+    """Convert typed catalog nodes and return the number of failures.
+
+    With jobs=0 each page runs in its own converter/cli.py subprocess.
+    With jobs>=1 pages are converted in-process across that many workers,
+    each of which loads the pages catalog only once.
+    parser selects the XHTML parser backend of the converter.
+    With cache_dir, pages whose converter inputs are unchanged are restored
+    from the conversion cache instead of converted again.
+    Output files whose content did not change are not rewritten, and the run
+    reports how many files under output_base_dir and public_dir changed.
+    With incremental and cache_dir, only the pages, folders and navigation
+    files planned by ConversionState are regenerated; the manifest still
+    lists every output.
+    """
+    take_changed()
     # Skip the root page
     root_page_id = pages[0]['page_id'] if pages else None
     targets = [p for p in pages if p['page_id'] != root_page_id]
@@ -651,7 +1112,39 @@ def convert_all(pages: List[Dict], var_dir: str, output_base_dir: str, public_di
 
     total = len(targets)
     failures = 0
-    generated_outputs: List[Dict[str, str]] = []
+    generated_by_index: Dict[int, Dict[str, str]] = {}
+    page_tasks: List[_PageTask] = []
+    cache = None
+    if cache_dir:
+        from converter.cli import resolve_pages_yaml_path
+        cache = ConversionCache(cache_dir, pages_yaml or resolve_pages_yaml_path(var_dir))
+    cache_hits = 0
+    skipped = 0  # pages left as is by an incremental run
+    # Shared by the output preflight, folder pages and navigation
+    children_index = ChildrenIndex(var_path, cache_dir)
+    state = None
+    plan = None
+    if incremental and cache_dir:
+        state = ConversionState(cache_dir, {
+            "converter": converter_stamp(),
+            "convert_all": hashlib.sha256(Path(__file__).read_bytes()).hexdigest(),
+            "parser": parser,
+            "pages_yaml": os.path.abspath(pages_yaml),
+            "output_dir": os.path.abspath(output_base_dir),
+            "public_dir": os.path.abspath(public_dir),
+            "base_url": base_url,
+            "space_key": effective_space_key,
+        })
+        with profiling.stage('convert_all.plan'):
+            plan = state.plan(pages, var_path, output_base_path, children_index)
+        if state.stored is None:
+            print(f"Incremental: no matching state in {state.path}, converting everything", file=sys.stderr)
+        else:
+            print(
+                f"Incremental: {len(plan.pages)} pages to convert ({plan.changed} changed, "
+                f"{plan.linked} linking to them), {len(plan.parents)} folders/navigation parents",
+                file=sys.stderr,
+            )
 
     if manifest_path:
         try:
@@ -661,6 +1154,7 @@ def convert_all(pages: List[Dict], var_dir: str, output_base_dir: str, public_di
                 pages,
                 var_path,
                 output_base_path.resolve(),
+                children_index,
             )
         except Exception as exc:
             print(f"  ERROR: output ownership preflight failed: {exc}", file=sys.stderr)
@@ -679,7 +1173,10 @@ def convert_all(pages: List[Dict], var_dir: str, output_base_dir: str, public_di
         try:
             relative_path = _output_relative_path(page)
             output_file = output_base_path / relative_path
-            if content_type == "folder":
+            if plan is not None and not plan.needs(page_id, content_type):
+                skipped += content_type == "page"
+                profiling.count('incremental_skips')
+            elif content_type == "folder":
                 print(f"[{i}/{total}] {page_id} → {output_file}", file=sys.stderr)
                 generate_folder_mdx(
                     page,
@@ -688,6 +1185,7 @@ def convert_all(pages: List[Dict], var_dir: str, output_base_dir: str, public_di
                     output_base_path,
                     base_url,
                     effective_space_key,
+                    children_index,
                 )
             else:
                 input_file = var_path / page_id / "page.xhtml"
@@ -696,35 +1194,110 @@ def convert_all(pages: List[Dict], var_dir: str, output_base_dir: str, public_di
 
                 output_file.parent.mkdir(parents=True, exist_ok=True)
                 attachment_dir = Path("/") / relative_path.with_suffix("")
-                cmd = [
-                    sys.executable, str(_SCRIPT_DIR / 'converter' / 'cli.py'),
-                    str(input_file), str(output_file),
-                    f'--public-dir={public_dir}',
-                    f'--attachment-dir={attachment_dir}',
-                    f'--log-level={log_level}',
-                ]
-                if pages_yaml:
-                    cmd.append(f'--pages-yaml={pages_yaml}')
-
-                print(f"[{i}/{total}] {page_id} → {output_file}", file=sys.stderr)
-                result = subprocess.run(cmd, capture_output=True, text=True)
-                if result.returncode != 0:
-                    raise ConversionError(result.stderr.strip())
-
-            generated_outputs.append({
+                if cache is not None and cache.restore(
+                    str(input_file), str(output_file), public_dir,
+                    cache.key(str(input_file), str(output_file), str(attachment_dir), parser=parser),
+                ) is not None:
+                    print(f"[{i}/{total}] {page_id} → {output_file} (cached)", file=sys.stderr)
+                    cache_hits += 1
+                    profiling.count('convert_cache_hits')
+                elif jobs > 0:
+                    page_tasks.append(_PageTask(
+                        i,
+                        page_id,
+                        str(input_file),
+                        str(output_file),
+                        str(attachment_dir),
+                    ))
+                    continue
+                else:
+                    cmd = [
+                        sys.executable, str(_SCRIPT_DIR / 'converter' / 'cli.py'),
+                        str(input_file), str(output_file),
+                        f'--public-dir={public_dir}',
+                        f'--attachment-dir={attachment_dir}',
+                        f'--log-level={log_level}',
+                        '--print-changed-outputs',
+                    ]
+                    if parser != DEFAULT_PARSER:
+                        cmd.append(f'--parser={parser}')
+                    if pages_yaml:
+                        cmd.append(f'--pages-yaml={pages_yaml}')
+                    if cache_dir:
+                        cmd.append(f'--cache-dir={cache_dir}')
+
+                    print(f"[{i}/{total}] {page_id} → {output_file}", file=sys.stderr)
+                    profiling.count('subprocesses')
+                    with profiling.stage('convert_all.page_subprocess'):
+                        result = subprocess.run(cmd, capture_output=True, text=True)
+                    if result.returncode != 0:
+                        raise ConversionError(result.stderr.strip())
+                    changed = parse_changed_outputs(result.stdout)
+                    if changed is None:
+                        # 변환은 성공했으므로 page를 실패로 세지 않는다
+                        logging.warning(f"{page_id}: converter did not report its changed outputs; counting 0")
+                        changed = 0
+                    note_changed(changed)
+
+            generated_by_index[i] = {
                 "page_id": page_id,
                 "type": content_type,
                 "kind": "mdx",
                 "path": relative_path.as_posix(),
-            })
+            }
         except Exception as exc:
             failures += 1
             print(f"  ERROR: {exc}", file=sys.stderr)
 
+    if page_tasks:
+        for task, error, cached in _convert_pages_in_process(
+            page_tasks,
+            jobs,
+            var_dir,
+            public_dir,
+            pages_yaml,
+            log_level,
+            parser,
+            cache_dir,
+        ):
+            print(
+                f"[{task.index}/{total}] {task.page_id} → {task.output_file}",
+                file=sys.stderr,
+            )
+            cache_hits += cached
+            if error is not None:
+                failures += 1
+                print(f"  ERROR: {error}", file=sys.stderr)
+                continue
+            generated_by_index[task.index] = {
+                "page_id": task.page_id,
+                "type": "page",
+                "kind": "mdx",
+                "path": _output_relative_path(
+                    nodes_by_id[task.page_id]
+                ).as_posix(),
+            }
+
+    generated_outputs: List[Dict[str, str]] = [
+        generated_by_index[index] for index in sorted(generated_by_index)
+    ]
+    if cache is not None:
+        converted_pages = sum(1 for entry in generated_outputs if entry["type"] == "page") - skipped
+        print(
+            f"Conversion cache: {cache_hits} hits, {converted_pages - cache_hits} misses ({cache_dir})",
+            file=sys.stderr,
+        )
+
     if failures == 0:
         try:
             generated_outputs.extend(
-                generate_navigation(pages, var_path, output_base_path)
+                generate_navigation(
+                    pages,
+                    var_path,
+                    output_base_path,
+                    children_index,
+                    plan.parents if plan is not None else None,
+                )
             )
         except Exception as exc:
             failures += 1
@@ -744,6 +1317,12 @@ def convert_all(pages: List[Dict], var_dir: str, output_base_dir: str, public_di
             failures += 1
             print(f"  ERROR: manifest finalization failed: {exc}", file=sys.stderr)
 
+    children_index.save()
+    if state is not None and failures == 0:
+        state.save()
+    changed = take_changed()
+    profiling.count('outputs_changed', changed)
+    print(f"Output files changed: {changed} ({output_base_dir}, {public_dir})", file=sys.stderr)
     return failures
 
 
@@ -777,7 +1356,32 @@ def main():
     parser.add_argument('--log-level', default='warning',
                         choices=['debug', 'info', 'warning', 'error', 'critical'],
                         help='Log level for converter/cli.py (default: warning)')
+    parser.add_argument('--jobs', type=int, default=0, metavar='N',
+                        help='Convert pages in-process across N worker processes '
+                             '(default: 0, one converter/cli.py subprocess per page)')
+    parser.add_argument('--parser', choices=PARSER_BACKENDS, default=DEFAULT_PARSER,
+                        help=f'XHTML parser backend of the converter (default: {DEFAULT_PARSER}); '
+                             'lxml is faster, verify with tests/run-tests.sh --type parser-parity')
+    parser.add_argument('--cache-dir', default='',
+                        help='Enable the conversion cache in this directory (e.g. cache/convert); unchanged '
+                             'pages are restored instead of converted (default: no cache)')
+    parser.add_argument('--clear-cache', action='store_true',
+                        help='Remove all conversion cache entries of --cache-dir before converting')
+    parser.add_argument('--incremental', action='store_true',
+                        help='Only convert pages whose inputs or catalog entries changed since the last '
+                             'incremental run, the pages linking to them, and the affected folders and '
+                             '_meta.ts files; the state is kept in the cache directory')
+    profiling.add_arguments(parser)
     args = parser.parse_args()
+    if args.jobs < 0:
+        parser.error('--jobs must be zero or a positive integer')
+    if args.parser not in available_parsers():
+        parser.error(f'--parser {args.parser} requires the lxml package (pip install lxml)')
+    if args.incremental and not args.cache_dir:
+        parser.error('--incremental keeps its state in the cache directory and requires --cache-dir')
+    if args.clear_cache and not args.cache_dir:
+        parser.error('--clear-cache requires --cache-dir')
+    profiling.start_from_args('convert_all', args)
 
     # Auto-derive pages-yaml from sync-code if not explicitly provided
     if args.pages_yaml is None:
@@ -790,6 +1394,8 @@ def main():
     args.public_dir = _resolve(args.public_dir)
     args.translations = _resolve(args.translations)
     args.redirects_file = _resolve(args.redirects_file)
+    if args.cache_dir:
+        args.cache_dir = _resolve(args.cache_dir)
     manifest_path = os.path.join(
         args.var_dir,
         "convert-manifests",
@@ -820,6 +1426,10 @@ def main():
     if args.verify_translations:
         sys.exit(0)
 
+    if args.clear_cache:
+        removed = clear_cache(args.cache_dir)
+        print(f"Cleared {removed} conversion cache entries from {args.cache_dir}", file=sys.stderr)
+
     # Run conversions
     failures = convert_all(pages, args.var_dir, args.output_dir, args.public_dir, args.log_level,
                            pages_yaml=args.pages_yaml,
@@ -827,7 +1437,11 @@ def main():
                            sync_code=args.sync_code,
                            base_url=args.base_url,
                            space_key=space_key,
-                           redirects_path=args.redirects_file)
+                           redirects_path=args.redirects_file,
+                           jobs=args.jobs,
+                           parser=args.parser,
+                           cache_dir=args.cache_dir,
+                           incremental=args.incremental)
 
     if failures:
         print(f"\nCompleted with {failures} failure(s) out of {len(pages)} pages", file=sys.stderr)
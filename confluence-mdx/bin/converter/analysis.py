@@ -0,0 +1,150 @@
+"""
+Single-pass applicability analysis for the forward converter.
+
+The converter dispatch asks the same questions about a subtree many times:
+whether it can be rendered inline (SingleLineParser.applicable), which tag names
+occur below it (TableToNativeMarkdown.applicable), and whether it contains a
+callout (StructuredMacroToCallout/AdfExtensionToCallout.has_applicable_nodes).
+DocumentAnalysis answers all of them from facts computed bottom-up in one
+pass over the document, so every query is O(1) after the pass.
+"""
+
+from typing import Dict, FrozenSet, List
+
+from bs4 import NavigableString, Tag
+
+# Tags that SingleLineParser renders inline when all of their children are inline.
+INLINE_CONTAINER_NAMES = frozenset({
+    'span',
+    'strong', 'em', 'code', 'u',
+    'br', 'a',
+    'ac:inline-comment-marker',
+    'ac:emoticon',
+    'time',
+    'ac:adf-fragment-mark', 'ac:adf-fragment-mark-detail',
+})
+# Tags that SingleLineParser renders inline regardless of their children.
+INLINE_LEAF_NAMES = frozenset({'ac:link', 'ac:image', 'ac:adf-fragment-mark'})
+INLINE_MACRO_NAMES = frozenset({'status'})
+
+CALLOUT_MACRO_NAMES = frozenset({'tip', 'info', 'note', 'warning', 'panel'})
+
+_STRUCTURED_MACRO_CALLOUT = 1
+_ADF_EXTENSION_CALLOUT = 2
+
+_NO_NAMES: FrozenSet[str] = frozenset()
+
+
+def is_structured_macro_callout(node) -> bool:
+    """<ac:structured-macro> rendered as a Callout by StructuredMacroToCallout."""
+    return (
+        isinstance(node, Tag)
+        and node.name == 'ac:structured-macro'
+        and node.get('ac:name', '') in CALLOUT_MACRO_NAMES
+    )
+
+
+def is_adf_extension_callout(node) -> bool:
+    """<ac:adf-extension> with a panel <ac:adf-node>, rendered by AdfExtensionToCallout."""
+    if not isinstance(node, Tag) or node.name != 'ac:adf-extension':
+        return False
+    for child in node.children:
+        if isinstance(child, Tag) and child.name == 'ac:adf-node' and child.get('type', '(unknown)') == 'panel':
+            return True
+    return False
+
+
+class DocumentAnalysis:
+    """
+    Per-node facts of a parsed document, keyed by node identity.
+
+    Built for the whole soup by ConfluenceToMarkdown. A query about a node outside
+    the analyzed trees (e.g. a parser used on a standalone fragment) analyzes that
+    node's subtree on first use. The analyzed roots are kept alive so that node
+    identities stay valid; the trees must not be modified after analysis.
+    """
+
+    def __init__(self, root=None):
+        self._roots: List = []
+        self._inline: Dict[int, bool] = {}
+        self._names: Dict[int, FrozenSet[str]] = {}
+        self._callouts: Dict[int, int] = {}
+        self._interned: Dict[FrozenSet[str], FrozenSet[str]] = {_NO_NAMES: _NO_NAMES}
+        if root is not None:
+            self.analyze(root)
+
+    def analyze(self, root) -> None:
+        """Compute facts for root and all of its descendants in one bottom-up pass."""
+        if not isinstance(root, Tag) or id(root) in self._inline:
+            return
+        self._roots.append(root)
+        # In reverse document order every descendant of a node is visited before the node.
+        nodes = [root]
+        nodes.extend(node for node in root.descendants if isinstance(node, Tag))
+        for node in reversed(nodes):
+            if id(node) not in self._inline:
+                self._analyze_node(node)
+
+    def _analyze_node(self, node: Tag) -> None:
+        all_inline = True
+        callouts = 0
+        names = set()
+        for child in node.contents:
+            if isinstance(child, NavigableString):
+                continue
+            key = id(child)
+            all_inline = all_inline and self._inline[key]
+            callouts |= self._callouts[key]
+            names.add(child.name)
+            names.update(self._names[key])
+
+        name = node.name
+        if name in INLINE_CONTAINER_NAMES:
+            inline = all_inline
+        elif name in INLINE_LEAF_NAMES:
+            inline = True
+        elif name == 'ac:structured-macro':
+            inline = node.get('ac:name', '') in INLINE_MACRO_NAMES
+        else:
+            inline = False
+
+        if is_structured_macro_callout(node):
+            callouts |= _STRUCTURED_MACRO_CALLOUT
+        if is_adf_extension_callout(node):
+            callouts |= _ADF_EXTENSION_CALLOUT
+
+        frozen = frozenset(names)
+        key = id(node)
+        self._inline[key] = inline
+        self._names[key] = self._interned.setdefault(frozen, frozen)
+        self._callouts[key] = callouts
+
+    def _ensure(self, node) -> int:
+        key = id(node)
+        if key not in self._inline:
+            self.analyze(node)
+        return key
+
+    def inline_only(self, node) -> bool:
+        """True if SingleLineParser can render the node as a single line."""
+        if isinstance(node, NavigableString):
+            return True
+        return self._inline[self._ensure(node)]
+
+    def descendant_names(self, node) -> FrozenSet[str]:
+        """Names of all descendant tags of the node, excluding the node itself."""
+        if isinstance(node, NavigableString):
+            return _NO_NAMES
+        return self._names[self._ensure(node)]
+
+    def has_structured_macro_callout(self, node) -> bool:
+        """True if the node or a descendant is a callout <ac:structured-macro>."""
+        if isinstance(node, NavigableString):
+            return False
+        return bool(self._callouts[self._ensure(node)] & _STRUCTURED_MACRO_CALLOUT)
+
+    def has_adf_extension_callout(self, node) -> bool:
+        """True if the node or a descendant is a panel <ac:adf-extension>."""
+        if isinstance(node, NavigableString):
+            return False
+        return bool(self._callouts[self._ensure(node)] & _ADF_EXTENSION_CALLOUT)
@@ -0,0 +1,198 @@
+"""
+Content-hash-keyed cache of forward conversion results.
+
+A page converts to the same MDX and sidecar mapping as long as its inputs are
+unchanged: page.xhtml, page.v1.yaml, the pages catalog, the conversion options
+and the converter code itself. ConversionCache stores the MDX, mapping.yaml
+and the attachment copies of each page under a key hashed from all of those,
+and replays them on a hit instead of converting again.
+
+One entry is kept per input file, so the cache does not grow with the number
+of runs; an entry whose key no longer matches is simply overwritten.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import uuid
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple
+
+CACHE_FORMAT = 1
+
+_BIN_DIR = Path(__file__).resolve().parent.parent  # confluence-mdx/bin/
+
+# Sources whose code determines the MDX and the sidecar mapping of a page:
+# the import closure of converter.cli and reverse_sync.sidecar.
+_CONVERTER_SOURCES = (
+    'converter',
+    'reverse_sync',
+    'mdx_to_storage',
+    'artifacts.py',
+    'text_utils.py',
+    'fetch/sync_profiles.py',
+)
+
+
+@lru_cache(maxsize=None)
+def converter_stamp() -> str:
+    """Hash of the converter code and of the libraries that shape its output.
+
+    Any change to a file in _CONVERTER_SOURCES invalidates all cache entries.
+    The stamp is the same in every process, whatever it has imported.
+    """
+    import bs4
+    import yaml
+
+    from artifacts import artifact_format
+
+    # mapping.yaml is written by the C or the pure-Python dumper, as YAML or JSON
+    digest = hashlib.sha256(
+        f'format={CACHE_FORMAT} bs4={bs4.__version__} yaml={yaml.__version__} '
+        f'libyaml={yaml.__with_libyaml__} artifacts={artifact_format()}'.encode()
+    )
+    try:
+        from lxml import etree
+        digest.update(f' lxml={etree.LXML_VERSION}'.encode())
+    except ImportError:
+        pass
+    for name in _CONVERTER_SOURCES:
+        root = _BIN_DIR / name
+        for source in sorted(root.rglob('*.py')) if root.is_dir() else [root]:
+            digest.update(source.relative_to(_BIN_DIR).as_posix().encode())
+            digest.update(source.read_bytes())
+    return digest.hexdigest()
+
+
+def _file_digest(path: str) -> str:
+    try:
+        with open(path, 'rb') as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except FileNotFoundError:
+        return 'missing'
+
+
+@dataclass
+class CachedConversion:
+    """A cache entry: the outputs of one page conversion."""
+    key: str
+    markdown: str
+    mapping: Optional[str]  # mapping.yaml, or None if the sidecar could not be generated
+    attachments: List[Tuple[str, str, str]] = field(default_factory=list)  # (original, output_dir, filename)
+
+
+class ConversionCache:
+    """Conversion results under cache_dir, keyed by the hash of the converter inputs."""
+
+    def __init__(self, cache_dir: str, catalog_path: str):
+        self.cache_dir = cache_dir
+        self.catalog_digest = _file_digest(catalog_path)
+        self.hits = 0  # restore() outcomes in this process
+        self.misses = 0
+
+    def key(self, input_file: str, output_file: str,
+            attachment_dir: Optional[str] = None,
+            language: Optional[str] = None,
+            page_dir: Optional[str] = None,
+            parser: str = 'html.parser') -> str:
+        """Hash of everything the MDX and mapping.yaml of input_file depend on."""
+        input_file = os.path.normpath(input_file)
+        page_data_dir = page_dir or os.path.dirname(input_file)
+        parts = [
+            converter_stamp(),
+            self.catalog_digest,
+            _file_digest(input_file),
+            _file_digest(os.path.join(page_data_dir, 'page.v1.yaml')),
+            os.path.normpath(output_file),  # language detection and relative links
+            attachment_dir or '',
+            language or '',
+            parser,
+        ]
+        return hashlib.sha256('\0'.join(parts).encode('utf-8')).hexdigest()
+
+    def _entry_path(self, input_file: str) -> str:
+        name = hashlib.sha1(os.path.abspath(input_file).encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, f'{name}.json')
+
+    def lookup(self, input_file: str, key: str) -> Optional[CachedConversion]:
+        try:
+            with open(self._entry_path(input_file), 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('key') != key:
+                return None
+            return CachedConversion(
+                key=key,
+                markdown=data['markdown'],
+                mapping=data.get('mapping'),
+                attachments=[tuple(item) for item in data.get('attachments', [])],
+            )
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def restore(self, input_file: str, output_file: str, public_dir: str, key: str,
+                skip_image_copy: bool = False) -> Optional[str]:
+        """Write the cached outputs of input_file and return the MDX, or None on a miss."""
+        entry = self.lookup(input_file, key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        from converter.core import copy_attachment
+        from converter.output import note_changed, write_if_changed
+        from text_utils import clean_text
+
+        input_dir = os.path.dirname(os.path.normpath(input_file))
+        note_changed(write_if_changed(output_file, entry.markdown))
+        if entry.mapping is not None:
+            write_if_changed(os.path.join(input_dir, 'mapping.yaml'), entry.mapping)
+        if not skip_image_copy:
+            for original, output_dir, filename in entry.attachments:
+                note_changed(copy_attachment(
+                    clean_text(os.path.join(input_dir, original)),
+                    os.path.normpath(os.path.join(public_dir, './' + output_dir)),
+                    filename,
+                ))
+        self.hits += 1
+        logging.info(f"Restored {output_file} from conversion cache")
+        return entry.markdown
+
+    def store(self, input_file: str, key: str, markdown: str, mapping: Optional[str],
+              attachments: Iterable) -> None:
+        """Record the outputs of a successful conversion; failures to write are only logged."""
+        entry = {
+            'format': CACHE_FORMAT,
+            'key': key,
+            'markdown': markdown,
+            'mapping': mapping,
+            'attachments': [
+                [attachment.original, attachment.output_dir, attachment.filename]
+                for attachment in attachments
+                if hasattr(attachment, 'original')  # attachments without ri:filename are never copied
+            ],
+        }
+        path = self._entry_path(input_file)
+        temp_path = f'{path}.{uuid.uuid4().hex}.tmp'
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(entry, f, ensure_ascii=False)
+            os.replace(temp_path, path)
+        except OSError as e:
+            logging.warning(f"Failed to write conversion cache entry for {input_file}: {e}")
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+
+
+def clear_cache(cache_dir: str) -> int:
+    """Remove every cache entry under cache_dir and return how many were removed."""
+    removed = 0
+    if not os.path.isdir(cache_dir):
+        return removed
+    for name in os.listdir(cache_dir):
+        if name.endswith('.json') or name.endswith('.tmp'):
+            os.unlink(os.path.join(cache_dir, name))
+            removed += 1
+    return removed
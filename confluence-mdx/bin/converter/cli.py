@@ -11,7 +11,7 @@ import logging
 import os
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import NamedTuple, Optional
 
 # Resolve project root (confluence-mdx/) from this script's location
 # bin/converter/cli.py -> .parent=converter/ -> .parent=bin/ -> .parent=confluence-mdx/
@@ -22,14 +22,243 @@ _PROJECT_DIR = _SCRIPT_DIR.parent                     # confluence-mdx/
 if str(_SCRIPT_DIR) not in sys.path:
     sys.path.insert(0, str(_SCRIPT_DIR))
 
-import converter.context as ctx
+from converter.cache import ConversionCache
 from converter.context import (
-    PAGES_BY_TITLE, PAGES_BY_ID,
-    PageV1,
-    load_pages_yaml, load_page_v1_yaml, build_link_mapping,
-    set_page_v1, get_attachments,
+    ConversionContext, PageCatalog, PageV1,
+    load_page_catalog, load_page_v1_yaml, build_link_mapping,
 )
 from converter.core import ConfluenceToMarkdown
+from converter.output import format_changed_outputs, note_changed, take_changed, write_if_changed
+from converter.xhtml_parser import DEFAULT_PARSER, PARSER_BACKENDS, available_parsers
+import profiling
+
+LOG_FORMAT = '%(levelname)s - %(funcName)s:%(lineno)d - %(message)s'
+
+
+def format_conversion_error(e: Exception) -> str:
+    """Describe a conversion failure with the innermost frame of its traceback."""
+    import traceback
+    tb = traceback.extract_tb(e.__traceback__)
+    if tb:
+        last_frame = tb[-1]
+        file_name = last_frame.filename.split('/')[-1]
+        line_no = last_frame.lineno
+        func_name = last_frame.name
+        code = last_frame.line
+        return f"Error during conversion: {e} (in {file_name}, function '{func_name}', line {line_no}, code: '{code}')"
+    return f"Error during conversion: {e}"
+
+
+def detect_language(output_file_path: str) -> str:
+    """Detect the language code from a 2-letter path component of the output path."""
+    # Extract language code from the output file path
+    path_parts = os.path.normpath(output_file_path).split(os.sep)
+
+    # Look for 2-letter language code in the path
+    detected_language = 'en'  # Default to English
+    for part in path_parts:
+        if len(part) == 2 and part.isalpha():
+            # Check if it's a known language code
+            if part in ['ko', 'ja', 'en']:
+                detected_language = part
+                break
+    return detected_language
+
+
+def resolve_pages_yaml_path(var_dir: str, pages_yaml: Optional[str] = None) -> str:
+    """Resolve the pages YAML path under var_dir.
+
+    Priority: --pages-yaml arg > pages.qm.yaml (new naming) > pages.yaml (legacy).
+    """
+    if pages_yaml:
+        return pages_yaml
+    pages_yaml_path = os.path.join(var_dir, 'pages.qm.yaml')
+    if not os.path.exists(pages_yaml_path):
+        pages_yaml_path = os.path.join(var_dir, 'pages.yaml')
+    return pages_yaml_path
+
+
+@profiling.timed('convert.load_catalog')
+def load_catalog(pages_yaml_path: str) -> PageCatalog:
+    """Load pages YAML as a read-only catalog for internal link resolution.
+
+    A long-lived process (e.g. a convert_all worker) loads it once and then
+    passes it to convert_file() for every page; the catalog is safe to share.
+    """
+    return load_page_catalog(pages_yaml_path)
+
+
+class PageConversion(NamedTuple):
+    """Result of converting one page in memory."""
+    xhtml: str  # 원본 XHTML — sidecar mapping에서 사용
+    markdown: str
+    context: ConversionContext
+    lost_infos: dict
+
+
+@profiling.timed('convert.page')
+def convert_xhtml(xhtml: str, catalog: PageCatalog,
+                  page_v1: Optional[PageV1] = None,
+                  input_file: str = '',
+                  output_file: str = '',
+                  public_dir: str = '',
+                  attachment_dir: Optional[str] = None,
+                  skip_image_copy: bool = False,
+                  language: Optional[str] = None,
+                  parser: str = DEFAULT_PARSER) -> PageConversion:
+    """Convert XHTML held in memory to Markdown and lost info, without touching the MDX or sidecar.
+
+    page_v1 is the parsed page.v1.yaml of the page, if any. input_file only
+    locates the page directory that holds the attachments and names the page
+    in log messages; it does not have to exist. output_file is used for
+    language detection and link resolution only. Attachments are still copied
+    unless skip_image_copy is set.
+    """
+    context = ConversionContext(
+        catalog=catalog,
+        input_file_path=os.path.normpath(input_file) if input_file else '',  # Normalize path for cross-platform compatibility
+        output_file_path=os.path.normpath(output_file) if output_file else '',
+    )
+
+    input_dir = os.path.dirname(context.input_file_path)
+    # Set an attachment directory if provided
+    if attachment_dir:
+        output_dir = attachment_dir
+        logging.info(f"Using attachment directory: {output_dir}")
+    else:
+        output_file_stem = Path(output_file).stem
+        output_dir = os.path.join(os.path.dirname(output_file), output_file_stem)
+        logging.info(f"Using default attachment directory: {output_dir}")
+
+    # Determine language: explicit --language takes precedence over path detection
+    if language:
+        context.language = language
+        logging.info(f"Language set explicitly: {context.language}")
+    else:
+        context.language = detect_language(context.output_file_path)
+        logging.info(f"Detected language from output path: {context.language}")
+
+    context.page_v1 = page_v1
+    # Build link mapping from page.v1.yaml for external link pageId resolution
+    context.link_mapping = build_link_mapping(page_v1)
+
+    with profiling.stage('convert.parse'):
+        converter = ConfluenceToMarkdown(xhtml, context=context, parser=parser)
+    with profiling.stage('convert.attachments'):
+        converter.load_attachments(input_dir, output_dir, public_dir,
+                                   skip_image_copy=skip_image_copy)
+    with profiling.stage('convert.markdown'):
+        markdown_content = converter.as_markdown()
+    profiling.count('pages_converted')
+    return PageConversion(xhtml, markdown_content, context, converter.lost_infos)
+
+
+def convert_page(input_file: str, output_file: str, public_dir: str,
+                 catalog: PageCatalog,
+                 attachment_dir: Optional[str] = None,
+                 skip_image_copy: bool = False,
+                 language: Optional[str] = None,
+                 page_dir: Optional[str] = None,
+                 parser: str = DEFAULT_PARSER) -> PageConversion:
+    """Convert one XHTML file to Markdown without writing the MDX or sidecar.
+
+    output_file is used for language detection and link resolution only.
+    Attachments are still copied unless skip_image_copy is set.
+    """
+    with open(input_file, 'r', encoding='utf-8') as f:
+        html_content = f.read()
+
+    # Load page.v1.yaml: --page-dir 우선, 없으면 input_dir에서 탐색
+    page_data_dir = page_dir if page_dir else os.path.dirname(os.path.normpath(input_file))
+    page_v1: Optional[PageV1] = load_page_v1_yaml(os.path.join(page_data_dir, 'page.v1.yaml'))
+
+    return convert_xhtml(
+        html_content, catalog,
+        page_v1=page_v1,
+        input_file=input_file,
+        output_file=output_file,
+        public_dir=public_dir,
+        attachment_dir=attachment_dir,
+        skip_image_copy=skip_image_copy,
+        language=language,
+        parser=parser,
+    )
+
+
+@profiling.timed('convert.sidecar')
+def write_sidecar_mapping(result: PageConversion) -> Optional[str]:
+    """Write mapping.yaml next to the input file and return it, or None if it could not be generated.
+
+    A sidecar failure is only logged; it never fails the conversion itself.
+    """
+    try:
+        from reverse_sync.sidecar import generate_sidecar_mapping
+        page_v1 = result.context.page_v1
+        page_id = str(page_v1.get('id')) if page_v1 else ''
+        sidecar_yaml = generate_sidecar_mapping(
+            result.xhtml, result.markdown, page_id,
+            lost_infos=result.lost_infos,
+        )
+        mapping_path = os.path.join(os.path.dirname(result.context.input_file_path), 'mapping.yaml')
+        write_if_changed(mapping_path, sidecar_yaml)
+        return sidecar_yaml
+    except Exception as e:
+        logging.warning(f"Sidecar mapping 생성 실패 (변환은 성공): {e}")
+        return None
+
+
+def convert_file(input_file: str, output_file: str, public_dir: str,
+                 catalog: PageCatalog,
+                 attachment_dir: Optional[str] = None,
+                 skip_image_copy: bool = False,
+                 language: Optional[str] = None,
+                 page_dir: Optional[str] = None,
+                 parser: str = DEFAULT_PARSER,
+                 cache: Optional[ConversionCache] = None) -> str:
+    """Convert one XHTML file to MDX in-process and return the Markdown.
+
+    Per-page state (input path, language, page.v1, link mapping, attachments)
+    lives in a fresh ConversionContext, so concurrent calls sharing one catalog
+    do not interfere with each other.
+    With a cache, unchanged inputs are restored from it instead of converted,
+    and a fresh conversion is stored in it.
+    Raises on conversion failure; a sidecar mapping failure is only logged.
+    """
+    cache_key = None
+    if cache is not None:
+        cache_key = cache.key(input_file, output_file, attachment_dir, language, page_dir, parser)
+        cached_markdown = cache.restore(input_file, output_file, public_dir, cache_key,
+                                        skip_image_copy=skip_image_copy)
+        if cached_markdown is not None:
+            profiling.count('convert_cache_hits')
+            return cached_markdown
+
+    result = convert_page(
+        input_file, output_file, public_dir, catalog,
+        attachment_dir=attachment_dir,
+        skip_image_copy=skip_image_copy,
+        language=language,
+        page_dir=page_dir,
+        parser=parser,
+    )
+    context = result.context
+    markdown_content = result.markdown
+
+    note_changed(write_if_changed(output_file, markdown_content))
+
+    for it in context.attachments:
+        if it.used:
+            logging.debug(f'Attachment {it} is used.')
+        else:
+            logging.warning(f'Attachment {it} is NOT used.')
+
+    sidecar_yaml = write_sidecar_mapping(result)
+
+    if cache is not None:
+        cache.store(input_file, cache_key, markdown_content, sidecar_yaml, context.attachments)
+
+    logging.info(f"Successfully converted {input_file} to {output_file}")
+    return markdown_content
 
 
 def main():
@@ -54,115 +283,47 @@ def main():
                         choices=['debug', 'info', 'warning', 'error', 'critical'],
                         default='info',
                         help='Set the logging level (default: info)')
+    parser.add_argument('--cache-dir',
+                        help='Conversion cache directory; restore unchanged pages from it and store new results')
+    parser.add_argument('--parser',
+                        choices=PARSER_BACKENDS,
+                        default=DEFAULT_PARSER,
+                        help=f'XHTML parser backend (default: {DEFAULT_PARSER}); '
+                             'lxml is faster, verify with tests/run-tests.sh --type parser-parity')
+    parser.add_argument('--print-changed-outputs', action='store_true',
+                        help='Print the number of output files (MDX, attachments) written as a '
+                             '"changed-outputs: N" line on stdout; used by convert_all.py')
+    profiling.add_arguments(parser)
     args = parser.parse_args()
+    if args.parser not in available_parsers():
+        parser.error(f'--parser {args.parser} requires the lxml package (pip install lxml)')
 
     # Configure logging with the specified level
     log_level = getattr(logging, args.log_level.upper())
-    logging.basicConfig(level=log_level, format='%(levelname)s - %(funcName)s:%(lineno)d - %(message)s')
-
-    # Store the input file path in shared context
-    ctx.INPUT_FILE_PATH = os.path.normpath(args.input_file)  # Normalize path for cross-platform compatibility
-    ctx.OUTPUT_FILE_PATH = os.path.normpath(args.output_file)
-
-    input_dir = os.path.dirname(ctx.INPUT_FILE_PATH)
-    # Set an attachment directory if provided
-    if args.attachment_dir:
-        output_dir = args.attachment_dir
-        logging.info(f"Using attachment directory: {output_dir}")
-    else:
-        output_file_stem = Path(args.output_file).stem
-        output_dir = os.path.join(os.path.dirname(args.output_file), output_file_stem)
-        logging.info(f"Using default attachment directory: {output_dir}")
-
-    # Determine language: explicit --language takes precedence over path detection
-    if args.language:
-        ctx.LANGUAGE = args.language
-        logging.info(f"Language set explicitly: {ctx.LANGUAGE}")
-    else:
-        # Extract language code from the output file path
-        path_parts = ctx.OUTPUT_FILE_PATH.split(os.sep)
-
-        # Look for 2-letter language code in the path
-        detected_language = 'en'  # Default to English
-        for part in path_parts:
-            if len(part) == 2 and part.isalpha():
-                # Check if it's a known language code
-                if part in ['ko', 'ja', 'en']:
-                    detected_language = part
-                    break
-
-        ctx.LANGUAGE = detected_language
-        logging.info(f"Detected language from output path: {ctx.LANGUAGE}")
+    logging.basicConfig(level=log_level, format=LOG_FORMAT)
+    profiling.start_from_args('converter', args)
 
     try:
-        with open(args.input_file, 'r', encoding='utf-8') as f:
-            html_content = f.read()
-
-        # 원본 XHTML 보존 — sidecar mapping에서 사용
-        xhtml_original = html_content
-
         # Load pages YAML for internal link resolution.
-        # Priority: --pages-yaml arg > pages.qm.yaml (new naming) > pages.yaml (legacy).
-        var_dir = os.path.join(input_dir, '..')
-        if args.pages_yaml:
-            pages_yaml_path = args.pages_yaml
-        else:
-            pages_yaml_path = os.path.join(var_dir, 'pages.qm.yaml')
-            if not os.path.exists(pages_yaml_path):
-                pages_yaml_path = os.path.join(var_dir, 'pages.yaml')
-        load_pages_yaml(pages_yaml_path, PAGES_BY_TITLE, PAGES_BY_ID)
-
-        # Load page.v1.yaml: --page-dir 우선, 없으면 input_dir에서 탐색
-        page_data_dir = args.page_dir if args.page_dir else input_dir
-        page_v1: Optional[PageV1] = load_page_v1_yaml(os.path.join(page_data_dir, 'page.v1.yaml'))
-        set_page_v1(page_v1)
-
-        # Build link mapping from page.v1.yaml for external link pageId resolution
-        ctx.GLOBAL_LINK_MAPPING = build_link_mapping(page_v1)
-
-        converter = ConfluenceToMarkdown(html_content)
-        converter.load_attachments(input_dir, output_dir, args.public_dir,
-                                   skip_image_copy=args.skip_image_copy)
-        markdown_content = converter.as_markdown()
-
-        with open(args.output_file, 'w', encoding='utf-8') as f:
-            f.write(markdown_content)
-
-        attachments = get_attachments()
-        for it in attachments:
-            if it.used:
-                logging.debug(f'Attachment {it} is used.')
-            else:
-                logging.warning(f'Attachment {it} is NOT used.')
-
-        # Sidecar mapping 생성 (실패해도 변환 자체는 차단하지 않음)
-        try:
-            from reverse_sync.sidecar import generate_sidecar_mapping
-            page_id = str(page_v1.get('id')) if page_v1 else ''
-            sidecar_yaml = generate_sidecar_mapping(
-                xhtml_original, markdown_content, page_id,
-                lost_infos=converter.lost_infos,
-            )
-            mapping_path = os.path.join(input_dir, 'mapping.yaml')
-            with open(mapping_path, 'w', encoding='utf-8') as f:
-                f.write(sidecar_yaml)
-        except Exception as e:
-            logging.warning(f"Sidecar mapping 생성 실패 (변환은 성공): {e}")
-
-        logging.info(f"Successfully converted {args.input_file} to {args.output_file}")
-
+        input_dir = os.path.dirname(os.path.normpath(args.input_file))
+        pages_yaml_path = resolve_pages_yaml_path(os.path.join(input_dir, '..'), args.pages_yaml)
+        catalog = load_catalog(pages_yaml_path)
+        convert_file(
+            args.input_file,
+            args.output_file,
+            args.public_dir,
+            catalog,
+            attachment_dir=args.attachment_dir,
+            skip_image_copy=args.skip_image_copy,
+            language=args.language,
+            page_dir=args.page_dir,
+            parser=args.parser,
+            cache=ConversionCache(args.cache_dir, pages_yaml_path) if args.cache_dir else None,
+        )
+        if args.print_changed_outputs:
+            print(format_changed_outputs(take_changed()))
     except Exception as e:
-        import traceback
-        tb = traceback.extract_tb(e.__traceback__)
-        if tb:
-            last_frame = tb[-1]
-            file_name = last_frame.filename.split('/')[-1]
-            line_no = last_frame.lineno
-            func_name = last_frame.name
-            code = last_frame.line
-            logging.error(f"Error during conversion: {e} (in {file_name}, function '{func_name}', line {line_no}, code: '{code}')")
-        else:
-            logging.error(f"Error during conversion: {e}")
+        logging.error(format_conversion_error(e))
         sys.exit(1)
 
 
@@ -2,21 +2,25 @@
 """
 Converter Context Module
 
-Provides global state, type definitions, and utility functions
-for the Confluence XHTML to Markdown conversion process.
+Provides the per-conversion context, the shared pages catalog, type definitions,
+and utility functions for the Confluence XHTML to Markdown conversion process.
 """
 
 import logging
 import os
 import re
 import unicodedata
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional, Dict, List, Any, TypedDict
+from types import MappingProxyType
+from typing import Optional, Callable, Dict, Iterable, List, Any, Mapping, TypedDict
 from urllib.parse import unquote, urlparse
 
 import yaml
 from bs4 import BeautifulSoup, NavigableString
 
+import pages_catalog
+from converter.analysis import DocumentAnalysis
 from text_utils import clean_text
 
 try:
@@ -58,18 +62,6 @@ class PageInfo(TypedDict, total=False):
 # Type alias for pages dictionary
 PagesDict = Dict[str, PageInfo]
 
-# Global variable to store an input file path
-INPUT_FILE_PATH = ""
-OUTPUT_FILE_PATH = ""
-LANGUAGE = 'en'
-
-# Global variables to store data
-PAGES_BY_TITLE: PagesDict = {}
-PAGES_BY_ID: PagesDict = {}
-GLOBAL_PAGE_V1: Optional[PageV1] = None
-GLOBAL_ATTACHMENTS: List = []
-GLOBAL_LINK_MAPPING: Dict[str, str] = {}  # Mapping of link text -> pageId from page.v1.yaml
-
 # Confluence status macro color to Badge component color mapping
 CONFLUENCE_COLOR_TO_BADGE_COLOR = {
     'Green': 'green',
@@ -81,12 +73,211 @@ CONFLUENCE_COLOR_TO_BADGE_COLOR = {
     'Purple': 'purple',
 }
 
-def confluence_url():
-    if GLOBAL_PAGE_V1:
-        page_id = GLOBAL_PAGE_V1.get('id')
-        return f'https://querypie.atlassian.net/wiki/spaces/QM/pages/{page_id}/'
-    else:
-        return 'https://querypie.atlassian.net/wiki/spaces/QM/overview'
+
+def _frozen_page(page: Mapping[str, Any]) -> Mapping[str, Any]:
+    return MappingProxyType(dict(page))
+
+
+class PageCatalog:
+    """
+    Read-only indexes of pages.yaml, keyed by title_orig and by page_id.
+
+    A catalog is built once and shared by every conversion in a process
+    (or thread pool); neither the indexes nor the page entries can be mutated.
+    """
+
+    __slots__ = ('by_title', 'by_id')
+
+    def __init__(self, by_title: Mapping[str, PageInfo], by_id: Mapping[str, PageInfo]):
+        self.by_title: Mapping[str, PageInfo] = MappingProxyType(
+            {title: _frozen_page(page) for title, page in by_title.items()})
+        self.by_id: Mapping[str, PageInfo] = MappingProxyType(
+            {page_id: self.by_title.get(page.get('title_orig'), _frozen_page(page))
+             for page_id, page in by_id.items()})
+
+    def __len__(self) -> int:
+        return len(self.by_id)
+
+    def __reduce__(self):
+        # MappingProxyType cannot be pickled; rebuild from plain dicts instead.
+        return (PageCatalog, (
+            {title: dict(page) for title, page in self.by_title.items()},
+            {page_id: dict(page) for page_id, page in self.by_id.items()},
+        ))
+
+    @classmethod
+    def from_pages(cls, pages: Iterable[Any]) -> 'PageCatalog':
+        """
+        Build a catalog from pages.yaml entries
+
+        Entries without a title_orig, and later entries with a duplicate title_orig, are skipped.
+        """
+        pages_by_title: PagesDict = {}
+        pages_by_id: PagesDict = {}
+        for page in pages:
+            if not isinstance(page, dict):
+                logging.warning(f"Page info must be of type dict: {repr(page)}")
+                continue
+
+            title_orig = page.get('title_orig')
+            if not title_orig:
+                logging.warning(f"Page info must have a title_orig: {repr(page)}")
+                continue
+
+            if title_orig in pages_by_title:
+                logging.warning(f"title_orig ${repr(title_orig)} already exists in pages_by_title: {repr(pages_by_title[title_orig])}")
+                logging.warning(f"title_orig ${repr(title_orig)} is from {repr(page)}")
+                continue
+
+            pages_by_title[title_orig] = page
+            pages_by_id[page['page_id']] = page
+        return cls(pages_by_title, pages_by_id)
+
+
+EMPTY_CATALOG = PageCatalog({}, {})
+
+
+@dataclass
+class ConversionContext:
+    """
+    State of one page conversion.
+
+    Threaded explicitly through ConfluenceToMarkdown and every parser/converter it
+    creates, so that many conversions can run in one interpreter without sharing
+    mutable state. Only the catalog is shared between contexts.
+    """
+    catalog: PageCatalog = EMPTY_CATALOG
+    input_file_path: str = ''
+    output_file_path: str = ''
+    language: str = 'en'
+    page_v1: Optional[PageV1] = None
+    attachments: List = field(default_factory=list)
+    link_mapping: Mapping[str, str] = field(default_factory=dict)  # Mapping of link text -> pageId from page.v1.yaml
+    analysis: DocumentAnalysis = field(default_factory=DocumentAnalysis)  # Per-node dispatch facts of the document
+
+    def confluence_url(self) -> str:
+        if self.page_v1:
+            page_id = self.page_v1.get('id')
+            return f'https://querypie.atlassian.net/wiki/spaces/QM/pages/{page_id}/'
+        else:
+            return 'https://querypie.atlassian.net/wiki/spaces/QM/overview'
+
+    def convert_confluence_url(self, href: str) -> tuple[str, Optional[str]]:
+        """
+        Convert a Confluence URL to an internal markdown link.
+
+        Args:
+            href: The URL to convert
+
+        Returns:
+            tuple: (converted_href, readable_link_text)
+                   readable_link_text is provided when the original link text (URL) should be replaced
+                   Format:
+                   - Same page segment: "#섹션 제목"
+                   - Different page segment: "문서 제목#섹션 제목" or "Unknown Title#섹션 제목"
+                   - Different page (no segment): "문서 제목" or "Unknown Title"
+        """
+        parsed = parse_confluence_url(href)
+        if not parsed:
+            return href, None
+
+        current_page_id = self.page_v1.get('id', '') if self.page_v1 else ''
+        target_page_id = parsed['page_id']
+        anchor = parsed['anchor']
+
+        if target_page_id == current_page_id and anchor:
+            # Same page segment link - convert to internal anchor
+            decoded_anchor = unquote(anchor).lower()
+            section_title = unquote(anchor).replace('-', ' ')
+            readable_text = f'#{section_title}'
+            logging.debug(f"Converted same-page segment link to #{decoded_anchor}")
+            return f'#{decoded_anchor}', readable_text
+
+        if anchor:
+            # Different page with anchor
+            target_page = self.catalog.by_id.get(target_page_id)
+            decoded_anchor = unquote(anchor).lower()
+            section_title = unquote(anchor).replace('-', ' ')
+            if target_page:
+                target_path = self.relative_path_to_titled_page(target_page.get('title', ''))
+                doc_title = target_page.get('title', 'Unknown Title')
+                readable_text = f'{doc_title}#{section_title}'
+                return f'{target_path}#{decoded_anchor}', readable_text
+            logging.warning(f"Target page {target_page_id} not found in pages dictionary")
+            readable_text = f'Unknown Title#{section_title}'
+            return href, readable_text
+
+        # Different page without anchor
+        target_page = self.catalog.by_id.get(target_page_id)
+        if target_page:
+            return self.relative_path_to_titled_page(target_page.get('title', '')), target_page.get('title')
+        logging.warning(f"Target page {target_page_id} not found in pages dictionary")
+        return href, 'Unknown Title'
+
+    def relative_path_to_titled_page(self, title: str):
+        if self.page_v1:
+            this_title = self.page_v1.get('title')
+            this_page = self.catalog.by_title.get(this_title)
+        else:
+            this_page = None
+            logging.warning(f"Page v1 not found in {self.input_file_path}")
+
+        if title:
+            target_page = self.catalog.by_title.get(title)
+        else:
+            target_page = None
+
+        if this_page and target_page:
+            relative_path = calculate_relative_path(this_page.get('path'), target_page.get('path'))
+            if relative_path:
+                href = relative_path
+            else:
+                href = "#invalid-relative-path"
+        elif not target_page:
+            logging.warning(f"Target title '{title}' not found in pages dictionary")
+            href = "#target-title-not-found"
+        else:
+            logging.warning(f"Unexpected failure of relative_path_to_titled_page: {title}")
+            href = "#unexpected-failure"
+        return href
+
+    def resolve_external_link(self, link_text: str, space_key: str, target_title: str) -> str:
+        """
+        Resolve external Confluence link URL using pageId from the link mapping
+
+        This method attempts to generate an accurate Confluence URL for external links
+        (links to pages outside the current conversion scope) by looking up the pageId
+        from link_mapping. If pageId is not found, it falls back to space overview
+        or error link.
+
+        Args:
+            link_text (str): The link body text to match in link_mapping
+            space_key (str): The Confluence space key
+            target_title (str): The target page title (for logging purposes)
+
+        Returns:
+            str: The resolved URL in one of these formats:
+                - With pageId: https://querypie.atlassian.net/wiki/spaces/{space_key}/pages/{page_id}
+                - Without pageId but with space_key: https://querypie.atlassian.net/wiki/spaces/{space_key}/overview
+                - Without space_key: #link-error
+        """
+        page_id = self.link_mapping.get(link_text)
+
+        if page_id and space_key:
+            # Generate accurate URL with pageId
+            href = f'https://querypie.atlassian.net/wiki/spaces/{space_key}/pages/{page_id}'
+            logging.info(f"Generated external Confluence link with pageId for '{link_text}' (title: '{target_title}'): {href}")
+            return href
+        elif space_key:
+            # Fallback to space overview URL if no pageId found
+            href = f'https://querypie.atlassian.net/wiki/spaces/{space_key}/overview'
+            logging.warning(f"No pageId found for '{link_text}', using space overview for '{target_title}' in space '{space_key}': {href}")
+            return href
+        else:
+            # No space key - show simple error message
+            href = '#link-error'
+            logging.warning(f"No space key found for external link to '{target_title}', using error anchor: {href}")
+            return href
 
 
 def parse_confluence_url(href: str) -> Optional[Dict[str, str]]:
@@ -123,132 +314,30 @@ def parse_confluence_url(href: str) -> Optional[Dict[str, str]]:
     }
 
 
-def convert_confluence_url(href: str) -> tuple[str, Optional[str]]:
-    """
-    Convert a Confluence URL to an internal markdown link.
-
-    Args:
-        href: The URL to convert
-
-    Returns:
-        tuple: (converted_href, readable_link_text)
-               readable_link_text is provided when the original link text (URL) should be replaced
-               Format:
-               - Same page segment: "#섹션 제목"
-               - Different page segment: "문서 제목#섹션 제목" or "Unknown Title#섹션 제목"
-               - Different page (no segment): "문서 제목" or "Unknown Title"
-    """
-    parsed = parse_confluence_url(href)
-    if not parsed:
-        return href, None
-
-    current_page_id = GLOBAL_PAGE_V1.get('id', '') if GLOBAL_PAGE_V1 else ''
-    target_page_id = parsed['page_id']
-    anchor = parsed['anchor']
-
-    if target_page_id == current_page_id and anchor:
-        # Same page segment link - convert to internal anchor
-        decoded_anchor = unquote(anchor).lower()
-        section_title = unquote(anchor).replace('-', ' ')
-        readable_text = f'#{section_title}'
-        logging.debug(f"Converted same-page segment link to #{decoded_anchor}")
-        return f'#{decoded_anchor}', readable_text
-
-    if anchor:
-        # Different page with anchor
-        target_page = PAGES_BY_ID.get(target_page_id)
-        decoded_anchor = unquote(anchor).lower()
-        section_title = unquote(anchor).replace('-', ' ')
-        if target_page:
-            target_path = relative_path_to_titled_page(target_page.get('title', ''))
-            doc_title = target_page.get('title', 'Unknown Title')
-            readable_text = f'{doc_title}#{section_title}'
-            return f'{target_path}#{decoded_anchor}', readable_text
-        logging.warning(f"Target page {target_page_id} not found in pages dictionary")
-        readable_text = f'Unknown Title#{section_title}'
-        return href, readable_text
-
-    # Different page without anchor
-    target_page = PAGES_BY_ID.get(target_page_id)
-    if target_page:
-        return relative_path_to_titled_page(target_page.get('title', '')), target_page.get('title')
-    logging.warning(f"Target page {target_page_id} not found in pages dictionary")
-    return href, 'Unknown Title'
-
-
-def load_pages_yaml(yaml_path: str, pages_by_title: PagesDict, pages_by_id: PagesDict):
+def load_page_catalog(yaml_path: str) -> PageCatalog:
     """
-    Load the pages.yaml file and populate the provided dictionaries with page information
+    Load the pages.yaml file into a read-only PageCatalog
 
     Args:
         yaml_path: Path to the pages.yaml file
-        pages_by_title: Dictionary to be populated with title as key and page info as value
-        pages_by_id: Dictionary to be populated with page_id as key and page info as value
 
     Returns:
-        PagesDict: Dictionary with title as key and page info as value, or empty dict if file doesn't exist
+        PageCatalog: Catalog indexed by title_orig and page_id, or an empty catalog if the file doesn't exist or has errors
     """
     try:
-        with open(yaml_path, 'r', encoding='utf-8') as f:
-            yaml_string = f.read()
-            yaml_data = yaml.safe_load(yaml_string)
-
-            # Convert a list to dictionary with title as a key
-            pages_dict: PagesDict = {}
-            if isinstance(yaml_data, list):
-                for page in yaml_data:
-                    if not isinstance(page, dict):
-                        logging.warning(f"Page info must be of type dict: {repr(page)}")
-                        continue
-
-                    title_orig = page.get('title_orig')
-                    if not title_orig:
-                        logging.warning(f"Page info must have a title_orig: {repr(page)}")
-                        continue
-
-                    if title_orig in pages_by_title:
-                        logging.warning(f"title_orig ${repr(title_orig)} already exists in pages_by_title: {repr(pages_by_title[title_orig])}")
-                        logging.warning(f"title_orig ${repr(title_orig)} is from {repr(page)}")
-                        continue
-
-                    pages_by_title[title_orig] = page
-                    pages_by_id[page['page_id']] = page
-
-            logging.info(f"Successfully loaded pages.yaml from {yaml_path} with {len(pages_by_id)} pages")
-            return pages_dict
+        yaml_data = pages_catalog.load_pages(yaml_path)
+        catalog = PageCatalog.from_pages(yaml_data if isinstance(yaml_data, list) else [])
+        logging.info(f"Successfully loaded pages.yaml from {yaml_path} with {len(catalog)} pages")
+        return catalog
     except FileNotFoundError:
         logging.warning(f"Pages YAML file not found: {yaml_path}")
-        return {}
+        return EMPTY_CATALOG
     except yaml.YAMLError as e:
         logging.error(f"Error parsing YAML file {yaml_path}: {e}")
-        return {}
+        return EMPTY_CATALOG
     except Exception as e:
         logging.error(f"Error loading pages.yaml from {yaml_path}: {e}")
-        return {}
-
-
-def get_page_v1() -> Optional[PageV1]:
-    """Get the current page_v1 data"""
-    global GLOBAL_PAGE_V1
-    return GLOBAL_PAGE_V1
-
-
-def get_attachments() -> List:
-    """Get the current attachments list"""
-    global GLOBAL_ATTACHMENTS
-    return GLOBAL_ATTACHMENTS
-
-
-def set_page_v1(page_v1: Optional[PageV1]) -> None:
-    """Set the current page_v1 data"""
-    global GLOBAL_PAGE_V1
-    GLOBAL_PAGE_V1 = page_v1
-
-
-def set_attachments(attachments: List) -> None:
-    """Set the current attachments list"""
-    global GLOBAL_ATTACHMENTS
-    GLOBAL_ATTACHMENTS = attachments
+        return EMPTY_CATALOG
 
 
 def calculate_relative_path(current_path: List[str], target_path: List[str]):
@@ -274,34 +363,6 @@ def calculate_relative_path(current_path: List[str], target_path: List[str]):
     return relative_path
 
 
-def relative_path_to_titled_page(title: str):
-    if get_page_v1():
-        this_title = get_page_v1().get('title')
-        this_page = PAGES_BY_TITLE.get(this_title)
-    else:
-        this_page = None
-        logging.warning(f"Page v1 not found in {INPUT_FILE_PATH}")
-
-    if title:
-        target_page = PAGES_BY_TITLE.get(title)
-    else:
-        target_page = None
-
-    if this_page and target_page:
-        relative_path = calculate_relative_path(this_page.get('path'), target_page.get('path'))
-        if relative_path:
-            href = relative_path
-        else:
-            href = "#invalid-relative-path"
-    elif not target_page:
-        logging.warning(f"Target title '{title}' not found in pages dictionary")
-        href = "#target-title-not-found"
-    else:
-        logging.warning(f"Unexpected failure of relative_path_to_titled_page: {title}")
-        href = "#unexpected-failure"
-    return href
-
-
 def load_page_v1_yaml(yaml_path: str) -> Optional[PageV1]:
     """
     Load page.v1.yaml file and return as a dictionary object
@@ -376,45 +437,6 @@ def build_link_mapping(page_v1: Optional[PageV1]) -> Dict[str, str]:
     return link_map
 
 
-def resolve_external_link(link_text: str, space_key: str, target_title: str) -> str:
-    """
-    Resolve external Confluence link URL using pageId from global link mapping
-
-    This function attempts to generate an accurate Confluence URL for external links
-    (links to pages outside the current conversion scope) by looking up the pageId
-    from GLOBAL_LINK_MAPPING. If pageId is not found, it falls back to space overview
-    or error link.
-
-    Args:
-        link_text (str): The link body text to match in GLOBAL_LINK_MAPPING
-        space_key (str): The Confluence space key
-        target_title (str): The target page title (for logging purposes)
-
-    Returns:
-        str: The resolved URL in one of these formats:
-            - With pageId: https://querypie.atlassian.net/wiki/spaces/{space_key}/pages/{page_id}
-            - Without pageId but with space_key: https://querypie.atlassian.net/wiki/spaces/{space_key}/overview
-            - Without space_key: #link-error
-    """
-    page_id = GLOBAL_LINK_MAPPING.get(link_text)
-
-    if page_id and space_key:
-        # Generate accurate URL with pageId
-        href = f'https://querypie.atlassian.net/wiki/spaces/{space_key}/pages/{page_id}'
-        logging.info(f"Generated external Confluence link with pageId for '{link_text}' (title: '{target_title}'): {href}")
-        return href
-    elif space_key:
-        # Fallback to space overview URL if no pageId found
-        href = f'https://querypie.atlassian.net/wiki/spaces/{space_key}/overview'
-        logging.warning(f"No pageId found for '{link_text}', using space overview for '{target_title}' in space '{space_key}': {href}")
-        return href
-    else:
-        # No space key - show simple error message
-        href = '#link-error'
-        logging.warning(f"No space key found for external link to '{target_title}', using error anchor: {href}")
-        return href
-
-
 def backtick_curly_braces(text):
     """
     Wrap text embraced by curly braces with backticks.
@@ -512,6 +534,20 @@ def split_into_sentences(line):
 
     return sentences
 
+def log_lazy(level: int, message: Callable[[], str]) -> None:
+    """
+    Log message() at level, building the message only if the level is enabled.
+
+    Use this in converter hot paths instead of logging.debug(f"...") when the
+    message walks the tree (node.text, str(node), ancestors(), print_node_with_properties()),
+    so that a disabled level costs a level check rather than a subtree traversal.
+    The log record is attributed to the caller, as with a direct logging call.
+    """
+    logger = logging.getLogger()
+    if logger.isEnabledFor(level):
+        logger.log(level, message(), stacklevel=2)
+
+
 def ancestors(node):
     max_depth = 20
     stack = []
@@ -22,21 +22,24 @@ from itertools import chain
 from typing import Optional, List
 from urllib.parse import unquote
 
-from bs4 import BeautifulSoup, Tag, NavigableString
+from bs4 import Tag, NavigableString
 from bs4.element import CData
 
-import converter.context as ctx
+from converter.analysis import (
+    INLINE_CONTAINER_NAMES, DocumentAnalysis,
+    is_adf_extension_callout, is_structured_macro_callout,
+)
 from converter.context import (
-    PAGES_BY_TITLE,
+    ConversionContext,
     CONFLUENCE_COLOR_TO_BADGE_COLOR,
-    confluence_url, parse_confluence_url, convert_confluence_url,
-    get_page_v1, get_attachments, set_page_v1, set_attachments,
-    relative_path_to_titled_page, resolve_external_link,
+    parse_confluence_url,
     backtick_curly_braces, navigable_string_as_markdown, split_into_sentences,
-    ancestors, print_node_with_properties, get_html_attributes,
+    ancestors, print_node_with_properties, get_html_attributes, log_lazy,
     datetime_ko_format, normalize_screenshots, clean_text,
 )
 from converter.lost_info import LostInfoCollector
+from converter.output import note_changed
+from converter.xhtml_parser import DEFAULT_PARSER, parse_xhtml
 
 try:
     import emoji
@@ -44,6 +47,33 @@ except ImportError:
     pass
 
 
+def copy_attachment(source_file: str, destination_dir: str, filename: str) -> bool:
+    """Copy an attachment into destination_dir unless a file is already there; return whether it copied."""
+    if os.path.exists(source_file):
+        logging.debug(f"Source file found: {repr(source_file)}")
+    else:
+        logging.warning(f"Source file not found: {repr(source_file)}")
+        return False
+
+    logging.debug(f"Destination directory: {destination_dir}")
+    if not os.path.exists(destination_dir):
+        logging.debug(f"Destination directory not found: {repr(destination_dir)}")
+        os.makedirs(destination_dir)
+    destination_file = os.path.join(destination_dir, filename)
+    if os.path.exists(destination_file):
+        # compare source_file and destination_file are equivalent.
+        if filecmp.cmp(source_file, destination_file):
+            # Leave the mtime alone so that builds do not see an unchanged file as modified
+            logging.debug(f"Destination file already exists: {repr(destination_file)}")
+        else:
+            logging.warning(f"Destination file already exists but different: {repr(destination_file)}")
+        return False
+    shutil.copyfile(source_file, destination_file)
+    # Change file permission to 0644
+    os.chmod(destination_file, 0o644)
+    return True
+
+
 class Attachment:
     """
     <ri:attachment filename="image-20240725-070857.png" version-at-save="1">
@@ -51,10 +81,12 @@ class Attachment:
     """
 
     def __init__(self, node: Tag, input_dir: str, output_dir: str, public_dir: str,
-                 collector: LostInfoCollector | None = None) -> None:
+                 collector: LostInfoCollector | None = None,
+                 context: ConversionContext | None = None) -> None:
         filename = node.get('ri:filename', '')
         if not filename:
-            logging.warning(f"add_attachment: Unexpected {print_node_with_properties(node)} from {ancestors(node)} in {ctx.INPUT_FILE_PATH}")
+            input_file_path = context.input_file_path if context else ''
+            log_lazy(logging.WARNING, lambda: f"add_attachment: Unexpected {print_node_with_properties(node)} from {ancestors(node)} in {input_file_path}")
             return
 
         # Apply unicodedata.normalize to prevent unmatched string comparison.
@@ -75,31 +107,12 @@ class Attachment:
         return f'{"{"}filename="{self.filename}",original="{self.original}"{"}"}'
 
     def copy_to_destination(self) -> None:
-        source_file = clean_text(os.path.join(self.input_dir, self.original))
-        if os.path.exists(source_file):
-            logging.debug(f"Source file found: {repr(source_file)}")
-        else:
-            logging.warning(f"Source file not found: {repr(source_file)}")
-            return
-
         logging.debug(f"public_dir={self.public_dir} output_dir={self.output_dir}")
-        destination_dir = os.path.normpath(os.path.join(self.public_dir, './' + self.output_dir))
-        logging.debug(f"Destination directory: {destination_dir}")
-        if not os.path.exists(destination_dir):
-            logging.debug(f"Destination directory not found: {repr(destination_dir)}")
-            os.makedirs(destination_dir)
-        destination_file = os.path.join(destination_dir, self.filename)
-        if os.path.exists(destination_file):
-            # compare source_file and destination_file are equivalent.
-            if filecmp.cmp(source_file, destination_file):
-                logging.debug(f"Destination file already exists: {repr(destination_file)}")
-                os.utime(destination_file, None)
-            else:
-                logging.warning(f"Destination file already exists but different: {repr(destination_file)}")
-        else:
-            shutil.copyfile(source_file, destination_file)
-            # Change file permission to 0644
-            os.chmod(destination_file, 0o644)
+        note_changed(copy_attachment(
+            clean_text(os.path.join(self.input_dir, self.original)),
+            os.path.normpath(os.path.join(self.public_dir, './' + self.output_dir)),
+            self.filename,
+        ))
 
     def as_markdown(self, caption: Optional[str] = None, width: Optional[str] = None, align: Optional[str] = None) -> str:
         if not caption:
@@ -149,19 +162,13 @@ def _is_unicode_punctuation(ch: str) -> bool:
 
 
 class SingleLineParser:
-    def __init__(self, node, collector: LostInfoCollector | None = None):
+    def __init__(self, node, collector: LostInfoCollector | None = None,
+                 context: ConversionContext | None = None):
         self.node = node
         self.collector = collector
+        self.context = context if context is not None else ConversionContext()
         self.markdown_lines = []
-        self.applicable_nodes = {
-            'span',
-            'strong', 'em', 'code', 'u',
-            'br', 'a',
-            'ac:inline-comment-marker',
-            'ac:emoticon',
-            'time',
-            'ac:adf-fragment-mark', 'ac:adf-fragment-mark-detail',
-        }
+        self.applicable_nodes = INLINE_CONTAINER_NAMES
         self.unapplicable_nodes = {
             'ul', 'ol', 'li',
             'ac:plain-text-body',
@@ -180,29 +187,7 @@ class SingleLineParser:
 
     @property
     def applicable(self):
-
-        def _is_applicable_recursively(node):
-            if isinstance(node, NavigableString):
-                return True
-            elif node.name in self.applicable_nodes:
-                for child in node.children:
-                    if _is_applicable_recursively(child):
-                        pass
-                    else:
-                        return False
-                return True
-            elif node.name in ['ac:link', 'ac:image', 'ac:adf-fragment-mark']:
-                return True
-            elif node.name in ['ac:structured-macro']:
-                attr_name = node.get('ac:name', '')
-                if attr_name in ['status']:
-                    return True
-                else:
-                    return False
-            else:
-                return False
-
-        return _is_applicable_recursively(self.node)
+        return self.context.analysis.inline_only(self.node)
 
     def convert_recursively(self, node):
         """Recursively convert child nodes to Markdown."""
@@ -211,7 +196,7 @@ class SingleLineParser:
             self.markdown_lines.append(text)
             return
 
-        logging.debug(f"SingleLineParser: type={type(node).__name__}, name={node.name}, value={repr(node.text)}")
+        log_lazy(logging.DEBUG, lambda: f"SingleLineParser: type={type(node).__name__}, name={node.name}, value={repr(node.text)}")
         if node.name in self._debug_tags:
             self.markdown_lines.append(f'{print_node_with_properties(node)}')
 
@@ -312,14 +297,14 @@ class SingleLineParser:
                 for child in node.children:
                     if isinstance(child, Tag) and child.name == 'ac:parameter':
                         if child.get('ac:name') == 'title':
-                            title = SingleLineParser(child, collector=self.collector).markdown_of_children(child)
+                            title = SingleLineParser(child, collector=self.collector, context=self.context).markdown_of_children(child)
                         elif child.get('ac:name') == 'colour':
                             confluence_color = child.text.strip()
                             color = CONFLUENCE_COLOR_TO_BADGE_COLOR.get(confluence_color, 'grey')
                 self.markdown_lines.append(f'<Badge color="{color}">{title}</Badge>')
             else:
                 # For other structured macros, we can just log or skip
-                logging.warning(f"SingleLineParser: Unexpected {print_node_with_properties(node)} from {ancestors(node)} in {ctx.INPUT_FILE_PATH}")
+                log_lazy(logging.WARNING, lambda: f"SingleLineParser: Unexpected {print_node_with_properties(node)} from {ancestors(node)} in {self.context.input_file_path}")
                 for child in node.children:
                     self.convert_recursively(child)
         elif node.name in ['ac:parameter']:
@@ -332,7 +317,7 @@ class SingleLineParser:
                 # ac:parameter with colour is not needed in Markdown
                 pass
             else:
-                logging.warning(f"SingleLineParser: Unexpected {print_node_with_properties(node)} from {ancestors(node)} in {ctx.INPUT_FILE_PATH}")
+                log_lazy(logging.WARNING, lambda: f"SingleLineParser: Unexpected {print_node_with_properties(node)} from {ancestors(node)} in {self.context.input_file_path}")
                 for child in node.children:
                     self.convert_recursively(child)
         elif node.name in ['ac:inline-comment-marker']:
@@ -343,8 +328,8 @@ class SingleLineParser:
             # <br/> is a line break. Just keep using <br/>.
             self.markdown_lines.append("<br/>")
         elif node.name in ['a']:
-            href, readable_anchor_text = convert_confluence_url(node.get('href', '#'))
-            link_text = ''.join(SingleLineParser(child, collector=self.collector).as_markdown for child in node.children)
+            href, readable_anchor_text = self.context.convert_confluence_url(node.get('href', '#'))
+            link_text = ''.join(SingleLineParser(child, collector=self.collector, context=self.context).as_markdown for child in node.children)
             if readable_anchor_text and link_text.startswith('http'):
                 link_text = readable_anchor_text
             self.markdown_lines.append(f"[{link_text}]({href})")
@@ -425,13 +410,13 @@ class SingleLineParser:
                     from datetime import datetime
                     date_obj = datetime.fromisoformat(datetime_attr.replace('Z', '+00:00'))
 
-                    if ctx.LANGUAGE == 'ko':
+                    if self.context.language == 'ko':
                         # Korean: YYYY년 MM월 DD일
                         formatted_date = date_obj.strftime('%Y년 %m월 %d일')
-                    elif ctx.LANGUAGE == 'ja':
+                    elif self.context.language == 'ja':
                         # Japanese: YYYY年MM月DD日
                         formatted_date = date_obj.strftime('%Y年%m月%d日')
-                    elif ctx.LANGUAGE == 'en':
+                    elif self.context.language == 'en':
                         # English: Jan 1, 2025
                         formatted_date = date_obj.strftime('%b %d, %Y')
                     else:
@@ -441,15 +426,15 @@ class SingleLineParser:
                     self.markdown_lines.append(formatted_date)
                 except ValueError:
                     # Use original text if date parsing fails
-                    logging.warning(
-                        f"Failed to parse datetime '{datetime_attr}' in {print_node_with_properties(node)} from {ancestors(node)} in {ctx.INPUT_FILE_PATH}")
+                    log_lazy(logging.WARNING, lambda:
+                        f"Failed to parse datetime '{datetime_attr}' in {print_node_with_properties(node)} from {ancestors(node)} in {self.context.input_file_path}")
             else:
                 # Process child nodes if the datetime attribute is not present
-                logging.warning(f"Failed to get datetime attribute in {print_node_with_properties(node)} from {ancestors(node)} in {ctx.INPUT_FILE_PATH}")
+                log_lazy(logging.WARNING, lambda: f"Failed to get datetime attribute in {print_node_with_properties(node)} from {ancestors(node)} in {self.context.input_file_path}")
         elif node.name in ['ac:image']:
             self.convert_inline_image(node)
         else:
-            logging.warning(f"SingleLineParser: Unexpected {print_node_with_properties(node)} from {ancestors(node)} in {ctx.INPUT_FILE_PATH}")
+            log_lazy(logging.WARNING, lambda: f"SingleLineParser: Unexpected {print_node_with_properties(node)} from {ancestors(node)} in {self.context.input_file_path}")
             self.markdown_lines.append(f'[{node.name}]')
             for child in node.children:
                 self.convert_recursively(child)
@@ -466,7 +451,7 @@ class SingleLineParser:
         """
         markdown = []
         for child in node.children:
-            markdown.append(SingleLineParser(child, collector=self.collector).as_markdown)
+            markdown.append(SingleLineParser(child, collector=self.collector, context=self.context).as_markdown)
         return ''.join(markdown)
 
     def convert_ac_link(self, node: Tag) -> str:
@@ -551,7 +536,7 @@ class SingleLineParser:
         # Process child nodes to extract link body and determine href
         for child in node.children:
             if isinstance(child, Tag) and child.name == 'ac:link-body':
-                link_body = SingleLineParser(child, collector=self.collector).as_markdown
+                link_body = SingleLineParser(child, collector=self.collector, context=self.context).as_markdown
 
             elif isinstance(child, Tag) and child.name == 'ri:space':
                 # Handle space links: <ac:link><ri:space ri:space-key="QCP" /></ac:link>
@@ -568,17 +553,17 @@ class SingleLineParser:
                 space_key = child.get('ri:space-key', '')
 
                 # Check if the target page is in pages.yaml
-                target_page = PAGES_BY_TITLE.get(target_title)
+                target_page = self.context.catalog.by_title.get(target_title)
 
                 if target_page:
                     # Internal link - use relative path
-                    href = relative_path_to_titled_page(target_title)
+                    href = self.context.relative_path_to_titled_page(target_title)
                 else:
                     # External link - resolve using pageId from link mapping
                     # Get link_body explicitly to ensure we have the correct text for lookup
                     link_body_node = node.find('ac:link-body')
-                    current_link_body = SingleLineParser(link_body_node, collector=self.collector).as_markdown if link_body_node else link_body
-                    href = resolve_external_link(current_link_body, space_key, target_title)
+                    current_link_body = SingleLineParser(link_body_node, collector=self.collector, context=self.context).as_markdown if link_body_node else link_body
+                    href = self.context.resolve_external_link(current_link_body, space_key, target_title)
 
         # Collect unresolved links
         if self.collector and href == '#link-error':
@@ -601,7 +586,7 @@ class SingleLineParser:
         Converts to Markdown:
             ![image-20240806-095511.png](image-20240806-095511.png){width="760"}
         """
-        logging.debug(f"Processing Confluence image: {node}")
+        log_lazy(logging.DEBUG, lambda: f"Processing Confluence image: {node}")
 
         # Extract width attribute if custom-width is true
         width = None
@@ -623,14 +608,14 @@ class SingleLineParser:
                 # Log warning if the filename is still empty
                 logging.warning("'ri:filename' attribute is empty, check XML namespace handling")
         else:
-            logging.warning(f'No attachment found in <ac:image> from {ancestors(node)}, no filename to use.')
+            log_lazy(logging.WARNING, lambda: f'No attachment found in <ac:image> from {ancestors(node)}, no filename to use.')
 
         # Find matching attachment in attachments list
         markdown = ''
         img_src = ''
         image_filename = unicodedata.normalize('NFC', image_filename)
         if image_filename:
-            attachments = get_attachments()
+            attachments = self.context.attachments
             for it in attachments:
                 if it.original == image_filename:
                     it.used = True
@@ -652,9 +637,11 @@ class SingleLineParser:
 
 
 class MultiLineParser:
-    def __init__(self, node, collector: LostInfoCollector | None = None):
+    def __init__(self, node, collector: LostInfoCollector | None = None,
+                 context: ConversionContext | None = None):
         self.node = node
         self.collector = collector
+        self.context = context if context is not None else ConversionContext()
         self.list_stack = []
         self.markdown_lines = []
         self._debug_markdown = False  # Used when debugging manually
@@ -732,8 +719,8 @@ class MultiLineParser:
         return True
 
     def append_empty_line_unless_first_child(self, node):
-        # Convert generator to list to check length
-        children_list = list(node.parent.children)
+        # Tag.contents is the parent's own child list; copying it per node is O(n^2) for long pages.
+        children_list = node.parent.contents
         if len(children_list) == 1:
             if self._debug_markdown:
                 self.markdown_lines.append(f'<{node.name} the-only-child=true>\n')
@@ -763,11 +750,11 @@ class MultiLineParser:
             if node.parent.name == '[document]' and len(node.text.strip()) == 0:
                 pass
             else:
-                logging.warning(f"MultiLineParser: Unexpected NavigableString {repr(node)} from {ancestors(node)} in {ctx.INPUT_FILE_PATH}")
-                self.markdown_lines.append(f"MultiLineParser: Unexpected NavigableString {repr(node)} of from {ancestors(node)} in {ctx.INPUT_FILE_PATH}")
+                log_lazy(logging.WARNING, lambda: f"MultiLineParser: Unexpected NavigableString {repr(node)} from {ancestors(node)} in {self.context.input_file_path}")
+                self.markdown_lines.append(f"MultiLineParser: Unexpected NavigableString {repr(node)} of from {ancestors(node)} in {self.context.input_file_path}")
             return
 
-        logging.debug(f"MultiLineParser: type={type(node).__name__}, name={node.name}, value={repr(node.text)}")
+        log_lazy(logging.DEBUG, lambda: f"MultiLineParser: type={type(node).__name__}, name={node.name}, value={repr(node.text)}")
         attr_name = node.get('ac:name', '(none)')
         if node.name in [
             '[document]',  # Start processing from the body of the document
@@ -779,14 +766,14 @@ class MultiLineParser:
         elif node.name in ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']:
             # Headings can exist in a <Callout> block.
             self.append_empty_line_unless_first_child(node)
-            self.markdown_lines.append(SingleLineParser(node, collector=self.collector).as_markdown + '\n')
+            self.markdown_lines.append(SingleLineParser(node, collector=self.collector, context=self.context).as_markdown + '\n')
             self.markdown_lines.append('\n')
-        elif node.name in ['ac:structured-macro'] and StructuredMacroToCallout(node).applicable:
+        elif node.name in ['ac:structured-macro'] and StructuredMacroToCallout(node, context=self.context).applicable:
             self.append_empty_line_unless_first_child(node)
-            self.markdown_lines.extend(StructuredMacroToCallout(node, collector=self.collector).as_markdown)
-        elif node.name == 'ac:adf-extension' and AdfExtensionToCallout(node).applicable:
+            self.markdown_lines.extend(StructuredMacroToCallout(node, collector=self.collector, context=self.context).as_markdown)
+        elif node.name == 'ac:adf-extension' and AdfExtensionToCallout(node, context=self.context).applicable:
             self.append_empty_line_unless_first_child(node)
-            self.markdown_lines.extend(AdfExtensionToCallout(node, collector=self.collector).as_markdown)
+            self.markdown_lines.extend(AdfExtensionToCallout(node, collector=self.collector, context=self.context).as_markdown)
         elif node.name in ['ac:structured-macro'] and attr_name in ['code']:
             self.convert_structured_macro_code(node)
         elif node.name in ['ac:structured-macro'] and attr_name in ['expand']:
@@ -797,13 +784,13 @@ class MultiLineParser:
             # Table of contents macro, we can skip it, as toc is provided by the Markdown renderer by default
             logging.info("Skipping TOC macro")
         elif node.name in ['ac:structured-macro'] and attr_name in ['children']:
-            logging.info(f"Unsupported {print_node_with_properties(node)} from {ancestors(node)} in {ctx.INPUT_FILE_PATH}")
+            log_lazy(logging.INFO, lambda: f"Unsupported {print_node_with_properties(node)} from {ancestors(node)} in {self.context.input_file_path}")
             self.markdown_lines.append(f'(Unsupported xhtml node: &lt;ac:structured-macro name="children"&gt;)\n')
         elif node.name in ['blockquote']:
             self.append_empty_line_unless_first_child(node)
             markdown = []
             for child in node.children:
-                markdown.extend(MultiLineParser(child, collector=self.collector).as_markdown)
+                markdown.extend(MultiLineParser(child, collector=self.collector, context=self.context).as_markdown)
             lines = ''.join(markdown).splitlines()
             for to_quote in lines:
                 self.markdown_lines.append(f'> {to_quote}\n')
@@ -814,13 +801,13 @@ class MultiLineParser:
             for child in node.children:
                 self.convert_recursively(child)
         elif node.name == 'table':
-            native_markdown = TableToNativeMarkdown(node, collector=self.collector)
+            native_markdown = TableToNativeMarkdown(node, collector=self.collector, context=self.context)
             if native_markdown.applicable:
                 self.append_empty_line_unless_first_child(node)
                 self.markdown_lines.extend(native_markdown.as_markdown)
             else:
                 self.append_empty_line_unless_first_child(node)
-                self.markdown_lines.extend(TableToHtmlTable(node, collector=self.collector).as_markdown)
+                self.markdown_lines.extend(TableToHtmlTable(node, collector=self.collector, context=self.context).as_markdown)
         elif node.name in ['p', 'div']:
             if not self._is_trailing_empty_p(node):
                 self.append_empty_line_unless_first_child(node)
@@ -830,7 +817,7 @@ class MultiLineParser:
                     # Problem: A paragraph was in a too long line.
                     # Resolve:
                     # - Split a paragraph into sentences. And arrange one sentence in each line.
-                    single_line = SingleLineParser(child, collector=self.collector).as_markdown
+                    single_line = SingleLineParser(child, collector=self.collector, context=self.context).as_markdown
                     # Preserve a leading whitespace in single_line
                     if single_line[0].isspace():
                         child_markdown.append(' ')
@@ -841,18 +828,18 @@ class MultiLineParser:
                     # Preserve an ending whitespace in single_line
                     if single_line[-1].isspace():
                         child_markdown.append(' ')
-                elif SingleLineParser(child, collector=self.collector).applicable:
-                    child_markdown.append(SingleLineParser(child, collector=self.collector).as_markdown)
+                elif SingleLineParser(child, collector=self.collector, context=self.context).applicable:
+                    child_markdown.append(SingleLineParser(child, collector=self.collector, context=self.context).as_markdown)
                 else:
                     if self._debug_markdown:
                         child_markdown.append(f'<{child.name}>')
-                    child_markdown.extend(MultiLineParser(child, collector=self.collector).as_markdown)
+                    child_markdown.extend(MultiLineParser(child, collector=self.collector, context=self.context).as_markdown)
                     if self._debug_markdown:
                         child_markdown.append(f'</{child.name}>')
             # Add an empty line after paragraphs
             self.markdown_lines.append(''.join(child_markdown).strip() + '\n')
         elif node.name in ['span']:
-            self.markdown_lines.append(SingleLineParser(node, collector=self.collector).as_markdown)
+            self.markdown_lines.append(SingleLineParser(node, collector=self.collector, context=self.context).as_markdown)
         elif node.name in ['br']:
             # <br/> is a line break. Just keep using <br/>.
             # Append '\n' for <br/> in MultiLineParser.
@@ -864,13 +851,13 @@ class MultiLineParser:
             self.append_empty_line_unless_first_child(node)
             self.convert_image(node)
         elif node.name in ['a']:
-            self.markdown_lines.append(SingleLineParser(node, collector=self.collector).as_markdown)
+            self.markdown_lines.append(SingleLineParser(node, collector=self.collector, context=self.context).as_markdown)
         elif node.name in ['hr']:
             # Using --- after a sentence means an H2 heading.
             # To prevent ambiguity with headings, use ______ for a horizontal rule.
             self.markdown_lines.append(f'______\n')
         else:
-            logging.warning(f"MultiLineParser: Unexpected {print_node_with_properties(node)} from {ancestors(node)} in {ctx.INPUT_FILE_PATH}")
+            log_lazy(logging.WARNING, lambda: f"MultiLineParser: Unexpected {print_node_with_properties(node)} from {ancestors(node)} in {self.context.input_file_path}")
             self.markdown_lines.append(f'[{node.name}]\n')
             for child in node.children:
                 self.convert_recursively(child)
@@ -885,11 +872,11 @@ class MultiLineParser:
             else:
                 if isinstance(child, NavigableString):
                     if len(child.text.strip()) > 0:
-                        logging.warning(f'Skip extracting NavigableString({repr(child)}) of <{node.name}> from {ancestors(node)} in {ctx.INPUT_FILE_PATH}')
+                        log_lazy(logging.WARNING, lambda: f'Skip extracting NavigableString({repr(child)}) of <{node.name}> from {ancestors(node)} in {self.context.input_file_path}')
                     else:
-                        logging.debug(f'Skip extracting NavigableString({repr(child)}) of <{node.name}> from {ancestors(node)} in {ctx.INPUT_FILE_PATH}')
+                        log_lazy(logging.DEBUG, lambda: f'Skip extracting NavigableString({repr(child)}) of <{node.name}> from {ancestors(node)} in {self.context.input_file_path}')
                 else:
-                    logging.warning(f'Skip extracting <{child.name}> of <{node.name}> from {ancestors(node)} in {ctx.INPUT_FILE_PATH}')
+                    log_lazy(logging.WARNING, lambda: f'Skip extracting <{child.name}> of <{node.name}> from {ancestors(node)} in {self.context.input_file_path}')
         self.list_stack.pop()
         return
 
@@ -909,26 +896,26 @@ class MultiLineParser:
             attr_name = child.get('ac:name', '(none)') if not isinstance(child, NavigableString) else '(none)'
             if isinstance(child, NavigableString):
                 if child.text.strip():  # Only process non-empty text nodes
-                    li_itself.append(SingleLineParser(child, collector=self.collector).as_markdown)
+                    li_itself.append(SingleLineParser(child, collector=self.collector, context=self.context).as_markdown)
             elif child.name == 'p':
                 # Process paragraph content
                 if len(li_itself) > 0:
                     li_itself.append('<br/>')
-                li_itself.append(SingleLineParser(child, collector=self.collector).as_markdown)
+                li_itself.append(SingleLineParser(child, collector=self.collector, context=self.context).as_markdown)
             elif child.name == 'ac:image':
                 # Process image separately using MultiLineParser
-                image_markdown = MultiLineParser(child, collector=self.collector).as_markdown
+                image_markdown = MultiLineParser(child, collector=self.collector, context=self.context).as_markdown
                 child_markdown.extend(image_markdown)
             elif child.name in ['ul', 'ol']:
                 pass  # Will be processed later in this method
             elif child.name in ['ac:structured-macro'] and attr_name in ['code']:
-                code_markdown = MultiLineParser(child, collector=self.collector).as_markdown
+                code_markdown = MultiLineParser(child, collector=self.collector, context=self.context).as_markdown
                 child_markdown.extend(code_markdown)
             else:
                 child_markdown.append(f'(Unexpected node name="{child.name}" ac:name="{attr_name}")\n')
 
-        logging.debug(f'li_itself={li_itself}')
-        logging.debug(f'child_markdown={child_markdown}')
+        log_lazy(logging.DEBUG, lambda: f'li_itself={li_itself}')
+        log_lazy(logging.DEBUG, lambda: f'child_markdown={child_markdown}')
 
         itself = ''.join(li_itself)
         self.markdown_lines.append(f'{prefix}{itself}\n')
@@ -957,7 +944,7 @@ class MultiLineParser:
             ![image-20240806-095511.png](image-20240806-095511.png){width="760"}
             *How QueryPie Works*
         """
-        logging.debug(f"Processing Confluence image: {node}")
+        log_lazy(logging.DEBUG, lambda: f"Processing Confluence image: {node}")
 
         # Extract image attributes
         align = node.get('ac:align', 'center')
@@ -980,7 +967,7 @@ class MultiLineParser:
                 # Log warning if the filename is still empty
                 logging.warning("'ri:filename' attribute is empty, check XML namespace handling")
         else:
-            logging.warning(f'No attachment found in <ac:image> from {ancestors(node)}, no filename to use.')
+            log_lazy(logging.WARNING, lambda: f'No attachment found in <ac:image> from {ancestors(node)}, no filename to use.')
 
         # Find a caption if present
         caption_text = ''
@@ -988,13 +975,13 @@ class MultiLineParser:
         if caption:
             caption_paragraph = caption.find('p')
             if caption_paragraph:
-                caption_text = SingleLineParser(caption_paragraph, collector=self.collector).as_markdown
+                caption_text = SingleLineParser(caption_paragraph, collector=self.collector, context=self.context).as_markdown
 
         markdown = ''
         img_src = ''
         image_filename = unicodedata.normalize('NFC', image_filename)
         if image_filename:
-            attachments = get_attachments()
+            attachments = self.context.attachments
             for it in attachments:
                 if it.original == image_filename:
                     it.used = True
@@ -1066,7 +1053,7 @@ class MultiLineParser:
         # Look for code content in the CDATA section
         rich_text_body = node.find('ac:rich-text-body')
         if rich_text_body:
-            self.markdown_lines.extend(MultiLineParser(rich_text_body, collector=self.collector).as_markdown)
+            self.markdown_lines.extend(MultiLineParser(rich_text_body, collector=self.collector, context=self.context).as_markdown)
 
         self.markdown_lines.append(f"</details>\n")
 
@@ -1090,9 +1077,11 @@ class MultiLineParser:
 
 
 class TableToNativeMarkdown:
-    def __init__(self, node, collector: LostInfoCollector | None = None):
+    def __init__(self, node, collector: LostInfoCollector | None = None,
+                 context: ConversionContext | None = None):
         self.node = node
         self.collector = collector
+        self.context = context if context is not None else ConversionContext()
         self.markdown_lines = []
         self.applicable_nodes = {
             'table', 'tbody', 'col', 'tr', 'colgroup', 'th', 'td',
@@ -1117,43 +1106,34 @@ class TableToNativeMarkdown:
 
     @property
     def applicable(self):
-        # Get all child nodes that are not NavigableString (including nested children)
-        descendants = set()
-
-        def collect_node_names(node):
-            for child in node.children:
-                if not isinstance(child, NavigableString):
-                    descendants.add(child.name)
-                    # Recursively collect names from children of children
-                    collect_node_names(child)
-
-        collect_node_names(self.node)
+        # Names of all descendant tags (including nested children)
+        descendants = self.context.analysis.descendant_names(self.node)
         unapplicable_descendants = descendants.difference(self.applicable_nodes)
         if_applicable = descendants.issubset(self.applicable_nodes)
         if descendants.isdisjoint(self.unapplicable_nodes) and if_applicable:
-            logging.info(f"TableToNativeMarkdown: Applicable {print_node_with_properties(self.node)} has {descendants}")
+            log_lazy(logging.INFO, lambda: f"TableToNativeMarkdown: Applicable {print_node_with_properties(self.node)} has {descendants}")
         elif unapplicable_descendants.issubset(self.unapplicable_nodes):
-            logging.info(f"TableToNativeMarkdown: Unapplicable {print_node_with_properties(self.node)} has {descendants}")
-            logging.info(f"TableToNativeMarkdown: Unapplicable due to {unapplicable_descendants} that is a subset of self.unapplicable_nodes")
+            log_lazy(logging.INFO, lambda: f"TableToNativeMarkdown: Unapplicable {print_node_with_properties(self.node)} has {descendants}")
+            log_lazy(logging.INFO, lambda: f"TableToNativeMarkdown: Unapplicable due to {unapplicable_descendants} that is a subset of self.unapplicable_nodes")
         else:
             unexpected = unapplicable_descendants.difference(self.unapplicable_nodes)
-            logging.warning(f"TableToNativeMarkdown: Unapplicable {print_node_with_properties(self.node)} has {descendants}")
-            logging.warning(f"TableToNativeMarkdown: Unapplicable due to {unapplicable_descendants} that has unexpected descendants: {unexpected}")
+            log_lazy(logging.WARNING, lambda: f"TableToNativeMarkdown: Unapplicable {print_node_with_properties(self.node)} has {descendants}")
+            log_lazy(logging.WARNING, lambda: f"TableToNativeMarkdown: Unapplicable due to {unapplicable_descendants} that has unexpected descendants: {unexpected}")
 
         return if_applicable
 
     def convert_recursively(self, node):
         """Recursively convert child nodes to Markdown."""
         if isinstance(node, NavigableString):
-            logging.warning(f"TableToNativeMarkdown: Unexpected NavigableString {repr(node)} from {ancestors(node)} in {ctx.INPUT_FILE_PATH}")
+            log_lazy(logging.WARNING, lambda: f"TableToNativeMarkdown: Unexpected NavigableString {repr(node)} from {ancestors(node)} in {self.context.input_file_path}")
             self.markdown_lines.append(node.text)
             return
 
-        logging.debug(f"TableToNativeMarkdown: type={type(node).__name__}, name={node.name}, value={repr(node.text)}")
+        log_lazy(logging.DEBUG, lambda: f"TableToNativeMarkdown: type={type(node).__name__}, name={node.name}, value={repr(node.text)}")
         if node.name in ['table']:
             self.convert_table(node)
         else:
-            logging.warning(f"TableToNativeMarkdown: Unexpected {print_node_with_properties(node)} from {ancestors(node)} in {ctx.INPUT_FILE_PATH}")
+            log_lazy(logging.WARNING, lambda: f"TableToNativeMarkdown: Unexpected {print_node_with_properties(node)} from {ancestors(node)} in {self.context.input_file_path}")
             self.markdown_lines.append(f'[{node.name}]\n')
             for child in node.children:
                 self.convert_recursively(child)
@@ -1184,7 +1164,7 @@ class TableToNativeMarkdown:
                 colspan = int(cell.get('colspan', 1))
                 rowspan = int(cell.get('rowspan', 1))
 
-                cell_content = SingleLineParser(cell, collector=self.collector).as_markdown
+                cell_content = SingleLineParser(cell, collector=self.collector, context=self.context).as_markdown
 
                 # Add cell content to the current row
                 current_row.append(cell_content)
@@ -1243,9 +1223,11 @@ class TableToNativeMarkdown:
 
 
 class TableToHtmlTable:
-    def __init__(self, node, collector: LostInfoCollector | None = None):
+    def __init__(self, node, collector: LostInfoCollector | None = None,
+                 context: ConversionContext | None = None):
         self.node = node
         self.collector = collector
+        self.context = context if context is not None else ConversionContext()
         self.markdown_lines = []
 
     @property
@@ -1258,11 +1240,11 @@ class TableToHtmlTable:
     def convert_recursively(self, node):
         """Recursively convert child nodes to Markdown."""
         if isinstance(node, NavigableString):
-            logging.warning(f"TableToHtmlTable: Unexpected NavigableString {repr(node)} from {ancestors(node)} in {ctx.INPUT_FILE_PATH}")
+            log_lazy(logging.WARNING, lambda: f"TableToHtmlTable: Unexpected NavigableString {repr(node)} from {ancestors(node)} in {self.context.input_file_path}")
             self.markdown_lines.append(node.text)
             return
 
-        logging.debug(f"TableToHtmlTable: type={type(node).__name__}, name={node.name}, value={repr(node.text)}")
+        log_lazy(logging.DEBUG, lambda: f"TableToHtmlTable: type={type(node).__name__}, name={node.name}, value={repr(node.text)}")
 
         if node.name in ['table', 'thead', 'tbody', 'tfoot', 'tr', 'colgroup']:
             """Convert table node to HTML table markup."""
@@ -1280,34 +1262,36 @@ class TableToHtmlTable:
 
             for child in node.children:
                 if isinstance(child, NavigableString):
-                    self.markdown_lines.append(SingleLineParser(child, collector=self.collector).as_markdown + '\n')
-                elif SingleLineParser(child, collector=self.collector).applicable:
-                    self.markdown_lines.append(SingleLineParser(child, collector=self.collector).as_markdown + '\n')
-                elif MultiLineParser(child, collector=self.collector).is_standalone_dash:
+                    self.markdown_lines.append(SingleLineParser(child, collector=self.collector, context=self.context).as_markdown + '\n')
+                elif SingleLineParser(child, collector=self.collector, context=self.context).applicable:
+                    self.markdown_lines.append(SingleLineParser(child, collector=self.collector, context=self.context).as_markdown + '\n')
+                elif MultiLineParser(child, collector=self.collector, context=self.context).is_standalone_dash:
                     # Wrap dash in <p> to prevent MDX interpreting it as a list marker
                     self.markdown_lines.append(f'<p>-</p>\n')
                 else:
-                    self.markdown_lines.extend(MultiLineParser(child, collector=self.collector).as_markdown)
+                    self.markdown_lines.extend(MultiLineParser(child, collector=self.collector, context=self.context).as_markdown)
 
             self.markdown_lines.append(f"</{node.name}>\n")
         elif node.name == 'col':
             """Convert col node to HTML col markup."""
             attrs = get_html_attributes(node)
             self.markdown_lines.append(f"<col{attrs}/>\n")
-        elif SingleLineParser(node, collector=self.collector).applicable:
+        elif SingleLineParser(node, collector=self.collector, context=self.context).applicable:
             # <ac:adf-fragment-mark> could be converted.
-            self.markdown_lines.append(SingleLineParser(node, collector=self.collector).as_markdown + '\n')
+            self.markdown_lines.append(SingleLineParser(node, collector=self.collector, context=self.context).as_markdown + '\n')
         else:
-            logging.warning(f"TableToHtmlTable: Unexpected {print_node_with_properties(node)} from {ancestors(node)} in {ctx.INPUT_FILE_PATH}")
+            log_lazy(logging.WARNING, lambda: f"TableToHtmlTable: Unexpected {print_node_with_properties(node)} from {ancestors(node)} in {self.context.input_file_path}")
             self.markdown_lines.append(f'[{node.name}]\n')
             for child in node.children:
                 self.convert_recursively(child)
 
 
 class StructuredMacroToCallout:
-    def __init__(self, node, collector: LostInfoCollector | None = None):
+    def __init__(self, node, collector: LostInfoCollector | None = None,
+                 context: ConversionContext | None = None):
         self.node = node
         self.collector = collector
+        self.context = context if context is not None else ConversionContext()
         self.markdown_lines = []
 
     @property
@@ -1319,38 +1303,21 @@ class StructuredMacroToCallout:
 
     @property
     def applicable(self):
-        attr_name = self.node.get('ac:name', '')
-        if self.node.name in ['ac:structured-macro']:
-            if attr_name in ['tip', 'info', 'note', 'warning']:
-                return True
-            elif attr_name in ['panel']:
-                return True
-        return False
+        # tip, info, note, warning and panel macros
+        return is_structured_macro_callout(self.node)
 
     @property
     def has_applicable_nodes(self):
-
-        def _has_applicable_node(node):
-            if isinstance(node, NavigableString):
-                return False
-            elif StructuredMacroToCallout(node).applicable:
-                return True
-            else:
-                for child in node.children:
-                    if _has_applicable_node(child):
-                        return True
-            return False
-
-        return _has_applicable_node(self.node)
+        return self.context.analysis.has_structured_macro_callout(self.node)
 
     def convert_recursively(self, node):
         """Recursively convert child nodes to Markdown."""
         if isinstance(node, NavigableString):
-            logging.warning(f"StructuredMacroToCallout: Unexpected NavigableString {repr(node)} from {ancestors(node)} in {ctx.INPUT_FILE_PATH}")
+            log_lazy(logging.WARNING, lambda: f"StructuredMacroToCallout: Unexpected NavigableString {repr(node)} from {ancestors(node)} in {self.context.input_file_path}")
             # Do not append unexpected NavigableString to markdown_lines.
             return
 
-        logging.debug(f"StructuredMacroToCallout: type={type(node).__name__}, name={node.name}, value={repr(node.text)}")
+        log_lazy(logging.DEBUG, lambda: f"StructuredMacroToCallout: type={type(node).__name__}, name={node.name}, value={repr(node.text)}")
         attr_name = node.get('ac:name', '')
         if node.name in ['ac:structured-macro'] and attr_name in ['tip', 'info', 'note', 'warning']:
             # https://nextra.site/docs/built-ins/callout
@@ -1365,10 +1332,10 @@ class StructuredMacroToCallout:
                 self.markdown_lines.append('<Callout type="error">\n')
             else:
                 self.markdown_lines.append(f'<Callout> {"{"}/* <ac:structured-macro ac:name="{attr_name}"> */{"}"}\n')
-                logging.warning(f"Unexpected {print_node_with_properties(node)} from {ancestors(node)} in {ctx.INPUT_FILE_PATH}")
+                log_lazy(logging.WARNING, lambda: f"Unexpected {print_node_with_properties(node)} from {ancestors(node)} in {self.context.input_file_path}")
 
             for child in node.children:
-                self.markdown_lines.extend(MultiLineParser(child, collector=self.collector).as_markdown)
+                self.markdown_lines.extend(MultiLineParser(child, collector=self.collector, context=self.context).as_markdown)
 
             self.markdown_lines.append('</Callout>\n')
         elif node.name in ['ac:structured-macro'] and attr_name in ['panel']:
@@ -1380,27 +1347,29 @@ class StructuredMacroToCallout:
                 self.markdown_lines.append(f'<Callout type="info" emoji="{parameter.text}">\n')
             else:
                 self.markdown_lines.append('<Callout>\n')
-                logging.warning(
-                    f'Cannot find <ac:parameter ac:name="panelIconText"> under {print_node_with_properties(node)} from {ancestors(node)} in {ctx.INPUT_FILE_PATH}')
+                log_lazy(logging.WARNING, lambda:
+                    f'Cannot find <ac:parameter ac:name="panelIconText"> under {print_node_with_properties(node)} from {ancestors(node)} in {self.context.input_file_path}')
 
             if rich_text_body:
-                self.markdown_lines.extend(MultiLineParser(rich_text_body, collector=self.collector).as_markdown)
+                self.markdown_lines.extend(MultiLineParser(rich_text_body, collector=self.collector, context=self.context).as_markdown)
             else:
-                logging.warning(
-                    f'Cannot find <ac:rich-text-body> under {print_node_with_properties(node)} from {ancestors(node)} in {ctx.INPUT_FILE_PATH}')
+                log_lazy(logging.WARNING, lambda:
+                    f'Cannot find <ac:rich-text-body> under {print_node_with_properties(node)} from {ancestors(node)} in {self.context.input_file_path}')
 
             self.markdown_lines.append('</Callout>\n')
         else:
-            logging.warning(f"StructuredMacroToCallout: Unexpected {print_node_with_properties(node)} from {ancestors(node)} in {ctx.INPUT_FILE_PATH}")
+            log_lazy(logging.WARNING, lambda: f"StructuredMacroToCallout: Unexpected {print_node_with_properties(node)} from {ancestors(node)} in {self.context.input_file_path}")
             self.markdown_lines.append(f'[{node.name}]\n')
             for child in node.children:
                 self.convert_recursively(child)
 
 
 class AdfExtensionToCallout:
-    def __init__(self, node, collector: LostInfoCollector | None = None):
+    def __init__(self, node, collector: LostInfoCollector | None = None,
+                 context: ConversionContext | None = None):
         self.node = node
         self.collector = collector
+        self.context = context if context is not None else ConversionContext()
         self.markdown_lines = []
 
     @property
@@ -1412,42 +1381,21 @@ class AdfExtensionToCallout:
 
     @property
     def applicable(self):
-        if not self.node.name in ['ac:adf-extension']:
-            return False
-
-        for child in self.node.children:
-            if not isinstance(child, Tag):
-                continue
-            node_type = child.get('type', '(unknown)')
-            logging.debug(f'child of ac:adf-extension name={child.name} type={node_type}')
-            if child.name == 'ac:adf-node' and node_type == 'panel':
-                return True
-        return False
+        # <ac:adf-extension> with an <ac:adf-node type="panel"> child
+        return is_adf_extension_callout(self.node)
 
     @property
     def has_applicable_nodes(self):
-
-        def _has_applicable_node(node):
-            if isinstance(node, NavigableString):
-                return False
-            elif AdfExtensionToCallout(node).applicable:
-                return True
-            else:
-                for child in node.children:
-                    if _has_applicable_node(child):
-                        return True
-            return False
-
-        return _has_applicable_node(self.node)
+        return self.context.analysis.has_adf_extension_callout(self.node)
 
     def convert_recursively(self, node):
         """Recursively convert child nodes to Markdown."""
         if isinstance(node, NavigableString):
-            logging.warning(f"AdfExtensionToCallout: Unexpected NavigableString {repr(node)} from {ancestors(node)} in {ctx.INPUT_FILE_PATH}")
+            log_lazy(logging.WARNING, lambda: f"AdfExtensionToCallout: Unexpected NavigableString {repr(node)} from {ancestors(node)} in {self.context.input_file_path}")
             # Do not append unexpected NavigableString to markdown_lines.
             return
 
-        logging.debug(f"AdfExtensionToCallout: type={type(node).__name__}, name={node.name}, value={repr(node.text)}")
+        log_lazy(logging.DEBUG, lambda: f"AdfExtensionToCallout: type={type(node).__name__}, name={node.name}, value={repr(node.text)}")
         attr_key = node.get('type', '(unknown)')
         if node.name in ['ac:adf-extension']:
             for child in node.children:
@@ -1461,40 +1409,44 @@ class AdfExtensionToCallout:
                     self.collector.add_adf_extension(node, panel_type)
                 logging.debug(f'Found <ac:adf-attribute key="panel-type"> text={adf_attribute.text}')
             else:
-                logging.warning(f"No <ac:adf-attribute> in {print_node_with_properties(node)} from {ancestors(node)} in {ctx.INPUT_FILE_PATH}")
+                log_lazy(logging.WARNING, lambda: f"No <ac:adf-attribute> in {print_node_with_properties(node)} from {ancestors(node)} in {self.context.input_file_path}")
 
             if panel_type == 'note':
                 self.markdown_lines.append('<Callout type="important">\n')
             else:
                 self.markdown_lines.append('<Callout>\n')
-                logging.warning(
-                    f'Unexpected panel-type of "{panel_type}" in {print_node_with_properties(node)} from {ancestors(node)} in {ctx.INPUT_FILE_PATH}')
+                log_lazy(logging.WARNING, lambda:
+                    f'Unexpected panel-type of "{panel_type}" in {print_node_with_properties(node)} from {ancestors(node)} in {self.context.input_file_path}')
 
             adf_content = node.find('ac:adf-content')
             if adf_content:
-                self.markdown_lines.extend(MultiLineParser(adf_content, collector=self.collector).as_markdown)
+                self.markdown_lines.extend(MultiLineParser(adf_content, collector=self.collector, context=self.context).as_markdown)
             else:
-                logging.warning(f"No <ac:adf-content> in {print_node_with_properties(node)} from {ancestors(node)} in {ctx.INPUT_FILE_PATH}")
+                log_lazy(logging.WARNING, lambda: f"No <ac:adf-content> in {print_node_with_properties(node)} from {ancestors(node)} in {self.context.input_file_path}")
 
             self.markdown_lines.append('</Callout>\n')
         elif node.name in ['ac:adf-fallback']:
             pass  # Ignore <ac:adf-fallback>
         else:
-            logging.warning(f"AdfExtensionToCallout: Unexpected {print_node_with_properties(node)} from {ancestors(node)} in {ctx.INPUT_FILE_PATH}")
+            log_lazy(logging.WARNING, lambda: f"AdfExtensionToCallout: Unexpected {print_node_with_properties(node)} from {ancestors(node)} in {self.context.input_file_path}")
             self.markdown_lines.append(f'[{node.name}]\n')
             for child in node.children:
                 self.convert_recursively(child)
 
 
 class ConfluenceToMarkdown:
-    def __init__(self, html_content: str):
+    def __init__(self, html_content: str, context: ConversionContext | None = None,
+                 parser: str = DEFAULT_PARSER):
         self.markdown_lines = []
         self._imports = {}
         self._debug_markdown = False  # Used when debugging manually
         self._collector = LostInfoCollector()
+        self.context = context if context is not None else ConversionContext()
 
-        # Parse HTML with BeautifulSoup
-        self.soup = BeautifulSoup(html_content, 'html.parser')
+        # Parse HTML with BeautifulSoup ('html.parser' or the faster 'lxml' backend)
+        self.soup = parse_xhtml(html_content, parser)
+        # One bottom-up pass answers every applicability check during conversion
+        self.context.analysis = DocumentAnalysis(self.soup)
 
     @property
     def lost_infos(self) -> dict:
@@ -1512,7 +1464,7 @@ class ConfluenceToMarkdown:
     @property
     def remark(self):
         remarks = []
-        page_v1 = get_page_v1()
+        page_v1 = self.context.page_v1
         if page_v1 and page_v1.get("title"):
             title = clean_text(page_v1.get("title")).strip()
             # repr() generates a valid value of string for yaml.
@@ -1531,7 +1483,7 @@ class ConfluenceToMarkdown:
     @property
     def title(self):
         """Get document title and format it as h1 heading for Nextra"""
-        page_v1 = get_page_v1()
+        page_v1 = self.context.page_v1
         if page_v1 and page_v1.get("title"):
             title = clean_text(page_v1.get("title")).strip()
             if title:
@@ -1554,25 +1506,26 @@ class ConfluenceToMarkdown:
             # Find ri:attachment nodes within each ac:image
             attachment_nodes = ac_image.find_all('ri:attachment')
             for node in attachment_nodes:
-                logging.debug(f"add attachment of <ac:image>{node}")
-                attachment = Attachment(node, input_dir, output_dir, public_dir, collector=self._collector)
+                log_lazy(logging.DEBUG, lambda: f"add attachment of <ac:image>{node}")
+                attachment = Attachment(node, input_dir, output_dir, public_dir,
+                                        collector=self._collector, context=self.context)
                 if not skip_image_copy:
                     attachment.copy_to_destination()
                 attachments.append(attachment)
 
-        logging.debug(f"attachments: {attachments}")
-        set_attachments(attachments)
+        log_lazy(logging.DEBUG, lambda: f"attachments: {attachments}")
+        self.context.attachments = attachments
 
     def as_markdown(self):
-        if StructuredMacroToCallout(self.soup).has_applicable_nodes:
+        if StructuredMacroToCallout(self.soup, context=self.context).has_applicable_nodes:
             self.add_import('Callout')
-        elif AdfExtensionToCallout(self.soup).has_applicable_nodes:
+        elif AdfExtensionToCallout(self.soup, context=self.context).has_applicable_nodes:
             self.add_import('Callout')
 
         # Add document title at the beginning if available
         self.markdown_lines.extend(self.title)
         # Start conversion
-        self.markdown_lines.extend(MultiLineParser(self.soup, collector=self._collector).as_markdown)
+        self.markdown_lines.extend(MultiLineParser(self.soup, collector=self._collector, context=self.context).as_markdown)
         # self.process_node(soup)
 
         # Join all Markdown lines and strip trailing spaces from each line
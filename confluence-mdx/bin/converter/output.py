@@ -0,0 +1,82 @@
+"""
+Write-if-changed output files.
+
+convert_all regenerates every MDX file, _meta.ts and attachment copy on each
+run, although most of them come out identical. Rewriting them bumps their
+mtimes, and the Next.js build and the deployment cache then treat every file
+as changed. write_if_changed() compares the new content with the file on disk
+and leaves identical files untouched, so the mtimes of the output tree only
+move for files whose content changed.
+
+Writers of output files report what they actually wrote or removed with
+note_changed(); take_changed() hands the tally of a process to convert_all,
+which reports the total of the run. A converter subprocess prints its tally as
+a CHANGED_OUTPUTS_MARKER line on stdout, read back with parse_changed_outputs().
+"""
+
+import logging
+import os
+import threading
+from typing import Optional, Union
+
+import profiling
+
+_changed = 0  # output files written or removed since the last take_changed()
+_changed_lock = threading.Lock()
+
+CHANGED_OUTPUTS_MARKER = 'changed-outputs:'
+
+
+def write_if_changed(path: str, content: str, encoding: str = 'utf-8') -> bool:
+    """Write content to path unless the file already holds exactly that; return whether it was written."""
+    data = content.encode(encoding)
+    try:
+        if os.path.getsize(path) == len(data):
+            with open(path, 'rb') as f:
+                if f.read() == data:
+                    logging.debug(f"Unchanged, not rewritten: {path}")
+                    profiling.count('outputs_unchanged')
+                    return False
+    except OSError:
+        pass  # missing or unreadable: write it
+    with open(path, 'wb') as f:
+        f.write(data)
+    profiling.count('outputs_written')
+    return True
+
+
+def note_changed(changed: Union[bool, int] = True) -> Union[bool, int]:
+    """Count changed output files and return changed.
+
+    changed is the result of one write (True counts one file) or a number of
+    files reported by a worker or subprocess.
+    """
+    global _changed
+    if changed:
+        with _changed_lock:
+            _changed += int(changed)
+    return changed
+
+
+def take_changed() -> int:
+    """Number of output files noted since the last call, resetting the tally."""
+    global _changed
+    with _changed_lock:
+        changed, _changed = _changed, 0
+    return changed
+
+
+def format_changed_outputs(changed: int) -> str:
+    """The stdout line through which a converter subprocess reports its tally."""
+    return f"{CHANGED_OUTPUTS_MARKER} {changed}"
+
+
+def parse_changed_outputs(stdout: str) -> Optional[int]:
+    """The tally of the last CHANGED_OUTPUTS_MARKER line in stdout, or None if there is none."""
+    for line in reversed(stdout.splitlines()):
+        if line.startswith(CHANGED_OUTPUTS_MARKER):
+            try:
+                return int(line[len(CHANGED_OUTPUTS_MARKER):].strip())
+            except ValueError:
+                return None
+    return None
@@ -0,0 +1,185 @@
+"""
+Parser backends for Confluence storage-format XHTML.
+
+The converter has always parsed pages with bs4's 'html.parser', which keeps
+namespaced tags such as <ac:link> and <ri:page> as plain tag names and turns
+<![CDATA[...]]> sections into CData strings. The 'lxml' backend produces the
+same BeautifulSoup tree from libxml2's XML parser. Tokenizing is then nearly
+free and parsing takes about two thirds of the time; what remains is bs4's
+own tree construction. bs4's own 'lxml' / 'lxml-xml' builders cannot be used
+directly: the HTML one turns CDATA into comments and the XML one drops the
+undeclared ac:/ri: prefixes and HTML named entities.
+
+Use `tests/run-tests.sh --type parser-parity` to check that both backends
+produce identical MDX before switching a full-space run to 'lxml'.
+"""
+
+import html
+import logging
+import re
+from typing import Dict, List, Optional, Tuple
+
+from bs4 import BeautifulSoup
+from bs4.builder import HTMLTreeBuilder
+from bs4.element import CData, Comment
+
+import profiling
+
+try:
+    from lxml import etree
+except ImportError:
+    etree = None
+
+DEFAULT_PARSER = 'html.parser'
+PARSER_BACKENDS = ('html.parser', 'lxml')
+
+# Element standing in for a CDATA section while libxml2 parses the document.
+# libxml2 reports CDATA through the same data() callback as text, so the
+# section is cut out beforehand and restored as a CData string afterwards.
+_CDATA_PLACEHOLDER = 'confluence-mdx-cdata'
+_ROOT = 'confluence-mdx-root'
+_NAMESPACE_BASE = 'urn:confluence-mdx:'
+
+_CDATA_RE = re.compile(r'<!\[CDATA\[(.*?)\]\]>', re.DOTALL)
+_ENTITY_RE = re.compile(r'&(#[0-9]+;|#[xX][0-9a-fA-F]+;|[A-Za-z][A-Za-z0-9]*;)?')
+_PREFIX_RE = re.compile(r'[<\s/]([A-Za-z_][\w.-]*):[A-Za-z_]')
+_XML_ENTITIES = {'amp;', 'lt;', 'gt;', 'quot;', 'apos;'}
+
+
+def available_parsers() -> List[str]:
+    """Parser backends usable in this environment."""
+    return [name for name in PARSER_BACKENDS if name != 'lxml' or etree is not None]
+
+
+def parse_xhtml(html_content: str, parser: str = DEFAULT_PARSER) -> BeautifulSoup:
+    """Parse Confluence XHTML with the given backend.
+
+    Documents that are not well-formed XML (an unclosed <br>, a bare '&')
+    cannot be handled by 'lxml'; they fall back to 'html.parser' with a warning.
+    """
+    profiling.count('soup_parses')
+    if parser == 'html.parser':
+        return BeautifulSoup(html_content, 'html.parser')
+    if parser != 'lxml':
+        raise ValueError(f"Unknown parser backend: {parser} (choose from {', '.join(PARSER_BACKENDS)})")
+    if etree is None:
+        raise ValueError("Parser backend 'lxml' requires the lxml package. Run: pip install lxml")
+
+    try:
+        return BeautifulSoup(html_content, builder=_LxmlXhtmlTreeBuilder())
+    except etree.XMLSyntaxError as e:
+        logging.warning(f"lxml parser failed, falling back to html.parser: {e}")
+        return BeautifulSoup(html_content, 'html.parser')
+
+
+def _xml_entity(match: 're.Match[str]') -> str:
+    """Rewrite an HTML named character reference as numeric references.
+
+    A bare ampersand or an unknown entity is left as is: libxml2 rejects it
+    and parse_xhtml() falls back to html.parser, whose handling of such
+    malformed input differs between text and attribute values.
+    """
+    ref = match.group(1)
+    if ref is None or ref[0] == '#' or ref in _XML_ENTITIES:
+        return match.group(0)
+    text = html.entities.html5.get(ref)
+    if text is None:
+        return match.group(0)
+    return ''.join(f'&#{ord(ch)};' for ch in text)
+
+
+def _prepare(html_content: str) -> Tuple[str, List[str], Dict[str, str]]:
+    """Turn a storage-format fragment into a well-formed XML document.
+
+    Returns the document, the CDATA sections cut out of it, and the namespace
+    URI declared for each prefix in use.
+    """
+    sections: List[str] = []
+
+    def _cut(match: 're.Match[str]') -> str:
+        sections.append(match.group(1))
+        return f'<{_CDATA_PLACEHOLDER} i="{len(sections) - 1}"/>'
+
+    body = _CDATA_RE.sub(_cut, html_content)
+    body = _ENTITY_RE.sub(_xml_entity, body)
+    prefixes = sorted(set(_PREFIX_RE.findall(body)) - {'xml', 'xmlns'})
+    namespaces = {_NAMESPACE_BASE + prefix: prefix for prefix in prefixes}
+    declarations = ''.join(f' xmlns:{prefix}="{uri}"' for uri, prefix in namespaces.items())
+    return f'<{_ROOT}{declarations}>{body}</{_ROOT}>', sections, namespaces
+
+
+class _LxmlXhtmlTreeBuilder(HTMLTreeBuilder):
+    """bs4 tree builder driven by lxml's XML parser target interface.
+
+    It is an HTMLTreeBuilder so that the resulting tree behaves exactly like an
+    'html.parser' tree: void elements, multi-valued class attributes and
+    HTML serialization are unchanged. Tag and attribute names are restored to
+    their prefixed form (ac:link, ri:content-title) and lowercased, as
+    html.parser does.
+    """
+
+    NAME = 'confluence-lxml'
+    features = [NAME]
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._sections: List[str] = []
+        self._namespaces: Dict[str, str] = {}
+        self._names: Dict[str, str] = {}
+        self._depth = 0
+
+    def feed(self, markup):
+        if isinstance(markup, bytes):
+            markup = markup.decode('utf-8')
+        document, self._sections, self._namespaces = _prepare(markup)
+        self._names = {}
+        self._depth = 0
+        parser = etree.XMLParser(target=self, huge_tree=True)
+        parser.feed(document)
+        parser.close()
+
+    def test_fragment_to_document(self, fragment):
+        return fragment
+
+    # lxml parser target interface
+
+    def _name(self, name: str) -> str:
+        result = self._names.get(name)
+        if result is None:
+            result = name
+            if name[0] == '{':
+                uri, local = name[1:].split('}', 1)
+                prefix: Optional[str] = self._namespaces.get(uri)
+                if prefix is not None:
+                    result = f'{prefix}:{local}'
+            result = self._names[name] = result.lower()
+        return result
+
+    def start(self, name, attrib, nsmap=None):
+        self._depth += 1
+        if self._depth == 1:
+            return  # synthetic root
+        if name == _CDATA_PLACEHOLDER:
+            self.soup.endData()
+            self.soup.handle_data(self._sections[int(attrib['i'])])
+            self.soup.endData(CData)
+            return
+        attrs = {self._name(key): value for key, value in attrib.items()}
+        self.soup.handle_starttag(self._name(name), None, None, attrs)
+
+    def end(self, name):
+        self._depth -= 1
+        if self._depth == 0 or name == _CDATA_PLACEHOLDER:
+            return
+        self.soup.handle_endtag(self._name(name))
+
+    def data(self, content):
+        self.soup.handle_data(content)
+
+    def comment(self, text):
+        self.soup.endData()
+        self.soup.handle_data(text)
+        self.soup.endData(Comment)
+
+    def close(self):
+        self.soup.endData()
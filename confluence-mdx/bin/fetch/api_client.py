@@ -2,14 +2,15 @@
 
 import logging
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Protocol
+from typing import Dict, Iterator, List, Optional, Protocol
 from urllib.parse import quote, urljoin
 
-import requests
 from requests.auth import HTTPBasicAuth
 
+import profiling
 from fetch.config import Config
 from fetch.exceptions import ApiError
+from http_transport import HttpTransport, RetryPolicy
 
 
 class ApiClientProtocol(Protocol):
@@ -21,6 +22,9 @@ class ApiClientProtocol(Protocol):
     def get_page_data_v2(self, page_id: str, content_type: str = "page") -> Optional[Dict]:
         ...
 
+    def get_page_version(self, page_id: str) -> Optional[int]:
+        ...
+
     def get_direct_children(self, page_id: str, content_type: str = "page") -> Optional[Dict]:
         ...
 
@@ -36,12 +40,22 @@ class ApiClient:
         self.logger = logger
         self.auth = HTTPBasicAuth(config.email, config.api_token)
         self.headers = {"Accept": "application/json"}
+        # One keep-alive session for every request; concurrent attachment downloads share its pool.
+        self.transport = HttpTransport(
+            pool_size=max(config.http_pool_size, config.fetch_workers, config.attachment_workers),
+            retry=RetryPolicy(
+                max_retries=config.http_max_retries,
+                backoff_factor=config.http_backoff_factor,
+            ),
+            auth=self.auth,
+            logger=logger,
+        )
 
     def make_request(self, url: str, description: str) -> Optional[Dict]:
         """Make API request and return response"""
         try:
             self.logger.debug(f"Making {description} request to: {url}")
-            response = requests.get(url, headers=self.headers, auth=self.auth)
+            response = self.transport.get(url, headers=self.headers)
             response.raise_for_status()
             data = response.json()
             if isinstance(data, dict):
@@ -77,6 +91,12 @@ class ApiClient:
             url = f"{self.config.base_url}/api/v2/pages/{page_id}?body-format=atlas_doc_format"
         return self.make_request(url, "V2 API page data")
 
+    def get_page_version(self, page_id: str) -> Optional[int]:
+        """Get the current version number of a page without its body"""
+        data = self.make_request(f"{self.config.base_url}/api/v2/pages/{page_id}", "V2 API page version")
+        version = (data or {}).get("version", {}).get("number")
+        return int(version) if version is not None else None
+
     def get_direct_children(self, page_id: str, content_type: str = "page") -> Optional[Dict]:
         """Get every direct child using the V2 API with cursor pagination."""
         if content_type == "folder":
@@ -254,13 +274,24 @@ class ApiClient:
             self.logger.error(f"Error getting recently modified pages: {str(e)}")
             raise ApiError(f"Failed to get recently modified pages: {str(e)}")
 
-    def download_attachment(self, page_id: str, attachment_id: str) -> Optional[bytes]:
-        """Download attachment content"""
+    ATTACHMENT_CHUNK_SIZE = 1024 * 1024
+    """Bytes read per chunk when streaming an attachment download."""
+
+    def iter_attachment_chunks(self, page_id: str, attachment_id: str) -> Iterator[bytes]:
+        """Stream attachment content in chunks without holding the whole body in memory"""
+        url = f"{self.config.base_url}/rest/api/content/{page_id}/child/attachment/{attachment_id}/download"
         try:
-            url = f"{self.config.base_url}/rest/api/content/{page_id}/child/attachment/{attachment_id}/download"
-            response = requests.get(url, headers={"Accept": "*/*"}, auth=self.auth)
-            response.raise_for_status()
-            return response.content
+            with self.transport.get(url, headers={"Accept": "*/*"}, stream=True) as response:
+                response.raise_for_status()
+                for chunk in response.iter_content(chunk_size=self.ATTACHMENT_CHUNK_SIZE):
+                    if chunk:
+                        profiling.count("bytes_downloaded", len(chunk))
+                        yield chunk
         except Exception as e:
             self.logger.error(f"Error downloading attachment {attachment_id}: {str(e)}")
             raise ApiError(f"Failed to download attachment: {str(e)}")
+
+    def log_request_stats(self) -> None:
+        """Log request, retry and latency counters per endpoint"""
+        for line in self.transport.format_stats():
+            self.logger.info(f"HTTP {line}")
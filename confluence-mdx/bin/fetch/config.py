@@ -32,6 +32,12 @@ class Config:
     email: Optional[str] = None
     api_token: Optional[str] = None
     download_attachments: bool = False
+    attachment_workers: int = 4  # Number of concurrent attachment downloads per page
+    fetch_workers: int = 4  # Number of pages fetched concurrently in --remote mode
+    incremental_fetch: bool = True  # Skip page bodies whose version matches fetch_index.json in --remote mode
+    http_pool_size: int = 10  # Keep-alive connections kept open to the Confluence host
+    http_max_retries: int = 5  # Retries of a request on 429/5xx or connection errors
+    http_backoff_factor: float = 1.0  # Retry n waits backoff_factor * 2**n seconds unless Retry-After says otherwise
     mode: str = "recent"  # Mode: "local", "remote", or "recent"
 
     @property
@@ -0,0 +1,102 @@
+"""Incremental fetch index: what was fetched for each page, and at which version."""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import uuid
+from dataclasses import asdict, dataclass, fields
+from typing import Any, Dict, Optional, Set
+
+
+def listing_hash(results: Any) -> str:
+    """Stable hash of an API listing (children or attachments results)."""
+    encoded = json.dumps(results, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha1(encoded.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class IndexEntry:
+    """State of one page or folder as of its last fetch."""
+
+    type: str = "page"
+    version: Optional[int] = None  # version.number of the page bodies on disk
+    children_hash: Optional[str] = None  # listing_hash() of children.v2.yaml results
+    attachments_hash: Optional[str] = None  # listing_hash() of attachments.v1.yaml results
+
+
+class FetchIndex:
+    """Per-space index stored as var/<start_page_id>/fetch_index.json.
+
+    Stage 1 reads it to skip page bodies whose version has not changed and
+    records what it fetched. Safe to use from the concurrent tree crawl.
+    """
+
+    FORMAT = 1
+
+    def __init__(self, path: str, logger: logging.Logger, entries: Optional[Dict[str, IndexEntry]] = None):
+        self.path = path
+        self.logger = logger
+        self.entries: Dict[str, IndexEntry] = entries or {}
+        self.unchanged: Set[str] = set()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, path: str, logger: logging.Logger) -> "FetchIndex":
+        """Load the index; a missing or unreadable file yields an empty index (full fetch)."""
+        if not os.path.exists(path):
+            return cls(path, logger)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("format") != cls.FORMAT:
+                raise ValueError(f"unsupported format {data.get('format')!r}")
+            names = {field.name for field in fields(IndexEntry)}
+            entries = {
+                page_id: IndexEntry(**{key: value for key, value in entry.items() if key in names})
+                for page_id, entry in data.get("pages", {}).items()
+            }
+        except Exception as e:
+            logger.warning(f"Ignoring fetch index {path}: {str(e)}")
+            return cls(path, logger)
+        logger.info(f"Loaded fetch index with {len(entries)} entries from {path}")
+        return cls(path, logger, entries)
+
+    def get(self, page_id: str) -> Optional[IndexEntry]:
+        with self._lock:
+            return self.entries.get(page_id)
+
+    def update(self, page_id: str, **values: Any) -> None:
+        """Set the given fields of a page's entry; None values leave a field as is."""
+        with self._lock:
+            entry = self.entries.setdefault(page_id, IndexEntry())
+            for key, value in values.items():
+                if value is not None:
+                    setattr(entry, key, value)
+
+    def mark_unchanged(self, page_id: str) -> None:
+        with self._lock:
+            self.unchanged.add(page_id)
+
+    def save(self) -> None:
+        """Write the index atomically: one JSON line per page, sorted by ID."""
+        with self._lock:
+            lines = [
+                f"{json.dumps(page_id)}:{json.dumps(asdict(entry), sort_keys=True, separators=(',', ':'))}"
+                for page_id, entry in sorted(self.entries.items())
+            ]
+        content = f'{{"format":{self.FORMAT},"pages":{{\n' + ",\n".join(lines) + "\n}}\n"
+
+        directory = os.path.dirname(self.path)
+        os.makedirs(directory, exist_ok=True)
+        temp_path = os.path.join(directory, f".{os.path.basename(self.path)}.{uuid.uuid4().hex}.part")
+        try:
+            with open(temp_path, "x", encoding="utf-8") as f:
+                f.write(content)
+            os.replace(temp_path, self.path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+            raise
+        self.logger.info(f"Fetch index saved to {self.path} ({len(lines)} entries)")
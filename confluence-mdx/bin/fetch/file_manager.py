@@ -2,10 +2,12 @@
 
 import logging
 import os
-from typing import Dict, Optional, Any, Protocol
+import uuid
+from typing import Dict, Iterable, Optional, Any, Protocol
 
 import yaml
 
+import artifacts
 from fetch.exceptions import FileError
 
 
@@ -15,9 +17,15 @@ class FileManagerProtocol(Protocol):
     def save_file(self, filepath: str, content: Any, is_binary: bool = False) -> bool:
         ...
 
+    def save_stream(self, filepath: str, chunks: Iterable[bytes]) -> int:
+        ...
+
     def save_yaml(self, filepath: str, data: Any) -> bool:
         ...
 
+    def save_artifact(self, filepath: str, data: Any) -> bool:
+        ...
+
     def load_yaml(self, filepath: str) -> Optional[Dict]:
         ...
 
@@ -56,16 +64,53 @@ class FileManager:
             self.logger.error(f"Error saving file {filepath}: {str(e)}")
             raise FileError(f"Failed to save file: {str(e)}")
 
+    def save_stream(self, filepath: str, chunks: Iterable[bytes]) -> int:
+        """Stream binary chunks to a temporary file and atomically rename it to filepath.
+
+        Readers never see a partially written file; on failure the existing file
+        (if any) is left untouched. Returns the number of bytes written.
+        """
+        directory = os.path.dirname(filepath)
+        self.ensure_directory(directory)
+        temp_path = os.path.join(directory, f".{os.path.basename(filepath)}.{uuid.uuid4().hex}.part")
+        try:
+            size = 0
+            with open(temp_path, 'xb') as f:
+                for chunk in chunks:
+                    f.write(chunk)
+                    size += len(chunk)
+            os.replace(temp_path, filepath)
+        except BaseException as e:
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+            if isinstance(e, OSError):
+                self.logger.error(f"Error saving file {filepath}: {str(e)}")
+                raise FileError(f"Failed to save file: {str(e)}") from e
+            raise
+
+        self.logger.debug(f"Saved {size} bytes to {filepath}")
+        return size
+
     def save_yaml(self, filepath: str, data: Any) -> bool:
-        """Save YAML data to a file with quoted strings"""
+        """Save YAML data to a file with quoted strings
+
+        Used for files kept under version control (pages.<code>.yaml), whose
+        format must stay byte-stable; API payloads go through save_artifact().
+        """
         return self.save_file(filepath, yaml.dump(data, allow_unicode=True, sort_keys=False, default_style='"'))
 
+    def save_artifact(self, filepath: str, data: Any) -> bool:
+        """Save an API payload with the C YAML dumper, or as compact JSON in json artifact mode"""
+        return self.save_file(filepath, artifacts.dump_artifact(data, sort_keys=False))
+
     def load_yaml(self, filepath: str) -> Optional[Dict]:
-        """Read YAML from a file"""
+        """Read YAML (or JSON written by save_artifact) from a file"""
         try:
             if os.path.exists(filepath):
                 with open(filepath, 'r', encoding='utf-8') as f:
-                    return yaml.safe_load(f)
+                    return artifacts.load_artifact(f.read())
         except Exception as e:
             self.logger.error(f"Error loading YAML from {filepath}: {str(e)}")
             raise FileError(f"Failed to load YAML: {str(e)}")
@@ -3,12 +3,15 @@
 import logging
 import os
 import sys
+import threading
 import traceback
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timezone
 from typing import Dict, Generator, List, Optional, Set
 
 from fetch.config import Config
 from fetch.api_client import ApiClient
+from fetch.fetch_index import FetchIndex
 from fetch.file_manager import FileManager
 from fetch.translation import TranslationService
 from fetch.stages import Stage1Processor, Stage2Processor, Stage3Processor, Stage4Processor
@@ -30,8 +33,13 @@ class ConfluencePageProcessor:
             logger,
         )
 
+        # The fetch index records page versions for API modes; --remote uses it to skip unchanged pages
+        self.fetch_index: Optional[FetchIndex] = None
+        if config.mode in ("remote", "recent"):
+            self.fetch_index = FetchIndex.load(self._get_fetch_index_path(config.default_start_page_id), logger)
+
         # Initialize stage processors
-        self.stage1 = Stage1Processor(config, self.api_client, self.file_manager, logger)
+        self.stage1 = Stage1Processor(config, self.api_client, self.file_manager, logger, self.fetch_index)
         self.stage2 = Stage2Processor(config, self.api_client, self.file_manager, logger)
         self.stage3 = Stage3Processor(config, self.api_client, self.file_manager, logger)
         self.stage4 = Stage4Processor(config, self.api_client, self.file_manager, logger)
@@ -49,16 +57,7 @@ class ConfluencePageProcessor:
     ) -> Optional[ContentNode]:
         """Process a page or folder through the applicable stages."""
         try:
-            self.logger.info(f"Processing {content_type} ID {page_id}")
-
-            # Stage 1: API Data Collection
-            self.stage1.process(page_id, content_type, include_children)
-
-            # Stage 2: Content Extraction
-            self.stage2.process(page_id, content_type)
-
-            # Stage 3: Attachment Download
-            self.stage3.process(page_id, content_type)
+            self.collect_content(page_id, content_type, include_children)
 
             # Stage 4: Document Listing
             page = self.stage4.process(
@@ -75,6 +74,28 @@ class ConfluencePageProcessor:
             self.logger.error(f"Error processing {content_type} ID {page_id}: {str(e)}")
             raise
 
+    def collect_content(
+        self,
+        page_id: str,
+        content_type: str = "page",
+        include_children: bool = True,
+    ) -> None:
+        """Run the stages that talk to the API and write page files (Stage 1-3)."""
+        self.logger.info(f"Processing {content_type} ID {page_id}")
+
+        # Stage 1: API Data Collection
+        refreshed = self.stage1.process(page_id, content_type, include_children)
+
+        # Stage 2: Content Extraction (the extracted files of an unchanged page are current)
+        if refreshed or self.config.mode == "local":
+            self.stage2.process(page_id, content_type)
+            self.stage1.record_version(page_id)
+        else:
+            self.logger.info(f"Stage 2 skipped for {content_type} ID {page_id} (unchanged)")
+
+        # Stage 3: Attachment Download
+        self.stage3.process(page_id, content_type)
+
     def get_child_content_refs(self, page_id: str) -> List[ContentRef]:
         """Load supported typed child references for recursive processing."""
         try:
@@ -222,10 +243,98 @@ class ConfluencePageProcessor:
             self.logger.debug(traceback.format_exc())
             raise
 
+    def fetch_page_tree_concurrent(
+        self,
+        page_id: str,
+        start_page_id: Optional[str] = None,
+        content_type: Optional[str] = None,
+    ) -> Generator[ContentNode, None, None]:
+        """Fetch a typed content tree via API with config.fetch_workers threads.
+
+        Stage 1-3 of a page are scheduled as soon as its parent's children list
+        is saved, so every known page of the tree is fetched concurrently.
+        Stage 4 and title translation need the parent's breadcrumbs and path;
+        they run in the calling thread, in the same depth-first order as
+        fetch_page_tree_recursive(), so the yielded nodes are identical.
+        """
+        if start_page_id is None:
+            start_page_id = page_id
+        if content_type is None:
+            content_type = self.config.root_content_type if page_id == start_page_id else "page"
+
+        crawler = _TreeCrawler(self, self.config.fetch_workers)
+        try:
+            crawler.schedule(page_id, content_type)
+            yield from self._walk_crawled_tree(crawler, page_id, start_page_id, content_type, None, None, set())
+        finally:
+            crawler.close()
+
+    def _walk_crawled_tree(
+        self,
+        crawler: "_TreeCrawler",
+        page_id: str,
+        start_page_id: str,
+        content_type: str,
+        parent_breadcrumbs: Optional[List[str]],
+        parent_path: Optional[List[str]],
+        visited: Set[str],
+    ) -> Generator[ContentNode, None, None]:
+        try:
+            if page_id in visited:
+                self.logger.warning(f"Skipping cycle or duplicate content ID {page_id}")
+                return
+            visited.add(page_id)
+
+            children = crawler.result(page_id)
+            page = self.stage4.process(
+                page_id,
+                start_page_id,
+                content_type=content_type,
+                parent_breadcrumbs=parent_breadcrumbs,
+            )
+            self.logger.info(f"Completed all stages for {content_type} ID {page_id}")
+
+            if page:
+                self.translation_service.translate_page(page, parent_path)
+
+                yield page
+
+                child_parent_breadcrumbs = (
+                    [] if page_id == start_page_id else list(page.breadcrumbs)
+                )
+                child_parent_path = (
+                    [] if page_id == start_page_id else list(page.path)
+                )
+                for child in children:
+                    yield from self._walk_crawled_tree(
+                        crawler,
+                        child.id,
+                        start_page_id,
+                        child.type,
+                        child_parent_breadcrumbs,
+                        child_parent_path,
+                        visited,
+                    )
+        except Exception as e:
+            self.logger.error(f"Error processing page ID {page_id}: {str(e)}")
+            self.logger.debug(traceback.format_exc())
+            raise
+
     def _get_fetch_state_path(self, start_page_id: str) -> str:
         """Return the path to the fetch state file for a specific start_page_id."""
         return os.path.join(self.config.default_output_dir, start_page_id, "fetch_state.yaml")
 
+    def _get_fetch_index_path(self, start_page_id: str) -> str:
+        """Return the path to the incremental fetch index for a specific start_page_id."""
+        return os.path.join(self.config.default_output_dir, start_page_id, "fetch_index.json")
+
+    def _save_fetch_index(self) -> None:
+        if self.fetch_index is None:
+            return
+        if self.fetch_index.unchanged:
+            self.logger.warning(f"Fetch index: {len(self.fetch_index.unchanged)} pages unchanged, page bodies not fetched")
+        self.fetch_index.save()
+
     def _load_fetch_state(self, start_page_id: str) -> Dict:
         """Load fetch state from var/<start_page_id>/fetch_state.yaml."""
         state_path = self._get_fetch_state_path(start_page_id)
@@ -406,10 +515,9 @@ class ConfluencePageProcessor:
                 page_count = 0
                 yaml_entries = []
 
-                for page in self.fetch_page_tree_recursive(
+                for page in self.fetch_page_tree_concurrent(
                     start_page_id,
                     start_page_id,
-                    use_local=False,
                     content_type=self.config.root_content_type,
                 ):
                     if page:
@@ -449,7 +557,51 @@ class ConfluencePageProcessor:
                 self.logger.info(f"YAML data saved to {output_yaml_path}")
 
             self.logger.info(f"Completed processing {page_count} pages")
+            self._save_fetch_index()
+            self.api_client.log_request_stats()
         except Exception as e:
             self.logger.error(f"Error in main execution: {str(e)}")
+            # Entries of the pages fetched before the failure are still valid
+            self._save_fetch_index()
             self.logger.debug(traceback.format_exc())
             sys.exit(1)
+
+
+class _TreeCrawler:
+    """Runs Stage 1-3 for every page of a tree on a thread pool.
+
+    Each task schedules the children it finds, so the crawl spreads over whole
+    tree levels instead of waiting for one page at a time. A content ID is
+    fetched at most once, even when it appears under several parents.
+    """
+
+    def __init__(self, processor: ConfluencePageProcessor, workers: int):
+        self.processor = processor
+        self.executor = ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="fetch")
+        self.futures: Dict[str, Future] = {}
+        self.lock = threading.Lock()
+        self.closed = False
+
+    def schedule(self, page_id: str, content_type: str) -> None:
+        with self.lock:
+            if self.closed or page_id in self.futures:
+                return
+            self.futures[page_id] = self.executor.submit(self._fetch, page_id, content_type)
+
+    def _fetch(self, page_id: str, content_type: str) -> List[ContentRef]:
+        self.processor.collect_content(page_id, content_type, include_children=True)
+        children = self.processor.get_child_content_refs(page_id)
+        for child in children:
+            self.schedule(child.id, child.type)
+        return children
+
+    def result(self, page_id: str) -> List[ContentRef]:
+        """Wait for a page scheduled by its parent and return its children."""
+        with self.lock:
+            future = self.futures[page_id]
+        return future.result()
+
+    def close(self) -> None:
+        with self.lock:
+            self.closed = True
+        self.executor.shutdown(wait=True, cancel_futures=True)
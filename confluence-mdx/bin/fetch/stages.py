@@ -3,10 +3,15 @@
 import logging
 import os
 import shutil
-from typing import Dict, List, Optional
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
 
+import profiling
 from fetch.config import Config
 from fetch.api_client import ApiClient
+from fetch.fetch_index import FetchIndex, listing_hash
 from fetch.file_manager import FileManager
 from fetch.models import ContentNode
 from text_utils import clean_text
@@ -15,11 +20,19 @@ from text_utils import clean_text
 class StageBase:
     """Base class for stage processors providing shared utilities and dependencies."""
 
-    def __init__(self, config: Config, api_client: ApiClient, file_manager: FileManager, logger: logging.Logger):
+    def __init__(
+        self,
+        config: Config,
+        api_client: ApiClient,
+        file_manager: FileManager,
+        logger: logging.Logger,
+        fetch_index: Optional[FetchIndex] = None,
+    ):
         self.config = config
         self.api_client = api_client
         self.file_manager = file_manager
         self.logger = logger
+        self.fetch_index = fetch_index
 
     def get_page_directory(self, page_id: str) -> str:
         """Return the directory path for a specific page."""
@@ -33,12 +46,23 @@ class StageBase:
 class Stage1Processor(StageBase):
     """Stage 1: API Data Collection - Fetch and save API responses to YAML files."""
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # page_id → version of the fetched page bodies, recorded once Stage 2 extracted them
+        self._fetched_versions: Dict[str, int] = {}
+
+    @profiling.timed("fetch.stage1_api_data")
     def process(
         self,
         page_id: str,
         content_type: str = "page",
         include_children: bool = True,
-    ) -> None:
+    ) -> bool:
+        """Fetch and save the API data of a page or folder.
+
+        Returns False when the fetch index shows that the page bodies on disk
+        are already at the current version and they were not downloaded again.
+        """
         self.logger.info(
             f"Stage 1: Collecting API data for {content_type} ID {page_id}"
         )
@@ -46,11 +70,12 @@ class Stage1Processor(StageBase):
         # Skip API calls if using local mode
         if self.config.mode == "local":
             self.logger.info(f"Stage 1 skipped for {content_type} ID {page_id} (local mode)")
-            return
+            return False
 
         directory = self.get_page_directory(page_id)
         self.file_manager.ensure_directory(directory)
 
+        unchanged = content_type == "page" and self._is_unchanged(page_id, directory)
         if content_type == "folder":
             api_operations = [
                 {
@@ -60,6 +85,8 @@ class Stage1Processor(StageBase):
                     'required': True,
                 },
             ]
+        elif unchanged:
+            api_operations = []
         else:
             api_operations = [
                 {
@@ -74,28 +101,45 @@ class Stage1Processor(StageBase):
                     'filename': "page.v2.yaml",
                     'required': True,
                 },
-                {
-                    'operation': lambda: self.api_client.get_attachments(page_id),
-                    'description': "V1 API attachments",
-                    'filename': "attachments.v1.yaml",
-                    'required': False,
-                },
             ]
 
+        # Replacing an attachment does not create a new page version, so the
+        # listing is still refreshed for an unchanged page when attachments are requested.
+        if content_type != "folder" and (not unchanged or self.config.download_attachments):
+            api_operations.append({
+                'operation': lambda: self.api_client.get_attachments(page_id),
+                'description': "V1 API attachments",
+                'filename': "attachments.v1.yaml",
+                'required': False,
+                'index_field': "attachments_hash",
+            })
+
         if include_children:
             api_operations.append({
                 'operation': lambda: self.api_client.get_direct_children(page_id, content_type),
                 'description': "V2 API direct children",
                 'filename': "children.v2.yaml",
                 'required': True,
+                'index_field': "children_hash",
             })
 
+        index_values: Dict[str, object] = {'type': content_type}
         for operation_info in api_operations:
             try:
                 data = operation_info['operation']()
                 if data:
                     filepath = os.path.join(directory, operation_info['filename'])
-                    self.file_manager.save_yaml(filepath, data)
+                    index_field = operation_info.get('index_field')
+                    if index_field:
+                        index_values[index_field] = listing_hash(data.get("results", []))
+                    if index_field and self._listing_unchanged(page_id, index_field, index_values[index_field], filepath):
+                        self.logger.debug(f"{operation_info['description']} unchanged for ID {page_id}")
+                    else:
+                        self.file_manager.save_artifact(filepath, data)
+                    if operation_info['filename'] == "page.v2.yaml":
+                        version = (data.get("version") or {}).get("number")
+                        if version is not None:
+                            self._fetched_versions[page_id] = version
                     self._log_operation_result(page_id, operation_info['description'], data)
                 elif operation_info.get('required', False):
                     raise ValueError(
@@ -106,7 +150,47 @@ class Stage1Processor(StageBase):
                 if operation_info.get('required', False):
                     raise
 
+        if self.fetch_index is not None:
+            self.fetch_index.update(page_id, **index_values)
         self.logger.info(f"Stage 1 completed for {content_type} ID {page_id}")
+        return not unchanged
+
+    def _is_unchanged(self, page_id: str, directory: str) -> bool:
+        """Probe the page version and compare it with the fetch index (--remote only)."""
+        if self.fetch_index is None or not self.config.incremental_fetch or self.config.mode != "remote":
+            return False
+        entry = self.fetch_index.get(page_id)
+        if entry is None or entry.version is None:
+            return False
+        if not all(
+            os.path.exists(os.path.join(directory, name))
+            for name in ("page.v1.yaml", "page.v2.yaml", "page.xhtml")
+        ):
+            return False
+        version = self.api_client.get_page_version(page_id)
+        if version != entry.version:
+            self.logger.info(f"Page {page_id} changed: indexed version {entry.version} != API version {version}")
+            return False
+        self.logger.info(f"Stage 1: page ID {page_id} unchanged at version {version}; page bodies not fetched")
+        self.fetch_index.mark_unchanged(page_id)
+        profiling.count("pages_unchanged")
+        return True
+
+    def record_version(self, page_id: str) -> None:
+        """Record the fetched version in the index after Stage 2 extracted the page bodies.
+
+        A page whose extraction failed keeps its previous version, so the next
+        --remote run fetches it again.
+        """
+        version = self._fetched_versions.pop(page_id, None)
+        if self.fetch_index is not None and version is not None:
+            self.fetch_index.update(page_id, version=version)
+
+    def _listing_unchanged(self, page_id: str, index_field: str, digest: str, filepath: str) -> bool:
+        if self.fetch_index is None or not os.path.exists(filepath):
+            return False
+        entry = self.fetch_index.get(page_id)
+        return entry is not None and getattr(entry, index_field) == digest
 
     def _log_operation_result(self, page_id: str, description: str, data: Dict) -> None:
         """Log specific information for different operations."""
@@ -123,6 +207,7 @@ class Stage1Processor(StageBase):
 class Stage2Processor(StageBase):
     """Stage 2: Content Extraction - Extract and save page content."""
 
+    @profiling.timed("fetch.stage2_content")
     def process(self, page_id: str, content_type: str = "page") -> bool:
         if content_type == "folder":
             self.logger.info(f"Stage 2 skipped for folder ID {page_id}")
@@ -163,7 +248,7 @@ class Stage2Processor(StageBase):
         # Extract ancestors
         ancestors = v1_data.get("ancestors", [])
         if ancestors:
-            self.file_manager.save_yaml(os.path.join(directory, "ancestors.v1.yaml"), {'results': ancestors})
+            self.file_manager.save_artifact(os.path.join(directory, "ancestors.v1.yaml"), {'results': ancestors})
             self.logger.debug(f"Extracted {len(ancestors)} ancestors for page ID {page_id}")
 
     def _extract_v2_content(self, page_id: str, v2_data: Dict, directory: str) -> None:
@@ -177,6 +262,7 @@ class Stage2Processor(StageBase):
 class Stage3Processor(StageBase):
     """Stage 3: Attachment Download - Download attachments if specified."""
 
+    @profiling.timed("fetch.stage3_attachments")
     def process(self, page_id: str, content_type: str = "page") -> bool:
         if content_type == "folder":
             self.logger.info(f"Stage 3 skipped for folder ID {page_id}")
@@ -206,14 +292,44 @@ class Stage3Processor(StageBase):
         attachments = attachments_data.get("results", [])
         self.logger.info(f"Found {len(attachments)} attachments for page ID {page_id}")
 
+        # Attachments sharing a file name overwrite each other; only the last one survives.
+        by_filename: Dict[str, Dict] = {}
         for attachment in attachments:
-            self._download_single_attachment(page_id, attachment, directory)
-
-        self.logger.info(f"Stage 3 completed for page ID {page_id}")
+            by_filename[clean_text(attachment.get("title", ""))] = attachment
+        if len(by_filename) < len(attachments):
+            self.logger.warning(f"{len(attachments) - len(by_filename)} attachments of page ID {page_id} share a file name with a later attachment")
+        unique_attachments = list(by_filename.values())
+
+        started = time.monotonic()
+        workers = max(1, min(self.config.attachment_workers, len(unique_attachments)))
+        if workers == 1:
+            results = [self._download_single_attachment(page_id, a, directory) for a in unique_attachments]
+        else:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="attachment") as executor:
+                results = list(executor.map(
+                    lambda a: self._download_single_attachment(page_id, a, directory),
+                    unique_attachments,
+                ))
+        elapsed = time.monotonic() - started
+
+        outcomes = Counter(outcome for outcome, _ in results)
+        downloaded_bytes = sum(size for outcome, size in results if outcome == "downloaded")
+        profiling.count("attachments_downloaded", outcomes["downloaded"])
+        rate = downloaded_bytes / elapsed / (1024 * 1024) if elapsed > 0 else 0.0
+        self.logger.info(
+            f"Stage 3 completed for page ID {page_id}: "
+            f"{outcomes['downloaded']} downloaded ({downloaded_bytes} bytes, {rate:.2f} MiB/s), "
+            f"{outcomes['copied']} copied from cache, {outcomes['skipped']} skipped, "
+            f"{outcomes['failed']} failed in {elapsed:.2f}s"
+        )
         return True
 
-    def _download_single_attachment(self, page_id: str, attachment: Dict, directory: str) -> None:
-        """Download a single attachment."""
+    def _download_single_attachment(self, page_id: str, attachment: Dict, directory: str) -> Tuple[str, int]:
+        """Download a single attachment.
+
+        Returns (outcome, size) where outcome is "skipped", "copied", "downloaded"
+        or "failed". Safe to run concurrently for distinct file names.
+        """
         try:
             attachment_id = attachment["id"]
             filename = clean_text(attachment["title"])
@@ -232,7 +348,7 @@ class Stage3Processor(StageBase):
                 if existing_size > 0:
                     if expected_size is None or existing_size == expected_size:
                         self.logger.info(f"Skipped attachment (already exists): {filename} (size: {existing_size} bytes)")
-                        return
+                        return "skipped", existing_size
                     self.logger.warning(f"Existing file size mismatch for {filename}: actual={existing_size}, expected={expected_size}. Will re-download.")
 
             # Check cache directory for the file before downloading from API
@@ -247,35 +363,39 @@ class Stage3Processor(StageBase):
                             # Copy from cache
                             shutil.copy2(cache_filepath, filepath)
                             self.logger.info(f"Copied attachment from cache: {filename} (size: {cache_file_size} bytes, matches expected size)")
-                            return
+                            return "copied", cache_file_size
                         else:
                             self.logger.warning(f"Cache file size mismatch for {filename}: cache={cache_file_size}, expected={expected_size}. Downloading from API.")
                     else:
                         # Copy from cache if no expected size available
                         shutil.copy2(cache_filepath, filepath)
                         self.logger.info(f"Copied attachment from cache: {filename} (size: {cache_file_size} bytes)")
-                        return
-
-            # Download from API if not found in cache (always overwrite existing files in var directory)
-            content = self.api_client.download_attachment(page_id, attachment_id)
-            if content:
-                self.file_manager.save_file(filepath, content, is_binary=True)
-                downloaded_size = len(content)
-                size_info = f" (size: {downloaded_size} bytes"
-                if expected_size is not None:
-                    if downloaded_size == expected_size:
-                        size_info += ", matches expected size"
-                    else:
-                        size_info += f", expected: {expected_size} bytes"
-                size_info += ")"
-                self.logger.warning(f"Downloaded attachment from API: {filename}{size_info}")
+                        return "copied", cache_file_size
+
+            # Download from API if not found in cache (always overwrite existing files in var directory).
+            # The body is streamed to a temporary file and renamed into place, so an
+            # interrupted download never leaves a truncated attachment behind.
+            downloaded_size = self.file_manager.save_stream(
+                filepath, self.api_client.iter_attachment_chunks(page_id, attachment_id)
+            )
+            size_info = f" (size: {downloaded_size} bytes"
+            if expected_size is not None:
+                if downloaded_size == expected_size:
+                    size_info += ", matches expected size"
+                else:
+                    size_info += f", expected: {expected_size} bytes"
+            size_info += ")"
+            self.logger.warning(f"Downloaded attachment from API: {filename}{size_info}")
+            return "downloaded", downloaded_size
         except Exception as e:
             self.logger.error(f"Error downloading attachment {attachment.get('title', 'unknown')}: {str(e)}")
+            return "failed", 0
 
 
 class Stage4Processor(StageBase):
     """Stage 4: Document Listing - Generate document information for output listing."""
 
+    @profiling.timed("fetch.stage4_listing")
     def process(
         self,
         page_id: str,
@@ -23,6 +23,7 @@ Usage examples:
   bin/fetch_cli.py --recent  # Download recent pages then process locally
   bin/fetch_cli.py --days 14  # Fetch pages modified in last 14 days (with --recent)
   bin/fetch_cli.py --attachments  # Download page content with attachments
+  bin/fetch_cli.py --profile var/profile.fetch.json  # Also write stage timings and API counters
 """
 
 import argparse
@@ -38,6 +39,7 @@ _PROJECT_DIR = _SCRIPT_DIR.parent               # confluence-mdx/
 if str(_SCRIPT_DIR) not in sys.path:
     sys.path.insert(0, str(_SCRIPT_DIR))
 
+import profiling
 from fetch.config import Config
 from fetch.processor import ConfluencePageProcessor
 from fetch.sync_profiles import SYNC_PROFILES
@@ -62,6 +64,14 @@ def main():
     parser.add_argument("--email", default=Config().email, help="Confluence email for authentication")
     parser.add_argument("--api-token", default=Config().api_token, help="Confluence API token for authentication")
     parser.add_argument("--attachments", action="store_true", help="Download page content with attachments")
+    parser.add_argument("--attachment-workers", type=int, default=Config().attachment_workers, metavar="N",
+                        help="Number of concurrent attachment downloads (default: %(default)s)")
+    parser.add_argument("--fetch-workers", type=int, default=Config().fetch_workers, metavar="N",
+                        help="Number of pages fetched concurrently in --remote mode (default: %(default)s)")
+    parser.add_argument("--full-refresh", action="store_true",
+                        help="Download every page body in --remote mode, ignoring the versions in fetch_index.json")
+    parser.add_argument("--http-max-retries", type=int, default=Config().http_max_retries, metavar="N",
+                        help="Retries for a request answered with 429/5xx or a connection error (default: %(default)s)")
 
     # Mode selection (mutually exclusive)
     mode_group = parser.add_mutually_exclusive_group()
@@ -78,7 +88,14 @@ def main():
                         help="Enable verbose output (sets log level to INFO)")
     parser.add_argument("--log-level", default="WARNING", choices=["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
                         help="Set the logging level (default: %(default)s)")
+    profiling.add_arguments(parser)
     args = parser.parse_args()
+    if args.attachment_workers < 1:
+        parser.error("--attachment-workers must be a positive integer")
+    if args.fetch_workers < 1:
+        parser.error("--fetch-workers must be a positive integer")
+    if args.http_max_retries < 0:
+        parser.error("--http-max-retries must not be negative")
 
     # Set up logging configuration
     # --verbose flag overrides --log-level to INFO
@@ -88,6 +105,7 @@ def main():
         format='%(levelname)s - %(filename)s:%(lineno)d - %(message)s',
         stream=sys.stderr
     )
+    profiling.start_from_args("fetch_cli", args)
 
     # Determine mode (default to "recent" if not specified)
     mode = args.mode if args.mode else "recent"
@@ -110,6 +128,10 @@ def main():
         default_start_page_id=start_page_id,
         root_content_type=root_content_type,
         download_attachments=args.attachments,
+        attachment_workers=args.attachment_workers,
+        fetch_workers=args.fetch_workers,
+        incremental_fetch=not args.full_refresh,
+        http_max_retries=args.http_max_retries,
         mode=mode
     )
 
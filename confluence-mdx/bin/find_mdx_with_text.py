@@ -22,13 +22,12 @@ import sys
 from pathlib import Path
 from typing import Dict, List, Optional
 
-import yaml
-
 # Ensure bin/ is on sys.path for fetch package imports
 _BIN_DIR = Path(__file__).resolve().parent  # confluence-mdx/bin/
 if str(_BIN_DIR) not in sys.path:
     sys.path.insert(0, str(_BIN_DIR))
 
+import pages_catalog
 from fetch.sync_profiles import SYNC_PROFILES
 
 # Configure logging
@@ -118,22 +117,21 @@ def load_pages_yaml(yaml_path: Path) -> Dict[str, Dict]:
         return pages_by_path
     
     try:
-        with open(yaml_path, 'r', encoding='utf-8') as f:
-            yaml_data = yaml.safe_load(f)
-            
-            if isinstance(yaml_data, list):
-                for page in yaml_data:
-                    if not isinstance(page, dict):
-                        continue
-                    
-                    path = page.get('path')
-                    if not path or not isinstance(path, list):
-                        continue
-                    
-                    # Convert path list to tuple for use as dictionary key
-                    path_tuple = tuple(path)
-                    pages_by_path[path_tuple] = page
-                    
+        yaml_data = pages_catalog.load_pages(yaml_path)
+
+        if isinstance(yaml_data, list):
+            for page in yaml_data:
+                if not isinstance(page, dict):
+                    continue
+
+                path = page.get('path')
+                if not path or not isinstance(path, list):
+                    continue
+
+                # Convert path list to tuple for use as dictionary key
+                path_tuple = tuple(path)
+                pages_by_path[path_tuple] = page
+
         logging.info(f"Loaded {len(pages_by_path)} pages from {yaml_path}")
     except Exception as e:
         logging.error(f"Error loading pages.yaml: {e}")
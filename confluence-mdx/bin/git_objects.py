@@ -0,0 +1,124 @@
+"""
+Batched access to git objects shared by the reverse-sync and sync tools.
+
+Reading a file at a ref with `git rev-parse` plus `git show ref:path` costs two
+process spawns per file, which adds up to hundreds of spawns in a branch batch.
+GitObjectReader keeps one `git cat-file --batch` process per repository and
+sends every ref resolution and blob read through it. Refs are resolved once
+and then addressed by object name, so a branch that moves during a batch is
+read consistently.
+"""
+
+import atexit
+import os
+import subprocess
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+import profiling
+
+
+class GitObjectError(ValueError):
+    """A ref or a path at a ref does not name a readable git object."""
+
+
+class GitObjectReader:
+    """Reads refs and blobs of one repository through a long-lived `git cat-file --batch`.
+
+    Safe to share between threads. A forked child (a ProcessPoolExecutor
+    worker) starts its own git process instead of using the parent's pipes.
+    """
+
+    def __init__(self, cwd: Union[str, Path, None] = None):
+        self.cwd = str(cwd) if cwd is not None else None
+        self._process: Optional[subprocess.Popen] = None
+        self._pid: Optional[int] = None
+        self._lock = threading.Lock()
+        self._refs: Dict[str, Optional[str]] = {}
+
+    def _ensure_process(self) -> subprocess.Popen:
+        if self._process is None or self._pid != os.getpid() or self._process.poll() is not None:
+            profiling.count('subprocesses')
+            self._process = subprocess.Popen(
+                ['git', 'cat-file', '--batch'],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                cwd=self.cwd,
+            )
+            self._pid = os.getpid()
+        return self._process
+
+    def _request(self, name: str) -> Optional[tuple]:
+        """Send one object name and return (oid, type, content), or None if it does not exist."""
+        if '\n' in name:
+            return None
+        with self._lock:
+            process = self._ensure_process()
+            process.stdin.write(name.encode('utf-8') + b'\n')
+            process.stdin.flush()
+            header = process.stdout.readline()
+            if not header:
+                self._process = None
+                raise GitObjectError(f"git cat-file exited while reading {name!r}")
+            fields = header.decode('utf-8', 'replace').rstrip('\n').split(' ')
+            # "<name> missing" / "<name> ambiguous" / "<oid> <type> <size>"
+            if len(fields) != 3 or not fields[2].isdigit():
+                return None
+            oid, object_type, size = fields[0], fields[1], int(fields[2])
+            content = process.stdout.read(size)
+            process.stdout.read(1)  # trailing LF
+            return oid, object_type, content
+
+    def resolve(self, ref: str) -> Optional[str]:
+        """Return the object name of ref, or None if it is not a valid ref (cached per reader)."""
+        if ref not in self._refs:
+            found = self._request(ref) if ref and not ref.startswith('-') else None
+            self._refs[ref] = found[0] if found else None
+        return self._refs[ref]
+
+    def read_blob(self, ref: str, path: str) -> bytes:
+        """Return the contents of path at ref."""
+        oid = self.resolve(ref)
+        if oid is None:
+            raise GitObjectError(f"Invalid git ref: {ref}")
+        found = self._request(f'{oid}:{path}')
+        if found is None:
+            raise GitObjectError(f"path '{path}' does not exist in '{ref}'")
+        if found[1] != 'blob':
+            raise GitObjectError(f"path '{path}' in '{ref}' is a {found[1]}, not a file")
+        return found[2]
+
+    def read_text(self, ref: str, path: str) -> str:
+        """Return path at ref as text, with newlines translated as `git show` read in text mode would be."""
+        text = self.read_blob(ref, path).decode('utf-8')
+        return text.replace('\r\n', '\n').replace('\r', '\n')
+
+    def close(self) -> None:
+        with self._lock:
+            process, self._process = self._process, None
+            if process is not None and self._pid == os.getpid():
+                process.stdin.close()
+                process.wait()
+                process.stdout.close()
+
+
+_readers: Dict[Optional[str], GitObjectReader] = {}
+_readers_lock = threading.Lock()
+
+
+def shared_reader(cwd: Union[str, Path, None] = None) -> GitObjectReader:
+    """Return the process-wide GitObjectReader of the repository at cwd."""
+    key = str(cwd) if cwd is not None else None
+    with _readers_lock:
+        reader = _readers.get(key)
+        if reader is None:
+            reader = _readers[key] = GitObjectReader(cwd)
+        return reader
+
+
+@atexit.register
+def _close_readers() -> None:
+    for reader in list(_readers.values()):
+        reader.close()
@@ -0,0 +1,189 @@
+"""
+HTTP transport shared by the Confluence API clients.
+
+fetch.ApiClient and reverse_sync.confluence_client both talk to the same
+Confluence instance. HttpTransport gives them one keep-alive requests.Session
+with a sized connection pool, retries 429/5xx responses with exponential
+backoff that honours Retry-After, and counts requests, retries and latency per
+endpoint so that a long fetch run can report where its time went.
+"""
+
+import logging
+import re
+import threading
+import time
+from dataclasses import dataclass, replace
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Callable, Dict, FrozenSet, List, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+import profiling
+
+# Methods that are safe to send again after a 5xx response or a connection error.
+# Other methods (PUT of a version-bound page update) are only retried on 429,
+# which means the server rejected the request without processing it.
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+_ID_SEGMENT = re.compile(r"^(?:att)?\d+$")
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """When and how long to wait before sending a request again."""
+    max_retries: int = 5
+    backoff_factor: float = 1.0  # Delay before retry n (0-based) is backoff_factor * 2**n seconds
+    max_backoff: float = 60.0  # Upper bound for both computed delays and Retry-After
+    retry_statuses: FrozenSet[int] = frozenset({429, 500, 502, 503, 504})
+
+    def should_retry_status(self, method: str, status: int) -> bool:
+        if status not in self.retry_statuses:
+            return False
+        return status == 429 or method in IDEMPOTENT_METHODS
+
+    def delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        if retry_after is not None:
+            return min(self.max_backoff, max(0.0, retry_after))
+        return min(self.max_backoff, self.backoff_factor * (2 ** attempt))
+
+
+@dataclass
+class EndpointStats:
+    """Counters for one endpoint ("GET /api/v2/pages/{id}")."""
+    requests: int = 0  # Logical requests, not counting retries
+    retries: int = 0
+    failures: int = 0  # Requests that ended in an exception or an HTTP error status
+    total_seconds: float = 0.0  # Time spent waiting for responses, over all attempts
+    max_seconds: float = 0.0
+
+    @property
+    def attempts(self) -> int:
+        return self.requests + self.retries
+
+    @property
+    def mean_seconds(self) -> float:
+        return self.total_seconds / self.attempts if self.attempts else 0.0
+
+
+def endpoint_name(method: str, url: str) -> str:
+    """Group URLs by endpoint: numeric ids become {id} and the query is dropped."""
+    path = urlsplit(url).path
+    segments = ["{id}" if _ID_SEGMENT.match(segment) else segment for segment in path.split("/")]
+    return f"{method.upper()} {'/'.join(segments)}"
+
+
+def parse_retry_after(value: Optional[str], now: Optional[datetime] = None) -> Optional[float]:
+    """Seconds to wait according to a Retry-After header (delta-seconds or HTTP-date)."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - (now or datetime.now(timezone.utc))).total_seconds())
+
+
+class HttpTransport:
+    """A pooled keep-alive session with retry/backoff and per-endpoint statistics.
+
+    Safe to share between threads. Callers keep their own error handling: the
+    final response is returned as is (call raise_for_status() on it), and the
+    final exception of a failed request is re-raised.
+    """
+
+    def __init__(
+        self,
+        pool_size: int = 10,
+        retry: RetryPolicy = RetryPolicy(),
+        auth=None,
+        logger: Optional[logging.Logger] = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.retry = retry
+        self.logger = logger or logging.getLogger(__name__)
+        self._sleep = sleep
+        self.session = requests.Session()
+        self.session.auth = auth
+        # Retries are handled here rather than by urllib3 so that they are counted.
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self._stats: Dict[str, EndpointStats] = {}
+        self._lock = threading.Lock()
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        method = method.upper()
+        endpoint = endpoint_name(method, url)
+        attempt = 0
+        while True:
+            started = time.monotonic()
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except requests.RequestException as exc:
+                self._record(endpoint, attempt, time.monotonic() - started)
+                if attempt >= self.retry.max_retries or method not in IDEMPOTENT_METHODS \
+                        or not isinstance(exc, (requests.ConnectionError, requests.Timeout)):
+                    self._record_failure(endpoint)
+                    raise
+                delay = self.retry.delay(attempt)
+                self.logger.warning(f"{endpoint} failed ({exc}); retry {attempt + 1}/{self.retry.max_retries} in {delay:.1f}s")
+            else:
+                self._record(endpoint, attempt, time.monotonic() - started)
+                status = response.status_code
+                if attempt >= self.retry.max_retries or not self.retry.should_retry_status(method, status):
+                    if status >= 400:
+                        self._record_failure(endpoint)
+                    if profiling.enabled() and not kwargs.get("stream"):
+                        # A streamed body is counted by whoever reads it
+                        profiling.count("bytes_downloaded", len(response.content))
+                    return response
+                delay = self.retry.delay(attempt, parse_retry_after(response.headers.get("Retry-After")))
+                self.logger.warning(f"{endpoint} returned HTTP {status}; retry {attempt + 1}/{self.retry.max_retries} in {delay:.1f}s")
+                response.close()
+            self._sleep(delay)
+            attempt += 1
+
+    def _record(self, endpoint: str, attempt: int, seconds: float) -> None:
+        with self._lock:
+            stats = self._stats.setdefault(endpoint, EndpointStats())
+            if attempt == 0:
+                stats.requests += 1
+            else:
+                stats.retries += 1
+            stats.total_seconds += seconds
+            stats.max_seconds = max(stats.max_seconds, seconds)
+        profiling.count("api_calls" if attempt == 0 else "api_retries")
+
+    def _record_failure(self, endpoint: str) -> None:
+        with self._lock:
+            self._stats[endpoint].failures += 1
+
+    def stats(self) -> Dict[str, EndpointStats]:
+        """A snapshot of the per-endpoint counters."""
+        with self._lock:
+            return {endpoint: replace(stats) for endpoint, stats in self._stats.items()}
+
+    def format_stats(self) -> List[str]:
+        """One summary line per endpoint, busiest endpoint first."""
+        lines = []
+        for endpoint, stats in sorted(self.stats().items(), key=lambda item: -item[1].total_seconds):
+            lines.append(
+                f"{endpoint}: {stats.requests} requests, {stats.retries} retries, "
+                f"{stats.failures} failures, mean {stats.mean_seconds * 1000:.0f} ms, "
+                f"max {stats.max_seconds * 1000:.0f} ms"
+            )
+        return lines
+
+    def close(self) -> None:
+        self.session.close()
@@ -10,13 +10,13 @@ from pathlib import Path
 from typing import Any, Optional
 from urllib.parse import unquote
 
-import yaml
 
 # Ensure bin/ is on sys.path for fetch package imports
 _BIN_DIR = Path(__file__).resolve().parent.parent  # confluence-mdx/bin/
 if str(_BIN_DIR) not in sys.path:
     sys.path.insert(0, str(_BIN_DIR))
 
+import pages_catalog
 from fetch.sync_profiles import SYNC_PROFILES
 
 
@@ -45,7 +45,7 @@ def load_pages_yaml(yaml_path: Path) -> list[PageEntry]:
     if not yaml_path.exists():
         return []
 
-    loaded: Any = yaml.safe_load(yaml_path.read_text(encoding="utf-8"))
+    loaded: Any = pages_catalog.load_pages(yaml_path)
     if not isinstance(loaded, list):
         return []
 
@@ -0,0 +1,114 @@
+"""
+Shared loader of the pages catalog (var/pages.<code>.yaml).
+
+The converter, convert_all, the MDX → storage link resolver, reverse-sync and
+the maintenance scripts all read the same catalog, often several times per
+process (emit_document() builds a LinkResolver for every page). Parsing it
+with PyYAML's pure-Python loader takes about 0.4s. load_pages() parses it
+with libyaml's CSafeLoader when PyYAML was built with it (about 25ms), and
+keeps the parsed entries in memory as a marshal blob keyed by the file's
+path, mtime and size, so that later loads in the process only unmarshal the
+blob (about 1ms). Nothing is written to disk.
+
+Every call returns fresh objects, so callers may modify what they get.
+"""
+
+import logging
+import marshal
+import os
+from functools import cached_property
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import yaml
+
+import profiling
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader
+
+# path → ((mtime_ns, size), marshal blob of the parsed YAML)
+_loaded: Dict[str, Tuple[Tuple[int, int], bytes]] = {}
+
+PathLike = Union[str, 'os.PathLike[str]']
+
+
+def safe_load(stream: Any) -> Any:
+    """yaml.safe_load() with the C loader when available; the result is the same."""
+    return yaml.load(stream, Loader=SafeLoader)
+
+
+@profiling.timed('catalog.load')
+def load_pages(yaml_path: PathLike) -> Any:
+    """Parsed content of a pages YAML file, normally a list of page entries.
+
+    Raises FileNotFoundError if the file does not exist and yaml.YAMLError if
+    it is not valid YAML. Content that marshal cannot store (such as
+    timestamps) is returned as parsed, without caching.
+    """
+    path = os.path.abspath(yaml_path)
+    stat = os.stat(path)
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    loaded = _loaded.get(path)
+    if loaded is not None and loaded[0] == stamp:
+        return marshal.loads(loaded[1])
+
+    with open(path, 'rb') as f:
+        data = f.read()
+    profiling.count('catalog_yaml_parses')
+    parsed = safe_load(data)
+    try:
+        blob = marshal.dumps(parsed)
+    except (ValueError, TypeError) as e:
+        # e.g. an unquoted date loads as datetime.date, which marshal cannot store
+        logging.debug(f"Not caching pages catalog {path}: {e}")
+        return parsed
+    _loaded[path] = (stamp, blob)
+    return marshal.loads(blob)
+
+
+class PagesIndex:
+    """Lookups over the entries of a pages catalog by page_id and path.
+
+    When several entries share a key, the first one in catalog order wins.
+    """
+
+    def __init__(self, pages: Sequence[Any]):
+        self.pages: List[Dict[str, Any]] = [page for page in pages if isinstance(page, dict)]
+
+    def __len__(self) -> int:
+        return len(self.pages)
+
+    @cached_property
+    def _by_id(self) -> Dict[str, Dict[str, Any]]:
+        index: Dict[str, Dict[str, Any]] = {}
+        for page in self.pages:
+            if page.get('page_id') is not None:
+                index.setdefault(str(page['page_id']), page)
+        return index
+
+    @cached_property
+    def _by_path(self) -> Dict[Tuple[str, ...], Dict[str, Any]]:
+        index: Dict[Tuple[str, ...], Dict[str, Any]] = {}
+        for page in self.pages:
+            if isinstance(page.get('path'), list):
+                index.setdefault(tuple(page['path']), page)
+        return index
+
+    def by_id(self, page_id: Any) -> Optional[Dict[str, Any]]:
+        return self._by_id.get(str(page_id))
+
+    def by_path(self, path: Sequence[str]) -> Optional[Dict[str, Any]]:
+        return self._by_path.get(tuple(path))
+
+
+def load_index(yaml_path: PathLike) -> PagesIndex:
+    """PagesIndex of a pages YAML file; a file that is not a list has no entries."""
+    pages = load_pages(yaml_path)
+    return PagesIndex(pages if isinstance(pages, list) else [])
+
+
+def clear_cache() -> None:
+    """Forget the catalogs loaded in this process."""
+    _loaded.clear()
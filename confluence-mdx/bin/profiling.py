@@ -0,0 +1,269 @@
+"""
+Opt-in run instrumentation shared by the CLIs: stage timers, counters and cProfile dumps.
+
+Instrumented code calls stage(), timed() and count() unconditionally. They do
+nothing until a CLI started with --profile calls start_from_args(), so a normal
+run only pays one flag check per call. At exit the run writes a JSON report:
+
+    {"tool": "convert_all", "argv": [...], "python": "3.11.7",
+     "wall_seconds": 12.3,
+     "stages": {"convert.page": {"calls": 120, "seconds": 9.8, "max_seconds": 0.4}},
+     "counters": {"pages_converted": 120, "soup_parses": 121}}
+
+Stage seconds add up every call of the stage, so stages that run in several
+threads can exceed wall_seconds, and nested stages are counted in their parent
+as well. Worker processes keep their own profiler; a pool that wants their
+numbers enables profiling in the worker and merges its take() snapshots into the
+parent with merge(). --profile-pstats additionally dumps cProfile statistics
+of the main process (python -m pstats FILE).
+"""
+
+import argparse
+import atexit
+import cProfile
+import functools
+import json
+import platform
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, List, Optional, TypeVar
+
+REPORT_VERSION = 1
+
+F = TypeVar('F', bound=Callable[..., Any])
+
+
+@dataclass
+class StageStats:
+    calls: int = 0
+    seconds: float = 0.0
+    max_seconds: float = 0.0
+
+
+class Profiler:
+    """Thread-safe stage timers and counters; disabled until enable() is called."""
+
+    def __init__(self):
+        self.enabled = False
+        self._lock = threading.Lock()
+        self._stages: Dict[str, StageStats] = {}
+        self._counters: Dict[str, int] = {}
+
+    def enable(self) -> None:
+        self.enabled = True
+
+    def disable(self) -> None:
+        self.enabled = False
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        if not self.enabled:
+            yield
+            return
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(name, time.perf_counter() - started)
+
+    def add_time(self, name: str, seconds: float) -> None:
+        with self._lock:
+            stats = self._stages.setdefault(name, StageStats())
+            stats.calls += 1
+            stats.seconds += seconds
+            stats.max_seconds = max(stats.max_seconds, seconds)
+
+    def count(self, name: str, n: int = 1) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + n
+
+    def snapshot(self, reset: bool = False) -> Dict[str, Any]:
+        """Stages and counters recorded so far, as plain JSON-ready dicts.
+
+        With reset, start over afterwards, so that a worker reports each task only once.
+        """
+        with self._lock:
+            snapshot = {
+                'stages': {
+                    name: {
+                        'calls': stats.calls,
+                        'seconds': round(stats.seconds, 6),
+                        'max_seconds': round(stats.max_seconds, 6),
+                    }
+                    for name, stats in sorted(self._stages.items())
+                },
+                'counters': dict(sorted(self._counters.items())),
+            }
+            if reset:
+                self._stages, self._counters = {}, {}
+        return snapshot
+
+    def merge(self, snapshot: Optional[Dict[str, Any]]) -> None:
+        """Add a snapshot() of another profiler, typically of a worker process."""
+        if not snapshot:
+            return
+        with self._lock:
+            for name, values in snapshot.get('stages', {}).items():
+                stats = self._stages.setdefault(name, StageStats())
+                stats.calls += values['calls']
+                stats.seconds += values['seconds']
+                stats.max_seconds = max(stats.max_seconds, values['max_seconds'])
+            for name, value in snapshot.get('counters', {}).items():
+                self._counters[name] = self._counters.get(name, 0) + value
+
+
+PROFILER = Profiler()
+
+
+def enabled() -> bool:
+    return PROFILER.enabled
+
+
+def stage(name: str):
+    """Context manager timing the enclosed block as one call of stage name."""
+    return PROFILER.stage(name)
+
+
+def count(name: str, n: int = 1) -> None:
+    PROFILER.count(name, n)
+
+
+def timed(name: str) -> Callable[[F], F]:
+    """Decorator timing every call of the function as stage name."""
+    def decorator(func: F) -> F:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not PROFILER.enabled:
+                return func(*args, **kwargs)
+            started = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                PROFILER.add_time(name, time.perf_counter() - started)
+        return wrapper  # type: ignore[return-value]
+    return decorator
+
+
+def take() -> Dict[str, Any]:
+    """The stages and counters recorded since the last take(), for merge() in another process."""
+    return PROFILER.snapshot(reset=True)
+
+
+def merge(snapshot: Optional[Dict[str, Any]]) -> None:
+    PROFILER.merge(snapshot)
+
+
+class _Run:
+    """The profiled run of one CLI invocation."""
+
+    def __init__(self, tool: str, report_path: Optional[str], pstats_path: Optional[str],
+                 argv: List[str]):
+        self.tool = tool
+        self.report_path = report_path
+        self.pstats_path = pstats_path
+        self.argv = argv
+        self.started = time.perf_counter()
+        self.cprofile = cProfile.Profile() if pstats_path else None
+
+
+_run: Optional[_Run] = None
+
+_SECRET_OPTIONS = ('token', 'password', 'secret')
+
+
+def _redacted_argv(argv: List[str]) -> List[str]:
+    """argv with the values of credential options (--api-token ...) replaced, as reports are shared."""
+    redacted = []
+    hide_next = False
+    for arg in argv:
+        if hide_next:
+            redacted.append('***')
+            hide_next = False
+            continue
+        option, sep, _ = arg.partition('=')
+        secret = option.startswith('--') and any(word in option for word in _SECRET_OPTIONS)
+        if secret and sep:
+            redacted.append(f'{option}=***')
+        else:
+            redacted.append(arg)
+            hide_next = secret
+    return redacted
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add --profile and --profile-pstats to a CLI parser."""
+    parser.add_argument('--profile', nargs='?', const='-', metavar='FILE',
+                        help='Record stage timings and counters and write them as a JSON report '
+                             'to FILE at exit (default: stderr)')
+    parser.add_argument('--profile-pstats', metavar='FILE',
+                        help='Also dump cProfile statistics of this process to FILE '
+                             '(inspect with python -m pstats FILE)')
+
+
+def start(tool: str, report_path: Optional[str] = '-', pstats_path: Optional[str] = None,
+          argv: Optional[List[str]] = None) -> None:
+    """Enable profiling for the rest of the process and write the report at exit.
+
+    report_path '-' writes the report to stderr; None writes no report.
+    """
+    global _run
+    if _run is not None:
+        return
+    _run = _Run(tool, report_path, pstats_path, _redacted_argv(sys.argv[1:] if argv is None else argv))
+    PROFILER.enable()
+    if _run.cprofile is not None:
+        _run.cprofile.enable()
+    atexit.register(finish)
+
+
+def start_from_args(tool: str, args: argparse.Namespace) -> None:
+    """start() if the parsed arguments ask for --profile or --profile-pstats."""
+    report_path = getattr(args, 'profile', None)
+    pstats_path = getattr(args, 'profile_pstats', None)
+    if report_path or pstats_path:
+        start(tool, report_path, pstats_path)
+
+
+def report() -> Dict[str, Any]:
+    """The JSON report of the current run."""
+    data = {
+        'version': REPORT_VERSION,
+        'tool': _run.tool if _run else '',
+        'argv': _run.argv if _run else [],
+        'python': platform.python_version(),
+        'wall_seconds': round(time.perf_counter() - _run.started, 6) if _run else 0.0,
+    }
+    data.update(PROFILER.snapshot())
+    return data
+
+
+def finish() -> Optional[Dict[str, Any]]:
+    """Stop profiling, write the report and the pstats dump, and return the report.
+
+    Runs at exit; calling it earlier ends the run. Later calls return None.
+    """
+    global _run
+    if _run is None:
+        return None
+    run = _run
+    if run.cprofile is not None:
+        run.cprofile.disable()
+        run.cprofile.dump_stats(run.pstats_path)
+    data = report()
+    _run = None
+    PROFILER.disable()
+    PROFILER.snapshot(reset=True)
+    atexit.unregister(finish)
+    if run.report_path:
+        text = json.dumps(data, indent=2, ensure_ascii=False) + '\n'
+        if run.report_path == '-':
+            sys.stderr.write(text)
+        else:
+            with open(run.report_path, 'w', encoding='utf-8') as f:
+                f.write(text)
+    return data
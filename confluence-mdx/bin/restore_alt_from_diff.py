@@ -20,16 +20,21 @@ _PROJECT_DIR = _SCRIPT_DIR.parent                    # confluence-mdx/
 _REPO_ROOT = _PROJECT_DIR.parent                     # repo root
 
 
-def get_diff_for_lang(lang: str) -> str:
-    """특정 언어의 git diff 가져오기"""
+def get_diff_for_langs(langs: List[str]) -> str:
+    """대상 언어들의 git diff를 git 한 번 실행으로 가져오기"""
     result = subprocess.run(
-        ['git', 'diff', f'src/content/{lang}/'],
+        ['git', 'diff', '--', *[f'src/content/{lang}/' for lang in langs]],
         capture_output=True, text=True, check=True,
         cwd=str(_REPO_ROOT),
     )
     return result.stdout
 
 
+def get_diff_for_lang(lang: str) -> str:
+    """특정 언어의 git diff 가져오기"""
+    return get_diff_for_langs([lang])
+
+
 def parse_diff_for_alt_mapping(diff_content: str) -> Dict[str, Dict[str, str]]:
     """
     diff에서 파일별 이미지 경로 → 기존 alt 텍스트 매핑 추출
@@ -114,13 +119,16 @@ def main():
 
     dry_run = args.dry_run
     target_langs = ['en', 'ja'] if args.lang == 'all' else [args.lang]
+    # diff에서 매핑 추출 (모든 대상 언어를 한 번에)
+    all_mappings = parse_diff_for_alt_mapping(get_diff_for_langs(target_langs))
 
     for lang in target_langs:
         print(f"\n=== Processing {lang} ===")
 
-        # diff에서 매핑 추출
-        diff_content = get_diff_for_lang(lang)
-        file_mappings = parse_diff_for_alt_mapping(diff_content)
+        file_mappings = {
+            path: mapping for path, mapping in all_mappings.items()
+            if path.startswith(f'src/content/{lang}/')
+        }
 
         print(f"Found {len(file_mappings)} files with alt text to restore")
 
@@ -9,6 +9,7 @@ import re
 
 import yaml
 
+import pages_catalog
 from reverse_sync.models import PageSnapshot
 from reverse_sync.equivalence import verify_push_equivalence
 
@@ -148,7 +149,7 @@ def verify_repository_source_identity(
         )
 
     try:
-        loaded = yaml.safe_load(Path(pages_path).read_text())
+        loaded = pages_catalog.load_pages(pages_path)
     except (OSError, yaml.YAMLError) as exc:
         return BaseParityResult(
             False,
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import functools
+from concurrent.futures import Executor, ProcessPoolExecutor, as_completed
 from dataclasses import dataclass
-from typing import Callable, List
+from typing import Callable, Dict, List
 
 from reverse_sync.prepare_service import VerificationRequest
 from reverse_sync.publish_service import PushConflictError
@@ -20,6 +22,54 @@ class BatchRuntime:
     confirm: Callable[[str], bool]
     is_success_status: Callable[[str], bool]
     emit: Callable[..., None]
+    # jobs > 1 일 때 verify_one을 실행할 pool. verify_one과 결과는 pickle 가능해야 합니다.
+    make_executor: Callable[[int], Executor] = ProcessPoolExecutor
+
+
+def _verify_file(
+    verify_one: Callable[..., dict],
+    branch: str,
+    ko_path: str,
+    *,
+    online: bool,
+    config: object,
+    lenient: bool,
+    no_normalize: bool,
+) -> dict:
+    """한 파일을 검증하고 결과를 반환합니다. 예외는 error 결과로 바꿉니다.
+
+    각 page는 자신의 var/<page_id>/ 에만 쓰므로 worker process에서 병렬로 실행해도 됩니다.
+    """
+
+    try:
+        request = VerificationRequest(
+            improved_mdx=f"{branch}:{ko_path}",
+            original_mdx=None,
+            lenient=lenient,
+            no_normalize=no_normalize,
+        )
+        if online:
+            result = verify_one(
+                request,
+                config=config,
+                prepare_push=True,
+            )
+        else:
+            result = verify_one(request)
+        if online and result.get("status") == "pass":
+            result.update(
+                status="blocked",
+                push_eligible=False,
+                reason_code="diagnostic_result_not_pushable",
+            )
+        result["file"] = ko_path
+        return result
+    except Exception as exc:
+        return {
+            "file": ko_path,
+            "status": "error",
+            "error": str(exc),
+        }
 
 
 def run_batch(
@@ -33,8 +83,13 @@ def run_batch(
     lenient: bool = False,
     no_normalize: bool = False,
     prepare_push: bool = False,
+    jobs: int = 1,
 ) -> List[dict]:
-    """branch 변경 문서를 검증하고 eligible run만 순차 발행합니다."""
+    """branch 변경 문서를 검증하고 eligible run만 순차 발행합니다.
+
+    jobs > 1 이면 검증을 worker jobs개에서 병렬로 실행합니다. 진행 표시는 끝난 순서대로
+    나오지만 결과 순서와 failures_only/limit 처리는 순차 실행과 같습니다. 발행은 항상 순차입니다.
+    """
 
     files = runtime.get_changed_files(branch)
     if not files:
@@ -50,55 +105,41 @@ def run_batch(
         f"Processing {count_label}/{total} file(s) from branch {branch}..."
     )
 
-    results = []
-    failure_count = 0
     online = push or prepare_push
     config = runtime.ensure_config() if online else None
-    for index, ko_path in enumerate(files, 1):
-        runtime.emit(
-            f"[{index}/{len(files)}] {ko_path} ... ",
-            end="",
-            flush=True,
-        )
-        try:
-            request = VerificationRequest(
-                improved_mdx=f"{branch}:{ko_path}",
-                original_mdx=None,
-                lenient=lenient,
-                no_normalize=no_normalize,
-            )
-            if online:
-                result = runtime.verify_one(
-                    request,
-                    config=config,
-                    prepare_push=True,
-                )
-            else:
-                result = runtime.verify_one(request)
-            if online and result.get("status") == "pass":
-                result.update(
-                    status="blocked",
-                    push_eligible=False,
-                    reason_code="diagnostic_result_not_pushable",
-                )
-            result["file"] = ko_path
-            runtime.emit(result.get("status", "unknown"))
-            results.append(result)
-        except Exception as exc:
-            runtime.emit("error")
-            results.append(
-                {
-                    "file": ko_path,
-                    "status": "error",
-                    "error": str(exc),
-                }
+    # failures_only + limit: 파일 순서대로 실패가 limit건 쌓이면 그 이후 파일은 결과에서 제외합니다.
+    failure_limit = limit if not push and failures_only and limit > 0 else 0
+
+    # partial은 worker process로 pickle하여 보낼 수 있습니다.
+    verify = functools.partial(
+        _verify_file,
+        runtime.verify_one,
+        branch,
+        online=online,
+        config=config,
+        lenient=lenient,
+        no_normalize=no_normalize,
+    )
+
+    if jobs > 1 and len(files) > 1:
+        results = _verify_parallel(files, verify, runtime, jobs, failure_limit)
+    else:
+        results = []
+        failure_count = 0
+        for index, ko_path in enumerate(files, 1):
+            runtime.emit(
+                f"[{index}/{len(files)}] {ko_path} ... ",
+                end="",
+                flush=True,
             )
-        if not runtime.is_success_status(
-            results[-1].get("status", "unknown")
-        ):
-            failure_count += 1
-        if not push and failures_only and limit > 0 and failure_count >= limit:
-            break
+            results.append(verify(ko_path))
+            runtime.emit(results[-1].get("status", "unknown"))
+            if not runtime.is_success_status(
+                results[-1].get("status", "unknown")
+            ):
+                failure_count += 1
+            if failure_limit and failure_count >= failure_limit:
+                break
 
     if not push:
         return results
@@ -176,3 +217,51 @@ def run_batch(
 
     runtime.emit(f"\nPushed {push_count}/{len(pushable)} file(s)")
     return results
+
+
+def _verify_parallel(
+    files: List[str],
+    verify: Callable[[str], dict],
+    runtime: BatchRuntime,
+    jobs: int,
+    failure_limit: int,
+) -> List[dict]:
+    """파일들을 pool에서 검증하고 파일 순서대로 결과를 반환합니다."""
+
+    finished: Dict[int, dict] = {}
+    results: List[dict] = []
+    failure_count = 0
+    with runtime.make_executor(jobs) as executor:
+        futures = {
+            executor.submit(verify, ko_path): index
+            for index, ko_path in enumerate(files)
+        }
+        for future in as_completed(futures):
+            index = futures[future]
+            try:
+                result = future.result()
+            except Exception as exc:
+                # worker process가 죽으면 해당 파일만 실패로 기록합니다.
+                result = {
+                    "file": files[index],
+                    "status": "error",
+                    "error": f"verification worker failed: {exc!r}",
+                }
+            finished[index] = result
+            runtime.emit(
+                f"[{index + 1}/{len(files)}] {files[index]} ... "
+                f"{result.get('status', 'unknown')}",
+                flush=True,
+            )
+            # 앞에서부터 연속으로 끝난 결과만 확정하여 순차 실행과 같은 지점에서 멈춥니다.
+            while len(results) in finished:
+                results.append(finished.pop(len(results)))
+                if not runtime.is_success_status(
+                    results[-1].get("status", "unknown")
+                ):
+                    failure_count += 1
+                if failure_limit and failure_count >= failure_limit:
+                    for pending in futures:
+                        pending.cancel()
+                    return results
+    return results
@@ -37,7 +37,9 @@ def diff_blocks(
     orig_keys = [_block_key(b) for b in original]
     impr_keys = [_block_key(b) for b in improved]
 
-    sm = SequenceMatcher(None, orig_keys, impr_keys)
+    # autojunk은 200개 이상의 블록에서 자주 나오는 key(빈 줄 등)를 무시하여
+    # 큰 페이지의 정렬을 깨뜨리므로 끈다.
+    sm = SequenceMatcher(None, orig_keys, impr_keys, autojunk=False)
     changes: List[BlockChange] = []
     alignment: Dict[int, int] = {}
 
@@ -7,6 +7,7 @@ from urllib.parse import urljoin, urlparse
 
 import requests
 
+from http_transport import HttpTransport
 from reverse_sync.models import (
     AttachmentCatalog,
     AttachmentRecord,
@@ -16,6 +17,11 @@ from reverse_sync.models import (
 
 CONFIG_FILE = Path.home() / '.config' / 'atlassian' / 'confluence.conf'
 
+# 모든 호출이 공유하는 keep-alive 세션. GET은 429/5xx와 connection 오류에서 최대 5번
+# backoff 후 재시도하고(Retry-After는 한 번에 최대 60초), version-bound PUT은 서버가
+# 처리하지 않은 429에서만 재시도한다. 이 정책은 reverse-sync 옵션으로 바꿀 수 없다.
+TRANSPORT = HttpTransport()
+
 
 def _load_credentials() -> Tuple[str, str]:
     """~/.config/atlassian/confluence.conf 에서 인증 정보를 로드한다."""
@@ -86,7 +92,7 @@ def _raise_mapped_http_error(
 def _request_json(method: str, url: str, config: ConfluenceConfig, **kwargs) -> Dict[str, Any]:
     try:
         kwargs.setdefault("timeout", config.timeout_seconds)
-        response = requests.request(
+        response = TRANSPORT.request(
             method,
             url,
             auth=(config.email, config.api_token),
@@ -161,7 +167,7 @@ def get_page_snapshot(
     url = f"{config.base_url}/api/v2/pages/{page_id}"
     captured_at = fetched_at or datetime.now(timezone.utc)
     try:
-        response = requests.get(
+        response = TRANSPORT.get(
             url,
             params={
                 "body-format": "storage",
@@ -203,7 +209,7 @@ def get_active_draft(
     url = f"{config.base_url}/api/v2/pages/{page_id}"
     captured_at = fetched_at or datetime.now(timezone.utc)
     try:
-        response = requests.get(
+        response = TRANSPORT.get(
             url,
             params={
                 "body-format": "storage",
@@ -276,7 +282,7 @@ def get_attachment_catalog(
             )
         seen_urls.add(url)
         try:
-            response = requests.get(
+            response = TRANSPORT.get(
                 url,
                 params=params,
                 auth=(config.email, config.api_token),
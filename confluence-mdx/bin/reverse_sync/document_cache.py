@@ -0,0 +1,121 @@
+"""Page-scoped cache of parsed XHTML documents shared by the reverse-sync stages.
+
+One verification parses the same page XHTML, and the same block fragments,
+in many stages: mapping recording, fragment extraction, sidecar building,
+patching, beautified diffs and plain-text extraction. Inside parse_scope(),
+parse_xhtml() parses each distinct XHTML string once and lends the same tree
+to every read-only caller, and mutable_xhtml() hands mutating stages a private
+copy of the cached tree (copy-on-write). Outside a scope both simply parse.
+
+ParseStats counts the real parses, the reuses and the copies of a scope so
+that a verification can report how often it parsed.
+"""
+
+from __future__ import annotations
+
+import copy
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+from bs4 import BeautifulSoup
+
+import profiling
+
+
+def _parse(xhtml: str) -> BeautifulSoup:
+    profiling.count("soup_parses")
+    return BeautifulSoup(xhtml, "html.parser")
+
+
+@dataclass
+class ParseStats:
+    """Parse counters of one scope."""
+
+    parses: int = 0  # XHTML strings actually run through html.parser
+    reuses: int = 0  # parse_xhtml() calls answered with an already parsed tree
+    copies: int = 0  # mutable_xhtml() calls answered with a copy of a parsed tree
+
+    def to_dict(self) -> Dict[str, int]:
+        return asdict(self)
+
+    def __str__(self) -> str:
+        return f"{self.parses} parsed, {self.reuses} reused, {self.copies} copied"
+
+
+class DocumentCache:
+    """Parsed documents of one page, keyed by their XHTML text."""
+
+    def __init__(self) -> None:
+        self._documents: Dict[str, BeautifulSoup] = {}
+        self._derived: Dict[Tuple[str, str], Any] = {}
+        self.stats = ParseStats()
+
+    def borrow(self, xhtml: str) -> BeautifulSoup:
+        """Return the shared tree of xhtml. The caller must not modify it."""
+        soup = self._documents.get(xhtml)
+        if soup is None:
+            soup = _parse(xhtml)
+            self._documents[xhtml] = soup
+            self.stats.parses += 1
+        else:
+            self.stats.reuses += 1
+        return soup
+
+    def copy(self, xhtml: str) -> BeautifulSoup:
+        """Return a tree of xhtml that the caller owns and may modify."""
+        soup = self._documents.get(xhtml)
+        if soup is None:
+            # Nothing to copy from: a fresh parse is cheaper than parse + copy.
+            self.stats.parses += 1
+            return _parse(xhtml)
+        self.stats.copies += 1
+        return copy.copy(soup)
+
+    def derived(self, xhtml: str, name: str, build: Callable[[BeautifulSoup], Any]) -> Any:
+        """Return build(shared tree of xhtml), built once per document (e.g. an xpath index)."""
+        key = (name, xhtml)
+        if key not in self._derived:
+            self._derived[key] = build(self.borrow(xhtml))
+        return self._derived[key]
+
+
+_current: ContextVar[Optional[DocumentCache]] = ContextVar(
+    "reverse_sync_document_cache", default=None
+)
+
+
+@contextmanager
+def parse_scope() -> Iterator[DocumentCache]:
+    """Share parsed documents between the stages run inside the block.
+
+    Scopes nest: an inner scope starts empty and the outer one is restored
+    on exit. Threads started inside the block do not see the scope.
+    """
+    cache = DocumentCache()
+    token = _current.set(cache)
+    try:
+        yield cache
+    finally:
+        _current.reset(token)
+
+
+def current_scope() -> Optional[DocumentCache]:
+    return _current.get()
+
+
+def parse_xhtml(xhtml: str) -> BeautifulSoup:
+    """Parse xhtml for reading; inside a scope the tree is shared and must not be modified."""
+    cache = _current.get()
+    if cache is None:
+        return _parse(xhtml)
+    return cache.borrow(xhtml)
+
+
+def mutable_xhtml(xhtml: str) -> BeautifulSoup:
+    """Parse xhtml into a tree the caller may modify (a copy of the cached tree inside a scope)."""
+    cache = _current.get()
+    if cache is None:
+        return _parse(xhtml)
+    return cache.copy(xhtml)
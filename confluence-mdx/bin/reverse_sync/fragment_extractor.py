@@ -12,8 +12,9 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import List, Tuple
 
-from bs4 import BeautifulSoup, Comment, NavigableString, Tag
+from bs4 import Comment, NavigableString, Tag
 
+from reverse_sync.document_cache import parse_xhtml
 from reverse_sync.mapping_recorder import iter_block_children
 
 
@@ -39,7 +40,7 @@ def extract_block_fragments(xhtml_text: str) -> FragmentExtractionResult:
     Raises:
         ValueError: 태그 경계를 찾지 못한 경우
     """
-    soup = BeautifulSoup(xhtml_text, "html.parser")
+    soup = parse_xhtml(xhtml_text)
 
     # Top-level element 순서 파악
     top_elements: List[Tuple[str, str]] = []
@@ -1,7 +1,8 @@
 """Mapping Recorder — XHTML 블록 요소를 추출하여 매핑 레코드를 생성한다."""
 from dataclasses import dataclass, field
 from typing import List, Optional
-from bs4 import BeautifulSoup, Comment, NavigableString, Tag
+from bs4 import Comment, NavigableString, Tag
+from reverse_sync.document_cache import parse_xhtml
 
 
 @dataclass
@@ -64,7 +65,7 @@ _iter_block_children = iter_block_children
 
 def record_mapping(xhtml: str) -> List[BlockMapping]:
     """XHTML에서 블록 레벨 요소를 추출하여 매핑 레코드를 생성한다."""
-    soup = BeautifulSoup(xhtml, 'html.parser')
+    soup = parse_xhtml(xhtml)
     mappings: List[BlockMapping] = []
     counters: dict = {}
 
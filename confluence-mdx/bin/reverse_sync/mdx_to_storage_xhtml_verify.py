@@ -11,9 +11,9 @@ from pathlib import Path
 import re
 from typing import Iterable
 
-from bs4 import BeautifulSoup
 from mdx_to_storage import emit_document, parse_mdx
 from mdx_to_storage.link_resolver import LinkResolver
+from reverse_sync.document_cache import mutable_xhtml
 from reverse_sync.xhtml_normalizer import normalize_soup
 from xhtml_beautify_diff import beautify_xhtml, xhtml_diff
 
@@ -54,7 +54,7 @@ def mdx_to_storage_xhtml_fragment(
 
 
 def _normalize_xhtml(xhtml: str, ignore_ri_filename: bool = False) -> str:
-    soup = BeautifulSoup(xhtml, "html.parser")
+    soup = mutable_xhtml(xhtml)
     normalize_soup(soup, ignore_ri_filename=ignore_ri_filename)
     return beautify_xhtml(str(soup)).strip()
 
@@ -17,6 +17,7 @@ from reverse_sync.capabilities import (
     is_markdown_table,
     select_renderer_strategy,
 )
+from reverse_sync.document_cache import mutable_xhtml, parse_xhtml
 from reverse_sync.mapping_recorder import BlockMapping, record_mapping
 from mdx_to_storage.parser import Block as MdxBlock
 from text_utils import (
@@ -130,7 +131,7 @@ def _contains_only_supported_preservation_units(xhtml_text: str) -> bool:
         "ri:page",
         "ri:space",
     }
-    soup = BeautifulSoup(xhtml_text, "html.parser")
+    soup = parse_xhtml(xhtml_text)
     preservation_tags = {
         tag.name
         for tag in soup.find_all()
@@ -675,7 +676,6 @@ def _build_list_item_merge_patch(
     제거된 아이템의 자식 요소(<ac:image> 등)를 이전 아이템으로 이동하고
     빈 <li>를 제거한다. 텍스트 변경은 _apply_text_changes로 처리한다.
     """
-    from bs4 import BeautifulSoup
     from reverse_sync.reconstructors import _find_list_item_by_path
     from reverse_sync.xhtml_patch_engine import _apply_text_changes
 
@@ -683,7 +683,7 @@ def _build_list_item_merge_patch(
     if not removed_paths:
         return None
 
-    soup = BeautifulSoup(mapping.xhtml_text, 'html.parser')
+    soup = mutable_xhtml(mapping.xhtml_text)
     root = soup.find(['ol', 'ul'])
     if root is None:
         return None
@@ -151,7 +151,7 @@ def _sidecar_index(sidecar: Optional[RoundtripSidecar]) -> dict[str, SidecarBloc
 
 def _mapping_for_patch(
     patch: dict[str, Any],
-    mappings: list[BlockMapping],
+    mappings_by_xpath: dict[str, BlockMapping],
 ) -> Optional[BlockMapping]:
     target = (
         patch.get("after_xpath")
@@ -161,16 +161,15 @@ def _mapping_for_patch(
     if target is None:
         return None
     target_text = str(target)
-    exact = {mapping.xhtml_xpath: mapping for mapping in mappings}
-    return exact.get(target_text) or exact.get(_root_xpath(target_text))
+    return mappings_by_xpath.get(target_text) or mappings_by_xpath.get(_root_xpath(target_text))
 
 
 def _target_identity(
     patch: dict[str, Any],
     sidecar: Optional[RoundtripSidecar],
+    sidecar_by_xpath: dict[str, SidecarBlock],
 ) -> Optional[TargetIdentity]:
     action = str(patch.get("action", "modify"))
-    sidecar_by_xpath = _sidecar_index(sidecar)
     if action == "insert":
         anchor = patch.get("after_xpath")
         if anchor is None:
@@ -504,7 +503,9 @@ def plan_patches(
         for issue in legacy_issues
         if issue.intent_ordinal not in identity_issue_ordinals
     ]
+    # patch마다 다시 만들지 않도록 xpath 조회 표는 plan 단위로 한 번만 만든다.
     sidecar_by_xpath = _sidecar_index(roundtrip_sidecar)
+    mappings_by_xpath = {mapping.xhtml_xpath: mapping for mapping in resolved_mappings}
     assigned_inserts: set[int] = set()
     operations: list[PatchOperation] = []
 
@@ -541,10 +542,10 @@ def plan_patches(
                 )
             )
             continue
-        target = _target_identity(patch, roundtrip_sidecar)
+        target = _target_identity(patch, roundtrip_sidecar, sidecar_by_xpath)
         if target is None:
             if enforce_provenance:
-                mapping = _mapping_for_patch(patch, resolved_mappings)
+                mapping = _mapping_for_patch(patch, mappings_by_xpath)
                 issue_intent_ordinal = (
                     intent_ordinals[0]
                     if len(intent_ordinals) == 1
@@ -591,7 +592,7 @@ def plan_patches(
                 base_fragment_sha256="",
             )
 
-        mapping = _mapping_for_patch(patch, resolved_mappings)
+        mapping = _mapping_for_patch(patch, mappings_by_xpath)
         capability = _capability_for_operation(
             action=str(patch.get("action", "modify")),
             intent_ordinals=intent_ordinals,
@@ -19,10 +19,11 @@ import json
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-import yaml
+import artifacts
 
 from reverse_sync.mapping_recorder import BlockMapping
 from reverse_sync.block_diff import NON_CONTENT_TYPES
+from reverse_sync.document_cache import parse_xhtml
 from reverse_sync.xhtml_normalizer import extract_plain_text
 
 
@@ -314,8 +315,8 @@ def _build_anchor_entries(fragment: str) -> list:
 
     li 직속 자식 ac:image(p 밖)는 포함하지 않는다.
     """
-    from bs4 import BeautifulSoup, NavigableString, Tag
-    soup = BeautifulSoup(fragment, 'html.parser')
+    from bs4 import NavigableString, Tag
+    soup = parse_xhtml(fragment)
     anchors = []
     for p in soup.find_all('p', recursive=False):
         offset = 0
@@ -380,8 +381,7 @@ def _build_list_anchor_entries(fragment: str) -> list:
         offset: p 내 plain text 기준 삽입 위치
         raw_xhtml: ac:image 원본 XHTML 문자열
     """
-    from bs4 import BeautifulSoup
-    soup = BeautifulSoup(fragment, 'html.parser')
+    soup = parse_xhtml(fragment)
     root = soup.find(['ul', 'ol'])
     if root is None:
         return []
@@ -577,7 +577,7 @@ def load_sidecar_mapping(mapping_path: str) -> List[SidecarEntry]:
             f"Sidecar mapping not found: {mapping_path}\n"
             f"Forward converter를 실행하여 mapping.yaml을 생성하세요."
         )
-    data = yaml.safe_load(path.read_text()) or {}
+    data = artifacts.read_artifact(path) or {}
     entries = []
     for item in data.get('mappings', []):
         children = [
@@ -605,7 +605,7 @@ def load_page_lost_info(mapping_path: str) -> dict:
     path = Path(mapping_path)
     if not path.exists():
         return {}
-    data = yaml.safe_load(path.read_text()) or {}
+    data = artifacts.read_artifact(path) or {}
     return data.get('lost_info', {})
 
 
@@ -737,7 +737,7 @@ def generate_sidecar_mapping(
     }
     if lost_infos:
         mapping_data['lost_info'] = lost_infos
-    return yaml.dump(mapping_data, allow_unicode=True, default_flow_style=False)
+    return artifacts.dump_artifact(mapping_data)
 
 
 
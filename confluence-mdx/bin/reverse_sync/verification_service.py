@@ -9,10 +9,11 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Callable, Dict
 
-import yaml
-
+import artifacts
+import profiling
 from mdx_to_storage.parser import parse_mdx_blocks
 from reverse_sync.block_diff import diff_blocks
+from reverse_sync.document_cache import parse_scope
 from reverse_sync.equivalence import verify_push_equivalence
 from reverse_sync.mapping_recorder import record_mapping
 from reverse_sync.planner import plan_patches
@@ -100,7 +101,7 @@ def save_diff_yaml(
         ],
     }
     (var_dir / "reverse-sync.diff.yaml").write_text(
-        yaml.dump(diff_data, allow_unicode=True, default_flow_style=False)
+        artifacts.dump_yaml(diff_data, allow_unicode=True, default_flow_style=False)
     )
 
 
@@ -164,7 +165,7 @@ def compile_result(
     if skipped_changes:
         result["skipped_changes"] = skipped_changes
     (var_dir / "reverse-sync.result.yaml").write_text(
-        yaml.dump(result, allow_unicode=True, default_flow_style=False)
+        artifacts.dump_yaml(result, allow_unicode=True, default_flow_style=False)
     )
     return result
 
@@ -190,7 +191,7 @@ def blocked_result(
     if detail:
         result["detail"] = detail
     (var_dir / "reverse-sync.result.yaml").write_text(
-        yaml.dump(result, allow_unicode=True, default_flow_style=False)
+        artifacts.dump_yaml(result, allow_unicode=True, default_flow_style=False)
     )
     return result
 
@@ -274,8 +275,48 @@ def run_verification(
     attachment_catalog=None,
     for_push: bool = False,
 ) -> Dict[str, Any]:
-    """candidate 준비부터 local proof/manifest 생성까지 검증 lifecycle을 실행합니다."""
+    """candidate 준비부터 local proof/manifest 생성까지 검증 lifecycle을 실행합니다.
+
+    한 번의 검증 안에서는 같은 XHTML을 한 번만 파싱하도록 parse_scope로 감싸고,
+    파싱 횟수를 reverse-sync.parse-stats.yaml에 남겨 회귀를 확인할 수 있게 합니다.
+    """
+
+    profiling.count("pages_verified")
+    with parse_scope() as documents:
+        result = _run_verification(
+            page_id,
+            original_src,
+            improved_src,
+            runtime=runtime,
+            xhtml_path=xhtml_path,
+            lenient=lenient,
+            no_normalize=no_normalize,
+            language=language,
+            page_dir=page_dir,
+            base_snapshot=base_snapshot,
+            attachment_catalog=attachment_catalog,
+            for_push=for_push,
+        )
+    stats_path = runtime.project_dir / "var" / page_id / "reverse-sync.parse-stats.yaml"
+    artifacts.write_artifact(stats_path, documents.stats.to_dict())
+    return result
 
+
+def _run_verification(
+    page_id: str,
+    original_src: MdxSource,
+    improved_src: MdxSource,
+    *,
+    runtime: VerificationRuntime,
+    xhtml_path: str | None = None,
+    lenient: bool = False,
+    no_normalize: bool = False,
+    language: str | None = None,
+    page_dir: str | None = None,
+    base_snapshot=None,
+    attachment_catalog=None,
+    for_push: bool = False,
+) -> Dict[str, Any]:
     now = datetime.now(timezone.utc).isoformat()
     var_dir = clean_reverse_sync_artifacts(runtime.project_dir, page_id)
 
@@ -392,9 +433,10 @@ def run_verification(
             )
         xhtml = Path(xhtml_path).read_text()
 
-    changes, alignment, original_blocks, improved_blocks = parse_and_diff(
-        original_mdx, improved_mdx
-    )
+    with profiling.stage("reverse_sync.diff"):
+        changes, alignment, original_blocks, improved_blocks = parse_and_diff(
+            original_mdx, improved_mdx
+        )
     title = extract_frontmatter_title(improved_blocks)
     if not changes:
         result = {
@@ -409,7 +451,7 @@ def run_verification(
         if title:
             result["title"] = title
         (var_dir / "reverse-sync.result.yaml").write_text(
-            yaml.dump(result, allow_unicode=True, default_flow_style=False)
+            artifacts.dump_yaml(result, allow_unicode=True, default_flow_style=False)
         )
         return result
 
@@ -425,21 +467,23 @@ def run_verification(
     from reverse_sync.sidecar import build_sidecar, load_page_lost_info
 
     page_lost_info = load_page_lost_info(str(var_dir / "mapping.yaml"))
-    roundtrip_sidecar = build_sidecar(xhtml, original_mdx, page_id=page_id)
-    patch_plan, original_mappings = runtime.planner(
-        changes,
-        original_blocks,
-        improved_blocks,
-        page_xhtml=xhtml,
-        alignment=alignment,
-        page_lost_info=page_lost_info,
-        roundtrip_sidecar=roundtrip_sidecar,
-        link_resolver=link_resolver,
-        attachment_filenames=attachment_filenames,
-        allow_text_identity_fallback=not for_push,
-        enforce_capabilities=for_push,
-        enforce_provenance=for_push,
-    )
+    with profiling.stage("reverse_sync.sidecar"):
+        roundtrip_sidecar = build_sidecar(xhtml, original_mdx, page_id=page_id)
+    with profiling.stage("reverse_sync.plan"):
+        patch_plan, original_mappings = runtime.planner(
+            changes,
+            original_blocks,
+            improved_blocks,
+            page_xhtml=xhtml,
+            alignment=alignment,
+            page_lost_info=page_lost_info,
+            roundtrip_sidecar=roundtrip_sidecar,
+            link_resolver=link_resolver,
+            attachment_filenames=attachment_filenames,
+            allow_text_identity_fallback=not for_push,
+            enforce_capabilities=for_push,
+            enforce_provenance=for_push,
+        )
     skipped_changes = patch_plan.to_legacy_skipped_changes()
 
     original_mapping_data = {
@@ -448,25 +492,22 @@ def run_verification(
         "source_xhtml": "page.xhtml",
         "blocks": [mapping.__dict__ for mapping in original_mappings],
     }
-    (var_dir / "reverse-sync.mapping.original.yaml").write_text(
-        yaml.dump(
-            original_mapping_data,
-            allow_unicode=True,
-            default_flow_style=False,
-        )
+    artifacts.write_artifact(
+        var_dir / "reverse-sync.mapping.original.yaml", original_mapping_data
     )
-    if for_push:
-        from reverse_sync.preserving_patcher import render_patch_plan_preserving
-
-        patched_xhtml = render_patch_plan_preserving(
-            xhtml,
-            patch_plan,
-            roundtrip_sidecar,
-        )
-    else:
-        from reverse_sync.legacy_xhtml_patcher import patch_xhtml
+    with profiling.stage("reverse_sync.patch"):
+        if for_push:
+            from reverse_sync.preserving_patcher import render_patch_plan_preserving
+
+            patched_xhtml = render_patch_plan_preserving(
+                xhtml,
+                patch_plan,
+                roundtrip_sidecar,
+            )
+        else:
+            from reverse_sync.legacy_xhtml_patcher import patch_xhtml
 
-        patched_xhtml = patch_xhtml(xhtml, patch_plan.to_patch_dicts())
+            patched_xhtml = patch_xhtml(xhtml, patch_plan.to_patch_dicts())
     (var_dir / "reverse-sync.patched.xhtml").write_text(patched_xhtml)
 
     xhtml_diff_report = "\n".join(
@@ -486,12 +527,8 @@ def run_verification(
             mapping.__dict__ for mapping in record_mapping(patched_xhtml)
         ],
     }
-    (var_dir / "reverse-sync.mapping.patched.yaml").write_text(
-        yaml.dump(
-            verify_mapping_data,
-            allow_unicode=True,
-            default_flow_style=False,
-        )
+    artifacts.write_artifact(
+        var_dir / "reverse-sync.mapping.patched.yaml", verify_mapping_data
     )
 
     src_page_v1 = Path(xhtml_path).parent / "page.v1.yaml"
@@ -537,15 +574,16 @@ def run_verification(
     )
 
     verify_stripped = strip_frontmatter(verify_mdx)
-    if for_push:
-        verify_result = verify_push_equivalence(impr_stripped, verify_stripped)
-    else:
-        verify_result = verify_roundtrip(
-            expected_mdx=impr_stripped,
-            actual_mdx=verify_stripped,
-            lenient=lenient,
-            no_normalize=no_normalize,
-        )
+    with profiling.stage("reverse_sync.verify"):
+        if for_push:
+            verify_result = verify_push_equivalence(impr_stripped, verify_stripped)
+        else:
+            verify_result = verify_roundtrip(
+                expected_mdx=impr_stripped,
+                actual_mdx=verify_stripped,
+                lenient=lenient,
+                no_normalize=no_normalize,
+            )
     roundtrip_diff_report = "".join(
         difflib.unified_diff(
             impr_stripped.splitlines(keepends=True),
@@ -598,7 +636,7 @@ def run_verification(
         )
 
     (var_dir / "reverse-sync.result.yaml").write_text(
-        yaml.dump(result, allow_unicode=True, default_flow_style=False)
+        artifacts.dump_yaml(result, allow_unicode=True, default_flow_style=False)
     )
     return result
 
@@ -15,6 +15,7 @@ from typing import Any, Iterable, List, Literal, Tuple
 SegmentKind = Literal["list_marker", "ws", "text", "item_boundary", "anchor"]
 
 from bs4 import BeautifulSoup, Tag
+from reverse_sync.document_cache import parse_xhtml
 from reverse_sync.mapping_recorder import get_text_with_emoticons
 from reverse_sync.mdx_to_xhtml_inline import mdx_block_to_inner_xhtml
 
@@ -84,7 +85,7 @@ def extract_visible_model_from_xhtml(
     if block_type not in _TEXT_BLOCK_TYPES:
         raise ValueError(f"지원하지 않는 visible XHTML block type입니다: {block_type}")
 
-    soup = BeautifulSoup(fragment, "html.parser")
+    soup = parse_xhtml(fragment)
     heading = soup.find(re.compile(r"^h[1-6]$"))
     heading_level = (
         int(heading.name[1])
@@ -106,7 +107,7 @@ def _extract_text_model(
     heading_level: int | None,
     source: str,
 ) -> VisibleContentModel:
-    soup = BeautifulSoup(fragment, "html.parser")
+    soup = parse_xhtml(fragment)
     visible_text = get_text_with_emoticons(soup)
     segments = _tokenize_visible_text(visible_text)
     units = _collect_preservation_units(soup)
@@ -238,7 +239,7 @@ def extract_list_model_from_mdx(content: str) -> VisibleContentModel:
 
 def extract_list_model_from_xhtml(fragment: str) -> VisibleContentModel:
     """Build a lossless visible-content model from XHTML list content."""
-    soup = BeautifulSoup(fragment, "html.parser")
+    soup = parse_xhtml(fragment)
     root = soup.find(["ul", "ol"])
     if root is None:
         return VisibleContentModel([], "", ("", None, (), ()))
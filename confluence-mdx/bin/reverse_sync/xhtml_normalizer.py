@@ -6,12 +6,12 @@ BeautifulSoup 기반으로 fragment 비교, plain-text 추출, xpath 기반 frag
 
 from __future__ import annotations
 
-import re
 from typing import Optional
 
 from bs4 import BeautifulSoup, NavigableString, Tag
 
-from reverse_sync.mapping_recorder import iter_block_children
+from reverse_sync.document_cache import mutable_xhtml, parse_xhtml
+from reverse_sync.xpath_index import document_xpath_index
 
 
 # ---------------------------------------------------------------------------
@@ -54,7 +54,7 @@ def extract_plain_text(fragment: str) -> str:
 
     이 함수의 출력은 reconstruction에서 anchor offset 좌표의 기준이 된다.
     """
-    soup = BeautifulSoup(fragment, "html.parser")
+    soup = parse_xhtml(fragment)
     return _extract_text_from_element(soup)
 
 
@@ -112,7 +112,7 @@ def normalize_fragment(
     - ignored attribute 제거 (선택)
     - BeautifulSoup prettify로 노드별 줄바꿈
     """
-    soup = BeautifulSoup(fragment, "html.parser")
+    soup = mutable_xhtml(fragment)
     normalize_soup(
         soup,
         strip_ignored_attrs=strip_ignored_attrs,
@@ -168,75 +168,7 @@ def extract_fragment_by_xpath(page_xhtml: str, xpath: str) -> Optional[str]:
 
     xpath 형식: "p[1]", "ul[2]", "macro-info[1]/p[1]"
     """
-    soup = BeautifulSoup(page_xhtml, "html.parser")
-    element = _find_element_by_xpath(soup, xpath)
+    element = document_xpath_index(page_xhtml).resolve(xpath)
     if element is None:
         return None
     return str(element)
-
-
-def _find_element_by_xpath(soup, xpath: str):
-    """간이 XPath로 요소를 찾는다."""
-    parts = xpath.split("/")
-    if len(parts) == 1:
-        return _find_element_by_simple_xpath(soup, xpath)
-
-    current = _find_element_by_simple_xpath(soup, parts[0])
-    if current is None:
-        return None
-
-    for part in parts[1:]:
-        container = _find_content_container(current)
-        if container is None:
-            if ":" in (current.name or ""):
-                return None
-            container = current
-        current = _find_element_by_simple_xpath(container, part)
-        if current is None:
-            return None
-
-    return current
-
-
-_XPATH_PATTERN = re.compile(r"([a-z0-9:-]+)\[(\d+)\]")
-
-
-def _find_element_by_simple_xpath(parent, xpath: str):
-    """단일 XPath 파트로 요소를 찾는다."""
-    match = _XPATH_PATTERN.match(xpath)
-    if not match:
-        return None
-    tag_name = match.group(1)
-    index = int(match.group(2))  # 1-based
-
-    macro_name = None
-    if tag_name.startswith("macro-"):
-        macro_name = tag_name[len("macro-"):]
-
-    count = 0
-    for child in iter_block_children(parent):
-        if not isinstance(child, Tag):
-            continue
-        if macro_name:
-            if child.name == "ac:structured-macro" and child.get("ac:name") == macro_name:
-                count += 1
-                if count == index:
-                    return child
-        elif child.name == tag_name:
-            count += 1
-            if count == index:
-                return child
-    return None
-
-
-def _find_content_container(parent: Tag):
-    """복합 xpath의 부모에서 콘텐츠 컨테이너를 찾는다."""
-    rich_body = parent.find("ac:rich-text-body")
-    if rich_body is not None:
-        return rich_body
-    node = parent.find("ac:adf-node")
-    if node is not None:
-        content = node.find("ac:adf-content")
-        if content is not None:
-            return content
-    return None
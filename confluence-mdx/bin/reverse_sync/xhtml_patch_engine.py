@@ -4,6 +4,8 @@ from bs4 import BeautifulSoup, NavigableString, Tag
 import difflib
 import re
 from reverse_sync.mapping_recorder import get_text_with_emoticons, iter_block_children
+from reverse_sync.document_cache import mutable_xhtml
+from reverse_sync.xpath_index import XPathIndex
 
 
 class XhtmlPatchError(ValueError):
@@ -17,7 +19,7 @@ def patch_xhtml_engine(
     strict: bool,
 ) -> str:
     """XHTML patch를 지정된 failure policy로 적용합니다."""
-    soup = BeautifulSoup(xhtml, 'html.parser')
+    soup = mutable_xhtml(xhtml)
     supported_actions = {'modify', 'delete', 'insert', 'replace_fragment'}
     if strict:
         unsupported = [
@@ -38,9 +40,10 @@ def patch_xhtml_engine(
                       if p.get('action', 'modify') == 'modify']
 
     # 모든 xpath를 DOM 변경 전에 미리 resolve (인덱스 shift 방지)
+    index = XPathIndex(soup)
     resolved_deletes = []
     for p in delete_patches:
-        el = _find_element_by_xpath(soup, p['xhtml_xpath'])
+        el = index.resolve(p['xhtml_xpath'])
         if el is None:
             if strict:
                 raise XhtmlPatchError(
@@ -54,7 +57,7 @@ def patch_xhtml_engine(
         after_xpath = p.get('after_xpath')
         anchor = None
         if after_xpath is not None:
-            anchor = _find_element_by_xpath(soup, after_xpath)
+            anchor = index.resolve(after_xpath)
             if anchor is None:
                 if strict:
                     raise XhtmlPatchError(
@@ -65,7 +68,7 @@ def patch_xhtml_engine(
 
     resolved_modifies = []
     for p in modify_patches:
-        el = _find_element_by_xpath(soup, p['xhtml_xpath'])
+        el = index.resolve(p['xhtml_xpath'])
         if el is None:
             if strict:
                 raise XhtmlPatchError(
@@ -76,7 +79,7 @@ def patch_xhtml_engine(
 
     resolved_replacements = []
     for p in replace_patches:
-        el = _find_element_by_xpath(soup, p['xhtml_xpath'])
+        el = index.resolve(p['xhtml_xpath'])
         if el is None:
             if strict:
                 raise XhtmlPatchError(
@@ -227,107 +230,6 @@ def _replace_element_resolved(element: Tag, new_html: str):
         prev = child
 
 
-def _find_element_by_xpath(soup: BeautifulSoup, xpath: str):
-    """간이 XPath로 요소를 찾는다.
-
-    단일 xpath: "p[1]", "h2[3]", "macro-info[1]"
-    복합 xpath: "macro-info[1]/p[1]", "macro-note[2]/ul[1]"
-    다단계 xpath: "ul[3]/li[7]/p[1]"
-    """
-    parts = xpath.split('/')
-    if len(parts) == 1:
-        return _find_element_by_simple_xpath(soup, xpath)
-
-    # 복합 xpath: 먼저 부모를 찾고, 내부 컨테이너에서 자식 검색
-    current = _find_element_by_simple_xpath(soup, parts[0])
-    if current is None:
-        return None
-
-    for part in parts[1:]:
-        # ac:structured-macro 등은 content container 내부에서 검색
-        container = _find_content_container(current)
-        if container is None:
-            if ':' in (current.name or ''):
-                # ac:structured-macro 등 Confluence 요소는 content container 없이
-                # 자식 검색 불가 (기존 동작 유지)
-                return None
-            # 일반 HTML 요소 (ul, ol, li 등)는 직접 자식 검색
-            container = current
-        current = _find_child_in_element(container, part)
-        if current is None:
-            return None
-
-    return current
-
-
-def _find_element_by_simple_xpath(soup: BeautifulSoup, xpath: str):
-    """간이 XPath (예: "p[1]", "h2[3]", "macro-info[1]")로 요소를 찾는다.
-
-    macro-* 패턴은 ac:structured-macro[ac:name="*"]로 해석한다.
-    """
-    match = re.match(r'([a-z0-9:-]+)\[(\d+)\]', xpath)
-    if not match:
-        return None
-    tag_name = match.group(1)
-    index = int(match.group(2))  # 1-based
-
-    # macro-{name} → ac:structured-macro[ac:name="{name}"] 매핑
-    macro_name = None
-    if tag_name.startswith('macro-'):
-        macro_name = tag_name[len('macro-'):]
-
-    count = 0
-    for child in iter_block_children(soup):
-        if not isinstance(child, Tag):
-            continue
-        if macro_name:
-            if child.name == 'ac:structured-macro' and child.get('ac:name') == macro_name:
-                count += 1
-                if count == index:
-                    return child
-        elif child.name == tag_name:
-            count += 1
-            if count == index:
-                return child
-    return None
-
-
-def _find_content_container(parent: Tag):
-    """복합 xpath의 부모 요소에서 자식 콘텐츠 컨테이너를 찾는다.
-
-    ac:structured-macro → ac:rich-text-body
-    ac:adf-extension → ac:adf-node > ac:adf-content
-    """
-    rich_body = parent.find('ac:rich-text-body')
-    if rich_body is not None:
-        return rich_body
-    node = parent.find('ac:adf-node')
-    if node is not None:
-        content = node.find('ac:adf-content')
-        if content is not None:
-            return content
-    return None
-
-
-def _find_child_in_element(parent: Tag, xpath_part: str):
-    """부모 요소 내에서 간이 xpath로 직접 자식을 찾는다."""
-    match = re.match(r'([a-z0-9:-]+)\[(\d+)\]', xpath_part)
-    if not match:
-        return None
-    tag_name = match.group(1)
-    index = int(match.group(2))
-
-    count = 0
-    for child in parent.children:
-        if not isinstance(child, Tag):
-            continue
-        if child.name == tag_name:
-            count += 1
-            if count == index:
-                return child
-    return None
-
-
 def _collapse_ws(s: str) -> str:
     """연속 공백을 단일 공백으로 축소한다."""
     return re.sub(r'\s+', ' ', s).strip()
@@ -0,0 +1,108 @@
+"""record_mapping이 만드는 간이 XPath를 element로 해석하는 index.
+
+간이 XPath 형식:
+    단일 xpath: "p[1]", "h2[3]", "macro-info[1]"
+    복합 xpath: "macro-info[1]/p[1]", "macro-note[2]/ul[1]"
+    다단계 xpath: "ul[3]/li[7]/p[1]"
+
+각 단계는 부모의 블록 레벨 자식 중 같은 이름의 n번째(1-based) 요소를 가리킨다.
+macro-{name}은 ac:structured-macro[ac:name="{name}"]로 해석하고, ac:layout은
+cell 내부로 진입한다(iter_block_children과 동일). 한 부모의 자식은 처음 방문할 때
+한 번만 순회해 (이름, 순번) → element 표로 만들어 두므로, 같은 문서에서 patch P개를
+해석하는 비용이 O(P·N)이 아니라 O(N + P)가 된다.
+
+index는 트리를 수정하기 전에 만든 것이므로, 트리를 수정한 뒤에는 새로 만들어야 한다.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Dict, Optional, Tuple
+
+from bs4 import Tag
+
+from reverse_sync.document_cache import current_scope, parse_xhtml
+from reverse_sync.mapping_recorder import iter_block_children
+
+_XPATH_PART = re.compile(r"([a-z0-9:-]+)\[(\d+)\]")
+
+
+def find_content_container(parent: Tag) -> Optional[Tag]:
+    """복합 xpath의 부모 요소에서 자식 콘텐츠 컨테이너를 찾는다.
+
+    ac:structured-macro → ac:rich-text-body
+    ac:adf-extension → ac:adf-node > ac:adf-content
+    """
+    rich_body = parent.find("ac:rich-text-body")
+    if rich_body is not None:
+        return rich_body
+    node = parent.find("ac:adf-node")
+    if node is not None:
+        content = node.find("ac:adf-content")
+        if content is not None:
+            return content
+    return None
+
+
+def _index_children(parent) -> Dict[Tuple[str, int], Tag]:
+    elements: Dict[Tuple[str, int], Tag] = {}
+    counters: Dict[str, int] = {}
+
+    def add(name: str, child: Tag) -> None:
+        counters[name] = counters.get(name, 0) + 1
+        elements[(name, counters[name])] = child
+
+    for child in iter_block_children(parent):
+        if not isinstance(child, Tag):
+            continue
+        add(child.name, child)
+        if child.name == "ac:structured-macro":
+            add(f"macro-{child.get('ac:name')}", child)
+    return elements
+
+
+class XPathIndex:
+    """한 parse tree의 간이 XPath 해석기. 부모별 자식 표는 lazy하게 만든다."""
+
+    def __init__(self, root) -> None:
+        self.root = root
+        # id(parent) → (parent, 자식 표). parent를 함께 보관해 id 재사용을 막는다.
+        self._levels: Dict[int, Tuple[object, Dict[Tuple[str, int], Tag]]] = {}
+
+    def _child(self, parent, part: str) -> Optional[Tag]:
+        match = _XPATH_PART.match(part)
+        if not match:
+            return None
+        level = self._levels.get(id(parent))
+        if level is None:
+            level = self._levels[id(parent)] = (parent, _index_children(parent))
+        return level[1].get((match.group(1), int(match.group(2))))
+
+    def resolve(self, xpath: str) -> Optional[Tag]:
+        """xpath가 가리키는 element를 반환한다. 없으면 None."""
+        parts = xpath.split("/")
+        current = self._child(self.root, parts[0])
+        for part in parts[1:]:
+            if current is None:
+                return None
+            # ac:structured-macro 등은 content container 내부에서 검색
+            container = find_content_container(current)
+            if container is None:
+                if ":" in (current.name or ""):
+                    # Confluence 요소는 content container 없이 자식 검색 불가
+                    return None
+                # 일반 HTML 요소 (ul, ol, li 등)는 직접 자식 검색
+                container = current
+            current = self._child(container, part)
+        return current
+
+
+def document_xpath_index(xhtml: str) -> XPathIndex:
+    """page XHTML의 읽기 전용 parse tree에 대한 index.
+
+    parse_scope 안에서는 문서별로 한 번만 만들어 같은 검증의 단계들이 공유한다.
+    """
+    cache = current_scope()
+    if cache is None:
+        return XPathIndex(parse_xhtml(xhtml))
+    return cache.derived(xhtml, "xpath_index", XPathIndex)
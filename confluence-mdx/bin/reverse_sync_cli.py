@@ -4,13 +4,15 @@
 중간 파일은 var/<page_id>/ 에 reverse-sync. prefix로 저장된다.
 """
 import argparse
+import io
 import json
+import logging
+import os
 import subprocess
 import sys
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Tuple
 
-import yaml
 # 스크립트 위치 기반 경로 상수
 _SCRIPT_DIR = Path(__file__).resolve().parent   # confluence-mdx/bin/
 _PROJECT_DIR = _SCRIPT_DIR.parent               # confluence-mdx/
@@ -20,6 +22,9 @@ _REPO_ROOT = _PROJECT_DIR.parent                # 레포 루트
 if str(_SCRIPT_DIR) not in sys.path:
     sys.path.insert(0, str(_SCRIPT_DIR))
 
+import pages_catalog
+import profiling
+from git_objects import GitObjectError, shared_reader
 from reverse_sync.batch_report import BatchReport
 from reverse_sync.batch_service import BatchRuntime, run_batch
 from reverse_sync.planner import plan_patches
@@ -56,23 +61,16 @@ _TOOL_VERSION = "reverse-sync-cli-v5"
 
 
 def _is_valid_git_ref(ref: str) -> bool:
-    """ref가 유효한 git ref인지 확인한다."""
-    result = subprocess.run(
-        ['git', 'rev-parse', '--verify', ref],
-        capture_output=True, text=True,
-    )
-    return result.returncode == 0
+    """ref가 유효한 git ref인지 확인한다. 같은 ref는 한 번만 해석한다."""
+    return shared_reader(_REPO_ROOT).resolve(ref) is not None
 
 
 def _get_file_from_git(ref: str, path: str) -> str:
-    """git show <ref>:<path>로 파일 내용을 반환한다."""
-    result = subprocess.run(
-        ['git', 'show', f'{ref}:{path}'],
-        capture_output=True, text=True,
-    )
-    if result.returncode != 0:
-        raise ValueError(f"Failed to get {path} at ref {ref}: {result.stderr.strip()}")
-    return result.stdout
+    """<ref>:<path> 파일 내용을 공유 `git cat-file --batch` process로 읽어 반환한다."""
+    try:
+        return shared_reader(_REPO_ROOT).read_text(ref, path)
+    except GitObjectError as e:
+        raise ValueError(f"Failed to get {path} at ref {ref}: {e}") from e
 
 
 def _resolve_mdx_source(arg: str) -> MdxSource:
@@ -105,6 +103,7 @@ def _get_changed_ko_mdx_files(branch: str) -> List[str]:
     """브랜치에서 변경된 src/content/ko/**/*.mdx 파일 목록을 반환한다."""
     if not _is_valid_git_ref(branch):
         raise ValueError(f"Invalid git ref: {branch}")
+    profiling.count('subprocesses')
     result = subprocess.run(
         ['git', 'diff', '--name-only', f'main...{branch}', '--', 'src/content/ko/'],
         capture_output=True, text=True, cwd=str(_REPO_ROOT),
@@ -122,15 +121,14 @@ def _resolve_page_id(ko_mdx_path: str) -> str:
     pages_path = _PROJECT_DIR / 'var' / 'pages.qm.yaml'
     if not pages_path.exists():
         raise ValueError("var/pages.qm.yaml not found")
-    pages = yaml.safe_load(pages_path.read_text())
-    for page in pages:
-        if page.get('path') == path_parts:
-            if page.get('type', 'page') == 'folder':
-                raise ValueError(
-                    f"MDX path '{ko_mdx_path}' is a generated Confluence folder "
-                    "landing page and cannot be reverse-synced"
-                )
-            return page['page_id']
+    page = pages_catalog.load_index(pages_path).by_path(path_parts)
+    if page is not None:
+        if page.get('type', 'page') == 'folder':
+            raise ValueError(
+                f"MDX path '{ko_mdx_path}' is a generated Confluence folder "
+                "landing page and cannot be reverse-synced"
+            )
+        return page['page_id']
     raise ValueError(f"MDX path '{ko_mdx_path}' not found in var/pages.qm.yaml")
 
 
@@ -139,24 +137,19 @@ def _ensure_reverse_sync_page(page_id: str) -> None:
     pages_path = _PROJECT_DIR / 'var' / 'pages.qm.yaml'
     if not pages_path.exists():
         return
-    pages = yaml.safe_load(pages_path.read_text()) or []
-    for page in pages:
-        if str(page.get('page_id')) != str(page_id):
-            continue
-        if page.get('type', 'page') == 'folder':
-            raise ValueError(
-                f"Content ID '{page_id}' is a generated Confluence folder "
-                "landing page and cannot be reverse-synced"
-            )
-        return
+    page = pages_catalog.load_index(pages_path).by_id(page_id)
+    if page is not None and page.get('type', 'page') == 'folder':
+        raise ValueError(
+            f"Content ID '{page_id}' is a generated Confluence folder "
+            "landing page and cannot be reverse-synced"
+        )
 
 
 def _resolve_attachment_dir(page_id: str) -> str:
     """page_id에서 pages.qm.yaml의 path를 조회하여 attachment-dir를 반환."""
-    pages = yaml.safe_load((_PROJECT_DIR / 'var' / 'pages.qm.yaml').read_text())
-    for page in pages:
-        if page['page_id'] == page_id:
-            return '/' + '/'.join(page['path'])
+    page = pages_catalog.load_index(_PROJECT_DIR / 'var' / 'pages.qm.yaml').by_id(page_id)
+    if page is not None:
+        return '/' + '/'.join(page['path'])
     raise ValueError(f"page_id '{page_id}' not found in var/pages.qm.yaml")
 
 
@@ -172,10 +165,95 @@ def _detect_language(descriptor: str) -> str:
     return 'ko'
 
 
+# REVERSE_SYNC_FORWARD_CONVERTER=subprocess 이면 page마다 converter/cli.py subprocess로 변환한다.
+_FORWARD_CONVERTER_ENV = 'REVERSE_SYNC_FORWARD_CONVERTER'
+
+# in-process forward converter가 재사용하는 pages catalog: path → ((mtime_ns, size), catalog)
+_forward_catalogs: Dict[str, Tuple[Tuple[int, int], Any]] = {}
+
+
+def _forward_catalog(pages_yaml_path: str):
+    """pages catalog를 한 번만 읽어 재사용한다. 파일이 바뀌면 다시 읽는다."""
+    from converter.cli import load_catalog
+
+    try:
+        stat = os.stat(pages_yaml_path)
+        stamp = (stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        stamp = (0, 0)
+    cached = _forward_catalogs.get(pages_yaml_path)
+    if cached is None or cached[0] != stamp:
+        cached = (stamp, load_catalog(pages_yaml_path))
+        _forward_catalogs[pages_yaml_path] = cached
+    return cached[1]
+
+
+@profiling.timed('reverse_sync.forward_convert')
 def _forward_convert(patched_xhtml_path: str, output_mdx_path: str, page_id: str,
                      language: str = 'ko', page_dir: str = None) -> str:
     """patched XHTML 파일을 forward converter로 MDX로 변환한다.
 
+    기본은 converter를 in-process로 호출하고, REVERSE_SYNC_FORWARD_CONVERTER=subprocess 이면
+    converter/cli.py subprocess를 실행한다. 두 경로는 같은 MDX와 mapping.yaml을 만든다.
+    """
+    if os.environ.get(_FORWARD_CONVERTER_ENV, 'in-process') == 'subprocess':
+        return _forward_convert_subprocess(patched_xhtml_path, output_mdx_path, page_id,
+                                           language=language, page_dir=page_dir)
+    return _forward_convert_in_process(patched_xhtml_path, output_mdx_path, page_id,
+                                       language=language, page_dir=page_dir)
+
+
+def _forward_convert_in_process(patched_xhtml_path: str, output_mdx_path: str, page_id: str,
+                                language: str = 'ko', page_dir: str = None) -> str:
+    """converter.cli.convert_xhtml()로 변환한다. subprocess 경로와 같은 입력, 같은 산출물을 사용한다.
+
+    converter 로그는 subprocess의 --log-level warning처럼 WARNING 이상만 모아 두었다가
+    변환이 실패하면 오류 메시지에 포함한다.
+    """
+    from converter.cli import (
+        LOG_FORMAT, convert_xhtml, format_conversion_error, resolve_pages_yaml_path,
+        write_sidecar_mapping,
+    )
+    from converter.context import load_page_v1_yaml
+
+    var_dir = (_PROJECT_DIR / 'var' / page_id).resolve()
+    abs_input = Path(patched_xhtml_path).resolve()
+    abs_output = Path(output_mdx_path).resolve()
+    attachment_dir = _resolve_attachment_dir(page_id)
+    page_data_dir = Path(page_dir).resolve() if page_dir else abs_input.parent
+
+    buffer = io.StringIO()
+    handler = logging.StreamHandler(buffer)
+    handler.setLevel(logging.WARNING)
+    handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    root_logger = logging.getLogger()
+    root_logger.addHandler(handler)
+    try:
+        result = convert_xhtml(
+            abs_input.read_text(encoding='utf-8'),
+            _forward_catalog(resolve_pages_yaml_path(str(abs_input.parent.parent))),
+            page_v1=load_page_v1_yaml(str(page_data_dir / 'page.v1.yaml')),
+            input_file=str(abs_input),
+            output_file=str(abs_output),
+            public_dir=str(var_dir.parent),
+            attachment_dir=attachment_dir,
+            skip_image_copy=True,
+            language=language,
+        )
+        abs_output.write_text(result.markdown, encoding='utf-8')
+        write_sidecar_mapping(result)
+    except Exception as e:
+        logging.error(format_conversion_error(e))
+        raise RuntimeError(f"Forward converter failed: {buffer.getvalue()}") from e
+    finally:
+        root_logger.removeHandler(handler)
+    return result.markdown
+
+
+def _forward_convert_subprocess(patched_xhtml_path: str, output_mdx_path: str, page_id: str,
+                                language: str = 'ko', page_dir: str = None) -> str:
+    """converter/cli.py subprocess로 변환한다.
+
     모든 경로를 절대 경로로 변환하여 cwd에 의존하지 않도록 한다.
     page_dir이 주어지면 converter에 --page-dir로 전달하여 page.v1.yaml을 읽는다.
     """
@@ -196,6 +274,7 @@ def _forward_convert(patched_xhtml_path: str, output_mdx_path: str, page_id: str
     if page_dir:
         cmd += ['--page-dir', str(Path(page_dir).resolve())]
 
+    profiling.count('subprocesses')
     result = subprocess.run(cmd, capture_output=True, text=True)
     if result.returncode != 0:
         raise RuntimeError(f"Forward converter failed: {result.stderr}")
@@ -601,12 +680,15 @@ def _add_common_args(parser: argparse.ArgumentParser):
                         help='page ID를 직접 지정 (기본: improved_mdx 경로에서 자동 유도)')
     parser.add_argument('--limit', type=int, default=0,
                         help='배치 모드에서 최대 처리 파일 수 (기본: 0=전체)')
+    parser.add_argument('--jobs', type=int, default=1, metavar='N',
+                        help='배치 모드에서 N개 worker process로 페이지를 병렬 검증 (기본: 1=순차, push는 항상 순차)')
     parser.add_argument('--failures-only', action='store_true',
                         help='실패한 결과만 출력 (--limit와 함께 사용 시 실패 건수 기준으로 제한)')
     parser.add_argument('--lenient', action='store_true',
                         help='관대 모드: 정규화 후 비교 (기본은 문자 그대로 비교하는 엄격 모드)')
     parser.add_argument('--no-normalize', action='store_true',
                         help='원시 모드: 정규화 없이 비교 (FC/패치 차이의 실제 규모를 확인)')
+    profiling.add_arguments(parser)
 
 
 def _do_verify(args, *, config=None, prepare_push: bool = False) -> dict:
@@ -674,6 +756,7 @@ def _do_verify_batch(
     lenient: bool = False,
     no_normalize: bool = False,
     prepare_push: bool = False,
+    jobs: int = 1,
 ) -> List[dict]:
     """CLI dependency를 주입하여 branch batch lifecycle을 실행합니다."""
 
@@ -696,6 +779,7 @@ def _do_verify_batch(
         lenient=lenient,
         no_normalize=no_normalize,
         prepare_push=prepare_push,
+        jobs=jobs,
     )
 
 
@@ -783,6 +867,7 @@ def main():
                               help='결과를 JSON 형식으로 출력')
 
     args = parser.parse_args()
+    profiling.start_from_args(f'reverse_sync_cli {args.command}', args)
 
     if args.command in ('verify', 'push', 'debug'):
         dry_run = args.command in ('verify', 'debug') or getattr(args, 'dry_run', False)
@@ -861,6 +946,10 @@ def main():
                 )
                 sys.exit(1)
 
+            if getattr(args, 'jobs', 1) < 1:
+                print('Error: --jobs는 1 이상이어야 합니다.', file=sys.stderr)
+                sys.exit(1)
+
             use_json = getattr(args, 'json', False)
             failures_only = getattr(args, 'failures_only', False)
 
@@ -882,6 +971,8 @@ def main():
                 }
                 if args.command == "push" and dry_run:
                     batch_kwargs["prepare_push"] = True
+                if getattr(args, "jobs", 1) > 1:
+                    batch_kwargs["jobs"] = args.jobs
                 results = _do_verify_batch(args.branch, **batch_kwargs)
                 batch_report = BatchReport.from_results(
                     command=args.command,
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Skeleton Generation Benchmark
+
+Converts every MDX file under the given paths (default: src/content) with the
+skeleton generator of a git revision and with the working tree, prints the
+time each took and fails if any skeleton differs.
+
+Usage:
+    bin/skeleton/benchmark.py                        # working tree vs HEAD
+    bin/skeleton/benchmark.py --against HEAD~3       # vs an older generator
+    bin/skeleton/benchmark.py --repeat 5 ../src/content/ko
+"""
+
+import argparse
+import atexit
+import importlib
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import types
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, List
+
+# Resolve project root (confluence-mdx/) from this script's location
+_SCRIPT_DIR = Path(__file__).resolve().parent.parent  # confluence-mdx/bin/
+_PROJECT_DIR = _SCRIPT_DIR.parent                     # confluence-mdx/
+
+# Ensure bin/ is on sys.path so skeleton package imports resolve without PYTHONPATH
+if str(_SCRIPT_DIR) not in sys.path:
+    sys.path.insert(0, str(_SCRIPT_DIR))
+
+from git_objects import GitObjectError, shared_reader
+from skeleton.cli import mdx_to_skeleton
+
+@dataclass
+class BenchmarkResult:
+    """Timings (best of the repeats, in seconds) and the files whose skeletons differ."""
+    files: int
+    reference_seconds: float
+    current_seconds: float
+    mismatches: List[Path] = field(default_factory=list)
+
+    @property
+    def speedup(self) -> float:
+        return self.reference_seconds / self.current_seconds if self.current_seconds else 0.0
+
+
+def collect_mdx_files(paths: List[Path]) -> List[Path]:
+    """MDX files under paths, without generated .skel.mdx files."""
+    files = []
+    for path in paths:
+        candidates = [path] if path.is_file() else path.rglob('*.mdx')
+        files.extend(p for p in candidates if p.suffix == '.mdx' and not p.name.endswith('.skel.mdx'))
+    return sorted(files)
+
+
+def _read_reference_package(rev: str, directory: Path) -> None:
+    """Write bin/skeleton/*.py as they are at rev into directory."""
+    result = subprocess.run(
+        ['git', 'ls-tree', '--name-only', rev, '--', 'bin/skeleton/'],
+        cwd=_PROJECT_DIR, capture_output=True, text=True,
+    )
+    names = [Path(line).name for line in result.stdout.splitlines() if line.endswith('.py')]
+    if result.returncode != 0 or 'cli.py' not in names:
+        raise GitObjectError(f'{rev} has no bin/skeleton/cli.py')
+    reader = shared_reader(_PROJECT_DIR)
+    for name in names:
+        (directory / name).write_text(reader.read_text(rev, f'./bin/skeleton/{name}'), encoding='utf-8')
+
+
+def _import_reference_cli(package_dir: Path) -> types.ModuleType:
+    """Import skeleton.cli from package_dir without disturbing the working-tree skeleton package."""
+    saved = {name: module for name, module in sys.modules.items()
+             if name == 'skeleton' or name.startswith('skeleton.')}
+    for name in saved:
+        del sys.modules[name]
+    package = types.ModuleType('skeleton')
+    package.__path__ = [str(package_dir)]
+    sys.modules['skeleton'] = package
+    try:
+        return importlib.import_module('skeleton.cli')
+    finally:
+        for name in [name for name in sys.modules if name == 'skeleton' or name.startswith('skeleton.')]:
+            del sys.modules[name]
+        sys.modules.update(saved)
+
+
+def _via_skeleton_file(convert_mdx_to_skeleton: Callable[[Path], Path], work_dir: Path) -> Callable[[str], str]:
+    """Text-to-skeleton function over a generator that only converts files (before mdx_to_skeleton existed)."""
+    input_path = work_dir / 'input.mdx'
+
+    def to_skeleton(text: str) -> str:
+        input_path.write_text(text, encoding='utf-8')
+        return convert_mdx_to_skeleton(input_path).read_text(encoding='utf-8')
+    return to_skeleton
+
+
+def load_reference(rev: str) -> Callable[[str], str]:
+    """Return the text-to-skeleton function of bin/skeleton/ as it is at rev.
+
+    The revision's whole skeleton package is loaded, so its cli.py imports its
+    own siblings. Revisions before mdx_to_skeleton() are converted through
+    convert_mdx_to_skeleton() on a temporary file; that file I/O is included
+    in their time.
+    """
+    work_dir = Path(tempfile.mkdtemp(prefix='skeleton-reference-'))
+    atexit.register(shutil.rmtree, work_dir, True)
+    package_dir = work_dir / 'skeleton'
+    package_dir.mkdir()
+    _read_reference_package(rev, package_dir)
+    module = _import_reference_cli(package_dir)
+    if hasattr(module, 'mdx_to_skeleton'):
+        return module.mdx_to_skeleton
+    if hasattr(module, 'convert_mdx_to_skeleton'):
+        return _via_skeleton_file(module.convert_mdx_to_skeleton, work_dir)
+    raise GitObjectError(f'{rev}:bin/skeleton/cli.py has neither mdx_to_skeleton nor convert_mdx_to_skeleton')
+
+
+def _convert_all(to_skeleton: Callable[[str], str], texts: List[str], repeat: int):
+    best = None
+    outputs = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        outputs = [to_skeleton(text) for text in texts]
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, outputs
+
+
+def run_benchmark(
+        files: List[Path],
+        reference: Callable[[str], str],
+        current: Callable[[str], str] = mdx_to_skeleton,
+        repeat: int = 1,
+) -> BenchmarkResult:
+    """Convert files with both generators and compare the skeletons byte for byte."""
+    texts = [path.read_text(encoding='utf-8') for path in files]
+    reference_seconds, expected = _convert_all(reference, texts, repeat)
+    current_seconds, actual = _convert_all(current, texts, repeat)
+    mismatches = [path for path, a, b in zip(files, expected, actual) if a != b]
+    return BenchmarkResult(len(files), reference_seconds or 0.0, current_seconds or 0.0, mismatches)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmark skeleton generation against a git revision and check identical output'
+    )
+    parser.add_argument('paths', nargs='*', type=Path,
+                        help='MDX files or directories (default: src/content)')
+    parser.add_argument('--against', default='HEAD',
+                        help='git revision of the reference skeleton generator (default: HEAD)')
+    parser.add_argument('--repeat', type=int, default=1,
+                        help='Convert every file N times and report the best time (default: 1)')
+    args = parser.parse_args()
+    if args.repeat < 1:
+        parser.error('--repeat must be at least 1')
+
+    files = collect_mdx_files(args.paths or [_PROJECT_DIR.parent / 'src' / 'content'])
+    if not files:
+        print('Error: no MDX files found', file=sys.stderr)
+        return 1
+    try:
+        reference = load_reference(args.against)
+    except GitObjectError as e:
+        print(f'Error: {e}', file=sys.stderr)
+        return 1
+
+    result = run_benchmark(files, reference, repeat=args.repeat)
+    print(f'{result.files} files')
+    print(f'  {args.against}: {result.reference_seconds:.2f}s')
+    print(f'  working tree: {result.current_seconds:.2f}s ({result.speedup:.1f}x)')
+    if result.mismatches:
+        print(f'{len(result.mismatches)} skeletons differ:')
+        for path in result.mismatches:
+            print(f'  - {path}')
+        return 1
+    print('All skeletons are identical')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -99,10 +99,13 @@ _PROJECT_DIR = _SCRIPT_DIR.parent                     # confluence-mdx/
 if str(_SCRIPT_DIR) not in sys.path:
     sys.path.insert(0, str(_SCRIPT_DIR))
 
+import profiling
 # Import modules for recursive processing and comparison
 from skeleton.compare import compare_files
+from skeleton import diff as skeleton_diff
 from skeleton.diff import (
-    compare_with_korean_skel,
+    SkeletonSource,
+    compare_skeletons,
     process_directories_recursive,
     initialize_config,
     should_exclude_file,
@@ -119,6 +122,71 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Patterns are compiled once: skeleton generation runs them for every line of every document.
+_HTML_ENTITY_PATTERN = r'&[a-zA-Z]+;|&#\d+;|&#x[0-9a-fA-F]+;'
+_YAML_FRONTMATTER = re.compile(r'^---\n(.*?)\n---\n', re.DOTALL)
+_IMPORT_FROM = re.compile(r'from\s+["\'][^"\']+["\']')
+_CODE_BLOCK = re.compile(r'(```\w*\n.*?```)', re.DOTALL)
+_INLINE_CODE_SECTION = re.compile(r'(?<!`)`([^`\n]+)`(?!`)')
+_LINK_OR_IMAGE = re.compile(r'(!?\[[^\]]*\]\()([^)]+)(\))')
+_HTML_ENTITY = re.compile(f'({_HTML_ENTITY_PATTERN})')
+_PROTECTED_PLACEHOLDER = re.compile(r'__(?:IMPORT|CODE_BLOCK|INLINE_CODE|URL|IMAGE_LINK|HTML_ENTITY)_\d+__')
+
+_PLACEHOLDER = re.compile(r'__[A-Z_]+_\d+__')
+_PARENTHESIZED_PLACEHOLDER = re.compile(r'\((__[A-Z_]+_\d+__)\)')
+_PLACEHOLDER_TOKEN = re.compile(r'`__[A-Z_]+_\d+__`|__[A-Z_]+_\d+__')
+_BOLD_ASTERISK = re.compile(r'\*\*([^*]+)\*\*')
+_BOLD_UNDERSCORE = re.compile(r'__([^_]+)__')
+_INLINE_CODE = re.compile(r'`([^`]+)`')
+_ITALIC = {marker: re.compile(rf'\{marker}([^{marker}]+?)\{marker}') for marker in ('*', '_')}
+_LINK_WITH_URL = re.compile(r'\[([^\]]+)\]\(([^)]+)\)')
+_LINK_WITHOUT_URL = re.compile(r'\[([^\]]+)\]')
+_EMOJI = re.compile(r':[a-z_]+:')
+_PUNCTUATION = re.compile(r'[.,;:!?。！？、]+')
+_STRUCTURAL_PREFIX = re.compile(r'^(\s*)(\d+\.\s+|[-*]\s+|#+\s+)')
+_LEADING_WHITESPACE = re.compile(r'^(\s+)')
+
+# _cleanup_text: formatted placeholders written back to back, e.g. **_TEXT_****_TEXT_**
+_SKELETON_PATTERNS = [r'\*\*_TEXT_\*\*', r'\*_TEXT_\*', r'`_TEXT_`', r'_TEXT_']
+_ADJACENT_PATTERN_PAIRS = [
+    re.compile(f'({first})({second})')
+    for first in _SKELETON_PATTERNS
+    for second in _SKELETON_PATTERNS
+]
+_ANY_ADJACENT_PATTERNS = re.compile(
+    '(?:{0})(?:{0})'.format('|'.join(_SKELETON_PATTERNS))
+)
+_CONSECUTIVE_TEXT = re.compile(r'_TEXT_([\s_]*_TEXT_)+')
+_SPACE_AFTER_BREAK = re.compile(r'(<br/?>|/>)\s+')
+# One alternative per token type, in the order the cleanup rules check them.
+# A character that starts no token is a one-character 'text' token; runs of
+# other characters are a single 'text' token, which no spacing rule tells apart.
+_CLEANUP_TOKEN = re.compile(
+    r'(?P<bold>\*\*_TEXT_\*\*)'
+    r'|(?P<italic>\*_TEXT_\*)'
+    r'|(?P<code>`[^`]+`)'
+    r'|(?P<link>\[_TEXT_\]\([^)]+\))'
+    r'|(?P<html_tag><br/?>|/>)'
+    rf'|(?P<html_entity>{_HTML_ENTITY_PATTERN})'
+    r'|(?P<whitespace>[ \n\t])'
+    r'|(?P<text_placeholder>_TEXT_)'
+    r'|(?P<text>[^*`\[</& \n\t_]+|.)',
+    re.DOTALL,
+)
+
+_IMPORT_PLACEHOLDER_LINE = re.compile(r'^__IMPORT_\d+__$')
+_HORIZONTAL_RULE = re.compile(r'^\s*([-](\s*[-]){2,}|[_](\s*[_]){2,}|[*](\s*[*]){2,})\s*$')
+_LIST_ITEM = re.compile(r'^(\s*)([-*]|\d+\.)(\s+)(.*)$')
+_HEADER = re.compile(r'^(\s*#+\s+)(.*)$')
+_IMG_TAG = re.compile(r'<img[^>]*>')
+_IMG_ALT_DOUBLE_QUOTED = re.compile(r'alt="[^"]*"')
+_IMG_ALT_SINGLE_QUOTED = re.compile(r"alt='[^']*'")
+_HTML_TAG_SPLIT = re.compile(r'(<[^>]+>|</[^>]+>)')
+_ENTITY_BEFORE_TEXT = re.compile(f'({_HTML_ENTITY_PATTERN})(_TEXT_)')
+_TEXT_BEFORE_ENTITY = re.compile(f'(_TEXT_)({_HTML_ENTITY_PATTERN})')
+_BREAK_SPACE_BEFORE_NEWLINE = re.compile(r'(<br/?>|/>)[ \t]+\n')
+_BREAK_SPACE_AT_LINE_END = re.compile(r'(<br/?>|/>)[^\S\n]+$', re.MULTILINE)
+
 
 @dataclass
 class ProtectedSection:
@@ -164,13 +232,12 @@ class ContentProtector:
 
     def extract_yaml_frontmatter(self, text: str) -> Tuple[str, Optional[ProtectedSection]]:
         """Extract the YAML frontmatter and replace with a placeholder"""
-        pattern = r'^---\n(.*?)\n---\n'
-        match = re.match(pattern, text, re.DOTALL)
+        match = _YAML_FRONTMATTER.match(text)
         if match:
             yaml_content = match.group(1)
             placeholder = "__YAML_FRONTMATTER__"
             protected = ProtectedSection(yaml_content, placeholder)
-            modified_text = re.sub(pattern, f"---\n{placeholder}\n---\n", text, count=1, flags=re.DOTALL)
+            modified_text = f"---\n{placeholder}\n---\n" + text[match.end():]
             return modified_text, protected
         return text, None
 
@@ -198,7 +265,7 @@ class ContentProtector:
                 j = i + 1
                 
                 # Check if this is a single-line import
-                if re.search(r'from\s+["\'][^"\']+["\']', line):
+                if _IMPORT_FROM.search(line):
                     # Single-line import - already complete
                     j = i + 1
                 else:
@@ -206,7 +273,7 @@ class ContentProtector:
                     while j < len(lines):
                         next_line = lines[j]
                         import_lines.append(next_line)
-                        if re.search(r'from\s+["\'][^"\']+["\']', next_line):
+                        if _IMPORT_FROM.search(next_line):
                             j += 1
                             break
                         j += 1
@@ -229,8 +296,6 @@ class ContentProtector:
 
     def extract_code_blocks(self, text: str) -> str:
         """Extracts code blocks and replaces them with placeholders"""
-        pattern = r'(```\w*\n.*?```)'
-
         def replace_code_block(match):
             full_block = match.group(1)
             placeholder = self._create_placeholder("CODE_BLOCK")
@@ -238,12 +303,10 @@ class ContentProtector:
             self.protected_sections.append(protected)
             return placeholder
 
-        return re.sub(pattern, replace_code_block, text, flags=re.DOTALL)
+        return _CODE_BLOCK.sub(replace_code_block, text)
 
     def extract_inline_code(self, text: str) -> str:
         """Extracts inline code and replaces it with placeholders"""
-        pattern = r'(?<!`)`([^`\n]+)`(?!`)'
-
         def replace_inline_code(match):
             code = match.group(1)
             placeholder = self._create_placeholder("INLINE_CODE")
@@ -251,12 +314,10 @@ class ContentProtector:
             self.protected_sections.append(protected)
             return f"`{placeholder}`"
 
-        return re.sub(pattern, replace_inline_code, text)
+        return _INLINE_CODE_SECTION.sub(replace_inline_code, text)
 
     def extract_urls(self, text: str) -> str:
         """Extracts URLs from links and images and preserves them"""
-        pattern = r'(!?\[[^\]]*\]\()([^)]+)(\))'
-
         def replace_url(match):
             prefix = match.group(1)
             url = match.group(2)
@@ -280,13 +341,11 @@ class ContentProtector:
                 self.protected_sections.append(protected)
                 return prefix + placeholder + suffix
 
-        return re.sub(pattern, replace_url, text)
+        return _LINK_OR_IMAGE.sub(replace_url, text)
 
 
     def extract_html_entities(self, text: str) -> str:
         """Extracts HTML entities and preserves them"""
-        pattern = r'(&[a-zA-Z]+;|&#\d+;|&#x[0-9a-fA-F]+;)'
-
         def replace_entity(match):
             entity = match.group(1)
             placeholder = self._create_placeholder("HTML_ENTITY")
@@ -294,13 +353,29 @@ class ContentProtector:
             self.protected_sections.append(protected)
             return placeholder
 
-        return re.sub(pattern, replace_entity, text)
+        return _HTML_ENTITY.sub(replace_entity, text)
 
     def restore_all(self, text: str) -> str:
-        """Restores all protected sections from placeholders"""
-        for section in self.protected_sections:
-            text = text.replace(section.placeholder, section.content)
-        return text
+        """
+        Restores all protected sections from placeholders in one pass over the text.
+
+        Same result as replacing the placeholders one section after another:
+        a placeholder inside a restored section is only replaced if its
+        section was protected later.
+        """
+        if not self.protected_sections:
+            return text
+        order = {section.placeholder: i for i, section in enumerate(self.protected_sections)}
+
+        def restore(text: str, first: int) -> str:
+            def replace(match):
+                i = order.get(match.group(0))
+                if i is None or i < first:
+                    return match.group(0)
+                return restore(self.protected_sections[i].content, i + 1)
+            return _PROTECTED_PLACEHOLDER.sub(replace, text)
+
+        return restore(text, 0)
 
 
 class TextProcessor:
@@ -353,6 +428,9 @@ class TextProcessor:
         """
         if not text:
             return []
+        if '<' not in text:
+            # No tag can start: same as splitting on whitespace
+            return text.split()
 
         tokens = []
         current = []
@@ -418,13 +496,13 @@ class TextProcessor:
         # or header markers (#)
         # Note: List marker must be followed by whitespace (not part of markdown formatting)
         # Pattern: (whitespace)(number. or - or *)(whitespace) or (whitespace)(#+)(whitespace)
-        structural_match = re.match(r'^(\s*)(\d+\.\s+|[-*]\s+|#+\s+)', line)
+        structural_match = _STRUCTURAL_PREFIX.match(line)
         if structural_match:
             prefix = structural_match.group(0)
             content = line[len(prefix):]
         else:
             # Try to match just whitespace prefix
-            whitespace_match = re.match(r'^(\s+)', line)
+            whitespace_match = _LEADING_WHITESPACE.match(line)
             if whitespace_match:
                 prefix = whitespace_match.group(0)
                 content = line[len(prefix):]
@@ -515,14 +593,9 @@ class TextProcessor:
             contains_duplicate_pattern = False
             for pattern_str in normalized_patterns:
                 # Check if the pattern appears in the token (as a substring)
-                # Use word boundaries to avoid false matches
                 if pattern_str in token:
-                    # More precise check: pattern should be surrounded by word boundaries or start/end
-                    # For patterns like "**_TEXT_**", check if it appears as a complete pattern
-                    pattern_escaped = re.escape(pattern_str)
-                    if re.search(pattern_escaped, token):
-                        contains_duplicate_pattern = True
-                        break
+                    contains_duplicate_pattern = True
+                    break
             
             if not contains_duplicate_pattern:
                 filtered_other_tokens.append(token)
@@ -583,8 +656,7 @@ class TextProcessor:
             return None
         
         # Match italic content
-        pattern = rf'\{marker}([^{marker}]+?)\{marker}'
-        match = re.match(pattern, text[pos:])
+        match = _ITALIC[marker].match(text, pos)
         if not match:
             return None
         
@@ -600,7 +672,7 @@ class TextProcessor:
         """Check if _ at pos is a valid italic marker (not part of word/emoji/bold)."""
         if pos + 1 < len(text) and text[pos + 1] == '_':
             return False  # Part of __ (bold) or placeholder
-        if re.match(r'__[A-Z_]+_\d+__', text[pos:]):
+        if _PLACEHOLDER.match(text, pos):
             return False  # Part of placeholder
         # Check boundaries: must be at word boundary (whitespace or start/end)
         before = text[pos - 1] if pos > 0 else ' '
@@ -609,26 +681,18 @@ class TextProcessor:
     
     def _find_next_marker(self, text: str, start: int) -> int:
         """Find position of next markdown marker, skipping wildcard patterns."""
-        patterns = [
-            r'`__[A-Z_]+_\d+__`',  # Placeholders with backticks
-            r'__[A-Z_]+_\d+__',     # Placeholders
-            r'\*\*',                # Bold start
-            r'__',                  # Bold start
-            r'`',                   # Code
-            r'\*',                  # Italic or wildcard
-            r'\[',                  # Link
-        ]
-        
+        # Placeholders start with ` or __, so the first of `, __, [ and ** covers them
         next_pos = len(text)
-        for pattern in patterns:
-            match = re.search(pattern, text[start:])
-            if match:
-                pos = start + match.start()
-                if text[pos] == '*' and pos + 1 < len(text) and text[pos + 1] == '.':
-                    continue  # Skip wildcard patterns (*.csv)
-                if match.start() < next_pos - start:
-                    next_pos = pos
-        
+        for marker in ('`', '__', '[', '**'):
+            pos = text.find(marker, start)
+            if pos != -1 and pos < next_pos:
+                next_pos = pos
+
+        # Italic or wildcard: only the first * is considered, and not if it starts *.csv
+        star_pos = text.find('*', start)
+        if star_pos != -1 and star_pos < next_pos and text[star_pos + 1:star_pos + 2] != '.':
+            next_pos = star_pos
+
         # Check for underscore (_) as italic marker
         underscore_pos = text.find('_', start)
         if underscore_pos != -1 and underscore_pos < next_pos and self._is_underscore_marker(text, underscore_pos):
@@ -642,80 +706,79 @@ class TextProcessor:
         i = 0
         
         while i < len(text):
-            matched = False
+            char = text[i]
             
             # 1. Placeholders (most specific)
-            if re.match(r'\((__[A-Z_]+_\d+__)\)', text[i:]):
-                match = re.match(r'\((__[A-Z_]+_\d+__)\)', text[i:])
-                tokens.append(('placeholder', match.group(0)))
-                i += len(match.group(0))
-                continue
+            if char == '(':
+                match = _PARENTHESIZED_PLACEHOLDER.match(text, i)
+                if match:
+                    tokens.append(('placeholder', match.group(0)))
+                    i = match.end()
+                    continue
             
-            match = re.match(r'`__[A-Z_]+_\d+__`|__[A-Z_]+_\d+__', text[i:])
-            if match:
-                tokens.append(('placeholder', match.group(0)))
-                i += len(match.group(0))
-                continue
+            if char in '`_':
+                match = _PLACEHOLDER_TOKEN.match(text, i)
+                if match:
+                    tokens.append(('placeholder', match.group(0)))
+                    i = match.end()
+                    continue
             
             # 2. Bold
-            if text[i:].startswith('**'):
-                match = re.match(r'\*\*([^*]+)\*\*', text[i:])
+            if text.startswith('**', i):
+                match = _BOLD_ASTERISK.match(text, i)
                 if match:
                     tokens.append(('bold', match.group(1)))
-                    i += len(match.group(0))
+                    i = match.end()
                     continue
             
-            if text[i:].startswith('__') and not re.match(r'__[A-Z_]+_\d+__', text[i:]):
-                match = re.match(r'__([^_]+)__', text[i:])
+            if text.startswith('__', i) and not _PLACEHOLDER.match(text, i):
+                match = _BOLD_UNDERSCORE.match(text, i)
                 if match:
                     tokens.append(('bold', match.group(1)))
-                    i += len(match.group(0))
+                    i = match.end()
                     continue
             
             # 3. Inline code
             # Note: inline code text is converted to _TEXT_ (not preserved as-is)
-            if text[i] == '`':
-                match = re.match(r'`([^`]+)`', text[i:])
+            if char == '`':
+                match = _INLINE_CODE.match(text, i)
                 if match:
                     tokens.append(('code', '_TEXT_'))
-                    i += len(match.group(0))
+                    i = match.end()
                     continue
             
             # 4. Italic
-            for marker in ['*', '_']:
-                if text[i] == marker:
-                    result = self._match_italic(text, i, marker)
-                    if result:
-                        content, length = result
-                        tokens.append(('italic', content))
-                        i += length
-                        matched = True
-                        break
-            if matched:
-                continue
+            if char in '*_':
+                result = self._match_italic(text, i, char)
+                if result:
+                    content, length = result
+                    tokens.append(('italic', content))
+                    i += length
+                    continue
             
             # 5. Links
-            if text[i] == '[' and not text[i:].startswith('!['):
+            if char == '[':
                 # Match link with URL (including placeholder URLs)
-                match = re.match(r'\[([^\]]+)\]\(([^)]+)\)', text[i:])
+                match = _LINK_WITH_URL.match(text, i)
                 if match:
                     tokens.append(('link', (match.group(1), match.group(2))))
-                    i += len(match.group(0))
+                    i = match.end()
                     continue
                 
-                match = re.match(r'\[([^\]]+)\]', text[i:])
+                match = _LINK_WITHOUT_URL.match(text, i)
                 if match:
                     tokens.append(('link', (match.group(1), None)))
-                    i += len(match.group(0))
+                    i = match.end()
                     continue
             
             # 6. Emoji pattern (before regular text to prevent splitting)
             # Emoji pattern: :[a-z_]+:
-            emoji_match = re.match(r':[a-z_]+:', text[i:])
-            if emoji_match:
-                tokens.append(('text', emoji_match.group(0)))
-                i += len(emoji_match.group(0))
-                continue
+            if char == ':':
+                emoji_match = _EMOJI.match(text, i)
+                if emoji_match:
+                    tokens.append(('text', emoji_match.group(0)))
+                    i = emoji_match.end()
+                    continue
             
             # 7. Regular text
             next_pos = self._find_next_marker(text, i)
@@ -766,7 +829,7 @@ class TextProcessor:
                 # Remove punctuation marks (periods, exclamation marks, question marks, colons, semicolons, commas, Japanese comma)
                 # Note: Colon (:) in general text is NOT a markdown syntax element and is removed like other punctuation
                 # Note: Japanese comma (、) is treated the same as regular comma (,)
-                cleaned = re.sub(r'[.,;:!?。！？、]+', '', content)
+                cleaned = _PUNCTUATION.sub('', content)
                 if cleaned.strip():
                     # Regular text processing
                     if needs_space_before() and content and content[0] == ' ':
@@ -790,31 +853,19 @@ class TextProcessor:
         Uses token-based approach instead of regex to avoid pattern matching issues.
         """
         # Step 0: Separate concatenated patterns (e.g., "**_TEXT_****_TEXT_**" -> "**_TEXT_** **_TEXT_**")
-        # This handles cases where multiple patterns are concatenated without spaces
-        # Define all patterns that need spacing when concatenated
-        patterns = [
-            r'\*\*_TEXT_\*\*',  # Bold: **_TEXT_**
-            r'\*_TEXT_\*',      # Italic: *_TEXT_*
-            r'`_TEXT_`',        # Inline code: `_TEXT_`
-            r'_TEXT_',          # Text placeholder: _TEXT_
-        ]
-        
-        # Add space between any two patterns (same or different) that are concatenated without space
-        # This handles:
+        # Add space between any two patterns (same or different) that are concatenated without space:
         # - Same patterns (e.g., "**_TEXT_****_TEXT_**" -> "**_TEXT_** **_TEXT_**")
         # - Different patterns in any order (e.g., "_TEXT_**_TEXT_**" or "*_TEXT_*_TEXT_")
-        # Process all combinations to ensure both directions are handled
-        for pattern1 in patterns:
-            for pattern2 in patterns:
-                # Create regex pattern: (pattern1)(pattern2) -> (pattern1) (pattern2)
-                regex_pattern = f'({pattern1})({pattern2})'
-                text = re.sub(regex_pattern, r'\1 \2', text)
+        # The pairs are applied one after another, so only lines that have any pair take that path.
+        if _ANY_ADJACENT_PATTERNS.search(text):
+            for pair in _ADJACENT_PATTERN_PAIRS:
+                text = pair.sub(r'\1 \2', text)
         
         # Step 1: Merge consecutive _TEXT_ placeholders
-        text = re.sub(r'_TEXT_([\s_]*_TEXT_)+', '_TEXT_', text)
+        text = _CONSECUTIVE_TEXT.sub('_TEXT_', text)
         
         # Step 2: Remove trailing spaces after HTML tags (e.g., <br/>  -> <br/>)
-        text = re.sub(r'(<br/?>|/>)\s+', r'\1', text)
+        text = _SPACE_AFTER_BREAK.sub(r'\1', text)
         
         # Step 3: Tokenize the text
         tokens = self._tokenize_for_cleanup(text)
@@ -826,72 +877,14 @@ class TextProcessor:
         return ''.join(normalized_parts)
     
     def _tokenize_for_cleanup(self, text: str) -> List[Tuple[str, str]]:
-        """Tokenize text for cleanup processing. Returns list of (type, content) tuples."""
-        tokens = []
-        i = 0
-        
-        while i < len(text):
-            # 1. Bold: **_TEXT_**
-            if text[i:].startswith('**_TEXT_**'):
-                tokens.append(('bold', '**_TEXT_**'))
-                i += len('**_TEXT_**')
-            # 2. Italic: *_TEXT_*
-            elif text[i:].startswith('*_TEXT_*'):
-                tokens.append(('italic', '*_TEXT_*'))
-                i += len('*_TEXT_*')
-            # 3. Inline code: `...`
-            elif text[i] == '`':
-                match = re.match(r'`([^`]+)`', text[i:])
-                if match:
-                    tokens.append(('code', match.group(0)))
-                    i += len(match.group(0))
-                else:
-                    tokens.append(('text', text[i]))
-                    i += 1
-            # 4. Link: [_TEXT_](url)
-            elif text[i] == '[' and text[i:].startswith('[_TEXT_]('):
-                match = re.match(r'\[_TEXT_\]\(([^)]+)\)', text[i:])
-                if match:
-                    tokens.append(('link', match.group(0)))
-                    i += len(match.group(0))
-                else:
-                    tokens.append(('text', text[i]))
-                    i += 1
-            # 5. HTML tag: <br/>, />
-            elif text[i] == '<' and i + 3 < len(text) and text[i:i+3] == '<br':
-                match = re.match(r'<br/?>', text[i:])
-                if match:
-                    tokens.append(('html_tag', match.group(0)))
-                    i += len(match.group(0))
-                else:
-                    tokens.append(('text', text[i]))
-                    i += 1
-            elif i + 1 < len(text) and text[i:i+2] == '/>':
-                tokens.append(('html_tag', '/>'))
-                i += 2
-            # 6. HTML entity: &lt;, &gt;, &amp;, etc.
-            elif text[i] == '&':
-                match = re.match(r'(&[a-zA-Z]+;|&#\d+;|&#x[0-9a-fA-F]+;)', text[i:])
-                if match:
-                    tokens.append(('html_entity', match.group(0)))
-                    i += len(match.group(0))
-                else:
-                    tokens.append(('text', text[i]))
-                    i += 1
-            # 7. Whitespace
-            elif text[i] in ' \n\t':
-                tokens.append(('whitespace', text[i]))
-                i += 1
-            # 8. _TEXT_ placeholder
-            elif text[i:].startswith('_TEXT_'):
-                tokens.append(('text_placeholder', '_TEXT_'))
-                i += len('_TEXT_')
-            # 9. 기타 문자
-            else:
-                tokens.append(('text', text[i]))
-                i += 1
-        
-        return tokens
+        """
+        Tokenize text for cleanup processing. Returns list of (type, content) tuples.
+
+        Token types: bold (**_TEXT_**), italic (*_TEXT_*), code (`...`), link ([_TEXT_](url)),
+        html_tag (<br/>, />), html_entity (&lt; etc.), whitespace, text_placeholder (_TEXT_)
+        and text (anything else).
+        """
+        return [(match.lastgroup, match.group(0)) for match in _CLEANUP_TOKEN.finditer(text)]
     
     def _normalize_spacing(self, tokens: List[Tuple[str, str]]) -> List[str]:
         """Normalize spacing between tokens. Returns list of strings to join."""
@@ -983,7 +976,7 @@ def process_text_line(line: str, text_processor: TextProcessor) -> str:
 
     # Import statements are now handled by ContentProtector.extract_import_statements
     # Check if this line is an import placeholder
-    if re.match(r'^__IMPORT_\d+__$', line.strip()):
+    if _IMPORT_PLACEHOLDER_LINE.match(line.strip()):
         return line
 
     if line.strip().startswith('```') or line.strip() == '```':
@@ -996,13 +989,13 @@ def process_text_line(line: str, text_processor: TextProcessor) -> str:
     # Preserve horizontal rules (---, ___, ***, or with spaces like - - -)
     # Markdown horizontal rule: 3 or more of the SAME character (-, _, or *) with optional spaces
     # Must use the same character type throughout (e.g., --- is valid, but *-* is not)
-    if re.match(r'^\s*([-](\s*[-]){2,}|[_](\s*[_]){2,}|[*](\s*[*]){2,})\s*$', line.strip()):
+    if _HORIZONTAL_RULE.match(line.strip()):
         return line
 
     # Check if line contains HTML tags - process HTML first
     if '<' in line and '>' in line:
         # For lines with HTML, check if it's a markdown list item first
-        list_match = re.match(r'^(\s*)([-*]|\d+\.)(\s+)(.*)$', line)
+        list_match = _LIST_ITEM.match(line)
         if list_match:
             # It's a list item with HTML - process markdown structure first, then HTML content
             indent = list_match.group(1)
@@ -1047,14 +1040,14 @@ def _process_html_line(line: str, text_processor: TextProcessor) -> str:
         tag = match.group(0)
         # Replace alt="..." with alt="_TEXT_"
         # Handle both alt="..." and alt='...'
-        tag = re.sub(r'alt="[^"]*"', 'alt="_TEXT_"', tag)
-        tag = re.sub(r"alt='[^']*'", "alt='_TEXT_'", tag)
+        tag = _IMG_ALT_DOUBLE_QUOTED.sub('alt="_TEXT_"', tag)
+        tag = _IMG_ALT_SINGLE_QUOTED.sub("alt='_TEXT_'", tag)
         return tag
 
-    stripped = re.sub(r'<img[^>]*>', replace_img_alt, stripped)
+    stripped = _IMG_TAG.sub(replace_img_alt, stripped)
 
     # Split by HTML tags, keeping the tags
-    parts = re.split(r'(<[^>]+>|</[^>]+>)', stripped)
+    parts = _HTML_TAG_SPLIT.split(stripped)
     result = []
     for i, part in enumerate(parts):
         if part.startswith('<'):
@@ -1086,14 +1079,14 @@ def process_markdown_line(line: str, text_processor: TextProcessor) -> str:
     IMPORTANT: Leading whitespace (indentation) MUST be preserved.
     The function extracts and preserves leading whitespace before processing content.
     """
-    header_match = re.match(r'^(\s*#+\s+)(.*)$', line)
+    header_match = _HEADER.match(line)
     if header_match:
         prefix = header_match.group(1)  # Preserves leading whitespace
         content = header_match.group(2)
         processed_content = text_processor.replace_text_in_content(content)
         return prefix + processed_content
 
-    list_match = re.match(r'^(\s*)([-*]|\d+\.)(\s+)(.*)$', line)
+    list_match = _LIST_ITEM.match(line)
     if list_match:
         indent = list_match.group(1)  # Preserves leading whitespace (indentation)
         marker = list_match.group(2)
@@ -1202,6 +1195,20 @@ def convert_mdx_to_skeleton(input_path: Path) -> Path:
     Returns:
         Path to the generated skeleton MDX file
     """
+    _check_mdx_input(input_path)
+
+    content = mdx_to_skeleton(input_path.read_text(encoding='utf-8'))
+
+    # Generate output path
+    output_path = input_path.parent / f"{input_path.stem}.skel.mdx"
+
+    # Write output file
+    output_path.write_text(content, encoding='utf-8')
+
+    return output_path
+
+
+def _check_mdx_input(input_path: Path) -> None:
     if not input_path.exists():
         raise FileNotFoundError(f"Input file not found: {input_path}")
 
@@ -1211,9 +1218,21 @@ def convert_mdx_to_skeleton(input_path: Path) -> Path:
     if input_path.name.endswith('.skel.mdx'):
         raise ValueError(f"Skipping .skel.mdx file to avoid recursion: {input_path}")
 
-    # Read input file
-    content = input_path.read_text(encoding='utf-8')
 
+@profiling.timed('skeleton.build')
+def mdx_to_skeleton(content: str) -> str:
+    """
+    Converts MDX text to skeleton text without touching the filesystem.
+
+    This is the conversion used by convert_mdx_to_skeleton(); the recursive
+    comparison calls it directly so that skeletons stay in memory.
+
+    Args:
+        content: MDX file content
+
+    Returns:
+        Skeleton MDX content
+    """
     # Initialize processors
     protector = ContentProtector()
     text_processor = TextProcessor()
@@ -1278,60 +1297,16 @@ def convert_mdx_to_skeleton(input_path: Path) -> Path:
     # Step 5: Post-processing to handle special cases
     # Normalize spacing after HTML entities: ensure space between HTML entity and _TEXT_
     # Pattern: &lt;_TEXT_ -> &lt; _TEXT_, &gt;_TEXT_ -> &gt; _TEXT_
-    content = re.sub(r'(&[a-zA-Z]+;|&#\d+;|&#x[0-9a-fA-F]+;)(_TEXT_)', r'\1 \2', content)
+    content = _ENTITY_BEFORE_TEXT.sub(r'\1 \2', content)
     # Pattern: _TEXT_&lt; -> _TEXT_ &lt;, _TEXT_&gt; -> _TEXT_ &gt;
-    content = re.sub(r'(_TEXT_)(&[a-zA-Z]+;|&#\d+;|&#x[0-9a-fA-F]+;)', r'\1 \2', content)
+    content = _TEXT_BEFORE_ENTITY.sub(r'\1 \2', content)
     
     # Remove trailing spaces after HTML tags at end of lines
     # Note: Use [ \t]+ instead of \s+ to avoid matching newlines, which would remove blank lines
-    content = re.sub(r'(<br/?>|/>)[ \t]+\n', r'\1\n', content)
-    # Remove trailing spaces after HTML tags before newlines (but preserve spaces before other content)
-    lines = content.split('\n')
-    processed_final_lines = []
-    for line in lines:
-        # Remove trailing space after /> or <br/> at end of line
-        line = re.sub(r'(<br/?>|/>)\s+$', r'\1', line)
-        processed_final_lines.append(line)
-    content = '\n'.join(processed_final_lines)
-
-    # Generate output path
-    output_path = input_path.parent / f"{input_path.stem}.skel.mdx"
-
-    # Write output file
-    output_path.write_text(content, encoding='utf-8')
-
-    return output_path
-
-
-def compare_skeleton_files(
-    korean_skel_path: Path,
-    translation_skel_path: Path,
-    translation_mdx_path: Path
-) -> Tuple[bool, Optional[str], Optional[Path]]:
-    """
-    Compare two skeleton MDX files and return comparison result.
-    
-    This function compares the Korean skeleton file with the translation skeleton file
-    and returns the comparison result. It uses the common comparison logic from skeleton_diff module.
-    
-    Args:
-        korean_skel_path: Path to the Korean skeleton MDX file
-        translation_skel_path: Path to the translation skeleton MDX file
-        translation_mdx_path: Path to the original translation MDX file (for error reporting)
-    
-    Returns:
-        Tuple of (should_continue, comparison_result, unmatched_file_path)
-        - should_continue: True if it should continue processing, False if max_diff is reached and should stop
-        - comparison_result: 'matched' if files are identical, 'unmatched' if different, None if not compared
-        - unmatched_file_path: Path to the unmatched .mdx file (with target/{lang} prefix) if unmatched, None otherwise
-    """
-    from skeleton import diff as skeleton_diff
-    # Access the internal comparison function
-    return skeleton_diff._compare_two_skeleton_files(
-        korean_skel_path,
-        translation_skel_path,
-        translation_mdx_path
-    )
+    content = _BREAK_SPACE_BEFORE_NEWLINE.sub(r'\1\n', content)
+    # Remove trailing whitespace after /> or <br/> at the end of any line
+    # (but preserve spaces before other content)
+    return _BREAK_SPACE_AT_LINE_END.sub(r'\1', content)
 
 
 def convert_and_compare_mdx_to_skeleton(input_path: Path) -> Tuple[Path, Optional[str], Optional[Path]]:
@@ -1365,15 +1340,11 @@ def convert_and_compare_mdx_to_skeleton(input_path: Path) -> Tuple[Path, Optiona
         output_path = convert_mdx_to_skeleton(input_path)
         return output_path, None, None
     
-    # Step 1: Convert input MDX to skeleton MDX
-    # Delete existing skeleton file if it exists
-    output_path = input_path.parent / f"{input_path.stem}.skel.mdx"
-    if output_path.exists():
-        output_path.unlink()
-    
-    # Convert and save
-    output_path = convert_mdx_to_skeleton(input_path)
-    
+    # Step 1: Convert input MDX to skeleton MDX (kept in memory and written for inspection)
+    _check_mdx_input(input_path)
+    translation = _write_skeleton(SkeletonSource.build(input_path, mdx_to_skeleton))
+    output_path = translation.skel_path
+
     # Step 2: Find corresponding Korean MDX file
     # Check if current file is Korean first
     current_lang = extract_language_code(input_path)
@@ -1388,20 +1359,22 @@ def convert_and_compare_mdx_to_skeleton(input_path: Path) -> Tuple[Path, Optiona
         return output_path, None, None
     
     # Step 3: Convert Korean MDX to skeleton MDX
-    # Delete existing skeleton file if it exists
-    korean_skel_path = korean_mdx_path.parent / f"{korean_mdx_path.stem}.skel.mdx"
-    if korean_skel_path.exists():
-        korean_skel_path.unlink()
+    korean = _write_skeleton(SkeletonSource.build(korean_mdx_path, mdx_to_skeleton))
     
-    # Convert and save
-    korean_skel_path = convert_mdx_to_skeleton(korean_mdx_path)
-    
-    # Step 4: Compare translation skeleton MDX with Korean skeleton MDX
-    _, comparison_result, unmatched_file_path = compare_skeleton_files(
-        korean_skel_path, output_path, input_path
-    )
-    
-    return output_path, comparison_result, unmatched_file_path
+    # Step 4: Compare translation skeleton with Korean skeleton in memory
+    comparison = compare_skeletons(korean, translation, skeleton_diff._ignore_rules)
+    if comparison.result == 'matched':
+        return output_path, 'matched', None
+    print(comparison.output, end='')
+    return output_path, 'unmatched', input_path
+
+
+def _write_skeleton(source: SkeletonSource) -> SkeletonSource:
+    """Replace the .skel.mdx file of source with its skeleton."""
+    if source.skel_path.exists():
+        source.skel_path.unlink()
+    source.skel_path.write_text(source.skeleton, encoding='utf-8')
+    return source
 
 
 def main():
@@ -1438,6 +1411,18 @@ def main():
         metavar='N',
         help='Maximum number of diffs to output before stopping (default: 5). Only applies with --recursive option.'
     )
+    parser.add_argument(
+        '--jobs',
+        type=int,
+        default=1,
+        metavar='N',
+        help='With --recursive, build and compare skeletons in N worker processes (default: 1, in this process)'
+    )
+    parser.add_argument(
+        '--write-skel',
+        action='store_true',
+        help='With --recursive, also write each skeleton as .skel.mdx next to its source (skeletons are compared in memory)'
+    )
     parser.add_argument(
         '--exclude',
         type=str,
@@ -1470,8 +1455,12 @@ def main():
         metavar='DIR',
         help='Delete all .skel.mdx files in directory(ies) recursively. If no directories specified, defaults to target/ko, target/ja, target/en'
     )
+    profiling.add_arguments(parser)
 
     args = parser.parse_args()
+    if args.jobs < 1:
+        parser.error('--jobs must be at least 1')
+    profiling.start_from_args('skeleton', args)
 
     # Initialize config if recursive mode is used or if --use-ignore is specified
     if args.recursive is not None or args.use_ignore:
@@ -1492,7 +1481,12 @@ def main():
             return 0
         elif args.recursive is not None:
             # Recursive mode: process directories
-            exit_code, unmatched_file_paths = process_directories_recursive(args.recursive, convert_and_compare_mdx_to_skeleton)
+            exit_code, unmatched_file_paths = process_directories_recursive(
+                args.recursive,
+                mdx_to_skeleton,
+                jobs=args.jobs,
+                write_skeletons=args.write_skel,
+            )
             
             # Save unmatched file paths to output file if specified
             if args.output is not None:
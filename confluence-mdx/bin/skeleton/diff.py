@@ -7,11 +7,14 @@ It provides functions for comparing skeleton files across different languages
 and processing directories recursively.
 """
 
+import functools
+import logging
 import re
-import subprocess
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Tuple, Optional, Dict, Set
+from typing import Callable, Dict, Iterator, List, Optional, Set, Tuple
 
 # Resolve project root (confluence-mdx/) from this module's location
 _SCRIPT_DIR = Path(__file__).resolve().parent.parent  # confluence-mdx/bin/
@@ -26,46 +29,33 @@ try:
 except ImportError:
     yaml = None
 
+import profiling
 from skeleton.common import (
     extract_language_code,
     get_korean_equivalent_path,
     get_path_without_lang_dir,
-    get_original_mdx_path,
 )
+from skeleton.textdiff import unified_diff_ignoring_space_change
+
+logger = logging.getLogger(__name__)
 
-# Global diff counter for tracking the number of diffs found
-_diff_count: int = 0
-_match_count: int = 0  # Counter for matching skeleton diffs
 _max_diff: Optional[int] = None  # Will be set to 5 (default) when --recursive is used
 _exclude_patterns: List[str] = ['/index.skel.mdx']  # Default exclude patterns
 _ignore_rules: Dict[str, Set[int]] = {}  # Dictionary mapping file paths to sets of line numbers to ignore
 
 
-def format_diff_with_original_content(
+def _replace_with_original_lines(
         diff_output: str,
         left_skel_path: Path,
-        right_skel_path: Path
+        right_skel_path: Path,
+        left_mdx_path: Path,
+        right_mdx_path: Path,
+        left_lines: List[str],
+        right_lines: List[str],
 ) -> str:
     """
-    Formats diff output by replacing .skel.mdx file paths with .mdx paths
-    and replacing diff content lines with original .mdx file content.
-
-    Converts skeleton diff (with _TEXT_ placeholders) to original content diff.
+    Rewrites a skeleton diff with the original .mdx lines (already read by the caller).
     """
-    # Get original .mdx file paths
-    left_mdx_path = get_original_mdx_path(left_skel_path)
-    right_mdx_path = get_original_mdx_path(right_skel_path)
-
-    if left_mdx_path is None or right_mdx_path is None:
-        return diff_output
-
-    # Read original .mdx files
-    try:
-        left_lines = left_mdx_path.read_text(encoding='utf-8').split('\n')
-        right_lines = right_mdx_path.read_text(encoding='utf-8').split('\n')
-    except FileNotFoundError:
-        return diff_output
-
     # Unified format chunk header pattern: @@ -start,count +start,count @@
     chunk_header_pattern = re.compile(r'^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@')
 
@@ -291,244 +281,231 @@ def filter_diff_output(
     return filtered_output
 
 
-def _compare_two_skeleton_files(
-    korean_skel_path: Path,
-    translation_skel_path: Path,
-    translation_mdx_path: Path
-) -> Tuple[bool, Optional[str], Optional[Path]]:
-    """
-    Internal function to compare two skeleton files.
-    
-    Args:
-        korean_skel_path: Path to the Korean skeleton MDX file
-        translation_skel_path: Path to the translation skeleton MDX file
-        translation_mdx_path: Path to the original translation MDX file (for error reporting)
-    
-    Returns:
-        Tuple of (should_continue, comparison_result, unmatched_file_path)
-    """
-    global _diff_count, _match_count, _max_diff, _ignore_rules
-    
-    # Check if max_diff is set and already reached
-    if _max_diff is not None:
-        if _diff_count >= _max_diff:
-            return False, None, None
-    
-    # Run diff command
-    try:
-        # Build diff command with unified format (-U 2 for 2 lines of context, -b to ignore whitespace amount differences)
-        # Note: -b ignores amount of whitespace but preserves line breaks and whitespace presence/absence
-        diff_cmd = ['diff', '-u', '-U', '2', '-b', str(korean_skel_path), str(translation_skel_path)]
-        
-        # Run diff and capture output
-        result = subprocess.run(
-            diff_cmd,
-            capture_output=True,
-            text=True,
-            check=False  # Don't raise exception on non-zero exit
-        )
-        
-        # Check if files are different (exit code 1 means differences found)
-        # Exit code 0 means files are identical
-        if result.returncode == 1:
-            # Get file path for ignore rules (use .mdx path, not .skel.mdx)
-            # Use full path including target/{lang}/ prefix
-            file_path_for_ignore = str(translation_mdx_path)
-            
-            # Filter diff output using ignore rules
-            filtered_diff = result.stdout
-            if file_path_for_ignore and _ignore_rules:
-                filtered_diff = filter_diff_output(result.stdout, file_path_for_ignore, _ignore_rules)
-            
-            # Check if filtered diff is empty (all differences were ignored)
-            # Remove file headers to check if there's actual content
-            filtered_content = '\n'.join([l for l in filtered_diff.split('\n') 
-                                         if l and not l.startswith('--- ') and not l.startswith('+++ ')])
-            
-            if filtered_content.strip():
-                # Files are different (after filtering), increment diff count
-                _diff_count += 1
-                
-                # Print command with "+ " prefix (only when there are actual differences)
-                print(f"+ {' '.join(diff_cmd)}")
-                
-                # Print filtered diff output
-                print(filtered_diff, end='')
-                
-                # Print original .mdx file diff (also filtered)
-                original_diff = format_diff_with_original_content(
-                    filtered_diff,
-                    korean_skel_path,
-                    translation_skel_path
-                )
-                if original_diff:
-                    print(original_diff, end='')
-            else:
-                # All differences were ignored, treat as matched
-                _match_count += 1
-                return True, 'matched', None
-            
-            # Check if max_diff reached
-            if _max_diff is not None:
-                if _diff_count >= _max_diff:
-                    return False, 'unmatched', translation_mdx_path
-            return True, 'unmatched', translation_mdx_path
-        elif result.returncode == 0:
-            # Files are identical, increment match count
-            _match_count += 1
-            return True, 'matched', None
-        
-        # Print stderr if any (errors)
-        if result.stderr:
-            print(result.stderr, end='', file=sys.stderr)
-    
-    except Exception as e:
-        print(f"Error running diff: {e}", file=sys.stderr)
-    
-    return True, None, None
-
-
-def compare_with_korean_skel(current_skel_path: Path) -> Tuple[bool, Optional[str], Optional[Path]]:
-    """
-    Compare current .skel.mdx file with Korean equivalent if it exists.
-    This function only performs comparison and does not modify or regenerate skeleton files.
-    
-    Args:
-        current_skel_path: Path to the current .skel.mdx file to compare
-
-    Returns:
-        Tuple of (should_continue, comparison_result, unmatched_file_path)
-        - should_continue: True if it should continue processing, False if max_diff is reached and should stop
-        - comparison_result: 'matched' if files are identical, 'unmatched' if different, None if not compared
-        - unmatched_file_path: Path to the unmatched .mdx file (with target/{lang} prefix) if unmatched, None otherwise
-    """
-    global _diff_count, _match_count, _max_diff, _ignore_rules
+@dataclass(frozen=True)
+class SkeletonSource:
+    """An MDX file together with its skeleton, both held in memory."""
+    mdx_path: Path
+    mdx_text: str
+    skeleton: str
 
-    current_lang = extract_language_code(current_skel_path)
+    @property
+    def skel_path(self) -> Path:
+        return self.mdx_path.parent / f"{self.mdx_path.stem}.skel.mdx"
 
-    # If current file is Korean, no need to compare
-    if current_lang == 'ko':
-        return True, None, None
+    @classmethod
+    def build(cls, mdx_path: Path, to_skeleton: Callable[[str], str]) -> 'SkeletonSource':
+        mdx_text = mdx_path.read_text(encoding='utf-8')
+        return cls(mdx_path, mdx_text, to_skeleton(mdx_text))
 
-    # Check if file path matches exclude patterns
-    if should_exclude_file(current_skel_path):
-        return True, None, None
 
-    # Check if max_diff is set and already reached
-    if _max_diff is not None:
-        if _diff_count >= _max_diff:
-            return False, None, None
-
-    # Get Korean equivalent path
-    korean_skel_path, korean_exists = get_korean_equivalent_path(current_skel_path)
+@dataclass(frozen=True)
+class SkeletonComparison:
+    """
+    Result of comparing a translation skeleton with its Korean skeleton.
 
-    if korean_skel_path is None:
-        return True, None, None
+    result is 'matched' or 'unmatched'; output holds the text to print for an
+    unmatched file (the filtered skeleton diff followed by the original content diff).
+    """
+    result: str
+    output: str = ''
 
-    # Check if skeleton files exist
-    if not current_skel_path.exists():
-        return True, None, None
-    if not korean_exists:
-        return True, None, None
 
-    # Get the original .mdx file path for comparison
-    current_mdx_path = get_original_mdx_path(current_skel_path)
-    if current_mdx_path is None:
-        return True, None, None
+@profiling.timed('skeleton.compare')
+def compare_skeletons(
+        korean: SkeletonSource,
+        translation: SkeletonSource,
+        ignore_rules: Dict[str, Set[int]],
+) -> SkeletonComparison:
+    """
+    Compare a translation skeleton with the Korean skeleton using `diff -u -b`
+    semantics and the ignore rules of the translation file.
 
-    # Use the common comparison function
-    return _compare_two_skeleton_files(
-        korean_skel_path,
-        current_skel_path,
-        current_mdx_path
+    The former `diff -u -U 2 -b` invocation printed 3 lines of context (GNU diff
+    keeps the larger of -u and -U), so the default context of 3 is kept.
+    """
+    diff_output = unified_diff_ignoring_space_change(
+        korean.skeleton, translation.skeleton,
+        str(korean.skel_path), str(translation.skel_path),
     )
+    if not diff_output:
+        return SkeletonComparison('matched')
+
+    # Filter diff output using ignore rules (keyed by the .mdx path with target/{lang}/ prefix)
+    if ignore_rules:
+        diff_output = filter_diff_output(diff_output, str(translation.mdx_path), ignore_rules)
+
+    # All differences were ignored, treat as matched
+    filtered_content = '\n'.join([l for l in diff_output.split('\n')
+                                  if l and not l.startswith('--- ') and not l.startswith('+++ ')])
+    if not filtered_content.strip():
+        return SkeletonComparison('matched')
+
+    original_diff = _replace_with_original_lines(
+        diff_output,
+        korean.skel_path, translation.skel_path,
+        korean.mdx_path, translation.mdx_path,
+        korean.mdx_text.split('\n'), translation.mdx_text.split('\n'),
+    )
+    header = f"+ skeleton diff -u -b {korean.skel_path} {translation.skel_path}\n"
+    return SkeletonComparison('unmatched', header + diff_output + original_diff)
 
 
-def process_directory(directory: Path, convert_func) -> Tuple[int, int, int, int, int, List[str], List[Path]]:
+@dataclass(frozen=True)
+class _CompareGroup:
     """
-    Process all .mdx files in a directory.
-    Returns tuple of (success_count, error_count, matched_count, unmatched_count, not_compared_count, not_compared_files, unmatched_file_paths).
-    
-    Args:
-        directory: Directory to process
-        convert_func: Function to convert MDX to skeleton (takes Path, returns Tuple[Path, Optional[str], Optional[Path]])
+    Files sharing one Korean skeleton: the Korean file (if any) is converted once
+    and every other member is compared with it.
     """
-    if not directory.exists():
-        raise FileNotFoundError(f"Directory not found: {directory}")
+    korean_path: Optional[Path]
+    members: Tuple[Path, ...]
+
+
+@dataclass(frozen=True)
+class _FileOutcome:
+    result: Optional[str] = None  # 'matched', 'unmatched' or None (not compared)
+    output: str = ''
+    error: Optional[str] = None
+
+
+def _compare_group(
+        group: _CompareGroup,
+        to_skeleton: Callable[[str], str],
+        ignore_rules: Dict[str, Set[int]],
+        write_skeletons: bool,
+) -> Dict[Path, _FileOutcome]:
+    """Convert the files of one group and compare translations with the Korean skeleton (worker entry point)."""
+    def build(path: Path) -> SkeletonSource:
+        source = SkeletonSource.build(path, to_skeleton)
+        if write_skeletons:
+            source.skel_path.write_text(source.skeleton, encoding='utf-8')
+        return source
+
+    korean = None
+    korean_error = None
+    if group.korean_path is not None:
+        try:
+            korean = build(group.korean_path)
+        except Exception as e:
+            korean_error = str(e)
 
-    if not directory.is_dir():
-        raise ValueError(f"Path is not a directory: {directory}")
+    outcomes: Dict[Path, _FileOutcome] = {}
+    for path in group.members:
+        if path == group.korean_path:
+            outcomes[path] = _FileOutcome(error=korean_error)
+            continue
+        try:
+            translation = build(path)
+        except Exception as e:
+            outcomes[path] = _FileOutcome(error=str(e))
+            continue
+        if group.korean_path is None:
+            outcomes[path] = _FileOutcome()
+        elif korean is None:
+            outcomes[path] = _FileOutcome(error=korean_error)
+        else:
+            comparison = compare_skeletons(korean, translation, ignore_rules)
+            outcomes[path] = _FileOutcome(comparison.result, comparison.output)
+    return outcomes
 
-    success_count = 0
-    error_count = 0
-    matched_count = 0
-    unmatched_count = 0
-    not_compared_count = 0
-    not_compared_files = []  # Track files that were not compared
-    unmatched_file_paths = []  # Track paths of unmatched files
 
-    # Find all .mdx files (recursively)
-    mdx_files = list(directory.rglob('*.mdx'))
+@dataclass
+class _ComparePlan:
+    directories: List[Tuple[Path, List[Path]]]
+    group_of: Dict[Path, _CompareGroup]
+    missing_korean: Dict[Path, Path]  # translation → Korean path that does not exist
 
-    # Filter out .skel.mdx files
-    mdx_files = [f for f in mdx_files if not f.name.endswith('.skel.mdx')]
+    @property
+    def groups(self) -> List[_CompareGroup]:
+        return list(dict.fromkeys(self.group_of.values()))
 
-    if not mdx_files:
-        return 0, 0, 0, 0, 0, [], []
 
-    for mdx_file in mdx_files:
-        # Check if max_diff reached before processing next file
-        global _diff_count, _max_diff
-        if _max_diff is not None and _diff_count >= _max_diff:
-            break
+def _plan_comparisons(directories: List[Path]) -> _ComparePlan:
+    """Group the .mdx files of the directories by the Korean file their comparison needs."""
+    listed: List[Tuple[Path, List[Path]]] = []
+    members: Dict[object, List[Path]] = {}
+    korean_of: Dict[object, Optional[Path]] = {}
+    key_of: Dict[Path, object] = {}
+    missing_korean: Dict[Path, Path] = {}
 
+    for directory in directories:
+        # Find all .mdx files (recursively), excluding .skel.mdx files
+        mdx_files = [f for f in directory.rglob('*.mdx') if not f.name.endswith('.skel.mdx')]
+        listed.append((directory, mdx_files))
+        for mdx_file in mdx_files:
+            korean_path = None
+            if extract_language_code(mdx_file) == 'ko':
+                korean_path = mdx_file
+            elif not should_exclude_file(mdx_file):
+                candidate, korean_exists = get_korean_equivalent_path(mdx_file)
+                if korean_exists:
+                    korean_path = candidate
+                else:
+                    missing_korean[mdx_file] = candidate
+            key = korean_path if korean_path is not None else ('standalone', mdx_file)
+            korean_of[key] = korean_path
+            group_members = members.setdefault(key, [])
+            if mdx_file not in group_members:
+                group_members.append(mdx_file)
+            key_of[mdx_file] = key
+
+    groups = {key: _CompareGroup(korean_of[key], tuple(paths)) for key, paths in members.items()}
+    group_of = {path: groups[key] for path, key in key_of.items()}
+    return _ComparePlan(listed, group_of, missing_korean)
+
+
+def _iter_outcomes(
+        plan: _ComparePlan,
+        to_skeleton: Callable[[str], str],
+        jobs: int,
+        write_skeletons: bool,
+) -> Iterator[_FileOutcome]:
+    """Yield the outcome of every planned file in directory order, computing groups in jobs worker processes."""
+    run = functools.partial(
+        _compare_group,
+        to_skeleton=to_skeleton,
+        ignore_rules=_ignore_rules,
+        write_skeletons=write_skeletons,
+    )
+    order = [path for _, files in plan.directories for path in files]
+    if jobs <= 1:
+        done: Dict[_CompareGroup, Dict[Path, _FileOutcome]] = {}
+        for path in order:
+            group = plan.group_of[path]
+            if group not in done:
+                done[group] = run(group)
+            yield done[group][path]
+        return
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = {group: executor.submit(run, group) for group in plan.groups}
         try:
-            _, comparison_result, unmatched_file_path = convert_func(mdx_file)
-            success_count += 1
-            
-            # Count matched/unmatched/not_compared
-            if comparison_result == 'matched':
-                matched_count += 1
-            elif comparison_result == 'unmatched':
-                unmatched_count += 1
-                # Collect unmatched file path if available
-                if unmatched_file_path is not None:
-                    unmatched_file_paths.append(unmatched_file_path)
-            elif comparison_result is None:
-                # Comparison was not performed (e.g., Korean file, no Korean equivalent, etc.)
-                not_compared_count += 1
-                # Get relative path for display
-                try:
-                    rel_path = mdx_file.relative_to(directory)
-                    not_compared_files.append(str(rel_path))
-                except ValueError:
-                    not_compared_files.append(str(mdx_file))
-
-            # Check again after processing (compare_with_korean_skel may have incremented _diff_count)
-            if _max_diff is not None and _diff_count >= _max_diff:
-                break
-        except ValueError as e:
-            # Skip .skel.mdx files silently
-            if '.skel.mdx' in str(e):
-                continue
-            print(f"{mdx_file}: {e}", file=sys.stderr)
-            error_count += 1
-        except Exception as e:
-            print(f"{mdx_file}: {e}", file=sys.stderr)
-            error_count += 1
-
-    return success_count, error_count, matched_count, unmatched_count, not_compared_count, not_compared_files, unmatched_file_paths
-
-
-def process_directories_recursive(directories: List[Path], convert_func) -> Tuple[int, List[Path]]:
+            for path in order:
+                yield futures[plan.group_of[path]].result()[path]
+        finally:
+            # --max-diff reached: drop groups that have not started yet
+            for future in futures.values():
+                future.cancel()
+
+
+def process_directories_recursive(
+        directories: List[Path],
+        to_skeleton: Callable[[str], str],
+        jobs: int = 1,
+        write_skeletons: bool = False,
+) -> Tuple[int, List[Path]]:
     """
     Process multiple directories recursively.
     If directories list is empty, uses default directories (target/ko, target/ja, target/en).
     Returns tuple of (exit_code, unmatched_file_paths).
+
+    Skeletons are built in memory: each Korean file is converted once and shared by
+    all of its translations, and comparisons run in jobs worker processes.
     
     Args:
         directories: List of directories to process
-        convert_func: Function to convert MDX to skeleton (takes Path, returns Tuple[Path, Optional[str], Optional[Path]])
+        to_skeleton: Function converting MDX text to skeleton text (must be picklable when jobs > 1)
+        jobs: Number of worker processes (1 = compare in this process)
+        write_skeletons: Also write each skeleton next to its source as .skel.mdx
     
     Returns:
         Tuple of (exit_code, unmatched_file_paths)
@@ -544,6 +521,20 @@ def process_directories_recursive(directories: List[Path], convert_func) -> Tupl
         ]
         directories = default_dirs
 
+    valid_directories = []
+    for directory in directories:
+        if not directory.exists():
+            print(f"Warning: Directory not found: {directory}", file=sys.stderr)
+            continue
+        if not directory.is_dir():
+            print(f"Warning: Path is not a directory: {directory}", file=sys.stderr)
+            continue
+        valid_directories.append(directory)
+
+    plan = _plan_comparisons(valid_directories)
+    outcomes = _iter_outcomes(plan, to_skeleton, jobs, write_skeletons)
+
+    diff_count = 0
     total_success = 0
     total_errors = 0
     total_matched = 0
@@ -551,39 +542,65 @@ def process_directories_recursive(directories: List[Path], convert_func) -> Tupl
     total_not_compared = 0
     all_unmatched_file_paths = []  # Collect all unmatched file paths
 
-    for directory in directories:
-        # Check if max_diff reached before processing next directory
-        global _diff_count, _max_diff
-        if _max_diff is not None and _diff_count >= _max_diff:
-            break
+    try:
+        for directory, mdx_files in plan.directories:
+            success_count = 0
+            error_count = 0
+            matched_count = 0
+            unmatched_count = 0
+            not_compared_count = 0
+            not_compared_files = []  # Track files that were not compared
+
+            for mdx_file in mdx_files:
+                outcome = next(outcomes)
+                profiling.count('skeleton_files')
+                if outcome.error is not None:
+                    print(f"{mdx_file}: {outcome.error}", file=sys.stderr)
+                    error_count += 1
+                    continue
+                success_count += 1
+
+                # Count matched/unmatched/not_compared
+                if outcome.result == 'matched':
+                    matched_count += 1
+                elif outcome.result == 'unmatched':
+                    diff_count += 1
+                    unmatched_count += 1
+                    all_unmatched_file_paths.append(mdx_file)
+                    print(outcome.output, end='')
+                else:
+                    # Comparison was not performed (e.g., Korean file, no Korean equivalent, etc.)
+                    if mdx_file in plan.missing_korean:
+                        logger.warning(f"Corresponding Korean MDX file not found: {plan.missing_korean[mdx_file]}")
+                    not_compared_count += 1
+                    try:
+                        not_compared_files.append(str(mdx_file.relative_to(directory)))
+                    except ValueError:
+                        not_compared_files.append(str(mdx_file))
+
+                if _max_diff is not None and diff_count >= _max_diff:
+                    break
 
-        if not directory.exists():
-            print(f"Warning: Directory not found: {directory}", file=sys.stderr)
-            continue
-        if not directory.is_dir():
-            print(f"Warning: Path is not a directory: {directory}", file=sys.stderr)
-            continue
-        success_count, error_count, matched_count, unmatched_count, not_compared_count, not_compared_files, unmatched_file_paths = process_directory(directory, convert_func)
-        total_success += success_count
-        total_errors += error_count
-        total_matched += matched_count
-        total_unmatched += unmatched_count
-        total_not_compared += not_compared_count
-        all_unmatched_file_paths.extend(unmatched_file_paths)
-
-        # Print statistics for this directory
-        # Verify: converted = matched + unmatched + not_compared
-        print(f"{directory}: {success_count} converted, {error_count} errors, {matched_count} matched, {unmatched_count} unmatched, {not_compared_count} not_compared")
-        
-        # Print not_compared files if any
-        if not_compared_files:
-            print(f"  Not compared files ({len(not_compared_files)}):")
-            for file_path in sorted(not_compared_files):
-                print(f"    - {file_path}")
+            total_success += success_count
+            total_errors += error_count
+            total_matched += matched_count
+            total_unmatched += unmatched_count
+            total_not_compared += not_compared_count
+
+            # Print statistics for this directory
+            # Verify: converted = matched + unmatched + not_compared
+            print(f"{directory}: {success_count} converted, {error_count} errors, {matched_count} matched, {unmatched_count} unmatched, {not_compared_count} not_compared")
 
-        # Check again after processing directory
-        if _max_diff is not None and _diff_count >= _max_diff:
-            break
+            # Print not_compared files if any
+            if not_compared_files:
+                print(f"  Not compared files ({len(not_compared_files)}):")
+                for file_path in sorted(not_compared_files):
+                    print(f"    - {file_path}")
+
+            if _max_diff is not None and diff_count >= _max_diff:
+                break
+    finally:
+        outcomes.close()
 
     # Print overall summary statistics
     if len(directories) > 1:
@@ -628,10 +645,8 @@ def initialize_config(max_diff: Optional[int], exclude_patterns: List[str], igno
         exclude_patterns: List of paths to exclude from diff comparison
         ignore_file_path: Path to ignore_skeleton_diff.yaml file. If None, uses default location.
     """
-    global _diff_count, _match_count, _max_diff, _exclude_patterns, _ignore_rules
+    global _max_diff, _exclude_patterns, _ignore_rules
     _max_diff = max_diff
-    _diff_count = 0  # Reset counter
-    _match_count = 0  # Reset match counter
     # Use exclude patterns from args, or default if empty
     _exclude_patterns = exclude_patterns if exclude_patterns and len(exclude_patterns) > 0 else ['/index.skel.mdx']
     # Load ignore rules
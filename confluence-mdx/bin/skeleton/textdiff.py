@@ -0,0 +1,542 @@
+#!/usr/bin/env python3
+"""
+Skeleton Text Diff Module
+
+In-memory equivalent of `diff -u -b` used to compare skeleton files, and of
+plain `diff -u` used by the testcase runner.
+
+The comparison follows the steps GNU diffutils uses to decide which lines are
+reported as changed, so that hunks (and the line numbers ignore_rules.yaml
+refers to) come out where `diff -u -b` put them:
+
+1. identical leading/trailing lines are set aside, keeping a horizon of
+   context lines (io.c find_identical_ends)
+2. lines that occur only in one file, or very often in the other, are
+   discarded up front (analyze.c discard_confusing_lines)
+3. the remaining lines are compared with Myers' O(ND) middle-snake
+   algorithm (gnulib diffseq.h compareseq/diag)
+4. runs of changes are slid to merge with neighbouring runs and otherwise
+   moved as far down as possible (analyze.c shift_boundaries)
+
+With -b, a line's comparison key ignores trailing whitespace and treats any
+run of whitespace as a single space; leading whitespace still counts.
+Without -b, a final line lacking its newline differs from the same line with one.
+"""
+
+import re
+from typing import Callable, List, Optional, Tuple
+
+_NO_NEWLINE_MARKER = '\\ No newline at end of file'
+# Comparison key suffix of a final line without newline (cannot occur inside a line)
+_INCOMPLETE_LINE = '\n'
+
+# C isspace() in the C locale: GNU diff does not treat Unicode spaces as blanks
+_BLANKS = ' \t\n\v\f\r'
+_BLANK_RUN = re.compile(r'[ \t\n\v\f\r]+')
+
+
+def space_change_key(line: str) -> str:
+    """Comparison key of a line under `diff -b`."""
+    return _BLANK_RUN.sub(' ', line.rstrip(_BLANKS))
+
+
+def split_lines(text: str) -> List[str]:
+    """Split text into lines (a missing final newline is not a difference under -b)."""
+    lines = text.split('\n')
+    if lines and lines[-1] == '':
+        lines.pop()
+    return lines
+
+
+def _identical_ends(left: List[str], right: List[str], horizon: int) -> Tuple[int, int]:
+    """
+    Number of leading and trailing lines to leave out of the comparison.
+
+    Byte-identical leading and trailing lines are skipped, except for the
+    horizon lines next to the differing middle.
+    """
+    limit = min(len(left), len(right))
+    prefix = 0
+    while prefix < limit and left[prefix] == right[prefix]:
+        prefix += 1
+    skip_prefix = max(0, prefix - horizon)
+
+    limit -= skip_prefix
+    suffix = 0
+    while suffix < limit and left[-1 - suffix] == right[-1 - suffix]:
+        suffix += 1
+    return skip_prefix, max(0, suffix - horizon)
+
+
+def _discard_confusing_lines(equivs: Tuple[List[int], List[int]]) -> Tuple[List[int], List[int]]:
+    """
+    Mark lines to leave out of the middle-snake search (1) or keep (0).
+
+    A line matching no line of the other file is discarded. A line matching
+    many lines is provisionally discardable (2) and is only discarded inside
+    a run of discarded lines.
+    """
+    counts = []
+    for f in range(2):
+        count = {}
+        for equiv in equivs[f]:
+            count[equiv] = count.get(equiv, 0) + 1
+        counts.append(count)
+
+    discarded = []
+    for f in range(2):
+        other_counts = counts[1 - f]
+        end = len(equivs[f])
+        # Multiply MANY by approximate square root of number of lines.
+        many = 5
+        tem = end // 64
+        while True:
+            tem >>= 2
+            if tem <= 0:
+                break
+            many *= 2
+        discards = []
+        for equiv in equivs[f]:
+            nmatch = other_counts.get(equiv, 0)
+            discards.append(1 if nmatch == 0 else 2 if nmatch > many else 0)
+        discarded.append(discards)
+
+    # Don't really discard the provisional lines except when they occur in a
+    # run of discardables, with nonprovisionals at the beginning and end.
+    for discards in discarded:
+        end = len(discards)
+        i = 0
+        while i < end:
+            if discards[i] == 2:
+                discards[i] = 0
+            elif discards[i] != 0:
+                # Find end of this run of discardable lines; count the provisionals.
+                provisional = 0
+                j = i
+                while j < end and discards[j] != 0:
+                    if discards[j] == 2:
+                        provisional += 1
+                    j += 1
+                # Cancel provisional discards at end, and shrink the run.
+                while j > i and discards[j - 1] == 2:
+                    j -= 1
+                    discards[j] = 0
+                    provisional -= 1
+                length = j - i
+
+                if provisional * 4 > length:
+                    # 1/4 of the run is provisional: keep all provisionals of the run.
+                    while j > i:
+                        j -= 1
+                        if discards[j] == 2:
+                            discards[j] = 0
+                else:
+                    # MINIMUM is approximate square root of LENGTH/4.
+                    minimum = 1
+                    tem = length >> 2
+                    while True:
+                        tem >>= 2
+                        if tem <= 0:
+                            break
+                        minimum <<= 1
+                    minimum += 1
+
+                    # Cancel any subrun of MINIMUM or more provisionals within the run.
+                    j = 0
+                    consec = 0
+                    while j < length:
+                        if discards[i + j] != 2:
+                            consec = 0
+                        else:
+                            consec += 1
+                            if consec == minimum:
+                                # Back up to start of subrun, to cancel it all.
+                                j -= consec
+                            elif consec > minimum:
+                                discards[i + j] = 0
+                        j += 1
+
+                    # Scan from beginning of run until 3 nonprovisionals in a row
+                    # or the first nonprovisional at least 8 lines in; cancel provisionals.
+                    consec = 0
+                    for j in range(length):
+                        if j >= 8 and discards[i + j] == 1:
+                            break
+                        if discards[i + j] == 2:
+                            consec = 0
+                            discards[i + j] = 0
+                        elif discards[i + j] == 0:
+                            consec = 0
+                        else:
+                            consec += 1
+                        if consec == 3:
+                            break
+
+                    # I advances to the last line of the run; same thing from the end.
+                    i += length - 1
+                    consec = 0
+                    for j in range(length):
+                        if j >= 8 and discards[i - j] == 1:
+                            break
+                        if discards[i - j] == 2:
+                            consec = 0
+                            discards[i - j] = 0
+                        elif discards[i - j] == 0:
+                            consec = 0
+                        else:
+                            consec += 1
+                        if consec == 3:
+                            break
+            i += 1
+    return discarded[0], discarded[1]
+
+
+def _middle_snake(xv: List[int], yv: List[int], xoff: int, xlim: int, yoff: int, ylim: int,
+                  fd: List[int], bd: List[int], origin: int) -> Tuple[int, int]:
+    """
+    Find the midpoint of a shortest edit script of xv[xoff:xlim] and yv[yoff:ylim].
+
+    fd/bd are the forward and backward furthest-reaching x per diagonal,
+    indexed by origin + (x - y). The search is always run to the minimal cost:
+    diff's cost cap (at least 4096 edits) is never reached by skeleton files.
+    """
+    dmin = xoff - ylim
+    dmax = xlim - yoff
+    fmid = xoff - yoff
+    bmid = xlim - ylim
+    fmin = fmax = fmid
+    bmin = bmax = bmid
+    odd = (fmid - bmid) & 1
+    fd[origin + fmid] = xoff
+    bd[origin + bmid] = xlim
+    unreachable = xlim + 1
+
+    while True:
+        # Extend the top-down search by an edit step in each diagonal.
+        if fmin > dmin:
+            fmin -= 1
+            fd[origin + fmin - 1] = -1
+        else:
+            fmin += 1
+        if fmax < dmax:
+            fmax += 1
+            fd[origin + fmax + 1] = -1
+        else:
+            fmax -= 1
+        for d in range(fmax, fmin - 1, -2):
+            tlo = fd[origin + d - 1]
+            thi = fd[origin + d + 1]
+            x = thi if tlo < thi else tlo + 1
+            y = x - d
+            while x < xlim and y < ylim and xv[x] == yv[y]:
+                x += 1
+                y += 1
+            fd[origin + d] = x
+            if odd and bmin <= d <= bmax and bd[origin + d] <= x:
+                return x, y
+
+        # Similarly extend the bottom-up search.
+        if bmin > dmin:
+            bmin -= 1
+            bd[origin + bmin - 1] = unreachable
+        else:
+            bmin += 1
+        if bmax < dmax:
+            bmax += 1
+            bd[origin + bmax + 1] = unreachable
+        else:
+            bmax -= 1
+        for d in range(bmax, bmin - 1, -2):
+            tlo = bd[origin + d - 1]
+            thi = bd[origin + d + 1]
+            x = tlo if tlo < thi else thi - 1
+            y = x - d
+            while xoff < x and yoff < y and xv[x - 1] == yv[y - 1]:
+                x -= 1
+                y -= 1
+            bd[origin + d] = x
+            if not odd and fmin <= d <= fmax and x <= fd[origin + d]:
+                return x, y
+
+
+def _compare_sequences(xv: List[int], yv: List[int]) -> Tuple[List[bool], List[bool]]:
+    """Mark the elements of xv deleted and of yv inserted by a shortest edit script."""
+    deleted = [False] * len(xv)
+    inserted = [False] * len(yv)
+    origin = len(yv) + 1
+    fd = [0] * (len(xv) + len(yv) + 3)
+    bd = [0] * (len(xv) + len(yv) + 3)
+
+    stack = [(0, len(xv), 0, len(yv))]
+    while stack:
+        xoff, xlim, yoff, ylim = stack.pop()
+        # Slide down the bottom initial diagonal, and up the top one.
+        while xoff < xlim and yoff < ylim and xv[xoff] == yv[yoff]:
+            xoff += 1
+            yoff += 1
+        while xoff < xlim and yoff < ylim and xv[xlim - 1] == yv[ylim - 1]:
+            xlim -= 1
+            ylim -= 1
+        if xoff == xlim:
+            for y in range(yoff, ylim):
+                inserted[y] = True
+        elif yoff == ylim:
+            for x in range(xoff, xlim):
+                deleted[x] = True
+        else:
+            xmid, ymid = _middle_snake(xv, yv, xoff, xlim, yoff, ylim, fd, bd, origin)
+            stack.append((xmid, xlim, ymid, ylim))
+            stack.append((xoff, xmid, yoff, ymid))
+    return deleted, inserted
+
+
+def _shift_boundaries(equivs: Tuple[List[int], List[int]], changed: Tuple[List[int], List[int]]) -> None:
+    """
+    Slide runs of changes: merge them with neighbouring runs where possible,
+    otherwise move them as far down as possible, then back to a point where
+    they face a change in the other file.
+
+    changed[f] has a 0 sentinel at both ends: line i of file f is changed[f][i + 1].
+    """
+    for f in range(2):
+        own = changed[f]
+        other = changed[1 - f]
+        equiv = equivs[f]
+        i_end = len(equiv)
+        i = 0
+        j = 0
+
+        while True:
+            # Scan forwards to find beginning of another run of changes,
+            # keeping track of the corresponding point in the other file.
+            while i < i_end and not own[i + 1]:
+                while other[j + 1]:
+                    j += 1
+                j += 1
+                i += 1
+            if i == i_end:
+                break
+
+            start = i
+            # Find the end of this run of changes.
+            i += 1
+            while own[i + 1]:
+                i += 1
+            while other[j + 1]:
+                j += 1
+
+            while True:
+                runlength = i - start
+
+                # Move the changed region back, so long as the previous unchanged
+                # line matches the last changed one (merges with previous runs).
+                while start and equiv[start - 1] == equiv[i - 1]:
+                    start -= 1
+                    own[start + 1] = 1
+                    i -= 1
+                    own[i + 1] = 0
+                    while own[start]:
+                        start -= 1
+                    j -= 1
+                    while other[j + 1]:
+                        j -= 1
+
+                # CORRESPONDING is the end of the run at the last point where it
+                # corresponds to a changed run in the other file (I_END: none).
+                corresponding = i if other[j] else i_end
+
+                # Move the changed region forward, so long as the first changed
+                # line matches the following unchanged one (merges with next runs).
+                while i != i_end and equiv[start] == equiv[i]:
+                    own[start + 1] = 0
+                    start += 1
+                    own[i + 1] = 1
+                    i += 1
+                    while own[i + 1]:
+                        i += 1
+                    j += 1
+                    while other[j + 1]:
+                        j += 1
+                        corresponding = i
+
+                if runlength == i - start:
+                    break
+
+            # If possible, move the fully-merged run back to a corresponding run
+            # in the other file.
+            while corresponding < i:
+                start -= 1
+                own[start + 1] = 1
+                i -= 1
+                own[i + 1] = 0
+                j -= 1
+                while other[j + 1]:
+                    j -= 1
+
+
+def _changed_lines(left_keys: List[str], right_keys: List[str]) -> Tuple[List[int], List[int]]:
+    """Return the 0/1 changed flags of both files, with a 0 sentinel at each end."""
+    classes = {}
+    equivs = (
+        [classes.setdefault(key, len(classes)) for key in left_keys],
+        [classes.setdefault(key, len(classes)) for key in right_keys],
+    )
+    discards = _discard_confusing_lines(equivs)
+    changed = ([0] * (len(left_keys) + 2), [0] * (len(right_keys) + 2))
+
+    kept = ([], [])
+    for f in range(2):
+        for index, discard in enumerate(discards[f]):
+            if discard:
+                changed[f][index + 1] = 1
+            else:
+                kept[f].append(index)
+
+    deleted, inserted = _compare_sequences(
+        [equivs[0][index] for index in kept[0]],
+        [equivs[1][index] for index in kept[1]],
+    )
+    for f, marks in ((0, deleted), (1, inserted)):
+        for position, mark in enumerate(marks):
+            if mark:
+                changed[f][kept[f][position] + 1] = 1
+
+    _shift_boundaries(equivs, changed)
+    return changed
+
+
+def _format_range(start: int, stop: int) -> str:
+    """Unified diff range of lines [start, stop): '3', '3,4' or '2,0' for an empty range."""
+    beginning = start + 1
+    length = stop - start
+    if length == 1:
+        return f'{beginning}'
+    if not length:
+        beginning -= 1
+    return f'{beginning},{length}'
+
+
+def unified_diff_ignoring_space_change(
+        left_text: str,
+        right_text: str,
+        left_label: str,
+        right_label: str,
+        context: int = 3,
+) -> str:
+    """
+    In-memory equivalent of `diff -u -b left right` with context lines of context.
+
+    Lines are printed as they appear in the input; unchanged lines inside a
+    hunk are taken from the left side, as diff prints them. File headers carry
+    the labels without timestamps.
+
+    Returns:
+        Unified diff text ending with a newline, or an empty string if the inputs match.
+    """
+    return _unified_diff(left_text, right_text, left_label, right_label, context, space_change_key)
+
+
+def unified_diff(
+        left_text: str,
+        right_text: str,
+        left_label: str,
+        right_label: str,
+        context: int = 3,
+) -> str:
+    """
+    In-memory equivalent of `diff -u --label left_label --label right_label left right`.
+
+    Returns:
+        Unified diff text ending with a newline, or an empty string if the inputs are identical.
+    """
+    return _unified_diff(left_text, right_text, left_label, right_label, context, None)
+
+
+def _unified_diff(
+        left_text: str,
+        right_text: str,
+        left_label: str,
+        right_label: str,
+        context: int,
+        key: Optional[Callable[[str], str]],
+) -> str:
+    """Unified diff comparing lines by key, or exactly (newline included) if key is None."""
+    left_lines = split_lines(left_text)
+    right_lines = split_lines(right_text)
+    left_incomplete = bool(left_text) and not left_text.endswith('\n')
+    right_incomplete = bool(right_text) and not right_text.endswith('\n')
+    left_exact = _exact_keys(left_lines, left_incomplete)
+    right_exact = _exact_keys(right_lines, right_incomplete)
+    if key is None:
+        left_keys, right_keys = left_exact, right_exact
+    else:
+        left_keys = [key(line) for line in left_lines]
+        right_keys = [key(line) for line in right_lines]
+    if left_keys == right_keys:
+        return ''
+
+    skip_prefix, skip_suffix = _identical_ends(left_exact, right_exact, context)
+    changed_left, changed_right = _changed_lines(
+        left_keys[skip_prefix:len(left_keys) - skip_suffix],
+        right_keys[skip_prefix:len(right_keys) - skip_suffix],
+    )
+
+    # Collect changes as (left_start, left_end, right_start, right_end) in file line numbers.
+    changes = []
+    i = j = 0
+    n_left = len(changed_left) - 2
+    n_right = len(changed_right) - 2
+    while i < n_left or j < n_right:
+        if changed_left[i + 1] or changed_right[j + 1]:
+            i0, j0 = i, j
+            while i < n_left and changed_left[i + 1]:
+                i += 1
+            while j < n_right and changed_right[j + 1]:
+                j += 1
+            changes.append((i0 + skip_prefix, i + skip_prefix, j0 + skip_prefix, j + skip_prefix))
+        else:
+            i += 1
+            j += 1
+    if not changes:
+        return ''
+
+    # Group changes into hunks: changes at most 2 * context lines apart share a hunk.
+    hunks = [[changes[0]]]
+    for change in changes[1:]:
+        if change[0] - hunks[-1][-1][1] <= 2 * context:
+            hunks[-1].append(change)
+        else:
+            hunks.append([change])
+
+    output = [f'--- {left_label}', f'+++ {right_label}']
+    for hunk in hunks:
+        left_start = max(0, hunk[0][0] - context)
+        right_start = hunk[0][2] - (hunk[0][0] - left_start)
+        left_stop = min(len(left_lines), hunk[-1][1] + context)
+        right_stop = hunk[-1][3] + (left_stop - hunk[-1][1])
+        output.append(
+            f'@@ -{_format_range(left_start, left_stop)} +{_format_range(right_start, right_stop)} @@'
+        )
+        position = left_start
+        for i0, i1, j0, j1 in hunk:
+            _print_lines(output, ' ', left_lines, position, i0, left_incomplete)
+            _print_lines(output, '-', left_lines, i0, i1, left_incomplete)
+            _print_lines(output, '+', right_lines, j0, j1, right_incomplete)
+            position = i1
+        _print_lines(output, ' ', left_lines, position, left_stop, left_incomplete)
+    return '\n'.join(output) + '\n'
+
+
+def _exact_keys(lines: List[str], incomplete: bool) -> List[str]:
+    """Lines as compared byte for byte: a final line without newline gets a distinct key."""
+    if not incomplete:
+        return lines
+    return lines[:-1] + [lines[-1] + _INCOMPLETE_LINE]
+
+
+def _print_lines(output: List[str], prefix: str, lines: List[str], start: int, stop: int,
+                 incomplete: bool) -> None:
+    """Append lines[start:stop]; diff marks a printed final line that has no newline."""
+    output.extend(prefix + line for line in lines[start:stop])
+    if incomplete and start < stop == len(lines):
+        output.append(_NO_NEWLINE_MARKER)
@@ -115,29 +115,70 @@ def get_repo_root() -> Path:
     return Path(result.stdout.strip())
 
 
-def get_commit_files(commit_hash: str) -> List[str]:
-    """commit에서 변경된 ko 파일 목록 추출"""
+def get_commit_diff(commit_hash: str) -> str:
+    """commit의 ko MDX 변경분 전체를 git show 한 번으로 가져오기
+
+    pathspec은 repo root 기준(:(top))이므로 어느 디렉토리에서 실행해도 같다.
+    rename은 파일별 diff와 같도록 새 파일 전체 추가로 취급한다(--no-renames).
+    """
     result = subprocess.run(
-        ['git', 'show', '--name-only', '--pretty=format:', commit_hash],
+        ['git', '-c', 'core.quotePath=false', 'show', '--unified=0', '--no-renames',
+         '--pretty=format:', commit_hash, '--', ':(top)src/content/ko/'],
         capture_output=True, text=True, check=True
     )
-    files = [f.strip() for f in result.stdout.strip().split('\n') if f.strip()]
-    # ko 파일만 필터링
-    ko_files = [f for f in files if f.startswith('src/content/ko/') and f.endswith('.mdx')]
-    return ko_files
+    return result.stdout
 
 
-def parse_commit_diff(commit_hash: str, file_path: str) -> List[LineChange]:
-    """commit의 특정 파일 diff를 파싱하여 변경된 라인 정보 추출"""
-    result = subprocess.run(
-        ['git', 'show', '--unified=0', commit_hash, '--', file_path],
-        capture_output=True, text=True, check=True
-    )
+_C_ESCAPES = {'a': 7, 'b': 8, 't': 9, 'n': 10, 'v': 11, 'f': 12, 'r': 13, '"': 34, '\\': 92}
 
+
+def _diff_header_path(value: str) -> str:
+    """+++ 헤더의 경로 부분을 실제 경로로 복원
+
+    공백이 있는 경로 뒤에는 tab이 붙고, 따옴표·역슬래시·제어 문자가 있는 경로는
+    C 문자열로 quote된다(UTF-8 byte는 8진수 escape).
+    """
+    value = value.rstrip('\t')
+    if not (len(value) >= 2 and value[0] == '"' and value[-1] == '"'):
+        return value
+    raw = bytearray()
+    body, i = value[1:-1], 0
+    while i < len(body):
+        char = body[i]
+        if char != '\\' or i + 1 >= len(body):
+            raw.extend(char.encode('utf-8'))
+            i += 1
+        elif body[i + 1] in '01234567':
+            raw.append(int(body[i + 1:i + 4], 8))
+            i += 4
+        else:
+            raw.append(_C_ESCAPES.get(body[i + 1], ord(body[i + 1])))
+            i += 2
+    return raw.decode('utf-8', errors='surrogateescape')
+
+
+def split_commit_diff(diff_text: str) -> Dict[str, str]:
+    """git show 출력을 파일별 diff로 나누기 (key: +++ b/ 경로, 삭제된 파일은 제외)"""
+    sections: Dict[str, List[str]] = {}
+    current: Optional[List[str]] = None
+    for line in diff_text.split('\n'):
+        if line.startswith('diff --git '):
+            current = None
+        elif current is None and line.startswith('+++ '):
+            path = _diff_header_path(line[4:])
+            if path.startswith('b/'):
+                current = sections.setdefault(path[2:], [])
+        elif current is not None:
+            current.append(line)
+    return {path: '\n'.join(lines) for path, lines in sections.items()}
+
+
+def parse_diff_changes(diff_text: str) -> List[LineChange]:
+    """한 파일의 --unified=0 diff를 파싱하여 변경된 라인 정보 추출"""
     changes = []
     current_line = 0
 
-    for line in result.stdout.split('\n'):
+    for line in diff_text.split('\n'):
         # @@ -old_start,old_count +new_start,new_count @@ 형식 파싱
         if line.startswith('@@'):
             # +new_start 추출
@@ -228,12 +269,12 @@ def generate_diff(target_path: Path) -> str:
 
 
 def analyze_commit(commit_hash: str) -> List[FileChange]:
-    """commit 분석하여 파일별 변경 정보 추출"""
-    ko_files = get_commit_files(commit_hash)
-
+    """commit 분석하여 파일별 변경 정보 추출 (git process는 한 번만 실행)"""
     file_changes = []
-    for ko_file in ko_files:
-        changes = parse_commit_diff(commit_hash, ko_file)
+    for ko_file, diff_text in split_commit_diff(get_commit_diff(commit_hash)).items():
+        if not ko_file.endswith('.mdx'):
+            continue
+        changes = parse_diff_changes(diff_text)
         if changes:
             file_changes.append(FileChange(ko_path=ko_file, changes=changes))
 
@@ -33,6 +33,7 @@ _PROJECT_DIR = _BIN_DIR.parent                    # confluence-mdx/
 if str(_BIN_DIR) not in sys.path:
     sys.path.insert(0, str(_BIN_DIR))
 
+import pages_catalog
 from fetch.sync_profiles import SYNC_PROFILES
 
 
@@ -51,8 +52,7 @@ def load_pages_yaml(var_dir: Path, sync_code: str = "qm") -> list[dict]:
         pages_file = var_dir / "pages.yaml"
     if not pages_file.exists():
         return []
-    with open(pages_file, encoding='utf-8') as f:
-        return yaml.safe_load(f) or []
+    return pages_catalog.load_pages(pages_file) or []
 
 
 def load_attachments(page_dir: Path) -> list[dict]:
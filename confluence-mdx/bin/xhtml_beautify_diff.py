@@ -21,7 +21,7 @@ import difflib
 import sys
 from pathlib import Path
 
-from bs4 import BeautifulSoup
+from reverse_sync.document_cache import parse_xhtml
 
 
 def beautify_xhtml(html: str) -> str:
@@ -33,7 +33,7 @@ def beautify_xhtml(html: str) -> str:
     - self-closing 통일 (<p /> → <p></p>)
     - &amp; / &lt; / &gt; 보존, 나머지 entity는 유니코드로 디코딩
     """
-    soup = BeautifulSoup(html, "html.parser")
+    soup = parse_xhtml(html)
     return soup.prettify(formatter="minimal")
 
 
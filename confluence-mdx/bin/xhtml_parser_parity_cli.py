@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""XHTML parser parity CLI for the forward converter.
+
+Converts every testcase page.xhtml with the default 'html.parser' backend and
+with a candidate backend (default: lxml), and fails on any difference in the
+generated MDX or in the lost info recorded for the sidecar mapping.
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+from converter.cli import LOG_FORMAT, convert_page, load_catalog, resolve_pages_yaml_path
+from converter.context import PageCatalog
+from converter.xhtml_parser import DEFAULT_PARSER, PARSER_BACKENDS, available_parsers
+
+
+@dataclass(frozen=True)
+class ParityResult:
+    case_id: str
+    passed: bool
+    reason: str
+    first_mismatch_line: int = -1
+
+
+def _first_mismatch_line(expected: str, actual: str) -> int:
+    expected_lines = expected.splitlines()
+    actual_lines = actual.splitlines()
+    for lineno, (a, b) in enumerate(zip(expected_lines, actual_lines), start=1):
+        if a != b:
+            return lineno
+    return min(len(expected_lines), len(actual_lines)) + 1
+
+
+def check_case_dir(case_dir: Path, catalog: PageCatalog, parser: str) -> ParityResult:
+    """Convert case_dir/page.xhtml with both backends and compare the results."""
+    case_id = case_dir.name
+    input_file = str(case_dir / "page.xhtml")
+    output_file = str(case_dir / "output.mdx")  # language detection only; nothing is written
+    results = {}
+    for backend in (DEFAULT_PARSER, parser):
+        try:
+            results[backend] = convert_page(
+                input_file, output_file, str(case_dir.parent), catalog,
+                skip_image_copy=True,
+                parser=backend,
+            )
+        except Exception as e:
+            return ParityResult(case_id, False, f"{backend}_error: {e}")
+
+    expected, actual = results[DEFAULT_PARSER], results[parser]
+    if expected.markdown != actual.markdown:
+        return ParityResult(
+            case_id, False, "mdx_mismatch",
+            _first_mismatch_line(expected.markdown, actual.markdown),
+        )
+    if expected.lost_infos != actual.lost_infos:
+        return ParityResult(case_id, False, "lost_info_mismatch")
+    return ParityResult(case_id, True, "identical")
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description=f"Check that an XHTML parser backend converts testcases exactly like {DEFAULT_PARSER}"
+    )
+    parser.add_argument(
+        "--testcases-dir",
+        type=Path,
+        default=Path("tests/testcases"),
+        help="Root directory containing testcase subdirectories",
+    )
+    parser.add_argument("--case-id", help="Only run one case directory")
+    parser.add_argument(
+        "--parser",
+        choices=[name for name in PARSER_BACKENDS if name != DEFAULT_PARSER],
+        default="lxml",
+        help="Candidate parser backend (default: lxml)",
+    )
+    parser.add_argument(
+        "--show-fail-limit",
+        type=int,
+        default=10,
+        help="Number of failed cases to print in detail",
+    )
+    parser.add_argument(
+        "--log-level",
+        choices=["debug", "info", "warning", "error", "critical"],
+        default="error",
+        help="Converter log level (default: error)",
+    )
+    return parser
+
+
+def _resolve_case_dirs(testcases_dir: Path, case_id: str | None) -> tuple[int, list[Path]]:
+    if not testcases_dir.is_dir():
+        print(f"Error: testcases dir not found: {testcases_dir}", file=sys.stderr)
+        return 2, []
+
+    if case_id:
+        case_dir = testcases_dir / case_id
+        if not (case_dir / "page.xhtml").is_file():
+            print(f"Error: case not found: {case_dir}", file=sys.stderr)
+            return 2, []
+        return 0, [case_dir]
+
+    case_dirs = sorted(p.parent for p in testcases_dir.glob("*/page.xhtml"))
+    if not case_dirs:
+        print("No testcase directories containing page.xhtml found.")
+    return 0, case_dirs
+
+
+def main() -> int:
+    parser = _build_parser()
+    args = parser.parse_args()
+    logging.basicConfig(level=getattr(logging, args.log_level.upper()), format=LOG_FORMAT)
+
+    if args.parser not in available_parsers():
+        print(f"Error: parser backend '{args.parser}' is not installed (pip install lxml)", file=sys.stderr)
+        return 2
+
+    rc, case_dirs = _resolve_case_dirs(args.testcases_dir, args.case_id)
+    if rc != 0:
+        return rc
+    if not case_dirs:
+        return 0
+
+    catalog = load_catalog(resolve_pages_yaml_path(str(args.testcases_dir)))
+    results = [check_case_dir(case_dir, catalog, args.parser) for case_dir in case_dirs]
+    failed = [r for r in results if not r.passed]
+
+    print(
+        f"[parser-parity {DEFAULT_PARSER} vs {args.parser}] "
+        f"total={len(results)} passed={len(results)-len(failed)} failed={len(failed)}"
+    )
+
+    if failed:
+        print("Failed cases:", ", ".join(r.case_id for r in failed))
+        limit = max(0, args.show_fail_limit)
+        for idx, result in enumerate(failed[:limit], start=1):
+            print(
+                f"- fail#{idx} case={result.case_id} reason={result.reason} mismatch_line={result.first_mismatch_line}"
+            )
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
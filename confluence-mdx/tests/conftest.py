@@ -3,4 +3,34 @@
 import sys
 from pathlib import Path
 
+import pytest
+
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "bin"))
+
+import pages_catalog  # noqa: E402
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--run-timing", action="store_true", default=False,
+        help="wall-clock 비율을 비교하는 timing 테스트도 실행 (공유 CI runner에서는 흔들리므로 기본 skip)",
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "timing: wall-clock 시간을 비교하는 테스트 (--run-timing으로 실행)")
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--run-timing"):
+        return
+    skip_timing = pytest.mark.skip(reason="timing 테스트는 --run-timing으로 실행")
+    for item in items:
+        if "timing" in item.keywords:
+            item.add_marker(skip_timing)
+
+
+@pytest.fixture(autouse=True)
+def _isolated_pages_catalog():
+    """테스트마다 process 안에서 읽어 둔 pages catalog를 비운다."""
+    pages_catalog.clear_cache()
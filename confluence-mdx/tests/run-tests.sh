@@ -7,12 +7,17 @@
 #
 # Options:
 #   --type TYPE       Test type: convert (default), skeleton, reverse-sync,
-#                     reverse-sync-verify, image-copy, xhtml-diff, byte-verify
+#                     reverse-sync-verify, image-copy, xhtml-diff, byte-verify,
+#                     parser-parity
 #   --log-level LEVEL Log level: warning (default), debug, info
 #   --test-id ID      Run specific test case only
 #   --test-dir DIR    Test case directory (default: testcases)
+#   --jobs N          Worker processes for convert, skeleton and reverse-sync
+#                     (default: number of CPUs)
 #   --verbose, -v     Show converter output (stdout/stderr)
 #   --help            Show this help message
+#
+# convert, skeleton and reverse-sync tests run in-process by run_testcases.py.
 
 set -o nounset -o errexit -o pipefail
 
@@ -26,7 +31,7 @@ BIN_DIR="../bin"
 VENV_DIR="../venv"
 
 CONVERTER_SCRIPT="${BIN_DIR}/converter/cli.py"
-SKELETON_SCRIPT="${BIN_DIR}/skeleton/cli.py"
+TESTCASE_RUNNER="./run_testcases.py"
 
 # Note: PYTHONPATH is no longer needed — skeleton scripts resolve their own sys.path
 
@@ -34,6 +39,7 @@ SKELETON_SCRIPT="${BIN_DIR}/skeleton/cli.py"
 TEST_TYPE="convert"
 LOG_LEVEL="warning"
 TEST_ID=""
+JOBS=""
 VERBOSE=false
 
 # Colors for output
@@ -43,7 +49,7 @@ YELLOW='\033[0;33m'
 NC='\033[0m' # No Color
 
 usage() {
-    sed -n '3,12p' "$0" | sed 's/^# //' | sed 's/^#//'
+    sed -n '3,18p' "$0" | sed 's/^# //' | sed 's/^#//'
     exit 0
 }
 
@@ -96,6 +102,10 @@ while [[ $# -gt 0 ]]; do
             TEST_DIR="$2"
             shift 2
             ;;
+        --jobs)
+            JOBS="$2"
+            shift 2
+            ;;
         --verbose|-v)
             VERBOSE=true
             shift
@@ -144,189 +154,19 @@ sys.exit(1)
 " "${page_id}"
 }
 
-# Run convert test for a single test case (XHTML → MDX)
-run_convert_test() {
-    local test_id="$1"
-    local test_path="${TEST_DIR}/${test_id}"
-
-    if [[ ! -f "${test_path}/page.xhtml" ]]; then
-        return 1
-    fi
-
-    local slug_path
-    slug_path=$(resolve_slug_path "${test_id}" 2>/dev/null) || slug_path=""
-
-    run_cmd python3 "${CONVERTER_SCRIPT}" --log-level "${LOG_LEVEL}" \
-        "${test_path}/page.xhtml" \
-        "${test_path}/output.mdx" \
-        --public-dir="${TEST_DIR}" \
-        --attachment-dir="${slug_path}" \
-        --skip-image-copy
-
-    if [[ ! -f "${test_path}/expected.mdx" ]]; then
-        echo "  Error: expected.mdx not found"
-        return 1
-    fi
-
-    run_cmd diff -u "${test_path}/expected.mdx" "${test_path}/output.mdx"
-}
-
-# Run skeleton test for a single test case
-run_skeleton_test() {
-    local test_id="$1"
-    local test_path="${TEST_DIR}/${test_id}"
-
-    if [[ ! -f "${test_path}/output.mdx" ]]; then
-        return 1
+# Run convert, skeleton or reverse-sync tests in-process (run_testcases.py)
+run_testcases() {
+    local -a runner_args=(--type "${TEST_TYPE}" --log-level "${LOG_LEVEL}" --test-dir "${TEST_DIR}")
+    if [[ -n "${TEST_ID}" ]]; then
+        runner_args+=(--test-id "${TEST_ID}")
     fi
-
-    run_cmd python3 "${SKELETON_SCRIPT}" "${test_path}/output.mdx"
-
-    if [[ ! -f "${test_path}/expected.skel.mdx" ]]; then
-        echo "  Error: expected.skel.mdx not found"
-        return 1  # Failure
+    if [[ -n "${JOBS}" ]]; then
+        runner_args+=(--jobs "${JOBS}")
     fi
-
-    run_cmd diff -u "${test_path}/expected.skel.mdx" "${test_path}/output.skel.mdx"
-}
-
-# Check if test case has required input files
-has_convert_input() {
-    local test_id="$1"
-    [[ -f "${TEST_DIR}/${test_id}/page.xhtml" ]]
-}
-
-has_skeleton_input() {
-    local test_id="$1"
-    [[ -f "${TEST_DIR}/${test_id}/output.mdx" ]] && [[ -f "${TEST_DIR}/${test_id}/expected.skel.mdx" ]]
-}
-
-# pages.yaml의 expected_status와 실제 verify 결과를 비교한다.
-# pages.yaml이 없거나 해당 page_id에 expected_status가 없으면 검증을 생략한다.
-# Args:
-#   $1: test_id
-#   $2: test_path (result.yaml 위치)
-verify_expected_status() {
-    local test_id="$1"
-    local test_path="$2"
-    local pages_yaml="${TEST_DIR}/pages.yaml"
-
-    [[ -f "${pages_yaml}" ]] || return 0
-
-    local actual_status expected_status
-    actual_status=$(python3 -c "
-import yaml
-result = yaml.safe_load(open('${test_path}/output.reverse-sync.result.yaml'))
-print(result.get('status', ''))
-")
-    expected_status=$(python3 -c "
-import sys, yaml
-pages = yaml.safe_load(open('${pages_yaml}'))
-for p in pages:
-    if str(p.get('page_id', '')) == '${test_id}':
-        es = p.get('expected_status')
-        if es is None:
-            print('__no_expected_status__')
-        else:
-            print(es)
-        sys.exit(0)
-print('__not_found__')
-")
-
-    # expected_status가 설정되지 않은 경우(catalog-only 항목 등) 검증 생략
-    if [[ "${expected_status}" == "__not_found__" || "${expected_status}" == "__no_expected_status__" ]]; then
-        return 0
-    fi
-
-    # actual_status: pass/no_changes → pass; 그 외 → fail
-    local actual_group
-    if [[ "${actual_status}" == "pass" || "${actual_status}" == "no_changes" ]]; then
-        actual_group="pass"
-    else
-        actual_group="${actual_status}"
-    fi
-
-    if [[ "${actual_group}" != "${expected_status}" ]]; then
-        echo "  Error: expected_status=${expected_status} 이지만 실제 status=${actual_status}"
-        return 1
-    fi
-}
-
-# Run reverse-sync test for a single test case
-run_reverse_sync_test() {
-    local test_id="$1"
-    local test_path="${TEST_DIR}/${test_id}"
-
-    # verify 실행 (cwd를 confluence-mdx root로 이동 — run_verify()가 var/<page_id>/에 중간 파일을 쓰므로)
-    mkdir -p "../var/${test_id}"
-    pushd .. > /dev/null
-    local verify_exit=0
-    run_cmd bin/reverse_sync_cli.py verify \
-        --page-id "${test_id}" \
-        --original-mdx "tests/${test_path}/original.mdx" \
-        --page-dir "tests/${test_path}" \
-        "tests/${test_path}/improved.mdx" || verify_exit=$?
-    popd > /dev/null
-
-    # 비정상 종료 시 즉시 실패
-    if [[ ${verify_exit} -ne 0 ]]; then
-        echo "  Error: verify 비정상 종료 (exit code ${verify_exit})"
-        return 1
-    fi
-
-    # var/에 생성된 중간 파일을 output.*으로 복사
-    local var_dir="../var/${test_id}"
-    cp "${var_dir}/reverse-sync.result.yaml"           "${test_path}/output.reverse-sync.result.yaml"
-    cp "${var_dir}/reverse-sync.patched.xhtml"          "${test_path}/output.reverse-sync.patched.xhtml"
-    cp "${var_dir}/reverse-sync.diff.yaml"              "${test_path}/output.reverse-sync.diff.yaml"
-    cp "${var_dir}/reverse-sync.mapping.original.yaml"  "${test_path}/output.reverse-sync.mapping.original.yaml"
-    cp "${var_dir}/reverse-sync.mapping.patched.yaml"   "${test_path}/output.reverse-sync.mapping.patched.yaml"
-
-    # MDX diff 검증: original.mdx ↔ improved.mdx 차이가 expected와 일치하는지 확인
-    log_step "diff -u --label a/original.mdx --label b/improved.mdx ${test_path}/original.mdx ${test_path}/improved.mdx > ${test_path}/output.mdx.diff"
-    diff -u --label a/original.mdx --label b/improved.mdx \
-        "${test_path}/original.mdx" "${test_path}/improved.mdx" \
-        > "${test_path}/output.mdx.diff" || true
-    if [[ -f "${test_path}/expected.mdx.diff" ]]; then
-        log_step "diff -u ${test_path}/expected.mdx.diff ${test_path}/output.mdx.diff"
-        diff -u "${test_path}/expected.mdx.diff" "${test_path}/output.mdx.diff"
-    fi
-
-    # expected와 비교 (timestamp/경로 필드 제외)
-    if [[ -f "${test_path}/expected.reverse-sync.result.yaml" ]]; then
-        log_step "diff -u ${test_path}/expected.reverse-sync.result.yaml ${test_path}/output.reverse-sync.result.yaml"
-        diff -u <(grep -v 'created_at' "${test_path}/expected.reverse-sync.result.yaml") \
-                <(grep -v 'created_at' "${test_path}/output.reverse-sync.result.yaml")
-    fi
-    if [[ -f "${test_path}/expected.reverse-sync.patched.xhtml" ]]; then
-        log_step "diff -u ${test_path}/expected.reverse-sync.patched.xhtml ${test_path}/output.reverse-sync.patched.xhtml"
-        diff -u "${test_path}/expected.reverse-sync.patched.xhtml" \
-                "${test_path}/output.reverse-sync.patched.xhtml"
-    fi
-    if [[ -f "${test_path}/expected.reverse-sync.diff.yaml" ]]; then
-        log_step "diff -u ${test_path}/expected.reverse-sync.diff.yaml ${test_path}/output.reverse-sync.diff.yaml"
-        diff -u <(grep -v 'created_at\|original_mdx\|improved_mdx' "${test_path}/expected.reverse-sync.diff.yaml") \
-                <(grep -v 'created_at\|original_mdx\|improved_mdx' "${test_path}/output.reverse-sync.diff.yaml")
-    fi
-    if [[ -f "${test_path}/expected.reverse-sync.mapping.original.yaml" ]]; then
-        log_step "diff -u ${test_path}/expected.reverse-sync.mapping.original.yaml ${test_path}/output.reverse-sync.mapping.original.yaml"
-        diff -u <(grep -v 'created_at\|source_xhtml' "${test_path}/expected.reverse-sync.mapping.original.yaml") \
-                <(grep -v 'created_at\|source_xhtml' "${test_path}/output.reverse-sync.mapping.original.yaml")
-    fi
-    if [[ -f "${test_path}/expected.reverse-sync.mapping.patched.yaml" ]]; then
-        log_step "diff -u ${test_path}/expected.reverse-sync.mapping.patched.yaml ${test_path}/output.reverse-sync.mapping.patched.yaml"
-        diff -u <(grep -v 'created_at\|source_xhtml' "${test_path}/expected.reverse-sync.mapping.patched.yaml") \
-                <(grep -v 'created_at\|source_xhtml' "${test_path}/output.reverse-sync.mapping.patched.yaml")
+    if [[ "${VERBOSE}" == "true" ]]; then
+        runner_args+=(--verbose)
     fi
-
-    # pages.yaml expected_status 검증 (pages.yaml이 있는 경우에만)
-    verify_expected_status "${test_id}" "${test_path}"
-}
-
-has_reverse_sync_input() {
-    local test_id="$1"
-    [[ -f "${TEST_DIR}/${test_id}/original.mdx" ]] && \
-    [[ -f "${TEST_DIR}/${test_id}/improved.mdx" ]]
+    run_cmd python3 "${TESTCASE_RUNNER}" "${runner_args[@]}"
 }
 
 # Run reverse-sync verify-only test (no expected file comparison)
@@ -547,26 +387,8 @@ main() {
     activate_venv
 
     case "${TEST_TYPE}" in
-        convert)
-            if [[ -n "${TEST_ID}" ]]; then
-                run_single_test run_convert_test "Convert" "${TEST_ID}"
-            else
-                run_all_tests run_convert_test "Convert" has_convert_input
-            fi
-            ;;
-        skeleton)
-            if [[ -n "${TEST_ID}" ]]; then
-                run_single_test run_skeleton_test "Skeleton" "${TEST_ID}"
-            else
-                run_all_tests run_skeleton_test "Skeleton" has_skeleton_input
-            fi
-            ;;
-        reverse-sync)
-            if [[ -n "${TEST_ID}" ]]; then
-                run_single_test run_reverse_sync_test "Reverse-Sync" "${TEST_ID}"
-            else
-                run_all_tests run_reverse_sync_test "Reverse-Sync" has_reverse_sync_input
-            fi
+        convert|skeleton|reverse-sync)
+            run_testcases
             ;;
         reverse-sync-verify)
             if [[ -n "${TEST_ID}" ]]; then
@@ -597,6 +419,15 @@ main() {
             echo "Running byte-equal verify (forced-splice)..."
             run_cmd python3 "${byte_verify_cli}" --testcases-dir "${TEST_DIR}" --splice
             ;;
+        parser-parity)
+            # html.parser와 lxml backend의 변환 결과(MDX)가 동일한지 확인
+            local -a parity_args=(--testcases-dir "${TEST_DIR}" --log-level "${LOG_LEVEL}")
+            if [[ -n "${TEST_ID}" ]]; then
+                parity_args+=(--case-id "${TEST_ID}")
+            fi
+            echo "Running XHTML parser parity (html.parser vs lxml)..."
+            run_cmd python3 "${BIN_DIR}/xhtml_parser_parity_cli.py" "${parity_args[@]}"
+            ;;
         *)
             echo "Unknown test type: ${TEST_TYPE}"
             exit 1
@@ -0,0 +1,482 @@
+#!/usr/bin/env python3
+"""
+Testcase runner for the convert, skeleton and reverse-sync tests
+
+Runs every case directory under --test-dir in-process: the converter,
+skeleton and reverse-sync modules and the pages catalogs are loaded once and
+shared by all cases, and the cases are spread over worker processes. Each
+case's log and output is captured and printed in case order, with the time
+the case took:
+
+    Testing case: testcases/544112828
+      OK (0.41s)
+
+A failed case prints the differences (and, with --verbose, every case prints
+its output), as run-tests.sh always did.
+
+Usage:
+    cd confluence-mdx/tests
+    python3 run_testcases.py --type convert
+    python3 run_testcases.py --type reverse-sync --test-dir reverse-sync --jobs 4
+    python3 run_testcases.py --type skeleton --test-id 544112828 --verbose
+"""
+
+import argparse
+import contextlib
+import io
+import logging
+import os
+import shutil
+import sys
+import time
+from argparse import Namespace
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+import yaml
+
+_TESTS_DIR = Path(__file__).resolve().parent
+_PROJECT_DIR = _TESTS_DIR.parent
+sys.path.insert(0, str(_PROJECT_DIR / 'bin'))
+
+import artifacts
+from converter.cli import (
+    LOG_FORMAT, convert_file, format_conversion_error, load_catalog, resolve_pages_yaml_path,
+)
+from converter.context import PageCatalog
+from skeleton.cli import convert_mdx_to_skeleton
+from skeleton.textdiff import unified_diff
+
+RED = '\033[0;31m'
+GREEN = '\033[0;32m'
+YELLOW = '\033[0;33m'
+NC = '\033[0m'
+
+# reverse-sync verify가 var/<page_id>/에 남기는 산출물 → output.* 으로 복사한다
+_REVERSE_SYNC_ARTIFACTS = [
+    'reverse-sync.result.yaml',
+    'reverse-sync.patched.xhtml',
+    'reverse-sync.diff.yaml',
+    'reverse-sync.mapping.original.yaml',
+    'reverse-sync.mapping.patched.yaml',
+]
+
+# expected.* 와 비교할 때 제외할 줄 (timestamp/경로 필드)
+_REVERSE_SYNC_IGNORED = {
+    'reverse-sync.result.yaml': ('created_at',),
+    'reverse-sync.patched.xhtml': (),
+    'reverse-sync.diff.yaml': ('created_at', 'original_mdx', 'improved_mdx'),
+    'reverse-sync.mapping.original.yaml': ('created_at', 'source_xhtml'),
+    'reverse-sync.mapping.patched.yaml': ('created_at', 'source_xhtml'),
+}
+
+
+@dataclass
+class Fixtures:
+    """State loaded once per run and shared by every case."""
+    test_dir: str  # as given on the command line, relative to tests/
+    log_level: int
+    verbose: bool
+    catalog: Optional[PageCatalog] = None
+    slugs: Dict[str, str] = field(default_factory=dict)  # page_id → attachment dir (/a/b/c)
+    expected_statuses: Dict[str, Optional[str]] = field(default_factory=dict)
+
+
+@dataclass
+class CaseResult:
+    case_id: str
+    passed: bool
+    output: str
+    seconds: float
+
+
+@dataclass(frozen=True)
+class CaseType:
+    label: str
+    has_input: Callable[[Path], bool]
+    run: Callable[[str, Fixtures, io.StringIO], bool]
+    load: Callable[[Fixtures], None]
+
+
+def _load_yaml_list(path: Path) -> list:
+    if not path.exists():
+        return []
+    with open(path, encoding='utf-8') as f:
+        return yaml.safe_load(f) or []
+
+
+def _load_slugs(fixtures: Fixtures) -> None:
+    """page_id → slug path from var/pages.qm.yaml (falls back to pages.yaml for compatibility)."""
+    var_dir = _PROJECT_DIR / 'var'
+    pages_file = var_dir / 'pages.qm.yaml'
+    if not pages_file.exists():
+        pages_file = var_dir / 'pages.yaml'
+    fixtures.slugs = {
+        str(page.get('page_id', '')): '/' + '/'.join(page['path'])
+        for page in _load_yaml_list(pages_file)
+        if page.get('path')
+    }
+
+
+def _load_convert_fixtures(fixtures: Fixtures) -> None:
+    fixtures.catalog = load_catalog(resolve_pages_yaml_path(fixtures.test_dir))
+    _load_slugs(fixtures)
+
+
+def _load_expected_statuses(fixtures: Fixtures) -> None:
+    fixtures.expected_statuses = {
+        str(page.get('page_id', '')): page.get('expected_status')
+        for page in _load_yaml_list(Path(fixtures.test_dir) / 'pages.yaml')
+    }
+
+
+def _no_fixtures(fixtures: Fixtures) -> None:
+    pass
+
+
+def _log_cmd(out: io.StringIO, fixtures: Fixtures, *words: str) -> None:
+    """Print the equivalent command line in verbose mode, to rerun a case by hand."""
+    if fixtures.verbose:
+        out.write(f"{YELLOW}+ {' '.join(words)}{NC}\n")
+
+
+def _log_step(out: io.StringIO, *words: str) -> None:
+    out.write(f"{YELLOW}+ {' '.join(words)}{NC}\n")
+
+
+def _without_lines(text: str, ignored: tuple) -> str:
+    """Drop the lines containing any of ignored, like grep -v."""
+    if not ignored:
+        return text
+    return ''.join(line for line in text.splitlines(keepends=True)
+                   if not any(word in line for word in ignored))
+
+
+def _normalized_artifact(text: str) -> str:
+    """YAML or JSON artifact re-dumped as YAML, so that only data differences show up.
+
+    The C and the pure-Python YAML dumper fold long strings differently, and
+    artifacts may be written as JSON (CONFLUENCE_MDX_ARTIFACT_FORMAT=json).
+    """
+    return artifacts.dump_yaml(artifacts.load_artifact(text), allow_unicode=True, default_flow_style=False)
+
+
+def _compare_files(out: io.StringIO, expected: Path, actual: Path, ignored: tuple = ()) -> bool:
+    """Print `diff -u expected actual` and return whether the files match."""
+    expected_text = expected.read_text(encoding='utf-8')
+    actual_text = actual.read_text(encoding='utf-8')
+    if expected.suffix == '.yaml':
+        expected_text, actual_text = _normalized_artifact(expected_text), _normalized_artifact(actual_text)
+    diff = unified_diff(
+        _without_lines(expected_text, ignored),
+        _without_lines(actual_text, ignored),
+        str(expected), str(actual),
+    )
+    out.write(diff)
+    return not diff
+
+
+# ============================================================================
+# Convert (XHTML → MDX)
+# ============================================================================
+
+def _has_convert_input(case_dir: Path) -> bool:
+    return (case_dir / 'page.xhtml').is_file()
+
+
+def run_convert_case(case_id: str, fixtures: Fixtures, out: io.StringIO) -> bool:
+    case_path = Path(fixtures.test_dir) / case_id
+    if not _has_convert_input(case_path):
+        out.write('  Error: page.xhtml not found\n')
+        return False
+
+    input_file = str(case_path / 'page.xhtml')
+    output_file = str(case_path / 'output.mdx')
+    attachment_dir = fixtures.slugs.get(case_id, '')
+    _log_cmd(out, fixtures, 'python3', '../bin/converter/cli.py',
+             '--log-level', logging.getLevelName(fixtures.log_level).lower(),
+             input_file, output_file, f'--public-dir={fixtures.test_dir}',
+             f'--attachment-dir={attachment_dir}', '--skip-image-copy')
+    try:
+        convert_file(input_file, output_file, fixtures.test_dir, fixtures.catalog,
+                     attachment_dir=attachment_dir, skip_image_copy=True)
+    except Exception as e:
+        logging.error(format_conversion_error(e))
+        return False
+
+    expected = case_path / 'expected.mdx'
+    if not expected.is_file():
+        out.write('  Error: expected.mdx not found\n')
+        return False
+    _log_cmd(out, fixtures, 'diff', '-u', str(expected), output_file)
+    return _compare_files(out, expected, Path(output_file))
+
+
+# ============================================================================
+# Skeleton (MDX → skeleton MDX)
+# ============================================================================
+
+def _has_skeleton_input(case_dir: Path) -> bool:
+    return (case_dir / 'output.mdx').is_file() and (case_dir / 'expected.skel.mdx').is_file()
+
+
+def run_skeleton_case(case_id: str, fixtures: Fixtures, out: io.StringIO) -> bool:
+    case_path = Path(fixtures.test_dir) / case_id
+    input_file = case_path / 'output.mdx'
+    if not input_file.is_file():
+        out.write('  Error: output.mdx not found\n')
+        return False
+
+    _log_cmd(out, fixtures, 'python3', '../bin/skeleton/cli.py', str(input_file))
+    output_file = convert_mdx_to_skeleton(input_file)
+
+    expected = case_path / 'expected.skel.mdx'
+    if not expected.is_file():
+        out.write('  Error: expected.skel.mdx not found\n')
+        return False
+    _log_cmd(out, fixtures, 'diff', '-u', str(expected), str(output_file))
+    return _compare_files(out, expected, output_file)
+
+
+# ============================================================================
+# Reverse-sync (MDX edit → patched XHTML)
+# ============================================================================
+
+def _has_reverse_sync_input(case_dir: Path) -> bool:
+    return (case_dir / 'original.mdx').is_file() and (case_dir / 'improved.mdx').is_file()
+
+
+@contextlib.contextmanager
+def _working_directory(path: Path):
+    previous = os.getcwd()
+    os.chdir(path)
+    try:
+        yield
+    finally:
+        os.chdir(previous)
+
+
+def _verify(case_id: str, case_path: Path, fixtures: Fixtures, out: io.StringIO) -> bool:
+    """`reverse_sync_cli.py verify` in-process, from confluence-mdx/ like the CLI is run."""
+    import reverse_sync_cli
+
+    # run_verify()가 var/<page_id>/에 중간 파일을 쓴다
+    (_PROJECT_DIR / 'var' / case_id).mkdir(parents=True, exist_ok=True)
+    page_dir = os.path.relpath(case_path.resolve(), _PROJECT_DIR)
+    args = Namespace(
+        improved_mdx=f'{page_dir}/improved.mdx',
+        original_mdx=f'{page_dir}/original.mdx',
+        page_id=case_id,
+        page_dir=page_dir,
+        lenient=False,
+        no_normalize=False,
+    )
+    _log_cmd(out, fixtures, 'bin/reverse_sync_cli.py', 'verify', '--page-id', case_id,
+             '--original-mdx', args.original_mdx, '--page-dir', page_dir, args.improved_mdx)
+    with _working_directory(_PROJECT_DIR):
+        try:
+            result = reverse_sync_cli._do_verify(args)
+        except Exception as e:
+            reason_code = getattr(e, 'reason_code', 'reverse_sync_error')
+            print(f'Error [{reason_code}]: {e}', file=sys.stderr)
+            out.write('  Error: verify 비정상 종료\n')
+            return False
+        reverse_sync_cli._print_results([result])
+    return True
+
+
+def _check_expected_status(case_id: str, case_path: Path, fixtures: Fixtures, out: io.StringIO) -> bool:
+    """pages.yaml의 expected_status와 실제 verify 결과를 비교한다.
+
+    pages.yaml이 없거나 해당 page_id에 expected_status가 없으면 검증을 생략한다.
+    """
+    expected_status = fixtures.expected_statuses.get(case_id)
+    if expected_status is None:
+        return True
+    with open(case_path / 'output.reverse-sync.result.yaml', encoding='utf-8') as f:
+        actual_status = (yaml.safe_load(f) or {}).get('status', '')
+    # actual_status: pass/no_changes → pass; 그 외 → fail
+    actual_group = 'pass' if actual_status in ('pass', 'no_changes') else actual_status
+    if actual_group != expected_status:
+        out.write(f'  Error: expected_status={expected_status} 이지만 실제 status={actual_status}\n')
+        return False
+    return True
+
+
+def run_reverse_sync_case(case_id: str, fixtures: Fixtures, out: io.StringIO) -> bool:
+    case_path = Path(fixtures.test_dir) / case_id
+    if not _has_reverse_sync_input(case_path):
+        out.write('  Error: original.mdx or improved.mdx not found\n')
+        return False
+    if not _verify(case_id, case_path, fixtures, out):
+        return False
+
+    # var/에 생성된 중간 파일을 output.*으로 복사
+    var_dir = _PROJECT_DIR / 'var' / case_id
+    for name in _REVERSE_SYNC_ARTIFACTS:
+        try:
+            shutil.copyfile(var_dir / name, case_path / f'output.{name}')
+        except OSError as e:
+            out.write(f'  Error: {name} not copied: {e}\n')
+            return False
+
+    # 산출물과 expected의 차이는 출력만 하고, 성패는 verify 결과와 expected_status로 정한다
+    # (run-tests.sh에서도 diff 결과는 case 결과에 반영되지 않았다)
+
+    # MDX diff: original.mdx ↔ improved.mdx 차이를 expected와 비교
+    mdx_diff = case_path / 'output.mdx.diff'
+    _log_step(out, 'diff -u --label a/original.mdx --label b/improved.mdx',
+              str(case_path / 'original.mdx'), str(case_path / 'improved.mdx'), '>', str(mdx_diff))
+    mdx_diff.write_text(unified_diff(
+        (case_path / 'original.mdx').read_text(encoding='utf-8'),
+        (case_path / 'improved.mdx').read_text(encoding='utf-8'),
+        'a/original.mdx', 'b/improved.mdx',
+    ), encoding='utf-8')
+    if (case_path / 'expected.mdx.diff').is_file():
+        _log_step(out, 'diff -u', str(case_path / 'expected.mdx.diff'), str(mdx_diff))
+        _compare_files(out, case_path / 'expected.mdx.diff', mdx_diff)
+
+    # expected와 비교 (timestamp/경로 필드 제외)
+    for name in _REVERSE_SYNC_ARTIFACTS:
+        expected = case_path / f'expected.{name}'
+        if expected.is_file():
+            actual = case_path / f'output.{name}'
+            _log_step(out, 'diff -u', str(expected), str(actual))
+            _compare_files(out, expected, actual, _REVERSE_SYNC_IGNORED[name])
+
+    # pages.yaml expected_status 검증 (pages.yaml이 있는 경우에만)
+    return _check_expected_status(case_id, case_path, fixtures, out)
+
+
+CASE_TYPES: Dict[str, CaseType] = {
+    'convert': CaseType('Convert', _has_convert_input, run_convert_case, _load_convert_fixtures),
+    'skeleton': CaseType('Skeleton', _has_skeleton_input, run_skeleton_case, _no_fixtures),
+    'reverse-sync': CaseType('Reverse-Sync', _has_reverse_sync_input, run_reverse_sync_case,
+                             _load_expected_statuses),
+}
+
+
+# ============================================================================
+# Runner
+# ============================================================================
+
+_worker_fixtures: Optional[Fixtures] = None
+
+
+def _init_worker(fixtures: Fixtures) -> None:
+    global _worker_fixtures
+    _worker_fixtures = fixtures
+
+
+def run_case(type_name: str, case_id: str, fixtures: Optional[Fixtures] = None) -> CaseResult:
+    """Run one case, capturing its stdout, stderr and log records."""
+    fixtures = fixtures or _worker_fixtures
+    out = io.StringIO()
+    handler = logging.StreamHandler(out)
+    handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    root_logger = logging.getLogger()
+    # skeleton.cli configures a stderr handler on import; the case's records go only to out
+    saved_handlers = root_logger.handlers[:]
+    root_logger.handlers[:] = [handler]
+    root_logger.setLevel(fixtures.log_level)
+    start = time.perf_counter()
+    try:
+        with contextlib.redirect_stdout(out), contextlib.redirect_stderr(out):
+            passed = CASE_TYPES[type_name].run(case_id, fixtures, out)
+    except Exception as e:
+        out.write(f'  Error: {type(e).__name__}: {e}\n')
+        passed = False
+    finally:
+        root_logger.handlers[:] = saved_handlers
+    return CaseResult(case_id, passed, out.getvalue(), time.perf_counter() - start)
+
+
+def _case_ids(case_type: CaseType, test_dir: str) -> List[str]:
+    return [path.name for path in sorted(Path(test_dir).iterdir())
+            if path.is_dir() and case_type.has_input(path)]
+
+
+def _print_status(result: CaseResult, verbose: bool) -> None:
+    if verbose:
+        print(result.output, end='')
+    if result.passed:
+        print(f'  {GREEN}OK{NC} ({result.seconds:.2f}s)')
+    else:
+        print(f'  {RED}FAILED{NC} ({result.seconds:.2f}s)')
+        if not verbose:
+            print(result.output, end='')
+    sys.stdout.flush()
+
+
+def run_all(type_name: str, case_ids: List[str], fixtures: Fixtures, jobs: int) -> int:
+    """Run the cases and print their results in order. Returns the number of failures."""
+    label = CASE_TYPES[type_name].label
+    print(f'Running {label} tests...')
+    print('')
+
+    jobs = max(1, min(jobs, len(case_ids)))
+    failed = 0
+    if jobs == 1:
+        results = (run_case(type_name, case_id, fixtures) for case_id in case_ids)
+        executor = None
+    else:
+        executor = ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=(fixtures,))
+        results = executor.map(run_case, [type_name] * len(case_ids), case_ids)
+    try:
+        for case_id, result in zip(case_ids, results):
+            print(f'Testing case: {fixtures.test_dir}/{case_id}')
+            _print_status(result, fixtures.verbose)
+            failed += not result.passed
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+
+    print('')
+    print(f'Results: {len(case_ids) - failed} passed, {failed} failed')
+    return failed
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description='Run convert, skeleton and reverse-sync testcases in-process'
+    )
+    parser.add_argument('--type', choices=list(CASE_TYPES), default='convert',
+                        help='Test type (default: convert)')
+    parser.add_argument('--log-level', choices=['debug', 'info', 'warning', 'error', 'critical'],
+                        default='warning', help='Converter log level (default: warning)')
+    parser.add_argument('--test-id', help='Run specific test case only')
+    parser.add_argument('--test-dir', default='testcases',
+                        help='Test case directory, relative to tests/ (default: testcases)')
+    parser.add_argument('--jobs', '-j', type=int, default=os.cpu_count() or 1,
+                        help='Worker processes (default: number of CPUs)')
+    parser.add_argument('--verbose', '-v', action='store_true',
+                        help='Show converter output of every case')
+    args = parser.parse_args()
+    if args.jobs < 1:
+        parser.error('--jobs must be at least 1')
+
+    os.chdir(_TESTS_DIR)
+    if not Path(args.test_dir).is_dir():
+        print(f'Error: test directory not found: {args.test_dir}', file=sys.stderr)
+        return 1
+
+    case_type = CASE_TYPES[args.type]
+    fixtures = Fixtures(args.test_dir, getattr(logging, args.log_level.upper()), args.verbose)
+    case_type.load(fixtures)
+
+    if args.test_id:
+        print(f'Testing case: {args.test_dir}/{args.test_id} ({case_type.label})')
+        result = run_case(args.type, args.test_id, fixtures)
+        _print_status(result, args.verbose)
+        return 0 if result.passed else 1
+
+    return 1 if run_all(args.type, _case_ids(case_type, args.test_dir), fixtures, args.jobs) else 0
+
+
+if __name__ == '__main__':
+    try:
+        sys.exit(main())
+    except KeyboardInterrupt:
+        sys.exit(130)
@@ -0,0 +1,81 @@
+"""Unit tests for bin/artifacts.py."""
+
+import json
+import logging
+
+import pytest
+import yaml
+
+import artifacts
+from fetch.file_manager import FileManager
+from reverse_sync.sidecar import generate_sidecar_mapping, load_sidecar_mapping
+
+_DATA = {
+    'page_id': '544384417',
+    'blocks': [
+        {'block_id': 'paragraph-1', 'xhtml_element_index': 3, 'children': [],
+         'xhtml_text': '선택된 역할에 따라 <code>🔍</code> 버튼을 누르면 ' * 8},
+    ],
+    'push_eligible': False,
+    'detail': None,
+}
+
+
+@pytest.fixture
+def json_mode(monkeypatch):
+    monkeypatch.setenv(artifacts.ARTIFACT_FORMAT_ENV, 'json')
+
+
+def test_dump_yaml_loads_back_with_the_pure_python_loader():
+    text = artifacts.dump_yaml(_DATA, allow_unicode=True, default_flow_style=False)
+    assert yaml.safe_load(text) == _DATA
+
+
+def test_artifact_format_defaults_to_yaml(monkeypatch):
+    monkeypatch.delenv(artifacts.ARTIFACT_FORMAT_ENV, raising=False)
+    assert artifacts.artifact_format() == 'yaml'
+    assert not artifacts.dump_artifact(_DATA).startswith('{')
+
+    monkeypatch.setenv(artifacts.ARTIFACT_FORMAT_ENV, 'toml')
+    assert artifacts.artifact_format() == 'yaml'
+
+
+def test_dump_artifact_writes_compact_json(json_mode):
+    text = artifacts.dump_artifact(_DATA)
+
+    assert text.endswith('}\n') and text.count('\n') == 1
+    assert json.loads(text) == _DATA
+    # JSON은 YAML이기도 하므로 기존 YAML reader도 그대로 읽는다
+    assert yaml.safe_load(text) == _DATA
+    assert list(json.loads(text)) == sorted(_DATA)
+    assert list(json.loads(artifacts.dump_artifact(_DATA, sort_keys=False))) == list(_DATA)
+
+
+@pytest.mark.parametrize('text', [
+    '{"a": [1, 2]}\n',
+    'a:\n- 1\n- 2\n',
+    '{a: [1, 2]}\n',  # YAML flow mapping
+])
+def test_load_artifact_reads_json_and_yaml(text):
+    assert artifacts.load_artifact(text) == {'a': [1, 2]}
+
+
+def test_file_manager_payloads_round_trip_in_both_formats(tmp_path, monkeypatch):
+    manager = FileManager(logging.getLogger(__name__))
+    for mode in artifacts.ARTIFACT_FORMATS:
+        monkeypatch.setenv(artifacts.ARTIFACT_FORMAT_ENV, mode)
+        path = str(tmp_path / f'page.v2.{mode}.yaml')
+        manager.save_artifact(path, _DATA)
+        assert manager.load_yaml(path) == _DATA
+
+
+def test_sidecar_mapping_in_json_mode(tmp_path, json_mode):
+    xhtml = '<h2>Overview</h2><p>본문입니다.</p>'
+    mdx = '## Overview\n\n본문입니다.\n'
+    mapping_text = generate_sidecar_mapping(xhtml, mdx, '1')
+    assert mapping_text.startswith('{')
+
+    mapping_file = tmp_path / 'mapping.yaml'
+    mapping_file.write_text(mapping_text, encoding='utf-8')
+    entries = load_sidecar_mapping(str(mapping_file))
+    assert [entry.xhtml_type for entry in entries] == ['heading', 'paragraph']
@@ -0,0 +1,96 @@
+"""Unit tests for the benchmark package (bin/benchmark)."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from benchmark.baseline import (
+    Baseline, compare, format_table, load_baseline, save_baseline, to_baseline,
+)
+from benchmark.stages import STAGES, Measurement, measure
+from benchmark.workloads import Workload, load_catalog_for, load_page, scale_page
+
+_TESTCASES_DIR = Path(__file__).resolve().parent / 'testcases'
+_CASE_DIR = _TESTCASES_DIR / '544384417'
+
+
+@pytest.fixture(scope='module')
+def page():
+    return load_page(_CASE_DIR)
+
+
+def test_scale_page_repeats_bodies_once_per_copy(page):
+    scaled = scale_page(page, 3)
+
+    assert scaled.page_id == '544384417x3'
+    assert scaled.xhtml == page.xhtml * 3
+    # frontmatter는 한 번만 남는다
+    assert scaled.mdx.count('\n---\n') == page.mdx.count('\n---\n')
+    assert len(scaled.mdx) > 2 * len(page.mdx)
+
+
+def test_scale_page_keeps_the_edit_in_the_first_copy_only(page):
+    scaled = scale_page(page, 3)
+
+    original_lines = scaled.original_mdx.splitlines()
+    improved_lines = scaled.improved_mdx.splitlines()
+    changed = {i for i, (a, b) in enumerate(zip(original_lines, improved_lines)) if a != b}
+    assert changed
+    # 편집은 첫 번째 복사본 범위 안에서만 나타난다
+    assert max(changed) < len(original_lines) // 3 + 1
+
+
+def test_measure_skips_pages_without_inputs(page):
+    workload = Workload('one', [page], load_catalog_for(_TESTCASES_DIR))
+    stages = {stage.name: stage for stage in STAGES}
+
+    skeleton = measure(stages['skeleton'], workload, repeat=1)
+    assert skeleton.stage == 'skeleton'
+    assert skeleton.workload == 'one'
+    assert skeleton.pages == 1
+    assert skeleton.seconds > 0
+
+    no_mdx = Workload('no-mdx', [page.__class__(page.page_id, page.case_dir, page.xhtml)],
+                      workload.catalog)
+    assert measure(stages['skeleton'], no_mdx, repeat=1) is None
+    assert measure(stages['plan_patches'], no_mdx, repeat=1) is None
+
+
+def test_baseline_roundtrip(tmp_path):
+    path = tmp_path / 'baseline.json'
+    save_baseline(path, to_baseline([Measurement('forward', 'testcases', 21, 0.123456)], 0.3, 2))
+
+    baseline = load_baseline(path)
+    assert baseline.threshold == 0.3
+    assert baseline.repeat == 2
+    assert baseline.seconds('forward', 'testcases') == 0.1235
+    assert baseline.seconds('forward', 'large-x10') is None
+
+
+def test_load_baseline_rejects_other_versions(tmp_path):
+    path = tmp_path / 'baseline.json'
+    path.write_text(json.dumps({'version': 99, 'results': {}}))
+    with pytest.raises(ValueError, match='version'):
+        load_baseline(path)
+
+
+def test_compare_flags_only_large_slowdowns():
+    baseline = Baseline(0.5, 5, {
+        'forward': {'testcases': {'pages': 21, 'seconds': 1.0}},
+        'skeleton': {'testcases': {'pages': 21, 'seconds': 0.05}},
+    })
+    comparisons = compare([
+        Measurement('forward', 'testcases', 21, 1.6),
+        Measurement('skeleton', 'testcases', 21, 0.1),   # +100%이지만 0.05초 차이는 잡음으로 본다
+        Measurement('sidecar', 'testcases', 21, 0.3),
+    ], baseline)
+
+    assert [c.is_regression(0.5) for c in comparisons] == [True, False, False]
+    assert comparisons[2].change is None
+
+    table = format_table(comparisons, 0.5).splitlines()
+    assert table[0].split() == ['stage', 'workload', 'baseline', 'current', 'change']
+    assert table[1].split() == ['forward', 'testcases', '1.000s', '1.600s', '+60.0%', 'REGRESSION']
+    assert table[2].split() == ['skeleton', 'testcases', '0.050s', '0.100s', '+100.0%']
+    assert table[3].split() == ['sidecar', 'testcases', '-', '0.300s', 'new']
@@ -0,0 +1,172 @@
+import os
+from pathlib import Path
+
+import pytest
+import yaml
+
+import converter.cli as converter_cli
+from convert_all import convert_all
+from converter.cache import ConversionCache, clear_cache
+from converter.cli import convert_file, load_catalog
+
+
+def _node(page_id: str, title: str, path: list[str]) -> dict:
+    return {
+        "page_id": page_id,
+        "type": "page",
+        "title": title,
+        "title_orig": title,
+        "breadcrumbs": [title],
+        "breadcrumbs_en": [title],
+        "path": path,
+    }
+
+
+PAGES = [
+    _node("root", "Root", ["root"]),
+    _node("page-a", "Page A", ["page-a"]),
+    _node("page-b", "Page B", ["section", "page-b"]),
+]
+
+
+def _write_page(var_dir: Path, page_id: str, title: str) -> None:
+    page_dir = var_dir / page_id
+    page_dir.mkdir(parents=True, exist_ok=True)
+    (page_dir / "page.v1.yaml").write_text(yaml.safe_dump({
+        "id": page_id,
+        "type": "page",
+        "title": title,
+        "ancestors": [],
+        "body": {},
+        "_links": {"base": "https://querypie.atlassian.net/wiki", "webui": f"/spaces/QM/pages/{page_id}"},
+    }), encoding="utf-8")
+    (page_dir / "page.xhtml").write_text(
+        f'<p>{title} body links to '
+        '<ac:link><ri:page ri:content-title="Page A"/><ac:link-body>Page A</ac:link-body></ac:link></p>'
+        '<ac:image><ri:attachment ri:filename="shot.png"/></ac:image>',
+        encoding="utf-8",
+    )
+    (page_dir / "children.v2.yaml").write_text(yaml.safe_dump({"results": []}), encoding="utf-8")
+    (page_dir / "shot.png").write_bytes(b"png " + page_id.encode())
+
+
+@pytest.fixture
+def workspace(tmp_path):
+    var_dir = tmp_path / "var"
+    pages_yaml = var_dir / "pages.qm.yaml"
+    pages_yaml.parent.mkdir(parents=True)
+    pages_yaml.write_text(yaml.safe_dump(PAGES, allow_unicode=True, sort_keys=False), encoding="utf-8")
+    for page in PAGES[1:]:
+        _write_page(var_dir, page["page_id"], page["title"])
+    return tmp_path
+
+
+def _convert(workspace: Path, cache: ConversionCache) -> str:
+    var_dir = workspace / "var"
+    return convert_file(
+        str(var_dir / "page-a" / "page.xhtml"),
+        str(workspace / "out" / "page-a.mdx"),
+        str(workspace / "public"),
+        load_catalog(str(var_dir / "pages.qm.yaml")),
+        attachment_dir="/page-a",
+        cache=cache,
+    )
+
+
+def _new_cache(workspace: Path) -> ConversionCache:
+    return ConversionCache(str(workspace / "cache"), str(workspace / "var" / "pages.qm.yaml"))
+
+
+def _count_conversions(monkeypatch) -> list:
+    calls = []
+    original = converter_cli.convert_page
+
+    def counting(*args, **kwargs):
+        calls.append(args[0])
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(converter_cli, "convert_page", counting)
+    return calls
+
+
+def test_hit_restores_identical_outputs_without_converting(workspace, monkeypatch):
+    (workspace / "out").mkdir()
+    calls = _count_conversions(monkeypatch)
+    markdown = _convert(workspace, _new_cache(workspace))
+    mdx = (workspace / "out" / "page-a.mdx").read_bytes()
+    mapping = (workspace / "var" / "page-a" / "mapping.yaml").read_bytes()
+
+    (workspace / "out" / "page-a.mdx").unlink()
+    (workspace / "var" / "page-a" / "mapping.yaml").unlink()
+    for image in (workspace / "public").rglob("shot.png"):
+        image.unlink()
+    cache = _new_cache(workspace)
+
+    assert _convert(workspace, cache) == markdown
+    assert len(calls) == 1
+    assert (cache.hits, cache.misses) == (1, 0)
+    assert (workspace / "out" / "page-a.mdx").read_bytes() == mdx
+    assert (workspace / "var" / "page-a" / "mapping.yaml").read_bytes() == mapping
+    assert [p.read_bytes() for p in (workspace / "public").rglob("shot.png")] == [b"png page-a"]
+
+
+@pytest.mark.parametrize("change", ["xhtml", "page_v1", "catalog", "stamp"])
+def test_changed_inputs_miss(workspace, monkeypatch, change):
+    (workspace / "out").mkdir()
+    _convert(workspace, _new_cache(workspace))
+    page_dir = workspace / "var" / "page-a"
+    if change == "xhtml":
+        (page_dir / "page.xhtml").write_text("<p>Changed body</p>", encoding="utf-8")
+    elif change == "page_v1":
+        data = yaml.safe_load((page_dir / "page.v1.yaml").read_text())
+        data["title"] = "Page A (renamed)"
+        (page_dir / "page.v1.yaml").write_text(yaml.safe_dump(data), encoding="utf-8")
+    elif change == "catalog":
+        pages = PAGES + [_node("page-c", "Page C", ["page-c"])]
+        (workspace / "var" / "pages.qm.yaml").write_text(yaml.safe_dump(pages), encoding="utf-8")
+    else:
+        monkeypatch.setattr("converter.cache.converter_stamp", lambda: "another converter")
+    cache = _new_cache(workspace)
+
+    markdown = _convert(workspace, cache)
+
+    assert (cache.hits, cache.misses) == (0, 1)
+    if change == "xhtml":
+        assert "Changed body" in markdown
+
+
+def test_clear_cache_removes_entries(workspace):
+    (workspace / "out").mkdir()
+    _convert(workspace, _new_cache(workspace))
+
+    assert clear_cache(str(workspace / "cache")) == 1
+    assert os.listdir(workspace / "cache") == []
+    assert clear_cache(str(workspace / "missing")) == 0
+
+
+@pytest.mark.parametrize("jobs", [0, 2])
+def test_convert_all_second_run_is_served_from_cache(workspace, capsys, jobs):
+    var_dir = workspace / "var"
+    output_dir = workspace / "output"
+    outputs = []
+    for _ in range(2):
+        failures = convert_all(
+            PAGES,
+            str(var_dir),
+            str(output_dir),
+            str(workspace / "public"),
+            "warning",
+            pages_yaml=str(var_dir / "pages.qm.yaml"),
+            jobs=jobs,
+            cache_dir=str(workspace / "cache"),
+        )
+        assert failures == 0
+        outputs.append({
+            path.relative_to(output_dir).as_posix(): path.read_text()
+            for path in output_dir.rglob("*.mdx")
+        })
+
+    assert outputs[0] == outputs[1]
+    stderr = capsys.readouterr().err
+    assert "Conversion cache: 0 hits, 2 misses" in stderr
+    assert "Conversion cache: 2 hits, 0 misses" in stderr
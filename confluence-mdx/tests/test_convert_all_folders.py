@@ -6,14 +6,18 @@ from pathlib import Path
 import pytest
 import yaml
 
+import artifacts
 from convert_all import (
+    ChildrenIndex,
     ConversionError,
+    ConversionState,
     convert_all,
     finalize_manifest,
     generate_folder_mdx,
     generate_navigation,
 )
 from content_redirects import reconcile_content_redirects
+from converter.xhtml_parser import available_parsers
 
 
 def _write_yaml(path: Path, data) -> None:
@@ -794,6 +798,76 @@ def test_convert_all_generates_folder_and_manifest(tmp_path):
     }]
 
 
+def test_convert_all_parses_each_children_snapshot_once_per_run(tmp_path, monkeypatch):
+    var_dir = tmp_path / "var"
+    output_dir = tmp_path / "output"
+    cache_dir = tmp_path / "cache"
+    manifest_path = (
+        var_dir / "convert-manifests" / "convert-manifest.qm.yaml"
+    )
+    root = _node("root", "page", "Root", ["root"])
+    outer = _node("outer", "folder", "Outer", ["outer"])
+    inner = _node("inner", "folder", "Inner", ["outer", "inner"])
+    for node in (outer, inner):
+        _write_yaml(var_dir / node["page_id"] / "folder.v2.yaml", _folder_data(
+            node["page_id"],
+            node["title"],
+        ))
+    _write_yaml(var_dir / "outer" / "children.v2.yaml", {
+        "results": [{"id": "inner", "type": "folder", "childPosition": 1}],
+    })
+    _write_yaml(var_dir / "inner" / "children.v2.yaml", {"results": []})
+
+    parsed = []
+    load_artifact = artifacts.load_artifact
+
+    def counting_load_artifact(text):
+        parsed.append(text)
+        return load_artifact(text)
+
+    monkeypatch.setattr(artifacts, "load_artifact", counting_load_artifact)
+
+    def run() -> int:
+        parsed.clear()
+        failures = convert_all(
+            [root, outer, inner],
+            str(var_dir),
+            str(output_dir),
+            str(tmp_path / "public"),
+            "warning",
+            manifest_path=str(manifest_path),
+            sync_code="qm",
+            cache_dir=str(cache_dir),
+        )
+        assert failures == 0
+        return len(parsed)
+
+    # preflight, folder page, navigation이 같은 index를 공유한다
+    assert run() == 2
+    assert "'inner': 'Inner'" in (output_dir / "outer" / "_meta.ts").read_text()
+
+    # 다음 실행은 저장된 index를 재사용하고, 바뀐 snapshot만 다시 읽는다
+    assert run() == 0
+    _write_yaml(var_dir / "inner" / "children.v2.yaml", {"results": [], "size": 0})
+    assert run() == 1
+
+
+def test_children_index_reports_invalid_snapshots(tmp_path):
+    var_dir = tmp_path / "var"
+    index = ChildrenIndex(var_dir)
+    with pytest.raises(ConversionError, match="Missing direct children snapshot"):
+        index.children("missing")
+
+    _write_yaml(var_dir / "bad" / "children.v2.yaml", {"results": {"id": "x"}})
+    with pytest.raises(ConversionError, match="results must be a list"):
+        index.children("bad")
+
+    (var_dir / "broken").mkdir()
+    (var_dir / "broken" / "children.v2.yaml").write_text("results: [\n", encoding="utf-8")
+    with pytest.raises(ConversionError, match="Invalid YAML"):
+        index.children("broken")
+
+
 def test_convert_all_generates_page_folder_and_central_navigation(tmp_path):
     var_dir = tmp_path / "var"
     output_dir = tmp_path / "output"
@@ -891,3 +965,240 @@ def test_reverse_sync_rejects_generated_folder_landing_page(tmp_path, monkeypatc
             lenient=False,
             no_normalize=False,
         ))
+
+
+def _write_convertible_page(var_dir: Path, page_id: str, title: str) -> None:
+    _write_yaml(var_dir / page_id / "page.v1.yaml", {
+        "id": page_id,
+        "type": "page",
+        "title": title,
+        "ancestors": [],
+        "body": {},
+        "_links": {
+            "base": "https://querypie.atlassian.net/wiki",
+            "webui": f"/spaces/QM/pages/{page_id}",
+        },
+    })
+    (var_dir / page_id / "page.xhtml").write_text(
+        f'<p>{title} body links to '
+        '<ac:link><ri:page ri:content-title="Page A"/>'
+        '<ac:link-body>Page A</ac:link-body></ac:link></p>',
+        encoding="utf-8",
+    )
+
+
+@pytest.mark.parametrize("jobs,parser", [
+    (1, "html.parser"),
+    (2, "html.parser"),
+    pytest.param(2, "lxml", marks=pytest.mark.skipif(
+        "lxml" not in available_parsers(), reason="lxml not installed")),
+])
+def test_convert_all_jobs_matches_subprocess_output(tmp_path, jobs, parser):
+    pages = [
+        _node("root", "page", "Root", ["root"]),
+        _node("page-a", "page", "Page A", ["page-a"]),
+        _node("page-b", "page", "Page B", ["section", "page-b"]),
+    ]
+    outputs = {}
+    for mode, mode_jobs in (("subprocess", 0), ("in-process", jobs)):
+        var_dir = tmp_path / mode / "var"
+        output_dir = tmp_path / mode / "output"
+        pages_yaml = var_dir / "pages.qm.yaml"
+        _write_yaml(pages_yaml, pages)
+        for page in pages[1:]:
+            _write_convertible_page(var_dir, page["page_id"], page["title"])
+            _write_yaml(var_dir / page["page_id"] / "children.v2.yaml", {
+                "results": [],
+            })
+
+        failures = convert_all(
+            pages,
+            str(var_dir),
+            str(output_dir),
+            str(tmp_path / mode / "public"),
+            "warning",
+            pages_yaml=str(pages_yaml),
+            manifest_path=str(
+                var_dir / "convert-manifests" / "convert-manifest.qm.yaml"
+            ),
+            sync_code="qm",
+            jobs=mode_jobs,
+            parser=parser if mode_jobs else "html.parser",
+        )
+
+        assert failures == 0
+        outputs[mode] = {
+            path.relative_to(output_dir).as_posix(): path.read_text()
+            for path in output_dir.rglob("*.mdx")
+        }
+        outputs[mode]["manifest"] = (
+            var_dir / "convert-manifests" / "convert-manifest.qm.yaml"
+        ).read_text()
+
+    assert set(outputs["in-process"]) == {
+        "page-a.mdx",
+        "section/page-b.mdx",
+        "manifest",
+    }
+    assert "](../page-a)" in outputs["in-process"]["section/page-b.mdx"]
+    assert outputs["in-process"] == outputs["subprocess"]
+
+
+def test_convert_all_jobs_isolates_page_failures(tmp_path, capsys):
+    var_dir = tmp_path / "var"
+    output_dir = tmp_path / "output"
+    pages_yaml = var_dir / "pages.qm.yaml"
+    pages = [
+        _node("root", "page", "Root", ["root"]),
+        _node("good", "page", "Good", ["good"]),
+        _node("broken", "page", "Broken", ["broken"]),
+    ]
+    _write_yaml(pages_yaml, pages)
+    _write_convertible_page(var_dir, "good", "Good")
+    _write_convertible_page(var_dir, "broken", "Broken")
+    # A directory where the output file should go makes only this page fail.
+    (output_dir / "broken.mdx").mkdir(parents=True)
+
+    failures = convert_all(
+        pages,
+        str(var_dir),
+        str(output_dir),
+        str(tmp_path / "public"),
+        "warning",
+        pages_yaml=str(pages_yaml),
+        jobs=2,
+    )
+
+    assert failures == 1
+    assert (output_dir / "good.mdx").is_file()
+    stderr = capsys.readouterr().err
+    assert "[1/2] good → " in stderr
+    assert "[2/2] broken → " in stderr
+    assert "ERROR - " in stderr
+    assert "Error during conversion" in stderr
+
+
+def test_convert_all_incremental_converts_changed_and_linking_pages(tmp_path, capsys):
+    var_dir = tmp_path / "var"
+    output_dir = tmp_path / "output"
+    pages_yaml = var_dir / "pages.qm.yaml"
+    manifest_path = var_dir / "convert-manifests" / "convert-manifest.qm.yaml"
+    page_a = _node("page-a", "page", "Page A", ["page-a"])
+    pages = [
+        _node("root", "page", "Root", ["root"]),
+        page_a,
+        _node("page-b", "page", "Page B", ["section", "page-b"]),
+        _node("page-c", "page", "Page C", ["page-c"]),
+    ]
+    for page in pages[1:]:
+        _write_convertible_page(var_dir, page["page_id"], page["title"])
+        _write_yaml(var_dir / page["page_id"] / "children.v2.yaml", {"results": []})
+    (var_dir / "page-c" / "page.xhtml").write_text("<p>Page C body</p>", encoding="utf-8")
+
+    def run() -> set[str]:
+        _write_yaml(pages_yaml, pages)
+        capsys.readouterr()
+        failures = convert_all(
+            pages,
+            str(var_dir),
+            str(output_dir),
+            str(tmp_path / "public"),
+            "warning",
+            pages_yaml=str(pages_yaml),
+            manifest_path=str(manifest_path),
+            sync_code="qm",
+            jobs=1,
+            cache_dir=str(tmp_path / "cache"),
+            incremental=True,
+        )
+        assert failures == 0
+        outputs = {entry["path"] for entry in yaml.safe_load(manifest_path.read_text())["outputs"]}
+        assert outputs == {
+            f"{Path(*page['path']).as_posix()}.mdx" for page in pages[1:]
+        }
+        return {
+            line.split()[1]
+            for line in capsys.readouterr().err.splitlines()
+            if line.startswith("[") and " → " in line
+        }
+
+    # 기록이 없으면 전체를 변환한다
+    assert run() == {"page-a", "page-b", "page-c"}
+    assert (tmp_path / "cache" / "convert-state.json").is_file()
+    assert run() == set()
+
+    (var_dir / "page-c" / "page.xhtml").write_text("<p>Page C changed</p>", encoding="utf-8")
+    assert run() == {"page-c"}
+    assert "Page C changed" in (output_dir / "page-c.mdx").read_text()
+
+    # 경로가 바뀐 page와 그 page를 link하는 page만 다시 변환한다
+    page_a["path"] = ["renamed-a"]
+    assert run() == {"page-a", "page-b"}
+    assert "](../renamed-a)" in (output_dir / "section" / "page-b.mdx").read_text()
+    assert not (output_dir / "page-a.mdx").exists()
+
+    (output_dir / "page-c.mdx").unlink()
+    assert run() == {"page-c"}
+
+
+def test_generate_navigation_writes_only_planned_parents(tmp_path):
+    var_dir = tmp_path / "var"
+    output_dir = tmp_path / "output"
+    pages = [
+        _node("root", "page", "Root", ["root"]),
+        _node("parent", "page", "Parent", ["parent"]),
+        _node("child", "page", "Child", ["parent", "child"]),
+    ]
+    _write_yaml(var_dir / "parent" / "children.v2.yaml", {
+        "results": [{"id": "child", "type": "page", "title": "Child", "childPosition": 1}],
+    })
+    _write_yaml(var_dir / "child" / "children.v2.yaml", {"results": []})
+    (output_dir / "parent").mkdir(parents=True)
+    (output_dir / "parent" / "child.mdx").write_text("# Child\n", encoding="utf-8")
+    meta_path = output_dir / "parent" / "_meta.ts"
+
+    entries = generate_navigation(pages, var_dir, output_dir, parents=set())
+    assert [entry["path"] for entry in entries] == ["parent/_meta.ts"]
+    assert "'child': 'Child'" in meta_path.read_text()  # missing files are always written
+
+    meta_path.write_text("stale", encoding="utf-8")
+    assert generate_navigation(pages, var_dir, output_dir, parents=set()) == entries
+    assert meta_path.read_text() == "stale"
+    generate_navigation(pages, var_dir, output_dir, parents={"parent"})
+    assert "'child': 'Child'" in meta_path.read_text()
+
+
+def test_conversion_state_plans_folders_of_retitled_children(tmp_path):
+    var_dir = tmp_path / "var"
+    output_dir = tmp_path / "output"
+    folder = _node("folder", "folder", "Folder", ["folder"])
+    child = _node("child", "page", "Child", ["folder", "child"])
+    other = _node("other", "page", "Other", ["other"])
+    pages = [_node("root", "page", "Root", ["root"]), folder, child, other]
+    _write_yaml(var_dir / "folder" / "folder.v2.yaml", _folder_data("folder", "Folder"))
+    _write_yaml(var_dir / "folder" / "children.v2.yaml", {
+        "results": [{"id": "child", "type": "page", "title": "Child", "childPosition": 1}],
+    })
+    for page_id in ("root", "child", "other"):
+        _write_yaml(var_dir / page_id / "children.v2.yaml", {"results": []})
+        (var_dir / page_id).joinpath("page.xhtml").write_text("<p>body</p>", encoding="utf-8")
+    for page in pages[1:]:
+        path = output_dir / f"{Path(*page['path']).as_posix()}.mdx"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("", encoding="utf-8")
+
+    options = {"converter": "stamp"}
+    state = ConversionState(str(tmp_path / "cache"), options)
+    plan = state.plan(pages, var_dir, output_dir, ChildrenIndex(var_dir))
+    assert plan.pages == {"child", "other"}
+    state.save()
+
+    state = ConversionState(str(tmp_path / "cache"), options)
+    assert state.plan(pages, var_dir, output_dir, ChildrenIndex(var_dir)).pages == set()
+
+    child["title"] = "Renamed child"
+    plan = state.plan(pages, var_dir, output_dir, ChildrenIndex(var_dir))
+    assert (plan.pages, plan.parents) == ({"child"}, {"folder", "child"})
+
+    # 다른 옵션으로 기록된 state는 사용하지 않는다
+    assert ConversionState(str(tmp_path / "cache"), {"converter": "other"}).stored is None
@@ -0,0 +1,89 @@
+"""DocumentAnalysis parity tests.
+
+DocumentAnalysis must answer the converter's dispatch questions exactly as the
+original recursive definitions did. The reference implementations below are
+those definitions, checked against every node of every testcase page.
+"""
+from pathlib import Path
+
+import pytest
+from bs4 import BeautifulSoup, NavigableString, Tag
+
+from converter.analysis import (
+    DocumentAnalysis,
+    is_adf_extension_callout,
+    is_structured_macro_callout,
+)
+from converter.context import ConversionContext
+from converter.core import SingleLineParser, TableToNativeMarkdown
+
+TESTCASES_DIR = Path(__file__).resolve().parent / 'testcases'
+PAGES = sorted(TESTCASES_DIR.glob('*/page.xhtml'))
+
+
+def _reference_inline_only(node):
+    if isinstance(node, NavigableString):
+        return True
+    if node.name in {
+        'span', 'strong', 'em', 'code', 'u', 'br', 'a',
+        'ac:inline-comment-marker', 'ac:emoticon', 'time',
+        'ac:adf-fragment-mark', 'ac:adf-fragment-mark-detail',
+    }:
+        return all(_reference_inline_only(child) for child in node.children)
+    if node.name in ['ac:link', 'ac:image', 'ac:adf-fragment-mark']:
+        return True
+    if node.name == 'ac:structured-macro':
+        return node.get('ac:name', '') == 'status'
+    return False
+
+
+def _reference_descendant_names(node):
+    return {d.name for d in node.descendants if isinstance(d, Tag)}
+
+
+def _reference_has(node, predicate):
+    if isinstance(node, NavigableString):
+        return False
+    if predicate(node):
+        return True
+    return any(_reference_has(child, predicate) for child in node.children)
+
+
+@pytest.mark.parametrize('page', PAGES, ids=lambda p: p.parent.name)
+def test_analysis_matches_recursive_definitions(page):
+    soup = BeautifulSoup(page.read_text(encoding='utf-8'), 'html.parser')
+    analysis = DocumentAnalysis(soup)
+
+    for node in [soup, *soup.descendants]:
+        if not isinstance(node, Tag):
+            continue
+        assert analysis.inline_only(node) == _reference_inline_only(node), node.name
+        assert analysis.descendant_names(node) == _reference_descendant_names(node), node.name
+        assert analysis.has_structured_macro_callout(node) == _reference_has(node, is_structured_macro_callout)
+        assert analysis.has_adf_extension_callout(node) == _reference_has(node, is_adf_extension_callout)
+
+
+def test_analysis_of_unanalyzed_fragment():
+    """Parsers used on standalone fragments analyze them on first use."""
+    soup = BeautifulSoup(
+        '<p><strong>bold <em>text</em></strong></p>'
+        '<table><tbody><tr><td><ul><li>item</li></ul></td></tr></tbody></table>',
+        'html.parser',
+    )
+    context = ConversionContext()
+
+    assert SingleLineParser(soup.find('strong'), context=context).applicable
+    assert not SingleLineParser(soup.find('p').parent, context=context).applicable
+    assert context.analysis.descendant_names(soup.find('table')) == {'tbody', 'tr', 'td', 'ul', 'li'}
+    assert not TableToNativeMarkdown(soup.find('table'), context=context).applicable
+
+
+def test_analysis_of_strings():
+    soup = BeautifulSoup('<p>text</p>', 'html.parser')
+    text = soup.find('p').contents[0]
+    analysis = DocumentAnalysis(soup)
+
+    assert analysis.inline_only(text)
+    assert analysis.descendant_names(text) == frozenset()
+    assert not analysis.has_structured_macro_callout(text)
+    assert not analysis.has_adf_extension_callout(text)
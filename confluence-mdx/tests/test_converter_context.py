@@ -0,0 +1,90 @@
+"""ConversionContext / PageCatalog: 변환 상태가 전역 없이 변환마다 분리되는지 테스트한다."""
+
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from converter.context import ConversionContext, PageCatalog, load_page_catalog
+from converter.core import ConfluenceToMarkdown
+
+
+def _page(page_id: str, title: str, path: list[str]) -> dict:
+    return {"page_id": page_id, "title": title, "title_orig": title, "path": path}
+
+
+_CATALOG = PageCatalog.from_pages([
+    _page("1", "Guide", ["guide"]),
+    _page("2", "Install", ["guide", "install"]),
+    _page("3", "Release Notes", ["release-notes"]),
+    _page("4", "Upgrade", ["guide", "upgrade"]),
+])
+
+_XHTML = (
+    '<p><ac:link><ri:page ri:content-title="Install"/>'
+    '<ac:link-body>Install</ac:link-body></ac:link> '
+    '<time datetime="2025-08-29" /></p>'
+)
+
+
+def _convert(title: str, language: str) -> str:
+    context = ConversionContext(
+        catalog=_CATALOG,
+        language=language,
+        page_v1={"id": "x", "title": title},
+    )
+    return ConfluenceToMarkdown(_XHTML, context=context).as_markdown()
+
+
+class TestPageCatalog:
+    def test_indexes_by_title_orig_and_page_id(self):
+        assert _CATALOG.by_title["Install"]["page_id"] == "2"
+        assert _CATALOG.by_id["3"]["title"] == "Release Notes"
+        assert len(_CATALOG) == 4
+
+    def test_duplicate_title_orig_keeps_first_entry(self):
+        catalog = PageCatalog.from_pages([
+            _page("1", "Same", ["a"]),
+            _page("2", "Same", ["b"]),
+            "not a dict",
+            {"page_id": "4"},
+        ])
+        assert dict(catalog.by_title["Same"])["path"] == ["a"]
+        assert set(catalog.by_id) == {"1"}
+
+    def test_indexes_and_entries_are_read_only(self):
+        with pytest.raises(TypeError):
+            _CATALOG.by_title["New"] = _page("9", "New", ["new"])
+        with pytest.raises(TypeError):
+            _CATALOG.by_id["1"]["title"] = "Changed"
+
+    def test_pickle_roundtrip(self):
+        restored = pickle.loads(pickle.dumps(_CATALOG))
+        assert dict(restored.by_id["2"]) == dict(_CATALOG.by_id["2"])
+        with pytest.raises(TypeError):
+            restored.by_id["2"]["title"] = "Changed"
+
+    def test_missing_yaml_gives_empty_catalog(self, tmp_path):
+        assert len(load_page_catalog(str(tmp_path / "missing.yaml"))) == 0
+
+
+class TestConversionContext:
+    def test_links_resolve_relative_to_context_page(self):
+        assert "[Install](guide/install)" in _convert("Release Notes", "en")
+        assert "[Install](install)" in _convert("Upgrade", "en")
+
+    def test_default_context_has_no_catalog(self):
+        markdown = ConfluenceToMarkdown(_XHTML).as_markdown()
+        assert "[Install](https://querypie.atlassian.net" not in markdown
+        assert "Aug 29, 2025" in markdown
+
+    def test_concurrent_conversions_do_not_share_state(self):
+        cases = [("Release Notes", "ko"), ("Upgrade", "ja")] * 20
+        expected = {case: _convert(*case) for case in set(cases)}
+        assert "2025년 08월 29일" in expected[("Release Notes", "ko")]
+        assert "2025年08月29日" in expected[("Upgrade", "ja")]
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda case: _convert(*case), cases))
+
+        assert results == [expected[case] for case in cases]
@@ -0,0 +1,123 @@
+"""Write-if-changed outputs (bin/converter/output.py) and their use by convert_all."""
+
+import os
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from convert_all import convert_all
+from converter.core import copy_attachment
+from converter.output import (
+    format_changed_outputs,
+    note_changed,
+    parse_changed_outputs,
+    take_changed,
+    write_if_changed,
+)
+from test_conversion_cache import PAGES, workspace  # noqa: F401  (fixture)
+
+
+def _age(root: Path, seconds: int = 60) -> dict:
+    """Move every file under root back in time and return their mtimes."""
+    mtimes = {}
+    for path in root.rglob("*"):
+        if path.is_file():
+            stat = path.stat()
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns - seconds * 1_000_000_000))
+            mtimes[path] = path.stat().st_mtime_ns
+    return mtimes
+
+
+def test_write_if_changed_skips_identical_content(tmp_path):
+    path = tmp_path / "page.mdx"
+    assert write_if_changed(str(path), "# 제목\n") is True
+    mtimes = _age(tmp_path)
+
+    assert write_if_changed(str(path), "# 제목\n") is False
+    assert path.stat().st_mtime_ns == mtimes[path]
+
+    assert write_if_changed(str(path), "# 제목!\n") is True
+    assert path.read_text(encoding="utf-8") == "# 제목!\n"
+    assert path.stat().st_mtime_ns > mtimes[path]
+
+
+def test_copy_attachment_leaves_identical_copy_untouched(tmp_path):
+    source = tmp_path / "var" / "shot.png"
+    source.parent.mkdir()
+    source.write_bytes(b"png")
+    public_dir = tmp_path / "public" / "page"
+
+    assert copy_attachment(str(source), str(public_dir), "shot.png") is True
+    mtimes = _age(tmp_path / "public")
+    assert copy_attachment(str(source), str(public_dir), "shot.png") is False
+
+    assert (public_dir / "shot.png").stat().st_mtime_ns == mtimes[public_dir / "shot.png"]
+
+
+def test_note_changed_tallies_until_taken():
+    take_changed()
+    assert note_changed(False) is False
+    assert note_changed(True) is True
+    note_changed(3)
+
+    assert take_changed() == 4
+    assert take_changed() == 0
+
+
+def test_parse_changed_outputs_reads_only_the_marker_line():
+    stdout = f"some debug output 7\n{format_changed_outputs(3)}\ntrailing 9\n"
+    assert parse_changed_outputs(stdout) == 3
+    assert parse_changed_outputs("12\n") is None
+    assert parse_changed_outputs("changed-outputs: many\n") is None
+    assert parse_changed_outputs("") is None
+
+
+@pytest.mark.parametrize("jobs", [0, 1])
+def test_second_convert_all_run_changes_no_files(workspace, capsys, jobs):  # noqa: F811
+    def run():
+        failures = convert_all(
+            PAGES,
+            str(workspace / "var"),
+            str(workspace / "out"),
+            str(workspace / "public"),
+            "warning",
+            pages_yaml=str(workspace / "var" / "pages.qm.yaml"),
+            jobs=jobs,
+        )
+        assert failures == 0
+        return capsys.readouterr().err
+
+    # page-a.mdx, section/page-b.mdx와 각 page의 이미지
+    assert "Output files changed: 4 " in run()
+    mtimes = {**_age(workspace / "out"), **_age(workspace / "public")}
+
+    assert "Output files changed: 0 " in run()
+    assert {path: path.stat().st_mtime_ns for path in mtimes} == mtimes
+
+    (workspace / "var" / "page-b" / "page.xhtml").write_text("<p>Page B edited</p>", encoding="utf-8")
+    assert "Output files changed: 1 " in run()
+
+
+def test_unreported_subprocess_tally_does_not_fail_the_page(workspace, capsys, monkeypatch, caplog):  # noqa: F811
+    run = subprocess.run
+
+    def run_without_marker(cmd, **kwargs):
+        result = run(cmd, **kwargs)
+        result.stdout = "debug output\n"
+        return result
+
+    monkeypatch.setattr(subprocess, "run", run_without_marker)
+    failures = convert_all(
+        PAGES,
+        str(workspace / "var"),
+        str(workspace / "out"),
+        str(workspace / "public"),
+        "warning",
+        pages_yaml=str(workspace / "var" / "pages.qm.yaml"),
+        jobs=0,
+    )
+
+    assert failures == 0
+    assert "did not report its changed outputs" in caplog.text
+    assert "Output files changed: 0 " in capsys.readouterr().err
@@ -0,0 +1,208 @@
+import logging
+import threading
+import time
+from pathlib import Path
+
+import pytest
+import yaml
+
+from fetch.api_client import ApiClient
+from fetch.config import Config
+from fetch.exceptions import ApiError
+from fetch.file_manager import FileManager
+from fetch.stages import Stage3Processor
+
+
+def _config(tmp_path: Path, *, workers: int = 4) -> Config:
+    return Config(
+        base_url="https://example.atlassian.net/wiki",
+        default_output_dir=str(tmp_path / "var"),
+        cache_dir=str(tmp_path / "cache"),
+        translations_file=str(tmp_path / "translations.txt"),
+        download_attachments=True,
+        attachment_workers=workers,
+        mode="remote",
+    )
+
+
+def _write_attachments(tmp_path: Path, page_id: str, attachments) -> Path:
+    directory = tmp_path / "var" / page_id
+    directory.mkdir(parents=True, exist_ok=True)
+    (directory / "attachments.v1.yaml").write_text(
+        yaml.safe_dump({"results": attachments}, allow_unicode=True),
+        encoding="utf-8",
+    )
+    return directory
+
+
+def _attachment(attachment_id: str, title: str, size=None) -> dict:
+    attachment = {"id": attachment_id, "title": title}
+    if size is not None:
+        attachment["extensions"] = {"fileSize": size}
+    return attachment
+
+
+class _StreamingApi:
+    """Serves attachment bodies in small chunks and records download concurrency."""
+
+    def __init__(self, bodies, *, delay: float = 0.0, fail_after_chunk=None):
+        self.bodies = bodies
+        self.delay = delay
+        self.fail_after_chunk = fail_after_chunk or {}
+        self.downloads = []
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def iter_attachment_chunks(self, page_id, attachment_id):
+        with self._lock:
+            self.downloads.append(attachment_id)
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            body = self.bodies[attachment_id]
+            for index in range(0, len(body), 4):
+                time.sleep(self.delay)
+                if self.fail_after_chunk.get(attachment_id) == index // 4:
+                    raise ApiError("connection reset")
+                yield body[index:index + 4]
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+def _stage3(tmp_path: Path, api, *, workers: int = 4) -> Stage3Processor:
+    logger = logging.getLogger(__name__)
+    return Stage3Processor(_config(tmp_path, workers=workers), api, FileManager(logger), logger)
+
+
+def test_downloads_attachments_concurrently_within_worker_bound(tmp_path):
+    attachments = [_attachment(str(i), f"image-{i}.png") for i in range(8)]
+    directory = _write_attachments(tmp_path, "100", attachments)
+    api = _StreamingApi({str(i): f"body of {i}".encode() for i in range(8)}, delay=0.01)
+
+    assert _stage3(tmp_path, api, workers=3).process("100")
+
+    assert sorted(api.downloads) == [str(i) for i in range(8)]
+    assert 1 < api.max_active <= 3
+    for i in range(8):
+        assert (directory / f"image-{i}.png").read_bytes() == f"body of {i}".encode()
+    assert not list(directory.glob("*.part"))
+
+
+def test_failed_download_keeps_existing_file_and_leaves_no_partial(tmp_path):
+    attachments = [
+        _attachment("1", "broken.png", size=100),
+        _attachment("2", "ok.png"),
+    ]
+    directory = _write_attachments(tmp_path, "100", attachments)
+    (directory / "broken.png").write_bytes(b"old")
+    api = _StreamingApi(
+        {"1": b"new content that never completes", "2": b"fine"},
+        fail_after_chunk={"1": 2},
+    )
+
+    assert _stage3(tmp_path, api).process("100")
+
+    assert (directory / "broken.png").read_bytes() == b"old"
+    assert (directory / "ok.png").read_bytes() == b"fine"
+    assert not list(directory.glob(".*.part"))
+
+
+def test_size_match_and_cache_short_circuits(tmp_path):
+    attachments = [
+        _attachment("1", "present.png", size=7),
+        _attachment("2", "cached.png", size=6),
+        _attachment("3", "stale.png", size=5),
+    ]
+    directory = _write_attachments(tmp_path, "100", attachments)
+    (directory / "present.png").write_bytes(b"present")
+    (directory / "stale.png").write_bytes(b"stale but wrong size")
+    cache_dir = tmp_path / "cache" / "100"
+    cache_dir.mkdir(parents=True)
+    (cache_dir / "cached.png").write_bytes(b"cached")
+    api = _StreamingApi({"3": b"fresh"})
+
+    assert _stage3(tmp_path, api).process("100")
+
+    assert api.downloads == ["3"]
+    assert (directory / "present.png").read_bytes() == b"present"
+    assert (directory / "cached.png").read_bytes() == b"cached"
+    assert (directory / "stale.png").read_bytes() == b"fresh"
+
+
+def test_reports_per_page_throughput(tmp_path, caplog):
+    attachments = [
+        _attachment("1", "a.png"),
+        _attachment("2", "b.png"),
+        _attachment("3", "c.png", size=3),
+    ]
+    directory = _write_attachments(tmp_path, "100", attachments)
+    (directory / "c.png").write_bytes(b"ccc")
+    api = _StreamingApi({"1": b"aaaa", "2": b"bbbbbb"})
+
+    with caplog.at_level(logging.INFO):
+        _stage3(tmp_path, api).process("100")
+
+    summary = [r.message for r in caplog.records if r.message.startswith("Stage 3 completed")]
+    assert len(summary) == 1
+    assert "2 downloaded (10 bytes" in summary[0]
+    assert "0 copied from cache, 1 skipped, 0 failed" in summary[0]
+
+
+def test_duplicate_file_names_keep_last_attachment(tmp_path):
+    attachments = [
+        _attachment("1", "same.png"),
+        _attachment("2", "same.png"),
+    ]
+    directory = _write_attachments(tmp_path, "100", attachments)
+    api = _StreamingApi({"1": b"first", "2": b"second"})
+
+    _stage3(tmp_path, api).process("100")
+
+    assert api.downloads == ["2"]
+    assert (directory / "same.png").read_bytes() == b"second"
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_results_do_not_depend_on_worker_count(tmp_path, workers):
+    attachments = [_attachment(str(i), f"file-{i}.bin") for i in range(5)]
+    directory = _write_attachments(tmp_path, "100", attachments)
+    api = _StreamingApi({str(i): bytes([i]) * (i + 1) for i in range(5)})
+
+    _stage3(tmp_path, api, workers=workers).process("100")
+
+    assert {p.name: p.read_bytes() for p in directory.glob("file-*.bin")} == {
+        f"file-{i}.bin": bytes([i]) * (i + 1) for i in range(5)
+    }
+
+
+def test_api_client_streams_attachment_body(tmp_path, monkeypatch):
+    calls = []
+
+    class FakeResponse:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def raise_for_status(self):
+            pass
+
+        def iter_content(self, chunk_size):
+            calls.append(chunk_size)
+            yield b"abc"
+            yield b""
+            yield b"def"
+
+    def fake_get(url, **kwargs):
+        assert kwargs["stream"] is True
+        assert url.endswith("/rest/api/content/100/child/attachment/att1/download")
+        return FakeResponse()
+
+    client = ApiClient(_config(tmp_path), logging.getLogger(__name__))
+    monkeypatch.setattr(client.transport, "get", fake_get)
+
+    assert list(client.iter_attachment_chunks("100", "att1")) == [b"abc", b"def"]
+    assert calls == [client.ATTACHMENT_CHUNK_SIZE]
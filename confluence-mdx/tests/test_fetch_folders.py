@@ -66,7 +66,7 @@ def test_make_request_normalizes_link_header_next_into_response_body(
         def json(self):
             return {"results": [], "_links": {}}
 
-    monkeypatch.setattr("fetch.api_client.requests.get", lambda *args, **kwargs: FakeResponse())
+    monkeypatch.setattr(client.transport, "get", lambda *args, **kwargs: FakeResponse())
 
     result = client.make_request("https://example.test", "test")
 
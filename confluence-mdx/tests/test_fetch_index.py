@@ -0,0 +1,214 @@
+import json
+import logging
+import os
+from collections import Counter
+from pathlib import Path
+
+import pytest
+
+from fetch.config import Config
+from fetch.file_manager import FileManager
+from fetch.fetch_index import FetchIndex, IndexEntry, listing_hash
+from fetch.processor import ConfluencePageProcessor
+
+TREE = {
+    "root": ["a", "b"],
+    "a": ["a1"],
+}
+
+
+def _config(tmp_path: Path, **overrides) -> Config:
+    values = dict(
+        base_url="https://example.atlassian.net/wiki",
+        default_output_dir=str(tmp_path / "var"),
+        cache_dir=str(tmp_path / "cache"),
+        translations_file=str(tmp_path / "translations.txt"),
+        default_start_page_id="root",
+        root_content_type="page",
+        fetch_workers=2,
+        mode="remote",
+    )
+    values.update(overrides)
+    return Config(**values)
+
+
+class _VersionedApi:
+    """A small page tree whose page versions and children can be changed between runs."""
+
+    def __init__(self):
+        self.versions = {page_id: 1 for page_id in ("root", "a", "b", "a1")}
+        self.children = {parent: list(children) for parent, children in TREE.items()}
+        self.calls = Counter()
+
+    def get_page_version(self, page_id):
+        self.calls["version"] += 1
+        return self.versions[page_id]
+
+    def get_page_data_v1(self, page_id):
+        self.calls["v1"] += 1
+        return {
+            "id": page_id,
+            "title": f"Title {page_id} v{self.versions[page_id]}",
+            "ancestors": [],
+            "body": {"storage": {"value": f"<p>{page_id} v{self.versions[page_id]}</p>"}},
+        }
+
+    def get_page_data_v2(self, page_id, content_type="page"):
+        self.calls["v2"] += 1
+        return {"id": page_id, "title": f"Title {page_id}", "version": {"number": self.versions[page_id]}}
+
+    def get_attachments(self, page_id):
+        self.calls["attachments"] += 1
+        return {"results": []}
+
+    def get_direct_children(self, page_id, content_type="page"):
+        self.calls["children"] += 1
+        return {"results": [
+            {"id": child, "type": "page", "title": f"Title {child}", "childPosition": position}
+            for position, child in enumerate(self.children.get(page_id, []))
+        ]}
+
+    def log_request_stats(self):
+        pass
+
+
+def _run(tmp_path: Path, api, **overrides) -> ConfluencePageProcessor:
+    processor = ConfluencePageProcessor(_config(tmp_path, **overrides), logging.getLogger(__name__))
+    processor.api_client = api
+    for stage in (processor.stage1, processor.stage2, processor.stage3, processor.stage4):
+        stage.api_client = api
+    processor.run()
+    return processor
+
+
+def _pages_yaml(tmp_path: Path) -> bytes:
+    return (tmp_path / "var" / Config().pages_yaml_filename).read_bytes()
+
+
+def test_second_remote_run_probes_versions_instead_of_fetching_bodies(tmp_path):
+    api = _VersionedApi()
+    _run(tmp_path, api)
+    first = _pages_yaml(tmp_path)
+    assert api.calls == Counter(v1=4, v2=4, attachments=4, children=4)
+
+    api.calls.clear()
+    processor = _run(tmp_path, api)
+
+    assert api.calls == Counter(version=4, children=4)
+    assert processor.fetch_index.unchanged == {"root", "a", "b", "a1"}
+    assert _pages_yaml(tmp_path) == first
+
+
+def test_changed_version_refetches_only_that_page(tmp_path):
+    api = _VersionedApi()
+    _run(tmp_path, api)
+    api.versions["a1"] = 2
+    api.calls.clear()
+
+    _run(tmp_path, api)
+
+    assert api.calls == Counter(version=4, children=4, v1=1, v2=1, attachments=1)
+    assert (tmp_path / "var" / "a1" / "page.xhtml").read_text() == "<p>a1 v2</p>"
+    index = FetchIndex.load(str(tmp_path / "var" / "root" / "fetch_index.json"), logging.getLogger(__name__))
+    assert index.get("a1").version == 2
+
+
+def test_failed_extraction_keeps_previous_version(tmp_path, monkeypatch):
+    api = _VersionedApi()
+    _run(tmp_path, api)
+    api.versions["a1"] = 2
+    save_file = FileManager.save_file
+
+    def failing_save_file(self, path, content):
+        if path.endswith(os.path.join("a1", "page.xhtml")):
+            raise OSError("disk full")
+        return save_file(self, path, content)
+
+    monkeypatch.setattr(FileManager, "save_file", failing_save_file)
+    with pytest.raises(SystemExit):
+        _run(tmp_path, api)
+    monkeypatch.undo()
+    index = FetchIndex.load(str(tmp_path / "var" / "root" / "fetch_index.json"), logging.getLogger(__name__))
+    assert index.get("a1").version == 1
+
+    _run(tmp_path, api)
+    assert (tmp_path / "var" / "a1" / "page.xhtml").read_text() == "<p>a1 v2</p>"
+
+
+def test_missing_page_xhtml_is_refetched(tmp_path):
+    api = _VersionedApi()
+    _run(tmp_path, api)
+    (tmp_path / "var" / "a1" / "page.xhtml").unlink()
+    api.calls.clear()
+
+    _run(tmp_path, api)
+
+    assert api.calls["v1"] == 1
+    assert (tmp_path / "var" / "a1" / "page.xhtml").read_text() == "<p>a1 v1</p>"
+
+
+def test_new_child_of_unchanged_parent_is_discovered(tmp_path):
+    api = _VersionedApi()
+    _run(tmp_path, api)
+    api.children["b"] = ["b1"]
+    api.versions["b1"] = 1
+    api.calls.clear()
+
+    _run(tmp_path, api)
+
+    assert api.calls["v1"] == 1
+    assert b"b1" in _pages_yaml(tmp_path)
+
+
+def test_unchanged_listing_is_not_rewritten(tmp_path):
+    api = _VersionedApi()
+    _run(tmp_path, api)
+    children_file = tmp_path / "var" / "root" / "children.v2.yaml"
+    children_file.write_text(children_file.read_text() + "# untouched\n")
+
+    _run(tmp_path, api)
+
+    assert children_file.read_text().endswith("# untouched\n")
+
+
+def test_full_refresh_and_attachments_bypass_the_index(tmp_path):
+    api = _VersionedApi()
+    _run(tmp_path, api)
+
+    api.calls.clear()
+    _run(tmp_path, api, download_attachments=True)
+    assert api.calls == Counter(version=4, children=4, attachments=4)
+
+    api.calls.clear()
+    _run(tmp_path, api, incremental_fetch=False)
+    assert api.calls == Counter(v1=4, v2=4, attachments=4, children=4)
+
+
+def test_index_file_round_trip(tmp_path):
+    path = tmp_path / "fetch_index.json"
+    index = FetchIndex(str(path), logging.getLogger(__name__))
+    index.update("1", version=3, children_hash=listing_hash([{"id": "2"}]))
+    index.update("1", attachments_hash="abc", version=None)
+    index.update("2", type="folder")
+    index.save()
+
+    data = json.loads(path.read_text())
+    assert data["format"] == FetchIndex.FORMAT
+    assert len(path.read_text().splitlines()) == 4
+    loaded = FetchIndex.load(str(path), logging.getLogger(__name__))
+    assert loaded.entries == {
+        "1": IndexEntry(version=3, children_hash=listing_hash([{"id": "2"}]), attachments_hash="abc"),
+        "2": IndexEntry(type="folder"),
+    }
+    assert not list(tmp_path.glob(".*.part"))
+
+
+def test_unreadable_index_means_full_fetch(tmp_path, caplog):
+    path = tmp_path / "fetch_index.json"
+    path.write_text("{not json")
+
+    with caplog.at_level(logging.WARNING):
+        index = FetchIndex.load(str(path), logging.getLogger(__name__))
+
+    assert index.entries == {}
+    assert "Ignoring fetch index" in caplog.text
@@ -0,0 +1,127 @@
+import logging
+import random
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from fetch.config import Config
+from fetch.exceptions import ApiError
+from fetch.processor import ConfluencePageProcessor
+
+# parent -> [(child id, type)] in childPosition order
+TREE = {
+    "root": [("a", "page"), ("f", "folder"), ("b", "page")],
+    "a": [("a1", "page"), ("a2", "page")],
+    "f": [("f1", "page"), ("shared", "page")],
+    "b": [("b1", "page"), ("shared", "page")],
+    "a1": [("a1x", "page")],
+    "shared": [("root", "page")],  # cycle back to the root
+}
+
+
+def _config(tmp_path: Path, *, workers: int) -> Config:
+    return Config(
+        base_url="https://example.atlassian.net/wiki",
+        default_output_dir=str(tmp_path / "var"),
+        cache_dir=str(tmp_path / "cache"),
+        translations_file=str(tmp_path / "translations.txt"),
+        default_start_page_id="root",
+        root_content_type="page",
+        fetch_workers=workers,
+        mode="remote",
+    )
+
+
+class _TreeApi:
+    """Serves TREE with random latency and records how many calls overlap."""
+
+    def __init__(self, *, seed: int = 0, fail=()):
+        self.random = random.Random(seed)
+        self.fail = set(fail)
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+
+    def _call(self, page_id):
+        with self.lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+            delay = self.random.uniform(0, 0.01)
+        try:
+            time.sleep(delay)
+            if page_id in self.fail:
+                raise ApiError(f"boom {page_id}")
+        finally:
+            with self.lock:
+                self.active -= 1
+
+    def get_page_data_v1(self, page_id):
+        self._call(page_id)
+        return {"id": page_id, "type": "page", "title": f"Title {page_id}", "ancestors": [], "body": {}}
+
+    def get_page_data_v2(self, page_id, content_type="page"):
+        self._call(page_id)
+        return {"id": page_id, "type": content_type, "title": f"Title {page_id}"}
+
+    def get_attachments(self, page_id):
+        return {"results": []}
+
+    def get_direct_children(self, page_id, content_type="page"):
+        self._call(page_id)
+        return {"results": [
+            {"id": child_id, "type": child_type, "title": f"Title {child_id}", "childPosition": position}
+            for position, (child_id, child_type) in enumerate(TREE.get(page_id, []), start=1)
+        ]}
+
+    def log_request_stats(self):
+        pass
+
+
+def _processor(tmp_path: Path, api, *, workers: int) -> ConfluencePageProcessor:
+    processor = ConfluencePageProcessor(_config(tmp_path, workers=workers), logging.getLogger(__name__))
+    processor.api_client = api
+    for stage in (processor.stage1, processor.stage2, processor.stage3, processor.stage4):
+        stage.api_client = api
+    return processor
+
+
+def test_concurrent_crawl_yields_same_nodes_as_recursive(tmp_path):
+    sequential = _processor(tmp_path / "seq", _TreeApi(), workers=1)
+    expected = [node.to_dict() for node in sequential.fetch_page_tree_recursive("root", "root")]
+
+    api = _TreeApi(seed=7)
+    concurrent = _processor(tmp_path / "par", api, workers=4)
+    actual = [node.to_dict() for node in concurrent.fetch_page_tree_concurrent("root", "root")]
+
+    assert actual == expected
+    assert [entry["page_id"] for entry in actual] == [
+        "root", "a", "a1", "a1x", "a2", "f", "f1", "shared", "b", "b1",
+    ]
+    assert actual[5]["type"] == "folder"
+    assert api.max_active > 1
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_pages_yaml_is_byte_identical_across_worker_counts(tmp_path, seed, capsys):
+    outputs = []
+    for workers in (1, 6):
+        processor = _processor(tmp_path / str(workers), _TreeApi(seed=seed + workers), workers=workers)
+        processor.run()
+        outputs.append((
+            (Path(processor.config.default_output_dir) / processor.config.pages_yaml_filename).read_bytes(),
+            capsys.readouterr().out,
+        ))
+    assert outputs[0] == outputs[1]
+
+
+def test_concurrent_crawl_propagates_fetch_errors_in_tree_order(tmp_path):
+    processor = _processor(tmp_path, _TreeApi(fail={"f1"}), workers=4)
+    seen = []
+
+    with pytest.raises(ApiError, match="boom f1"):
+        for node in processor.fetch_page_tree_concurrent("root", "root"):
+            seen.append(node.page_id)
+
+    assert seen == ["root", "a", "a1", "a1x", "a2", "f"]
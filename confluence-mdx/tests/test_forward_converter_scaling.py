@@ -0,0 +1,93 @@
+"""Forward converter 성능 회귀 테스트: 가장 큰 testcase 기준으로 변환 시간이 선형으로 증가하는지 확인한다.
+
+문서 크기(페이지를 k번 이어붙임)와 중첩 깊이(ac:layout 래퍼 d겹)를 늘려가며
+as_markdown() 시간만 측정한다 (XHTML 파싱 시간은 제외).
+중첩마다 subtree 전체를 다시 읽는 코드(예: debug 로그의 node.text)가 들어오면 깊이 비율이 깨진다.
+시간 비율 테스트는 공유 runner에서 흔들리므로 `pytest --run-timing`으로만 실행한다.
+"""
+
+import logging
+import time
+from pathlib import Path
+
+import pytest
+
+import converter.core as core
+from converter.core import ConfluenceToMarkdown
+
+_TESTCASES_DIR = Path(__file__).parent / "testcases"
+_LAYOUT_OPEN = "<ac:layout><ac:layout-section><ac:layout-cell>"
+_LAYOUT_CLOSE = "</ac:layout-cell></ac:layout-section></ac:layout>"
+
+
+def _largest_testcase_xhtml() -> str:
+    pages = sorted(
+        _TESTCASES_DIR.glob("*/page.xhtml"),
+        key=lambda path: path.stat().st_size,
+    )
+    return pages[-1].read_text(encoding="utf-8")
+
+
+def _conversion_seconds(xhtml: str, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        converter = ConfluenceToMarkdown(xhtml)
+        started = time.perf_counter()
+        converter.as_markdown()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+@pytest.fixture
+def warning_level():
+    root = logging.getLogger()
+    previous = root.level
+    root.setLevel(logging.WARNING)
+    yield
+    root.setLevel(previous)
+
+
+@pytest.mark.timing
+def test_conversion_time_is_linear_in_document_size(warning_level):
+    xhtml = _largest_testcase_xhtml()
+    _conversion_seconds(xhtml, repeat=1)  # warm up lazy initialisation
+
+    single = _conversion_seconds(xhtml)
+    eightfold = _conversion_seconds(xhtml * 8)
+
+    assert eightfold < single * 8 * 1.6
+
+
+@pytest.mark.timing
+def test_conversion_time_does_not_grow_with_nesting_depth(warning_level):
+    xhtml = _largest_testcase_xhtml()
+    _conversion_seconds(xhtml, repeat=1)
+
+    shallow = _conversion_seconds(_LAYOUT_OPEN + xhtml + _LAYOUT_CLOSE)
+    deep = _conversion_seconds(_LAYOUT_OPEN * 128 + xhtml + _LAYOUT_CLOSE * 128)
+
+    assert deep < shallow * 2
+
+
+def test_disabled_levels_do_not_build_log_messages(monkeypatch):
+    calls = []
+
+    def _counting(original):
+        def wrapper(node):
+            calls.append(original.__name__)
+            return original(node)
+        return wrapper
+
+    monkeypatch.setattr(core, "ancestors", _counting(core.ancestors))
+    monkeypatch.setattr(
+        core,
+        "print_node_with_properties",
+        _counting(core.print_node_with_properties),
+    )
+    root = logging.getLogger()
+    monkeypatch.setattr(root, "level", logging.CRITICAL)
+
+    for page in sorted(_TESTCASES_DIR.glob("*/page.xhtml")):
+        ConfluenceToMarkdown(page.read_text(encoding="utf-8")).as_markdown()
+
+    assert calls == []
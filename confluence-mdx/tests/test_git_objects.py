@@ -0,0 +1,121 @@
+"""git_objects 유닛 테스트 — 임시 git 저장소에서 cat-file --batch reader와 batched diff를 확인."""
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import sync_ko_commit
+from git_objects import GitObjectError, GitObjectReader
+
+
+def _git(repo, *args):
+    return subprocess.run(
+        ['git', '-c', 'user.name=t', '-c', 'user.email=t@example.com', *args],
+        cwd=repo, check=True, capture_output=True, text=True,
+    ).stdout.strip()
+
+
+@pytest.fixture
+def repo(tmp_path):
+    _git(tmp_path, 'init', '-q', '-b', 'main')
+    ko = tmp_path / 'src' / 'content' / 'ko'
+    ko.mkdir(parents=True)
+    (ko / 'a.mdx').write_text('# A\n\nfirst\n', encoding='utf-8')
+    (ko / 'b.mdx').write_text('# B\n', encoding='utf-8')
+    (ko / 'crlf.mdx').write_bytes('한국어\r\nline\r\n'.encode('utf-8'))
+    _git(tmp_path, 'add', '.')
+    _git(tmp_path, 'commit', '-q', '-m', 'base')
+    return tmp_path
+
+
+def test_reads_many_blobs_through_one_process(repo):
+    reader = GitObjectReader(repo)
+    try:
+        assert reader.read_text('main', 'src/content/ko/a.mdx') == '# A\n\nfirst\n'
+        process = reader._process
+        for _ in range(20):
+            assert reader.read_text('main', 'src/content/ko/b.mdx') == '# B\n'
+        assert reader._process is process
+        assert reader.resolve('main') == _git(repo, 'rev-parse', 'main')
+    finally:
+        reader.close()
+
+
+def test_resolved_ref_is_pinned_for_the_reader(repo):
+    reader = GitObjectReader(repo)
+    try:
+        assert reader.read_text('main', 'src/content/ko/b.mdx') == '# B\n'
+        (repo / 'src' / 'content' / 'ko' / 'b.mdx').write_text('# B2\n', encoding='utf-8')
+        _git(repo, 'commit', '-q', '-am', 'move main')
+
+        assert reader.read_text('main', 'src/content/ko/b.mdx') == '# B\n'
+        assert GitObjectReader(repo).read_text('main', 'src/content/ko/b.mdx') == '# B2\n'
+    finally:
+        reader.close()
+
+
+def test_text_matches_git_show_in_text_mode(repo):
+    reader = GitObjectReader(repo)
+    shown = subprocess.run(
+        ['git', 'show', 'main:src/content/ko/crlf.mdx'],
+        cwd=repo, capture_output=True, text=True, check=True,
+    ).stdout
+    assert reader.read_text('main', 'src/content/ko/crlf.mdx') == shown == '한국어\nline\n'
+    assert reader.read_blob('main', 'src/content/ko/crlf.mdx').endswith(b'\r\n')
+    reader.close()
+
+
+def test_invalid_refs_and_missing_paths(repo):
+    reader = GitObjectReader(repo)
+    assert reader.resolve('no-such-branch') is None
+    assert reader.resolve('--output=x') is None
+    with pytest.raises(GitObjectError, match='Invalid git ref'):
+        reader.read_text('no-such-branch', 'src/content/ko/a.mdx')
+    with pytest.raises(GitObjectError, match='does not exist'):
+        reader.read_text('main', 'src/content/ko/missing.mdx')
+    with pytest.raises(GitObjectError, match='not a file'):
+        reader.read_text('main', 'src/content/ko')
+    # 실패 뒤에도 같은 process로 계속 읽을 수 있다.
+    assert reader.read_text('main', 'src/content/ko/b.mdx') == '# B\n'
+    reader.close()
+
+
+def test_concurrent_reads_do_not_interleave(repo):
+    reader = GitObjectReader(repo)
+    paths = ['src/content/ko/a.mdx', 'src/content/ko/b.mdx'] * 25
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        contents = list(executor.map(lambda path: reader.read_text('main', path), paths))
+    assert contents == ['# A\n\nfirst\n', '# B\n'] * 25
+    reader.close()
+
+
+def test_sync_ko_commit_reads_whole_commit_with_one_diff(repo, monkeypatch):
+    ko = repo / 'src' / 'content' / 'ko'
+    (ko / 'a.mdx').write_text('# A\n\nchanged\nadded\n', encoding='utf-8')
+    (ko / 'new.mdx').write_text('new\n', encoding='utf-8')
+    (ko / 'b.mdx').unlink()
+    _git(repo, 'add', '-A')
+    _git(repo, 'commit', '-q', '-m', 'change')
+    monkeypatch.chdir(repo / 'src')  # pathspec는 repo root 기준이다
+
+    changes = {fc.ko_path: fc.changes for fc in sync_ko_commit.analyze_commit('HEAD')}
+
+    assert sorted(changes) == ['src/content/ko/a.mdx', 'src/content/ko/new.mdx']
+    assert [(c.line_number, c.new_content) for c in changes['src/content/ko/a.mdx']] == [
+        (3, 'changed'), (4, 'added'),
+    ]
+    assert [(c.line_number, c.new_content) for c in changes['src/content/ko/new.mdx']] == [(1, 'new')]
+
+
+def test_sync_ko_commit_handles_quoted_and_spaced_paths(repo, monkeypatch):
+    ko = repo / 'src' / 'content' / 'ko'
+    (ko / 'a b.mdx').write_text('spaced\n', encoding='utf-8')
+    (ko / 'quote"d.mdx').write_text('quoted\n', encoding='utf-8')
+    _git(repo, 'add', '-A')
+    _git(repo, 'commit', '-q', '-m', 'names')
+    monkeypatch.chdir(repo)
+
+    diffs = sync_ko_commit.split_commit_diff(sync_ko_commit.get_commit_diff('HEAD'))
+
+    assert sorted(diffs) == ['src/content/ko/a b.mdx', 'src/content/ko/quote"d.mdx']
+    assert sync_ko_commit._diff_header_path('"b/\\354\\225\\210 \\"x\\".mdx"') == 'b/안 "x".mdx'
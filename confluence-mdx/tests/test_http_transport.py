@@ -0,0 +1,204 @@
+"""http_transport 유닛 테스트 — 로컬 stub 서버로 connection 재사용, retry/backoff, 통계를 확인."""
+import logging
+import threading
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from fetch.api_client import ApiClient
+from fetch.config import Config
+from http_transport import HttpTransport, RetryPolicy, endpoint_name, parse_retry_after
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def _respond(self):
+        server = self.server
+        with server.lock:
+            server.client_ports.append(self.client_address[1])
+            server.methods.append(self.command)
+            script = server.scripts.get(self.path, [])
+            status, headers = script.pop(0) if script else (200, {})
+        length = int(self.headers.get("Content-Length") or 0)
+        if length:
+            self.rfile.read(length)
+        body = b'{"ok": true}'
+        self.send_response(status)
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = _respond
+    do_PUT = _respond
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+    httpd.lock = threading.Lock()
+    httpd.client_ports = []
+    httpd.methods = []
+    httpd.scripts = {}
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    httpd.url = f"http://127.0.0.1:{httpd.server_address[1]}"
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _transport(**retry):
+    delays = []
+    transport = HttpTransport(pool_size=2, retry=RetryPolicy(**retry), sleep=delays.append)
+    return transport, delays
+
+
+def test_reuses_one_connection(server):
+    transport, _ = _transport()
+    for page_id in range(5):
+        assert transport.get(f"{server.url}/api/v2/pages/{page_id}").json() == {"ok": True}
+    assert len(server.client_ports) == 5
+    assert len(set(server.client_ports)) == 1
+
+
+def test_retries_429_honouring_retry_after(server):
+    server.scripts["/api/v2/pages/1"] = [(429, {"Retry-After": "7"})]
+    transport, delays = _transport()
+
+    response = transport.get(f"{server.url}/api/v2/pages/1")
+
+    assert response.status_code == 200
+    assert delays == [7.0]
+    stats = transport.stats()["GET /api/v2/pages/{id}"]
+    assert (stats.requests, stats.retries, stats.failures) == (1, 1, 0)
+
+
+def test_retries_5xx_with_exponential_backoff(server):
+    server.scripts["/api/v2/pages/1"] = [(503, {}), (502, {}), (500, {})]
+    transport, delays = _transport(backoff_factor=0.5)
+
+    assert transport.get(f"{server.url}/api/v2/pages/1").status_code == 200
+    assert delays == [0.5, 1.0, 2.0]
+
+
+def test_gives_up_after_max_retries(server):
+    server.scripts["/api/v2/pages/1"] = [(503, {})] * 5
+    transport, delays = _transport(max_retries=2, max_backoff=1.5)
+
+    response = transport.get(f"{server.url}/api/v2/pages/1")
+
+    assert response.status_code == 503
+    assert delays == [1.0, 1.5]
+    stats = transport.stats()["GET /api/v2/pages/{id}"]
+    assert (stats.requests, stats.retries, stats.failures) == (1, 2, 1)
+
+
+def test_put_is_not_retried_on_5xx(server):
+    server.scripts["/api/v2/pages/1"] = [(503, {})]
+    transport, delays = _transport()
+
+    assert transport.request("PUT", f"{server.url}/api/v2/pages/1", json={}).status_code == 503
+    assert delays == []
+    assert server.methods == ["PUT"]
+
+
+def test_put_is_retried_on_429(server):
+    server.scripts["/api/v2/pages/1"] = [(429, {"Retry-After": "1"})]
+    transport, delays = _transport()
+
+    assert transport.request("PUT", f"{server.url}/api/v2/pages/1", json={}).status_code == 200
+    assert server.methods == ["PUT", "PUT"]
+
+
+def test_connection_errors_are_retried_then_raised():
+    transport, delays = _transport(max_retries=1)
+    with pytest.raises(requests.ConnectionError):
+        transport.get("http://127.0.0.1:1/api/v2/pages/1", timeout=1)
+    assert delays == [1.0]
+    assert transport.stats()["GET /api/v2/pages/{id}"].failures == 1
+
+
+@pytest.mark.parametrize("error", [requests.Timeout("timeout"), requests.ConnectionError("reset")])
+def test_put_is_sent_once_on_connection_error(monkeypatch, error):
+    """서버가 이미 처리했을 수 있는 version-bound PUT은 다시 보내지 않는다."""
+    transport, delays = _transport()
+    calls = []
+
+    def fail(method, url, **kwargs):
+        calls.append(method)
+        raise error
+
+    monkeypatch.setattr(transport.session, "request", fail)
+    with pytest.raises(type(error)):
+        transport.request("PUT", "https://example.atlassian.net/wiki/api/v2/pages/1", json={})
+    assert calls == ["PUT"]
+    assert delays == []
+    assert transport.stats()["PUT /wiki/api/v2/pages/{id}"].failures == 1
+
+
+def test_format_stats_lists_each_endpoint(server):
+    transport, _ = _transport()
+    transport.get(f"{server.url}/api/v2/pages/1")
+    transport.get(f"{server.url}/rest/api/content/1/child/attachment/att2/download")
+
+    lines = transport.format_stats()
+
+    assert len(lines) == 2
+    assert any(line.startswith("GET /api/v2/pages/{id}: 1 requests, 0 retries, 0 failures") for line in lines)
+
+
+@pytest.mark.parametrize("url, expected", [
+    ("https://x/wiki/api/v2/pages/123?body-format=storage", "GET /wiki/api/v2/pages/{id}"),
+    ("https://x/wiki/rest/api/content/1/child/attachment/att9/download",
+     "GET /wiki/rest/api/content/{id}/child/attachment/{id}/download"),
+    ("https://x/wiki/api/v2/pages/123/children", "GET /wiki/api/v2/pages/{id}/children"),
+])
+def test_endpoint_name(url, expected):
+    assert endpoint_name("get", url) == expected
+
+
+def test_parse_retry_after():
+    now = datetime(2024, 1, 1, 0, 0, 0, tzinfo=timezone.utc)
+    assert parse_retry_after("12") == 12.0
+    assert parse_retry_after("Mon, 01 Jan 2024 00:00:30 GMT", now=now) == 30.0
+    assert parse_retry_after("Sun, 31 Dec 2023 23:59:00 GMT", now=now) == 0.0
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
+
+
+def test_fetch_api_client_logs_stats(server, tmp_path, caplog):
+    client = ApiClient(Config(base_url=server.url, cache_dir=str(tmp_path)), logging.getLogger(__name__))
+    assert client.make_request(f"{server.url}/api/v2/pages/1", "V2 API page") == {"ok": True}
+
+    with caplog.at_level(logging.INFO):
+        client.log_request_stats()
+
+    assert "HTTP GET /api/v2/pages/{id}: 1 requests, 0 retries, 0 failures" in caplog.text
+
+
+def test_profile_counts_api_calls_and_bytes(server, monkeypatch):
+    import profiling
+
+    profiler = profiling.Profiler()
+    profiler.enable()
+    monkeypatch.setattr(profiling, "PROFILER", profiler)
+    server.scripts["/api/v2/pages/1"] = [(503, {})]
+    transport, _ = _transport()
+
+    transport.get(f"{server.url}/api/v2/pages/1")
+    transport.get(f"{server.url}/api/v2/pages/2")
+
+    assert profiler.snapshot()["counters"] == {
+        "api_calls": 2,
+        "api_retries": 1,
+        "bytes_downloaded": 2 * len(b'{"ok": true}'),
+    }
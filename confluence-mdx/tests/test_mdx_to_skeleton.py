@@ -19,8 +19,11 @@ from pathlib import Path
 
 from skeleton.cli import (
     ContentProtector,
+    ProtectedSection,
+    TextProcessor,
     process_yaml_frontmatter,
     convert_mdx_to_skeleton,
+    mdx_to_skeleton,
 )
 
 
@@ -1848,6 +1851,44 @@ def test_pattern_normalization_with_badge_tags():
             f"Input: {input_line!r}\nExpected: {expected!r}\nGot: {normalized!r}"
 
 
+# ============================================================================
+# Compiled Tokenizer Tests
+# ============================================================================
+
+def test_restore_all_matches_sequential_replacement():
+    """Placeholders inside a restored section are only restored for sections protected later"""
+    protector = ContentProtector()
+    protector.protected_sections = [
+        ProtectedSection('import a from "__URL_2__"', '__IMPORT_1__'),
+        ProtectedSection('/docs', '__URL_2__'),
+        ProtectedSection('x __IMPORT_1__', '__CODE_BLOCK_3__'),
+    ]
+    result = protector.restore_all('__IMPORT_1__ [t](__URL_2__) __CODE_BLOCK_3__ ___URL_2__')
+    assert result == 'import a from "/docs" [t](/docs) x __IMPORT_1__ _/docs'
+
+
+def test_tokenize_for_cleanup_token_types():
+    """Cleanup tokens keep their types; other characters are text tokens"""
+    tokens = TextProcessor()._tokenize_for_cleanup('_TEXT_ **_TEXT_**<br/>&lt;x`c`[_TEXT_](/a)*')
+    assert tokens == [
+        ('text_placeholder', '_TEXT_'), ('whitespace', ' '), ('bold', '**_TEXT_**'),
+        ('html_tag', '<br/>'), ('html_entity', '&lt;'), ('text', 'x'), ('code', '`c`'),
+        ('link', '[_TEXT_](/a)'), ('text', '*'),
+    ]
+
+
+def test_cleanup_separates_concatenated_patterns():
+    """Formatted placeholders written back to back are separated before merging"""
+    processor = TextProcessor()
+    assert processor._cleanup_text('**_TEXT_****_TEXT_**') == '**_TEXT_** **_TEXT_**'
+    assert processor._cleanup_text('_TEXT_`_TEXT_`<br/>_TEXT_') == '_TEXT_ `_TEXT_` <br/> _TEXT_'
+
+
+def test_wildcard_asterisk_is_text():
+    """*.csv is plain text, not the start of italic"""
+    assert mdx_to_skeleton('Upload *.csv files and **bold**text') == '_TEXT_ **_TEXT_**'
+
+
 # ============================================================================
 # Test Runner
 # ============================================================================
@@ -1865,6 +1906,10 @@ def run_all_tests():
         test_content_protector_extract_image_links,
         test_content_protector_extract_html_entities,
         test_content_protector_restore_all,
+        test_restore_all_matches_sequential_replacement,
+        test_tokenize_for_cleanup_token_types,
+        test_cleanup_separates_concatenated_patterns,
+        test_wildcard_asterisk_is_text,
         
         # TextProcessor tests
         test_text_processor_replace_text_in_content_empty,
@@ -0,0 +1,116 @@
+"""Unit tests for bin/pages_catalog.py."""
+
+import datetime
+import os
+
+import pytest
+import yaml
+
+import pages_catalog
+import profiling
+
+_PAGES = [
+    {'page_id': '100', 'title_orig': 'Root', 'path': ['root'], 'type': 'page'},
+    {'page_id': '200', 'title_orig': 'Guide', 'path': ['root', 'guide'], 'type': 'folder'},
+    {'page_id': '300', 'title_orig': 'Guide', 'path': ['root', 'guide'], 'type': 'page'},
+    {'page_id': 400, 'title_orig': '한글 문서', 'path': ['root', 'korean']},
+]
+
+
+@pytest.fixture
+def pages_yaml(tmp_path):
+    path = tmp_path / 'pages.qm.yaml'
+    path.write_text(yaml.safe_dump(_PAGES, allow_unicode=True), encoding='utf-8')
+    return path
+
+
+def _expected(path):
+    return yaml.safe_load(path.read_text(encoding='utf-8'))
+
+
+def _yaml_parses(func):
+    profiling.PROFILER.enable()
+    try:
+        profiling.take()
+        func()
+        return profiling.take()['counters'].get('catalog_yaml_parses', 0)
+    finally:
+        profiling.PROFILER.disable()
+
+
+def test_load_pages_matches_pure_python_loader(pages_yaml):
+    expected = _expected(pages_yaml)
+    assert pages_catalog.load_pages(pages_yaml) == expected
+    assert pages_catalog.safe_load(pages_yaml.read_text(encoding='utf-8')) == expected
+
+
+def test_load_pages_returns_fresh_objects(pages_yaml):
+    first = pages_catalog.load_pages(pages_yaml)
+    first[0]['title_orig'] = 'changed'
+
+    assert pages_catalog.load_pages(pages_yaml)[0]['title_orig'] == 'Root'
+
+
+def test_load_pages_reuses_the_parsed_catalog(pages_yaml):
+    assert _yaml_parses(lambda: pages_catalog.load_pages(pages_yaml)) == 1
+    # mtime/size가 같으면 메모리 사본을 쓴다
+    assert _yaml_parses(lambda: pages_catalog.load_pages(pages_yaml)) == 0
+    assert pages_catalog.load_pages(pages_yaml) == _expected(pages_yaml)
+
+
+def test_load_pages_rereads_a_changed_catalog(pages_yaml):
+    pages_catalog.load_pages(pages_yaml)
+
+    pages_yaml.write_text(yaml.safe_dump(_PAGES[:1]), encoding='utf-8')
+    stat = pages_yaml.stat()
+    os.utime(pages_yaml, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert _yaml_parses(lambda: pages_catalog.load_pages(pages_yaml)) == 1
+    assert pages_catalog.load_pages(pages_yaml) == _PAGES[:1]
+
+
+def test_load_pages_writes_nothing_to_disk(pages_yaml):
+    before = sorted(pages_yaml.parent.iterdir())
+    pages_catalog.load_pages(pages_yaml)
+    assert sorted(pages_yaml.parent.iterdir()) == before
+
+
+def test_load_pages_returns_unmarshallable_content_uncached(tmp_path):
+    path = tmp_path / 'pages.qm.yaml'
+    path.write_text("- page_id: '100'\n  created: 2024-01-02\n", encoding='utf-8')
+
+    assert pages_catalog.load_pages(path) == _expected(path)
+    assert pages_catalog.load_pages(path)[0]['created'] == datetime.date(2024, 1, 2)
+    assert str(path) not in pages_catalog._loaded
+
+
+def test_load_pages_propagates_errors(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        pages_catalog.load_pages(tmp_path / 'missing.yaml')
+
+    broken = tmp_path / 'broken.yaml'
+    broken.write_text('- [unclosed\n', encoding='utf-8')
+    with pytest.raises(yaml.YAMLError):
+        pages_catalog.load_pages(broken)
+
+
+def test_pages_index_lookups(pages_yaml):
+    index = pages_catalog.load_index(pages_yaml)
+
+    assert len(index) == 4
+    assert index.by_id('100')['title_orig'] == 'Root'
+    assert index.by_id(400)['path'] == ['root', 'korean']
+    assert index.by_id('400')['title_orig'] == '한글 문서'
+    # 같은 key가 여러 번 나오면 catalog 순서상 첫 항목
+    assert index.by_path(['root', 'guide'])['page_id'] == '200'
+    assert index.by_path(('root',))['page_id'] == '100'
+    assert index.by_id('999') is None
+    assert index.by_path(['nowhere']) is None
+
+
+def test_clear_cache_forgets_loaded_catalogs(pages_yaml):
+    pages_catalog.load_pages(pages_yaml)
+
+    pages_catalog.clear_cache()
+    assert pages_catalog._loaded == {}
+    assert _yaml_parses(lambda: pages_catalog.load_pages(pages_yaml)) == 1
@@ -0,0 +1,135 @@
+"""Unit tests for bin/profiling.py and the --profile instrumentation of the CLIs."""
+
+import json
+import pstats
+
+import pytest
+
+import profiling
+from convert_all import convert_all
+from test_convert_all_folders import _node, _write_convertible_page, _write_yaml
+
+
+@pytest.fixture
+def profiler(monkeypatch):
+    """An enabled profiler standing in for the process-wide one."""
+    profiler = profiling.Profiler()
+    profiler.enable()
+    monkeypatch.setattr(profiling, "PROFILER", profiler)
+    return profiler
+
+
+def test_disabled_profiler_records_nothing(monkeypatch):
+    profiler = profiling.Profiler()
+    monkeypatch.setattr(profiling, "PROFILER", profiler)
+
+    with profiling.stage("convert.page"):
+        profiling.count("pages_converted")
+    assert profiling.timed("skeleton.build")(str.upper)("a") == "A"
+
+    assert profiler.snapshot() == {"stages": {}, "counters": {}}
+
+
+def test_stages_and_counters(profiler):
+    @profiling.timed("skeleton.build")
+    def build(text):
+        return text.upper()
+
+    for _ in range(3):
+        with profiling.stage("convert.page"):
+            profiling.count("pages_converted")
+    assert build("a") == "A"
+    profiling.count("bytes_downloaded", 10)
+    with pytest.raises(RuntimeError):
+        with profiling.stage("convert.page"):
+            raise RuntimeError("failed pages are timed too")
+
+    snapshot = profiler.snapshot()
+    assert snapshot["counters"] == {"bytes_downloaded": 10, "pages_converted": 3}
+    assert snapshot["stages"]["convert.page"]["calls"] == 4
+    assert snapshot["stages"]["skeleton.build"]["calls"] == 1
+    stats = snapshot["stages"]["convert.page"]
+    assert 0 <= stats["max_seconds"] <= stats["seconds"]
+
+
+def test_take_and_merge(profiler):
+    worker = profiling.Profiler()
+    worker.enable()
+    with worker.stage("convert.page"):
+        worker.count("pages_converted")
+    taken = worker.snapshot(reset=True)
+    assert worker.snapshot() == {"stages": {}, "counters": {}}
+
+    profiling.count("pages_converted")
+    profiling.merge(taken)
+    profiling.merge(taken)
+    profiling.merge(None)
+
+    snapshot = profiler.snapshot()
+    assert snapshot["counters"] == {"pages_converted": 3}
+    assert snapshot["stages"]["convert.page"]["calls"] == 2
+
+
+def test_report_and_pstats_dump(profiler, tmp_path):
+    report_path = tmp_path / "profile.json"
+    pstats_path = tmp_path / "profile.pstats"
+    profiling.start(
+        "fetch_cli", str(report_path), str(pstats_path),
+        argv=["--remote", "--api-token", "secret", "--email=me@example.com", "--api-token=secret"],
+    )
+    with profiling.stage("fetch.stage1_api_data"):
+        profiling.count("api_calls", 2)
+
+    data = profiling.finish()
+
+    assert profiling.finish() is None
+    assert not profiler.enabled
+    assert json.loads(report_path.read_text()) == data
+    assert data["tool"] == "fetch_cli"
+    assert data["argv"] == ["--remote", "--api-token", "***", "--email=me@example.com", "--api-token=***"]
+    assert data["counters"] == {"api_calls": 2}
+    assert data["stages"]["fetch.stage1_api_data"]["calls"] == 1
+    assert data["wall_seconds"] >= data["stages"]["fetch.stage1_api_data"]["seconds"]
+    assert pstats.Stats(str(pstats_path)).total_calls > 0
+
+
+def test_report_to_stderr(profiler, capsys):
+    profiling.start("skeleton", argv=[])
+    profiling.count("skeleton_files")
+    profiling.finish()
+
+    report = json.loads(capsys.readouterr().err)
+    assert report["counters"] == {"skeleton_files": 1}
+
+
+@pytest.mark.parametrize("jobs", [0, 2])
+def test_convert_all_profile(profiler, tmp_path, jobs):
+    """Counters of worker processes reach the parent report; subprocess runs count their spawns."""
+    var_dir = tmp_path / "var"
+    pages_yaml = var_dir / "pages.qm.yaml"
+    pages = [
+        _node("root", "page", "Root", ["root"]),
+        _node("page-a", "page", "Page A", ["page-a"]),
+        _node("page-b", "page", "Page B", ["page-b"]),
+    ]
+    _write_yaml(pages_yaml, pages)
+    for page in pages[1:]:
+        _write_convertible_page(var_dir, page["page_id"], page["title"])
+        _write_yaml(var_dir / page["page_id"] / "children.v2.yaml", {"results": []})
+
+    failures = convert_all(
+        pages, str(var_dir), str(tmp_path / "output"), str(tmp_path / "public"), "warning",
+        pages_yaml=str(pages_yaml), jobs=jobs,
+    )
+
+    assert failures == 0
+    snapshot = profiler.snapshot()
+    if jobs:
+        assert snapshot["counters"]["pages_converted"] == 2
+        assert snapshot["counters"]["soup_parses"] >= 2
+        assert snapshot["stages"]["convert.page"]["calls"] == 2
+        assert "subprocesses" not in snapshot["counters"]
+    else:
+        assert snapshot["counters"]["subprocesses"] == 2
+        assert snapshot["stages"]["convert_all.page_subprocess"]["calls"] == 2
+    assert snapshot["stages"]["convert_all.navigation"]["calls"] == 1
@@ -0,0 +1,78 @@
+"""batch_service 유닛 테스트 — --jobs 병렬 검증의 결과 순서, limit 처리, 순차 발행을 확인."""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from reverse_sync.batch_service import BatchRuntime, run_batch
+
+FILES = [f"src/content/ko/page-{index}.mdx" for index in range(8)]
+FAILING = {"src/content/ko/page-1.mdx", "src/content/ko/page-4.mdx", "src/content/ko/page-6.mdx"}
+
+
+def _verify(request, **kwargs):
+    """파일 번호의 역순으로 늦게 끝나도록 하여 완료 순서를 파일 순서와 다르게 만든다."""
+    ko_path = request.improved_mdx.split(":", 1)[1]
+    index = FILES.index(ko_path)
+    time.sleep((len(FILES) - index) * 0.005)
+    if ko_path == "src/content/ko/page-3.mdx":
+        raise ValueError("page not found")
+    status = "fail" if ko_path in FAILING else "verified_local" if kwargs else "pass"
+    return {"status": status, "page_id": f"p{index}", "push_eligible": bool(kwargs)}
+
+
+def _runtime(emitted, published=None, *, workers="thread"):
+    def publish_one(page_id, **kwargs):
+        published.append((page_id, threading.current_thread() is threading.main_thread()))
+        return {"status": "remote_verified", "version": 2}
+
+    return BatchRuntime(
+        get_changed_files=lambda branch: list(FILES),
+        verify_one=_verify,
+        ensure_config=lambda: object(),
+        publish_one=publish_one,
+        confirm=lambda prompt: True,
+        is_success_status=lambda status: status in ("pass", "verified_local"),
+        emit=lambda message, **kwargs: emitted.append(message),
+        **({"make_executor": ThreadPoolExecutor} if workers == "thread" else {}),
+    )
+
+
+def _statuses(results):
+    return [(result["file"], result["status"]) for result in results]
+
+
+@pytest.mark.parametrize("workers", ["thread", "process"])
+def test_parallel_results_match_sequential_order(workers):
+    sequential = run_batch("topic", runtime=_runtime([]))
+    emitted = []
+
+    parallel = run_batch("topic", runtime=_runtime(emitted, workers=workers), jobs=4)
+
+    assert _statuses(parallel) == _statuses(sequential)
+    assert parallel[3] == {"file": FILES[3], "status": "error", "error": "page not found"}
+    progress = [message for message in emitted if message.startswith("[")]
+    assert sorted(progress) == sorted(
+        f"[{index}/{len(FILES)}] {result['file']} ... {result['status']}"
+        for index, result in enumerate(sequential, 1)
+    )
+
+
+def test_parallel_failures_only_limit_stops_at_same_file():
+    sequential = run_batch("topic", runtime=_runtime([]), failures_only=True, limit=2)
+
+    parallel = run_batch("topic", runtime=_runtime([]), failures_only=True, limit=2, jobs=3)
+
+    assert _statuses(parallel) == _statuses(sequential)
+    assert parallel[-1]["file"] == FILES[3]
+
+
+def test_parallel_verification_publishes_sequentially_in_file_order():
+    published = []
+
+    results = run_batch("topic", runtime=_runtime([], published), push=True, yes=True, jobs=4)
+
+    assert [page_id for page_id, _ in published] == ["p0", "p2", "p5", "p7"]
+    assert all(on_main_thread for _, on_main_thread in published)
+    assert [result["push"]["status"] for result in results if "push" in result] == ["remote_verified"] * 4
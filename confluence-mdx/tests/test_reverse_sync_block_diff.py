@@ -153,3 +153,18 @@ def test_mixed_add_delete_modify():
     types = {c.change_type for c in changes}
     # 변경이 감지되어야 함
     assert len(changes) >= 2
+
+
+def test_large_page_single_change():
+    """200개 이상의 블록에서도 반복되는 블록을 junk로 취급하지 않는다."""
+    body = "## Section\n\n본문입니다.\n\n* 항목\n\n"
+    original_mdx = "# Title\n\n" + body * 60
+    improved_mdx = "# Title\n\n" + body.replace("본문입니다.", "수정된 본문입니다.") + body * 59
+    original = parse_mdx_blocks(original_mdx)
+    improved = parse_mdx_blocks(improved_mdx)
+    assert len(original) >= 200
+    changes, alignment = diff_blocks(original, improved)
+
+    assert len(changes) == 1
+    assert "수정된 본문입니다." in changes[0].new_block.content
+    assert len(alignment) == len(original)
@@ -893,6 +893,7 @@ def test_do_verify_batch_delegates_to_batch_service(monkeypatch):
         lenient=True,
         no_normalize=True,
         prepare_push=True,
+        jobs=4,
     )
 
     runtime = captured["kwargs"].pop("runtime")
@@ -907,6 +908,7 @@ def test_do_verify_batch_delegates_to_batch_service(monkeypatch):
             "lenient": True,
             "no_normalize": True,
             "prepare_push": True,
+            "jobs": 4,
         },
     }
     assert runtime.get_changed_files is _get_changed_ko_mdx_files
@@ -2361,3 +2363,61 @@ class TestCleanArtifactsPreservesBackup:
         assert (var_dir / 'reverse-sync.backup.xhtml').exists()
         assert not (var_dir / 'reverse-sync.diff.yaml').exists()
         assert not (var_dir / 'reverse-sync.patched.xhtml').exists()
+
+
+# --- in-process forward converter ---
+
+TESTCASES_DIR = Path(__file__).parent / "testcases"
+
+
+@pytest.fixture
+def forward_convert_var(tmp_path, monkeypatch):
+    """testcase 1454342158을 var/ 구조로 복사하고 _PROJECT_DIR을 patch."""
+    import shutil
+
+    monkeypatch.setattr('reverse_sync_cli._PROJECT_DIR', tmp_path)
+    page_id = "1454342158"
+    var_dir = tmp_path / "var" / page_id
+    var_dir.mkdir(parents=True)
+    shutil.copy2(TESTCASES_DIR / "pages.yaml", tmp_path / "var" / "pages.qm.yaml")
+    for name in ("page.xhtml", "page.v1.yaml"):
+        shutil.copy2(TESTCASES_DIR / page_id / name, var_dir / name)
+    return page_id, var_dir
+
+
+def test_forward_convert_in_process_matches_subprocess(forward_convert_var, monkeypatch):
+    from reverse_sync_cli import _forward_convert
+
+    page_id, var_dir = forward_convert_var
+    outputs = {}
+    for mode in ("in-process", "subprocess"):
+        monkeypatch.setenv("REVERSE_SYNC_FORWARD_CONVERTER", mode)
+        (var_dir / "mapping.yaml").unlink(missing_ok=True)
+        mdx = _forward_convert(str(var_dir / "page.xhtml"), str(var_dir / f"{mode}.mdx"),
+                               page_id, language="ko")
+        assert mdx == (var_dir / f"{mode}.mdx").read_text()
+        outputs[mode] = (mdx, (var_dir / "mapping.yaml").read_text())
+
+    assert outputs["in-process"] == outputs["subprocess"]
+    assert outputs["in-process"][0].startswith("---\n")
+
+
+def test_forward_convert_in_process_reuses_catalog(forward_convert_var):
+    from reverse_sync_cli import _forward_catalog, _forward_convert_in_process
+
+    page_id, var_dir = forward_convert_var
+    pages_yaml = str(var_dir.parent / "pages.qm.yaml")
+    _forward_convert_in_process(str(var_dir / "page.xhtml"), str(var_dir / "a.mdx"), page_id)
+    catalog = _forward_catalog(pages_yaml)
+    _forward_convert_in_process(str(var_dir / "page.xhtml"), str(var_dir / "b.mdx"), page_id)
+
+    assert _forward_catalog(pages_yaml) is catalog
+    assert (var_dir / "a.mdx").read_text() == (var_dir / "b.mdx").read_text()
+
+
+def test_forward_convert_in_process_reports_failure(forward_convert_var):
+    from reverse_sync_cli import _forward_convert_in_process
+
+    page_id, var_dir = forward_convert_var
+    with pytest.raises(RuntimeError, match="Forward converter failed: .*Error during conversion"):
+        _forward_convert_in_process(str(var_dir / "missing.xhtml"), str(var_dir / "out.mdx"), page_id)
@@ -0,0 +1,92 @@
+"""document_cache 유닛 테스트 — 검증 한 번에서 같은 XHTML을 한 번만 파싱하는지 확인."""
+import shutil
+from pathlib import Path
+
+import bs4
+import pytest
+import yaml
+
+from reverse_sync.document_cache import mutable_xhtml, parse_scope, parse_xhtml
+from reverse_sync_cli import MdxSource, run_verify
+
+TESTS_DIR = Path(__file__).parent
+CASE_ID = "1177321474"
+
+
+def test_parse_outside_scope_is_fresh_every_time():
+    assert parse_xhtml("<p>a</p>") is not parse_xhtml("<p>a</p>")
+
+
+def test_scope_shares_reads_and_copies_for_writes():
+    with parse_scope() as documents:
+        shared = parse_xhtml("<p>a</p>")
+        assert parse_xhtml("<p>a</p>") is shared
+
+        owned = mutable_xhtml("<p>a</p>")
+        owned.p.string = "changed"
+        assert str(parse_xhtml("<p>a</p>")) == "<p>a</p>"
+
+        assert str(mutable_xhtml("<p>b</p>")) == "<p>b</p>"
+
+    assert documents.stats.to_dict() == {"parses": 2, "reuses": 2, "copies": 1}
+    assert parse_xhtml("<p>a</p>") is not shared
+
+
+def test_nested_scope_restores_outer_scope():
+    with parse_scope() as outer:
+        parse_xhtml("<p>a</p>")
+        with parse_scope() as inner:
+            parse_xhtml("<p>a</p>")
+        parse_xhtml("<p>a</p>")
+
+    assert (outer.stats.parses, outer.stats.reuses) == (1, 1)
+    assert (inner.stats.parses, inner.stats.reuses) == (1, 0)
+
+
+@pytest.fixture
+def counted_parses(monkeypatch):
+    """BeautifulSoup에 넘겨진 markup별 파싱 횟수를 센다."""
+    counts = {}
+    original_init = bs4.BeautifulSoup.__init__
+
+    def counting_init(self, markup="", *args, **kwargs):
+        if isinstance(markup, str):
+            counts[markup] = counts.get(markup, 0) + 1
+        original_init(self, markup, *args, **kwargs)
+
+    monkeypatch.setattr(bs4.BeautifulSoup, "__init__", counting_init)
+    return counts
+
+
+def test_verification_parses_each_page_document_once(tmp_path, monkeypatch, counted_parses):
+    monkeypatch.setattr("reverse_sync_cli._PROJECT_DIR", tmp_path)
+    monkeypatch.setenv("REVERSE_SYNC_FORWARD_CONVERTER", "in-process")
+    case_dir = TESTS_DIR / "reverse-sync" / CASE_ID
+    var_dir = tmp_path / "var" / CASE_ID
+    var_dir.mkdir(parents=True)
+    shutil.copy2(TESTS_DIR / "testcases" / "pages.yaml", tmp_path / "var" / "pages.qm.yaml")
+    for name in ("page.xhtml", "page.v1.yaml"):
+        shutil.copy2(case_dir / name, var_dir / name)
+
+    result = run_verify(
+        page_id=CASE_ID,
+        original_src=MdxSource((case_dir / "original.mdx").read_text(), "original.mdx"),
+        improved_src=MdxSource((case_dir / "improved.mdx").read_text(), "improved.mdx"),
+        page_dir=str(case_dir),
+    )
+
+    # test catalog에는 링크 대상 page가 없어 roundtrip 판정은 다를 수 있지만, 파싱 경로는 같다.
+    assert result["status"] in ("pass", "fail")
+    page_xhtml = (case_dir / "page.xhtml").read_text()
+    patched_xhtml = (var_dir / "reverse-sync.patched.xhtml").read_text()
+    assert counted_parses[page_xhtml] == 1
+    # forward converter는 자체 parser로 한 번 더 읽는다.
+    assert counted_parses[patched_xhtml] <= 2
+
+    # 그 밖의 문서(block fragment 등)도 두 번 파싱되지 않는다.
+    assert [markup[:60] for markup, count in counted_parses.items()
+            if count > 1 and markup != patched_xhtml] == []
+
+    stats = yaml.safe_load((var_dir / "reverse-sync.parse-stats.yaml").read_text())
+    assert stats["parses"] <= len(counted_parses)
+    assert stats["reuses"] > 0
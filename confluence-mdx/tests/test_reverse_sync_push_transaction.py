@@ -709,7 +709,7 @@ def test_v2_snapshot_uses_one_response_for_version_title_and_body():
     }
     response.raise_for_status.return_value = None
 
-    with patch("reverse_sync.confluence_client.requests.get", return_value=response) as get:
+    with patch("reverse_sync.confluence_client.TRANSPORT.get", return_value=response) as get:
         snapshot = get_page_snapshot(
             ConfluenceConfig(base_url="https://example.atlassian.net/wiki", email="e", api_token="t"),
             "123",
@@ -767,7 +767,7 @@ def test_v2_attachment_catalog_reads_every_page():
     second.links = {}
 
     with patch(
-        "reverse_sync.confluence_client.requests.get",
+        "reverse_sync.confluence_client.TRANSPORT.get",
         side_effect=[first, second],
     ) as get:
         catalog = get_attachment_catalog(
@@ -809,7 +809,7 @@ def test_v2_attachment_catalog_rejects_cross_page_item():
     response.links = {}
 
     with patch(
-        "reverse_sync.confluence_client.requests.get",
+        "reverse_sync.confluence_client.TRANSPORT.get",
         return_value=response,
     ), pytest.raises(InvalidDependencySnapshotError):
         get_attachment_catalog(
@@ -834,7 +834,7 @@ def test_v2_attachment_catalog_rejects_cross_origin_pagination():
     }
 
     with patch(
-        "reverse_sync.confluence_client.requests.get",
+        "reverse_sync.confluence_client.TRANSPORT.get",
         return_value=response,
     ), pytest.raises(InvalidDependencySnapshotError, match="범위를 벗어납니다"):
         get_attachment_catalog(
@@ -861,7 +861,7 @@ def test_linked_page_not_found_maps_to_dependency_failure():
     )
 
     with patch(
-        "reverse_sync.confluence_client.requests.get",
+        "reverse_sync.confluence_client.TRANSPORT.get",
         return_value=response,
     ), pytest.raises(InvalidDependencySnapshotError) as exc_info:
         gateway.get_page_identity("456")
@@ -900,7 +900,7 @@ def test_invalid_v2_snapshot_is_fail_closed(payload):
     response.json.return_value = payload
     response.raise_for_status.return_value = None
 
-    with patch("reverse_sync.confluence_client.requests.get", return_value=response):
+    with patch("reverse_sync.confluence_client.TRANSPORT.get", return_value=response):
         with pytest.raises(InvalidPageSnapshotError):
             get_page_snapshot(
                 ConfluenceConfig(base_url="https://example.atlassian.net/wiki", email="e", api_token="t"),
@@ -914,7 +914,7 @@ def test_v2_snapshot_maps_conflict_without_retry():
     response.status_code = 409
     response.raise_for_status.side_effect = requests.HTTPError(response=response)
 
-    with patch("reverse_sync.confluence_client.requests.get", return_value=response) as get:
+    with patch("reverse_sync.confluence_client.TRANSPORT.get", return_value=response) as get:
         with pytest.raises(VersionConflictError):
             get_page_snapshot(
                 ConfluenceConfig(base_url="https://example.atlassian.net/wiki", email="e", api_token="t"),
@@ -942,7 +942,7 @@ def test_v2_active_draft_adapter_parses_draft_snapshot():
     }
     response.raise_for_status.return_value = None
 
-    with patch("reverse_sync.confluence_client.requests.get", return_value=response) as get:
+    with patch("reverse_sync.confluence_client.TRANSPORT.get", return_value=response) as get:
         snapshot = get_active_draft(
             ConfluenceConfig(base_url="https://example.atlassian.net/wiki", email="e", api_token="t"),
             "123",
@@ -960,7 +960,7 @@ def test_v2_active_draft_adapter_returns_none_on_not_found():
     response = MagicMock()
     response.status_code = 404
 
-    with patch("reverse_sync.confluence_client.requests.get", return_value=response) as get:
+    with patch("reverse_sync.confluence_client.TRANSPORT.get", return_value=response) as get:
         snapshot = get_active_draft(
             ConfluenceConfig(base_url="https://example.atlassian.net/wiki", email="e", api_token="t"),
             "123",
@@ -986,7 +986,7 @@ def test_v2_update_uses_exact_requested_version_and_candidate_once():
     )
 
     with patch(
-        "reverse_sync.confluence_client.requests.request",
+        "reverse_sync.confluence_client.TRANSPORT.request",
         return_value=response,
     ) as request:
         update_page(
@@ -1025,7 +1025,7 @@ def test_v2_update_maps_provider_errors(status_code, expected_error):
     )
 
     with patch(
-        "reverse_sync.confluence_client.requests.request",
+        "reverse_sync.confluence_client.TRANSPORT.session.request",
         return_value=response,
     ) as request:
         with pytest.raises(expected_error):
@@ -1047,8 +1047,9 @@ def test_v2_update_maps_network_error_without_retry():
         api_token="t",
     )
 
+    # retry loop은 TRANSPORT.request 안에 있으므로 그 아래의 session을 patch한다.
     with patch(
-        "reverse_sync.confluence_client.requests.request",
+        "reverse_sync.confluence_client.TRANSPORT.session.request",
         side_effect=requests.Timeout("timeout"),
     ) as request:
         with pytest.raises(NetworkError):
@@ -0,0 +1,81 @@
+"""xpath_index 유닛 테스트 — 간이 XPath 해석과 부모별 자식 표의 1회 구축을 확인."""
+from pathlib import Path
+
+import pytest
+from bs4 import BeautifulSoup
+
+import reverse_sync.xpath_index as xpath_index
+from reverse_sync.document_cache import parse_scope
+from reverse_sync.mapping_recorder import record_mapping
+from reverse_sync.xpath_index import XPathIndex, document_xpath_index
+
+TESTCASES_DIR = Path(__file__).parent / "testcases"
+
+PAGE = (
+    "<h2>Title</h2>"
+    "<p>first</p>"
+    '<ac:structured-macro ac:name="info"><ac:rich-text-body>'
+    "<p>info one</p><ul><li><p>item</p></li><li><p>second item</p></li></ul>"
+    "</ac:rich-text-body></ac:structured-macro>"
+    "<ac:layout><ac:layout-section><ac:layout-cell>"
+    "<p>in layout</p>"
+    "</ac:layout-cell></ac:layout-section></ac:layout>"
+    '<ac:structured-macro ac:name="code"><ac:plain-text-body>x</ac:plain-text-body></ac:structured-macro>'
+    '<ac:structured-macro ac:name="info"><ac:rich-text-body><p>info two</p></ac:rich-text-body></ac:structured-macro>'
+)
+
+
+@pytest.mark.parametrize("xpath, text", [
+    ("h2[1]", "Title"),
+    ("p[2]", "in layout"),
+    ("macro-info[2]", "info two"),
+    ("ac:structured-macro[2]", "x"),
+    ("macro-info[1]/p[1]", "info one"),
+    ("macro-info[1]/ul[1]/li[2]", "second item"),
+    ("macro-info[1]/ul[1]/li[2]/p[1]", "second item"),
+])
+def test_resolves_simplified_xpaths(xpath, text):
+    element = XPathIndex(BeautifulSoup(PAGE, "html.parser")).resolve(xpath)
+    assert element is not None and element.get_text() == text
+
+
+@pytest.mark.parametrize("xpath", ["p[3]", "macro-note[1]", "macro-code[1]/p[1]", "h2[1]/p[1]", "bogus"])
+def test_missing_targets_resolve_to_none(xpath):
+    assert XPathIndex(BeautifulSoup(PAGE, "html.parser")).resolve(xpath) is None
+
+
+def test_each_parent_is_scanned_once(monkeypatch):
+    scanned = []
+    original = xpath_index._index_children
+
+    def counting(parent):
+        scanned.append(parent.name)
+        return original(parent)
+
+    monkeypatch.setattr(xpath_index, "_index_children", counting)
+    index = XPathIndex(BeautifulSoup(PAGE, "html.parser"))
+    for _ in range(3):
+        for xpath in ("h2[1]", "p[1]", "macro-info[1]/p[1]", "macro-info[1]/ul[1]"):
+            assert index.resolve(xpath) is not None
+
+    assert scanned == ["[document]", "ac:rich-text-body"]
+
+
+def test_document_index_is_shared_within_scope():
+    with parse_scope():
+        assert document_xpath_index(PAGE) is document_xpath_index(PAGE)
+    assert document_xpath_index(PAGE) is not document_xpath_index(PAGE)
+
+
+@pytest.mark.parametrize("case_id", ["544113141", "544381877", "1454342158"])
+def test_every_recorded_mapping_xpath_resolves(case_id):
+    page_path = TESTCASES_DIR / case_id / "page.xhtml"
+    if not page_path.exists():
+        pytest.skip(f"testcase {case_id} not found")
+    page_xhtml = page_path.read_text(encoding="utf-8")
+    index = XPathIndex(BeautifulSoup(page_xhtml, "html.parser"))
+
+    for mapping in record_mapping(page_xhtml):
+        element = index.resolve(mapping.xhtml_xpath)
+        assert element is not None, mapping.xhtml_xpath
+        assert element.get_text().strip() or not mapping.xhtml_plain_text
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Unit tests for run_testcases.py
+
+Usage:
+    cd confluence-mdx/tests
+    python3 -m pytest test_run_testcases.py -v
+"""
+
+import io
+import logging
+
+import pytest
+
+import run_testcases
+from run_testcases import Fixtures, run_all, run_case
+from skeleton.cli import mdx_to_skeleton
+
+
+@pytest.fixture
+def skeleton_cases(tmp_path, monkeypatch):
+    """A test directory with a passing, a failing and an incomplete skeleton case"""
+    for case_id, text in {'100': '# 제목\n\n본문\n', '200': '* 항목\n', '300': '# 제목\n'}.items():
+        case_dir = tmp_path / 'cases' / case_id
+        case_dir.mkdir(parents=True)
+        (case_dir / 'output.mdx').write_text(text, encoding='utf-8')
+    (tmp_path / 'cases' / '100' / 'expected.skel.mdx').write_text(mdx_to_skeleton('# 제목\n\n본문\n'))
+    (tmp_path / 'cases' / '200' / 'expected.skel.mdx').write_text('_TEXT_\n')
+    monkeypatch.chdir(tmp_path)
+    return Fixtures('cases', logging.WARNING, verbose=False)
+
+
+def test_run_case_reports_differences(skeleton_cases):
+    """A failing case carries the unified diff against its expectation"""
+    assert run_case('skeleton', '100', skeleton_cases).passed
+
+    result = run_case('skeleton', '200', skeleton_cases)
+    assert not result.passed
+    assert '--- cases/200/expected.skel.mdx\n+++ cases/200/output.skel.mdx\n' in result.output
+    assert '-_TEXT_\n+* _TEXT_\n' in result.output
+
+
+@pytest.mark.parametrize('jobs', [1, 2])
+def test_run_all_prints_results_in_case_order(skeleton_cases, capsys, jobs):
+    """Cases without inputs are left out; results come in order with timings, failures with output"""
+    case_ids = run_testcases._case_ids(run_testcases.CASE_TYPES['skeleton'], 'cases')
+    assert case_ids == ['100', '200']
+
+    assert run_all('skeleton', case_ids, skeleton_cases, jobs) == 1
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[:3] == ['Running Skeleton tests...', '', 'Testing case: cases/100']
+    assert lines[3].startswith(f'  {run_testcases.GREEN}OK{run_testcases.NC} (')
+    assert lines[4] == 'Testing case: cases/200'
+    assert lines[5].startswith(f'  {run_testcases.RED}FAILED{run_testcases.NC} (')
+    assert '+* _TEXT_' in lines
+    assert lines[-1] == 'Results: 1 passed, 1 failed'
+
+
+def test_expected_status_groups_no_changes_with_pass(tmp_path):
+    """no_changes satisfies expected_status pass; other statuses must match exactly"""
+    case_dir = tmp_path / '100'
+    case_dir.mkdir()
+    fixtures = Fixtures(str(tmp_path), logging.WARNING, verbose=False,
+                        expected_statuses={'100': 'pass', '200': None})
+
+    for status, expected in [('no_changes', True), ('pass', True), ('fail', False)]:
+        (case_dir / 'output.reverse-sync.result.yaml').write_text(f'status: {status}\n')
+        out = io.StringIO()
+        assert run_testcases._check_expected_status('100', case_dir, fixtures, out) is expected
+    assert 'expected_status=pass 이지만 실제 status=fail' in out.getvalue()
+    assert run_testcases._check_expected_status('200', case_dir, fixtures, out)
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Unit tests for skeleton/benchmark.py
+
+Usage:
+    cd confluence-mdx/tests
+    python3 -m pytest test_skeleton_benchmark.py -v
+"""
+
+import sys
+
+import skeleton.cli
+from skeleton.benchmark import _import_reference_cli, _via_skeleton_file, collect_mdx_files, run_benchmark
+from skeleton.cli import mdx_to_skeleton
+
+
+def test_collect_mdx_files_skips_skeletons(tmp_path):
+    """Generated .skel.mdx files and other files are not benchmarked"""
+    (tmp_path / 'sub').mkdir()
+    for name in ('a.mdx', 'a.skel.mdx', 'sub/b.mdx', 'notes.txt'):
+        (tmp_path / name).write_text('# T\n')
+
+    assert collect_mdx_files([tmp_path]) == [tmp_path / 'a.mdx', tmp_path / 'sub' / 'b.mdx']
+    assert collect_mdx_files([tmp_path / 'a.mdx']) == [tmp_path / 'a.mdx']
+
+
+def test_run_benchmark_reports_differing_skeletons(tmp_path):
+    """Files whose skeletons differ between the two generators are listed"""
+    first = tmp_path / 'first.mdx'
+    second = tmp_path / 'second.mdx'
+    first.write_text('# 제목\n\n본문\n')
+    second.write_text('* 항목\n')
+
+    def reference(text: str) -> str:
+        skeleton = mdx_to_skeleton(text)
+        return skeleton + '\n' if text.startswith('*') else skeleton
+
+    result = run_benchmark([first, second], reference, repeat=2)
+    assert result.files == 2
+    assert result.mismatches == [second]
+    assert run_benchmark([first, second], mdx_to_skeleton).mismatches == []
+
+
+def test_reference_cli_without_mdx_to_skeleton_is_driven_through_files(tmp_path):
+    """An older generator is imported with its own siblings and converted via a temporary file"""
+    package_dir = tmp_path / 'skeleton'
+    package_dir.mkdir()
+    (package_dir / '__init__.py').write_text('')
+    (package_dir / 'common.py').write_text('MARK = "old"\n')
+    (package_dir / 'cli.py').write_text(
+        'from pathlib import Path\n'
+        'from skeleton.common import MARK\n'
+        'def convert_mdx_to_skeleton(input_path):\n'
+        '    output_path = input_path.parent / f"{input_path.stem}.skel.mdx"\n'
+        '    output_path.write_text(MARK + ":" + input_path.read_text())\n'
+        '    return output_path\n'
+    )
+
+    module = _import_reference_cli(package_dir)
+
+    assert not hasattr(module, 'mdx_to_skeleton')
+    assert sys.modules['skeleton.cli'] is skeleton.cli
+    work_dir = tmp_path / 'work'
+    work_dir.mkdir()
+    assert _via_skeleton_file(module.convert_mdx_to_skeleton, work_dir)('# T\n') == 'old:# T\n'
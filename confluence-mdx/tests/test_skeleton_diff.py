@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Unit tests for skeleton/textdiff.py and the in-process comparison of skeleton/diff.py
+
+Usage:
+    cd confluence-mdx/tests
+    python3 -m pytest test_skeleton_diff.py -v
+"""
+
+import random
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from skeleton import diff as skeleton_diff
+from skeleton.cli import mdx_to_skeleton
+from skeleton.diff import SkeletonSource, compare_skeletons, process_directories_recursive
+from skeleton.textdiff import unified_diff, unified_diff_ignoring_space_change
+
+
+def _hunks(left: str, right: str) -> str:
+    """Diff without the two file header lines."""
+    output = unified_diff_ignoring_space_change(left, right, 'a', 'b')
+    return output.split('\n', 2)[2] if output else ''
+
+
+# ============================================================================
+# unified_diff_ignoring_space_change Tests
+# ============================================================================
+
+def test_space_change_is_not_a_difference():
+    """Trailing whitespace, whitespace runs and a missing final newline are ignored like diff -b"""
+    assert unified_diff_ignoring_space_change('a  b\nc\t\n', 'a b\nc', 'a', 'b') == ''
+
+
+def test_leading_whitespace_is_a_difference():
+    """Leading whitespace still counts under diff -b"""
+    assert _hunks('a\nb\n', 'a\n  b\n') == '@@ -1,2 +1,2 @@\n a\n-b\n+  b\n'
+
+
+def test_headers_and_empty_ranges():
+    """Headers carry the labels; an empty side prints 'N,0' like GNU diff"""
+    output = unified_diff_ignoring_space_change('', 'x\n', 'ko.skel.mdx', 'ja.skel.mdx')
+    assert output == '--- ko.skel.mdx\n+++ ja.skel.mdx\n@@ -0,0 +1 @@\n+x\n'
+
+
+def test_changes_are_placed_like_gnu_diff():
+    """Ambiguous changes are moved as far down as possible (GNU shift_boundaries)"""
+    assert _hunks('a\nb\nb\nc\n', 'a\nb\nc\n') == '@@ -1,4 +1,3 @@\n a\n b\n-b\n c\n'
+
+    korean = '# T\n\n_TEXT_\n\n_TEXT_\n\n## S\n\n_TEXT_\n'
+    translation = '# T\n\n_TEXT_\n\n## S\n\n_TEXT_\n\n_TEXT_\n'
+    assert _hunks(korean, translation) == (
+        '@@ -2,8 +2,8 @@\n'
+        ' \n _TEXT_\n \n-_TEXT_\n-\n ## S\n \n _TEXT_\n+\n+_TEXT_\n'
+    )
+
+
+def test_distant_changes_get_separate_hunks():
+    """Changes more than 2 * context lines apart are printed as separate hunks"""
+    left = ''.join(f'{i}\n' for i in range(20))
+    right = left.replace('2\n', 'two\n', 1).replace('17\n', 'seventeen\n')
+    assert [line for line in _hunks(left, right).split('\n') if line.startswith('@@')] == [
+        '@@ -1,6 +1,6 @@',
+        '@@ -15,6 +15,6 @@',
+    ]
+
+
+def test_missing_final_newline():
+    """diff marks a printed last line without newline; only plain diff counts it as a change"""
+    assert unified_diff_ignoring_space_change('a\nb', 'a\nb\n', 'a', 'b') == ''
+    assert unified_diff('a\nb', 'a\nb\n', 'a', 'b') == (
+        '--- a\n+++ b\n@@ -1,2 +1,2 @@\n a\n-b\n\\ No newline at end of file\n+b\n'
+    )
+    assert _hunks('x\na\nb', 'a\nb\n') == '@@ -1,3 +1,2 @@\n-x\n a\n b\n\\ No newline at end of file\n'
+
+
+@pytest.mark.skipif(shutil.which('diff') is None, reason='GNU diff not available')
+def test_matches_gnu_diff_on_random_skeletons(tmp_path):
+    """Output is identical to `diff -u -b` and `diff -u` on skeleton-like inputs"""
+    vocabulary = ['', '_TEXT_', '_TEXT_  ', '## _TEXT_', '* _TEXT_', '  * _TEXT_',
+                  '<Callout>', '</Callout>', '```', 'x = 1']
+    rng = random.Random(20240601)
+    left_path = tmp_path / 'left'
+    right_path = tmp_path / 'right'
+    for _ in range(200):
+        left = [rng.choice(vocabulary) for _ in range(rng.randint(0, 60))]
+        right = list(left)
+        for _ in range(rng.randint(1, 6)):
+            position = rng.randint(0, len(right))
+            if right and rng.random() < 0.5:
+                del right[min(position, len(right) - 1)]
+            else:
+                right.insert(position, rng.choice(vocabulary))
+        left_text = '\n'.join(left) + ('\n' if left and rng.random() < 0.8 else '')
+        right_text = '\n'.join(right) + ('\n' if right and rng.random() < 0.8 else '')
+        left_path.write_text(left_text)
+        right_path.write_text(right_text)
+
+        for options, to_diff in ((['-b'], unified_diff_ignoring_space_change), ([], unified_diff)):
+            expected = subprocess.run(['diff', '-u', *options, '--label', 'a', '--label', 'b',
+                                       str(left_path), str(right_path)],
+                                      capture_output=True, text=True).stdout
+            assert to_diff(left_text, right_text, 'a', 'b') == expected, (options, left, right)
+
+
+# ============================================================================
+# compare_skeletons Tests
+# ============================================================================
+
+def _source(path: Path, text: str) -> SkeletonSource:
+    return SkeletonSource(path, text, mdx_to_skeleton(text))
+
+
+def test_compare_skeletons_matched_and_unmatched():
+    """Text differences are matched; structural differences report both diffs"""
+    korean = _source(Path('target/ko/page.mdx'), '# 제목\n\n본문입니다.\n')
+    assert compare_skeletons(korean, _source(Path('target/ja/page.mdx'), '# Title\n\nBody.\n'), {}).result == 'matched'
+
+    comparison = compare_skeletons(korean, _source(Path('target/ja/page.mdx'), '# Title\n\n* Body.\n'), {})
+    assert comparison.result == 'unmatched'
+    assert comparison.output.startswith('+ skeleton diff -u -b target/ko/page.skel.mdx target/ja/page.skel.mdx\n')
+    assert '+* Body.' in comparison.output
+
+
+def test_compare_skeletons_applies_ignore_rules():
+    """Differences on ignored lines of the translation are treated as matched"""
+    korean = _source(Path('target/ko/page.mdx'), '# 제목\n\n본문입니다.\n')
+    translation = _source(Path('target/ja/page.mdx'), '# Title\n\n* Body.\n')
+    assert compare_skeletons(korean, translation, {'target/ja/page.mdx': {3}}).result == 'matched'
+
+
+# ============================================================================
+# process_directories_recursive Tests
+# ============================================================================
+
+@pytest.fixture
+def target_tree(tmp_path, monkeypatch):
+    """A target/{ko,ja,en} tree with one matching and one unmatched translation"""
+    monkeypatch.setattr(skeleton_diff, '_max_diff', None)
+    monkeypatch.setattr(skeleton_diff, '_ignore_rules', {})
+    for lang, pages in {
+        'ko': {'a.mdx': '# 가\n\n내용\n', 'b.mdx': '# 나\n\n내용\n'},
+        'ja': {'a.mdx': '# A\n\nText\n', 'b.mdx': '# B\n\n* Text\n'},
+        'en': {'a.mdx': '# A\n\nText\n', 'b.mdx': '# B\n\nText\n'},
+    }.items():
+        directory = tmp_path / 'target' / lang
+        directory.mkdir(parents=True)
+        for name, text in pages.items():
+            (directory / name).write_text(text, encoding='utf-8')
+    monkeypatch.chdir(tmp_path)
+    return [Path('target/ko'), Path('target/ja'), Path('target/en')]
+
+
+class _CountingSkeleton:
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, text: str) -> str:
+        self.calls.append(text)
+        return mdx_to_skeleton(text)
+
+
+def test_recursive_compare_builds_each_skeleton_once(target_tree, capsys):
+    """Each Korean file is converted once for all its translations, and nothing is written"""
+    to_skeleton = _CountingSkeleton()
+    exit_code, unmatched = process_directories_recursive(target_tree, to_skeleton)
+
+    assert exit_code == 0
+    assert unmatched == [Path('target/ja/b.mdx')]
+    assert len(to_skeleton.calls) == 6
+    assert not list(Path('target').rglob('*.skel.mdx'))
+    out = capsys.readouterr().out
+    assert 'target/ja: 2 converted, 0 errors, 1 matched, 1 unmatched, 0 not_compared' in out
+    assert 'Total: 6 converted, 0 errors, 3 matched, 1 unmatched, 2 not_compared' in out
+
+
+def test_recursive_compare_stops_at_max_diff(target_tree, monkeypatch, capsys):
+    """Processing stops once max_diff unmatched files were reported"""
+    monkeypatch.setattr(skeleton_diff, '_max_diff', 1)
+    _, unmatched = process_directories_recursive(target_tree, mdx_to_skeleton)
+
+    assert unmatched == [Path('target/ja/b.mdx')]
+    assert 'target/en:' not in capsys.readouterr().out
+
+
+def test_recursive_compare_in_worker_processes(target_tree, capsys):
+    """Worker processes produce the same report; --write-skel writes the skeletons"""
+    process_directories_recursive(target_tree, mdx_to_skeleton)
+    sequential = capsys.readouterr().out
+
+    _, unmatched = process_directories_recursive(target_tree, mdx_to_skeleton, jobs=2, write_skeletons=True)
+    assert capsys.readouterr().out == sequential
+    assert unmatched == [Path('target/ja/b.mdx')]
+    assert len(list(Path('target').rglob('*.skel.mdx'))) == 6
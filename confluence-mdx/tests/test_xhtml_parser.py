@@ -0,0 +1,91 @@
+"""converter.xhtml_parser 유닛 테스트 — lxml backend가 html.parser와 같은 tree를 만드는지 확인."""
+from pathlib import Path
+
+import pytest
+from bs4 import Tag
+from bs4.element import CData
+
+from converter.cli import load_catalog, resolve_pages_yaml_path
+from converter.xhtml_parser import parse_xhtml
+
+pytest.importorskip("lxml")
+
+import xhtml_parser_parity_cli as parity_cli  # noqa: E402
+
+TESTCASES_DIR = Path(__file__).resolve().parent / "testcases"
+CASE_DIRS = sorted(p.parent for p in TESTCASES_DIR.glob("*/page.xhtml"))
+
+
+def _tree(soup):
+    """Node types, names, attributes and text of every node in document order."""
+    return [
+        (type(node).__name__, node.name, dict(node.attrs)) if isinstance(node, Tag)
+        else (type(node).__name__, str(node))
+        for node in soup.descendants
+    ]
+
+
+def _assert_same_tree(xhtml):
+    expected = parse_xhtml(xhtml, "html.parser")
+    actual = parse_xhtml(xhtml, "lxml")
+    assert _tree(actual) == _tree(expected)
+    assert str(actual) == str(expected)
+    return actual
+
+
+@pytest.mark.parametrize("case_dir", CASE_DIRS, ids=lambda p: p.name)
+def test_lxml_tree_matches_html_parser(case_dir):
+    _assert_same_tree((case_dir / "page.xhtml").read_text(encoding="utf-8"))
+
+
+@pytest.mark.parametrize("case_dir", CASE_DIRS, ids=lambda p: p.name)
+def test_lxml_conversion_matches_html_parser(case_dir):
+    catalog = load_catalog(resolve_pages_yaml_path(str(TESTCASES_DIR)))
+    result = parity_cli.check_case_dir(case_dir, catalog, "lxml")
+    assert result.passed, result
+
+
+def test_namespaced_tags_and_cdata():
+    soup = _assert_same_tree(
+        '<ac:structured-macro ac:name="code" ac:schema-version="1">'
+        '<ac:parameter ac:name="language">sql</ac:parameter>'
+        '<ac:plain-text-body><![CDATA[SELECT * FROM t WHERE a < 1 && b > 2]]></ac:plain-text-body>'
+        '</ac:structured-macro>'
+        '<p><ac:link><ri:page ri:content-title="Guide" /></ac:link></p>'
+    )
+    body = soup.find("ac:plain-text-body")
+    assert isinstance(body.contents[0], CData)
+    assert str(body.contents[0]) == "SELECT * FROM t WHERE a < 1 && b > 2"
+    assert soup.find("ri:page")["ri:content-title"] == "Guide"
+
+
+def test_entities():
+    _assert_same_tree(
+        '<p>a&nbsp;b &rarr; &amp; &lt;tag&gt; &#8212; &#x2014; &quot;&apos;</p>'
+        '<a href="https://example.com/?a=1&amp;b=2">x</a>'
+    )
+
+
+def test_html_semantics():
+    soup = _assert_same_tree(
+        '<p class="one two"><br /><img src="a.png" /><span></span></p>'
+        '<time datetime="2024-01-01" />'
+    )
+    assert soup.find("p")["class"] == ["one", "two"]
+
+
+@pytest.mark.parametrize("xhtml", [
+    "<p>line<br>next</p>",
+    "<p>R&D</p>",
+    "<p>&unknown;</p>",
+], ids=["unclosed-tag", "bare-ampersand", "unknown-entity"])
+def test_malformed_input_falls_back_to_html_parser(caplog, xhtml):
+    with caplog.at_level("WARNING"):
+        soup = parse_xhtml(xhtml, "lxml")
+    assert "falling back to html.parser" in caplog.text
+    assert str(soup) == str(parse_xhtml(xhtml, "html.parser"))
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError, match="Unknown parser backend"):
+        parse_xhtml("<p/>", "html5lib")